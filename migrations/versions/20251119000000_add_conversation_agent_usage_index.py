@@ -0,0 +1,46 @@
+"""Add covering index for conversation agent usage statistics
+
+Revision ID: 20251119000000
+Revises: 20251118000002
+Create Date: 2025-11-19 00:00:00.000000
+
+ConversationRepository.get_agent_usage_stats() unnests agents_involved for
+conversations in a time window. Including agents_involved in a started_at
+index lets Postgres answer it with an index-only scan.
+
+The index is built CONCURRENTLY (outside the migration transaction) so
+writes to conversations are not blocked while it builds; IF NOT EXISTS makes
+a rerun after an interrupted build safe (drop an INVALID leftover index first).
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20251119000000'
+down_revision = '20251118000002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create covering index on conversations(started_at) INCLUDE (agents_involved)"""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_conversations_started_at_agents',
+            'conversations',
+            ['started_at'],
+            unique=False,
+            postgresql_include=['agents_involved'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop covering index"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_conversations_started_at_agents',
+            table_name='conversations',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
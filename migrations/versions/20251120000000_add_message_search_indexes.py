@@ -0,0 +1,71 @@
+"""Add full-text and trigram search indexes on messages
+
+Revision ID: 20251120000000
+Revises: 20251119000000
+Create Date: 2025-11-20 00:00:00.000000
+
+MessageRepository.search() matches message content with a tsvector query
+(ranked, GIN on a generated search_vector column) and, for substrings, with
+ILIKE backed by a pg_trgm GIN index. Without them every admin search is a
+sequential scan of the messages table.
+
+Adding the stored generated column rewrites the table once. The indexes are
+built CONCURRENTLY (outside the migration transaction) so writes to
+messages are not blocked while they build; IF NOT EXISTS makes a rerun after
+an interrupted build safe (drop an INVALID leftover index first).
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20251120000000'
+down_revision = '20251119000000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add messages.search_vector and build the GIN indexes concurrently"""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        "ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_messages_search_vector',
+            'messages',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_messages_content_trgm',
+            'messages',
+            ['content'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop search indexes and column (pg_trgm is left installed)"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_messages_content_trgm',
+            table_name='messages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'idx_messages_search_vector',
+            table_name='messages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('messages', 'search_vector')
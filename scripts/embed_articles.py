@@ -13,6 +13,9 @@ project_root = Path(__file__).parent.parent
 src_path = project_root / 'src'
 sys.path.insert(0, str(src_path))
 
+from src.bm25_index import BM25Index
+from src.core.config import get_settings
+from src.local_vector_index import LocalVectorIndex
 from src.vector_store import VectorStore
 from typing import List, Dict
 
@@ -92,6 +95,28 @@ def load_and_embed_articles(
     return embedded_articles
 
 
+def build_local_index(embedded_articles: List[Dict], index_path: str) -> None:
+    """
+    Write the in-process vector and BM25 indexes used by src/knowledge_base.py
+
+    Running API workers pick up both new indexes within a few seconds, on
+    their next search.
+
+    Args:
+        embedded_articles: Articles with embeddings
+        index_path: Output directory (vectors.npy + payloads.json)
+    """
+    print(f"\nBuilding local vector index in {index_path}...")
+    count = LocalVectorIndex.build(
+        embedded_articles, index_path, model=get_settings().embedding.model
+    )
+    print(f"✓ Indexed {count} articles")
+
+    print("Building BM25 keyword index...")
+    BM25Index.from_articles(embedded_articles).save(os.path.join(index_path, "bm25.json"))
+    print("✓ Keyword index saved")
+
+
 def process_all_articles(output_combined: str = "data/all_articles_embedded.json"):
     """
     Process all article files and combine into one
@@ -153,6 +178,17 @@ if __name__ == "__main__":
         action="store_true",
         help="Process all article files and combine"
     )
+    parser.add_argument(
+        "--index-path",
+        type=str,
+        default="data/kb_index",
+        help="Directory for the local vector index (default: data/kb_index)"
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Skip building the local vector index"
+    )
     
     args = parser.parse_args()
     
@@ -178,6 +214,9 @@ if __name__ == "__main__":
             
             embedded_articles = load_and_embed_articles(input_file, output_file)
         
+        if embedded_articles and not args.no_index:
+            build_local_index(embedded_articles, args.index_path)
+        
         # Show stats
         if embedded_articles:
             print("\n" + "=" * 60)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Generate src/agents/agent_manifest.json from the @AgentRegistry.register decorators.
+
+Parses the agent modules listed in src/agents/loader.py without importing
+them. Run after adding, renaming or moving an agent (the Docker build runs
+it too).
+
+Usage:
+    python scripts/generate_agent_manifest.py
+    python scripts/generate_agent_manifest.py --check   # exit 1 if stale
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.loader import MANIFEST_PATH, build_manifest, load_manifest, write_manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the agent registration manifest")
+    parser.add_argument(
+        "--check", action="store_true", help="Only verify the committed manifest is up to date"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        if load_manifest() != build_manifest():
+            print(f"{MANIFEST_PATH} is stale - run scripts/generate_agent_manifest.py")
+            return 1
+        print(f"{MANIFEST_PATH} is up to date")
+        return 0
+
+    count = write_manifest()
+    print(f"Wrote {count} agents to {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
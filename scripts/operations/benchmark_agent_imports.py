@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark agent import cost per tier group.
+
+Each measurement runs in a fresh interpreter so module caches do not leak
+between groups. The baseline row is the shared cost every worker pays
+(AgentRegistry + BaseAgent and their dependencies); group rows are the
+extra time and memory to import that group's agent modules on top of it.
+
+Usage:
+    python scripts/operations/benchmark_agent_imports.py
+    python scripts/operations/benchmark_agent_imports.py --group essential_routing
+    python scripts/operations/benchmark_agent_imports.py --repeat 3
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.agents.loader import AGENT_MODULES  # light module, no agent imports
+
+# Runs inside the child interpreter: argv[1] is a JSON list of modules
+_CHILD = """
+import importlib, json, logging, sys, time
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+logging.disable(logging.CRITICAL)
+start_rss, start = rss_kb(), time.perf_counter()
+import src.agents.base.base_agent
+import src.services.infrastructure.agent_registry
+base_s, base_rss = time.perf_counter() - start, rss_kb() - start_rss
+
+start_rss, start = rss_kb(), time.perf_counter()
+for name in json.loads(sys.argv[1]):
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+from src.services.infrastructure.agent_registry import AgentRegistry
+print(json.dumps({
+    "baseline_s": base_s,
+    "baseline_kb": base_rss,
+    "group_s": time.perf_counter() - start,
+    "group_kb": rss_kb() - start_rss,
+    "agents": len(AgentRegistry.get_loaded_agents()),
+}))
+"""
+
+
+def measure(modules: list[str]) -> dict:
+    """Import modules in a fresh interpreter and return its measurements"""
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, json.dumps(modules)],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Logging may still reach stdout; the result is the last line
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark agent import cost per tier group")
+    parser.add_argument("--group", choices=list(AGENT_MODULES), help="Only benchmark one group")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per group (median reported)")
+    args = parser.parse_args()
+
+    groups = {args.group: AGENT_MODULES[args.group]} if args.group else dict(AGENT_MODULES)
+    if not args.group:
+        groups["all"] = [m for modules in AGENT_MODULES.values() for m in modules]
+
+    print(f"{'group':<28} {'agents':>6} {'import (s)':>11} {'RSS (MB)':>9}")
+    print("-" * 57)
+
+    baseline = []
+    for group, modules in groups.items():
+        runs = [measure(modules) for _ in range(args.repeat)]
+        baseline.extend(runs)
+        print(
+            f"{group:<28} {runs[0]['agents']:>6} "
+            f"{statistics.median(r['group_s'] for r in runs):>11.2f} "
+            f"{statistics.median(r['group_kb'] for r in runs) / 1024:>9.1f}"
+        )
+
+    print("-" * 57)
+    print(
+        f"{'baseline (registry + base)':<28} {'':>6} "
+        f"{statistics.median(r['baseline_s'] for r in baseline):>11.2f} "
+        f"{statistics.median(r['baseline_kb'] for r in baseline) / 1024:>9.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
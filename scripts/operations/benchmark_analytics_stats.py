@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the analytics agents' statistics on long series.
+
+Compares the previous pure-Python implementations (loops over lists of
+dicts) with the array-backed helpers in
+src/agents/operational/analytics/timeseries.py:
+
+- anomaly detection: statistics, z-scores, rate changes, flatlines
+- linear trend fit
+- correlation matrix over several metrics
+
+Usage:
+    python scripts/operations/benchmark_analytics_stats.py
+    python scripts/operations/benchmark_analytics_stats.py --points 1000000 --metrics 50
+    python scripts/operations/benchmark_analytics_stats.py --skip-legacy
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.agents.operational.analytics.timeseries import (
+    TimeSeries,
+    correlate,
+    flatline_starts,
+    linear_fit,
+    rate_changes,
+    summary_stats,
+    zscores,
+)
+
+
+def legacy_anomalies(points: list[dict]) -> int:
+    """Previous AnomalyDetector loops: stats, z-scores, rates, flatlines"""
+    values = [p["value"] for p in points if isinstance(p.get("value"), (int, float))]
+    mean = sum(values) / len(values)
+    std = math.sqrt(sum((x - mean) ** 2 for x in values) / len(values))
+    sorted(values)
+    found = sum(1 for p in points if abs((p["value"] - mean) / std) >= 2.0)
+
+    rates = []
+    for i in range(1, len(points)):
+        prev, curr = points[i - 1]["value"], points[i]["value"]
+        rates.append((curr - prev) / abs(prev) * 100 if prev != 0 else 0)
+    mean_rate = sum(rates) / len(rates)
+    rate_std = math.sqrt(sum((r - mean_rate) ** 2 for r in rates) / len(rates))
+    found += sum(1 for r in rates if abs((r - mean_rate) / rate_std) >= 2.5)
+
+    for i in range(len(points) - 4):
+        window = [p["value"] for p in points[i : i + 5]]
+        found += len(set(window)) == 1
+    return found
+
+
+def vectorized_anomalies(points: list[dict]) -> int:
+    series = TimeSeries.from_points(points)
+    stats = summary_stats(series.values)
+    found = int((zscores(series.values, stats["mean"], stats["std_dev"]) >= 2.0).sum())
+    rates = rate_changes(series.values)
+    found += int((zscores(rates, rates.mean(), rates.std()) >= 2.5).sum())
+    return found + len(flatline_starts(series.values))
+
+
+def legacy_fit(values: list[float]) -> float:
+    n = len(values)
+    x_mean, y_mean = (n - 1) / 2, sum(values) / n
+    numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+def legacy_correlations(series: dict[str, list[float]]) -> None:
+    for x in series.values():
+        for y in series.values():
+            n = len(x)
+            mx, my = sum(x) / n, sum(y) / n
+            cov = sum((x[i] - mx) * (y[i] - my) for i in range(n))
+            math.sqrt(sum((x[i] - mx) ** 2 for i in range(n)))
+            math.sqrt(sum((y[i] - my) ** 2 for i in range(n)))
+            _ = cov
+
+
+def timed(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analytics statistics")
+    parser.add_argument("--points", type=int, default=100_000, help="Points per series")
+    parser.add_argument("--metrics", type=int, default=10, help="Series in the correlation matrix")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best reported)")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the NumPy versions")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    values = [100 + rng.gauss(0, 10) for _ in range(args.points)]
+    points = [{"timestamp": i, "value": v} for i, v in enumerate(values)]
+    base = np.array(values)
+    series = {
+        f"metric_{m}": (base * rng.uniform(-2, 2) + rng.gauss(0, 5)).tolist()
+        for m in range(args.metrics)
+    }
+
+    cases = [
+        ("anomalies", lambda: legacy_anomalies(points), lambda: vectorized_anomalies(points)),
+        ("linear fit", lambda: legacy_fit(values), lambda: linear_fit(np.array(values))),
+        (
+            f"correlations ({args.metrics}x{args.metrics})",
+            lambda: legacy_correlations(series),
+            lambda: correlate(series),
+        ),
+    ]
+
+    print(f"{args.points} points per series")
+    print(f"{'case':<26} {'legacy (s)':>11} {'numpy (s)':>10} {'speedup':>8}")
+    print("-" * 58)
+    for name, legacy, vectorized in cases:
+        new = timed(vectorized, args.repeat)
+        if args.skip_legacy:
+            print(f"{name:<26} {'-':>11} {new:>10.4f} {'-':>8}")
+            continue
+        old = timed(legacy, 1)
+        print(f"{name:<26} {old:>11.3f} {new:>10.4f} {old / new:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
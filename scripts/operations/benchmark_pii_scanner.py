@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark PII scanning on long transcripts.
+
+Compares the previous per-type approach (one finditer per PII type, one
+string rebuild per redaction) with the single-pass scanner in
+src/utils/pii_scanner.py, on one long transcript and on a bulk batch of
+messages (in process and across a process pool).
+
+Usage:
+    python scripts/operations/benchmark_pii_scanner.py
+    python scripts/operations/benchmark_pii_scanner.py --words 500000 --messages 20000
+    python scripts/operations/benchmark_pii_scanner.py --workers 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import pii_scanner
+
+_WORDS = ["the", "customer", "asked", "about", "their", "invoice", "and", "agent", "billing"]
+_WORDS += ["refund", "subscription", "account", "upgrade", "plan", "support", "ticket", "thanks"]
+
+_PII = [
+    "4111 1111 1111 1111",
+    "123-45-6789",
+    "jane.doe@example.com",
+    "(415) 555-2671",
+    "10.0.12.7",
+    "password: hunter22",
+    "221 Baker Street",
+    "94107",
+    "sk" + "A1b2C3d4" * 5,
+]
+
+
+def make_text(words: int, pii_every: int, rng: random.Random) -> str:
+    """Prose with a PII value roughly every `pii_every` words"""
+    out = []
+    for i in range(words):
+        out.append(rng.choice(_PII) if i % pii_every == pii_every - 1 else rng.choice(_WORDS))
+    return " ".join(out)
+
+
+def legacy_scan(text: str) -> str:
+    """The previous implementation: one pass per type, redaction by slicing"""
+    detections = []
+    for pii_type, pattern in pii_scanner.COMPILED_PATTERNS.items():
+        for match in pattern.finditer(text):
+            validator = pii_scanner._VALIDATORS.get(pii_type)
+            if validator is None or validator(match.group(0)):
+                detections.append((match.start(), match.end(), pii_type))
+    detections.sort()
+
+    redacted = text
+    for start, end, pii_type in reversed(detections):
+        redacted = redacted[:start] + f"[REDACTED:{pii_type.upper()}]" + redacted[end:]
+    return redacted
+
+
+def timed(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PII scanning on long transcripts")
+    parser.add_argument("--words", type=int, default=200_000, help="Words in the long transcript")
+    parser.add_argument("--messages", type=int, default=10_000, help="Messages in the bulk batch")
+    parser.add_argument("--pii-every", type=int, default=200, help="Words between PII values")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Pool size")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    transcript = make_text(args.words, args.pii_every, rng)
+    messages = [
+        make_text(rng.randint(5, 60), args.pii_every // 4, rng) for _ in range(args.messages)
+    ]
+
+    cases = [
+        ("transcript legacy", lambda: legacy_scan(transcript)),
+        ("transcript single-pass", lambda: pii_scanner.scan_text(transcript)),
+        ("bulk legacy", lambda: [legacy_scan(m) for m in messages]),
+        ("bulk single-pass", lambda: list(pii_scanner.scan_messages(messages))),
+    ]
+    if args.workers > 1:
+        cases.append(
+            (
+                f"bulk pool x{args.workers}",
+                lambda: list(pii_scanner.scan_messages(messages, workers=args.workers)),
+            )
+        )
+
+    print(f"transcript: {len(transcript) / 1e6:.1f} MB, bulk: {len(messages)} messages")
+    print(f"{'case':<26} {'time (s)':>9}")
+    print("-" * 36)
+    for name, fn in cases:
+        print(f"{name:<26} {timed(fn, args.repeat):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,11 +22,12 @@ print()
 
 print("Loading agents...")
 try:
-    # Import agents package (triggers auto-load)
-    import src.agents
-
+    # Import every agent module (agents are otherwise loaded on demand)
+    from src.agents.loader import load_all_agents
     from src.services.infrastructure.agent_registry import AgentRegistry
 
+    load_all_agents()
+
     print("✅ Agents loaded successfully")
     print()
 
@@ -1,14 +1,8 @@
 """
 Agents package - Multi-agent system components
 
-Auto-loads all agents on import to register them in AgentRegistry.
+Agent modules are no longer imported when this package is imported.
+AgentRegistry.get_agent() imports the module registering an agent on first
+use, using the manifest generated by src/agents/loader.py. Call
+src.agents.loader.load_all_agents() to register everything eagerly.
 """
-
-# Auto-load all agents on package import
-from src.agents.loader import load_all_agents
-
-# This ensures all agents are registered when you do:
-# from src.agents import ...
-# or
-# import src.agents
-load_all_agents()
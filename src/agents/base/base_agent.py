@@ -8,6 +8,7 @@ and knowledge base integration.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -18,12 +19,26 @@ from src.agents.base.exceptions import (
     AgentLLMError,
 )
 from src.core.config import get_settings
-from src.llm.client import llm_client
+from src.llm.client import cached_text, llm_client
+from src.llm.semantic_cache import get_semantic_cache
 from src.workflow.state import AgentState
+from src.workflow.streaming import emit_token, is_streaming
 
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_shared_anthropic_client() -> Anthropic:
+    """
+    Process-wide legacy Anthropic client
+
+    Each client owns an HTTP connection pool, so agents share one instead
+    of building a client per instance.
+    """
+    settings = get_settings()
+    return Anthropic(api_key=settings.anthropic.api_key)
+
+
 @dataclass
 class AgentConfig:
     """
@@ -89,8 +104,7 @@ class BaseAgent(ABC):
         self.logger = logger.bind(agent=config.name, agent_type=config.type.value)
 
         # Legacy Anthropic client (kept for backward compatibility)
-        settings = get_settings()
-        self.client = anthropic_client or Anthropic(api_key=settings.anthropic.api_key)
+        self.client = anthropic_client or get_shared_anthropic_client()
 
         # NEW: Unified LLM client (LiteLLM abstraction)
         self.llm_client = llm_client
@@ -138,6 +152,10 @@ class BaseAgent(ABC):
         temperature: float | None = None,
         max_tokens: int | None = None,
         conversation_history: list[dict[str, Any]] | None = None,
+        stream: bool | None = None,
+        cache_text: str | None = None,
+        cache_scope: str | None = None,
+        context: str | None = None,
     ) -> str:
         """
         Call LLM via unified client with error handling and logging.
@@ -154,51 +172,76 @@ class BaseAgent(ABC):
             max_tokens: Override default max tokens
             conversation_history: Optional list of previous messages for multi-turn context.
                                  Each message should have 'role' and 'content' keys.
+            stream: Forward tokens to the workflow token sink while generating.
+                    Defaults to True for specialists during a streaming execution,
+                    so routers and analyzers producing JSON are never streamed.
+            cache_text: Message to key the semantic response cache on. Only used
+                        when the cache is enabled for this agent and there is no
+                        conversation history (the history would change the answer).
+            cache_scope: Prompt context the response depends on; cached entries
+                         only match within the same scope.
+            context: Semi-static context (e.g. customer metadata) sent after the
+                     system prompt. Keep per-request data here rather than in
+                     system_prompt so the provider can cache the system prompt.
 
         Returns:
-            LLM response text
+            LLM response text (the full text, also when streamed)
 
         Raises:
             AgentLLMError: If LLM call fails
         """
+        cache = None
+        if cache_text and not conversation_history:
+            cache = get_semantic_cache()
+            if cache is not None and cache.is_enabled_for(self.config.name):
+                cached = await cache.get(self.config.name, cache_text, scope=cache_scope)
+                if cached is not None:
+                    self.logger.debug("llm_response_served_from_cache")
+                    return cached
+            else:
+                cache = None
+
         try:
             # Get model tier from config model name
             model_tier = self._model_tier_map.get(self.config.model, "haiku")
 
-            # Build messages list with proper multi-turn format
-            messages = []
-
-            # Add system prompt as the first message context
-            system_context = system_prompt
-
-            # If conversation history is provided, format it for context
-            if conversation_history and len(conversation_history) > 0:
-                # Build conversation context string for the system prompt
-                history_text = self._format_conversation_history(conversation_history)
-                system_context = (
-                    f"{system_prompt}\n\n## Previous Conversation History:\n{history_text}"
-                )
+            messages = self._build_messages(
+                system_prompt, user_message, conversation_history, context
+            )
 
-            # Format as single user message with system context
-            # (LiteLLM/Anthropic work best with this format)
-            messages = [
-                {
-                    "role": "user",
-                    "content": f"{system_context}\n\n## Current Message:\n{user_message}",
-                }
-            ]
+            if stream is None:
+                stream = is_streaming() and self.config.type == AgentType.SPECIALIST
+
+            call_temperature = temperature if temperature is not None else self.config.temperature
+            call_max_tokens = max_tokens if max_tokens is not None else self.config.max_tokens
+
+            if stream and is_streaming():
+                # Forward deltas to the SSE consumer as they arrive
+                chunks = []
+                async for chunk in self.llm_client.chat_completion_stream(
+                    messages=messages,
+                    model_tier=model_tier,
+                    temperature=call_temperature,
+                    max_tokens=call_max_tokens,
+                ):
+                    chunks.append(chunk)
+                    emit_token(self.config.name, chunk)
+                return "".join(chunks)
 
             # Call unified LLM client (automatically uses current backend)
             content = await self.llm_client.chat_completion(
                 messages=messages,
                 model_tier=model_tier,
-                temperature=temperature if temperature is not None else self.config.temperature,
-                max_tokens=max_tokens if max_tokens is not None else self.config.max_tokens,
+                temperature=call_temperature,
+                max_tokens=call_max_tokens,
             )
 
             # Note: Metrics and cost tracking are handled inside llm_client.chat_completion()
             # No need to log here - llm_client already logs everything
 
+            if cache is not None:
+                await cache.set(self.config.name, cache_text, content, scope=cache_scope)
+
             return content
 
         except Exception as e:
@@ -209,6 +252,43 @@ class BaseAgent(ABC):
                 details={"error_type": type(e).__name__},
             ) from e
 
+    def _build_messages(
+        self,
+        system_prompt: str,
+        user_message: str,
+        conversation_history: list[dict[str, Any]] | None = None,
+        context: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Build LLM messages in prompt-cache-friendly order.
+
+        Provider prompt caches match on an exact prefix, so content goes from
+        most to least stable: the agent's static system prompt, the
+        semi-static context, the conversation history, then the current
+        message. Each stable part ends a cache breakpoint (see cached_text).
+
+        Args:
+            system_prompt: Static system instructions
+            user_message: Current message
+            conversation_history: Previous messages (see get_conversation_context)
+            context: Semi-static context for this conversation
+
+        Returns:
+            A system message (if there are instructions) and a user message,
+            as text blocks
+        """
+        system_blocks = [cached_text(text) for text in (system_prompt, context) if text]
+
+        user_blocks = []
+        if conversation_history:
+            history_text = self._format_conversation_history(conversation_history)
+            user_blocks.append(cached_text(f"## Previous Conversation History:\n{history_text}"))
+        user_blocks.append({"type": "text", "text": f"## Current Message:\n{user_message}"})
+
+        messages = [{"role": "system", "content": system_blocks}] if system_blocks else []
+        messages.append({"role": "user", "content": user_blocks})
+        return messages
+
     def _format_conversation_history(
         self, history: list[dict[str, Any]], max_messages: int = 10
     ) -> str:
@@ -217,6 +297,7 @@ class BaseAgent(ABC):
 
         Args:
             history: List of message dictionaries with 'role' and 'content'
+                     (role "summary" holds the summary of older turns)
             max_messages: Maximum number of recent messages to include (prevents token overflow)
 
         Returns:
@@ -225,10 +306,16 @@ class BaseAgent(ABC):
         if not history:
             return ""
 
+        # The summary of older turns is always kept, outside the message limit
+        summaries = [msg for msg in history if msg.get("role") == "summary"]
+        history = [msg for msg in history if msg.get("role") != "summary"]
+
         # Take only the most recent messages to prevent token overflow
         recent_history = history[-max_messages:] if len(history) > max_messages else history
 
-        formatted_parts = []
+        formatted_parts = [
+            f"Summary of earlier conversation: {msg.get('content', '')}" for msg in summaries
+        ]
         for msg in recent_history:
             role = msg.get("role", "unknown")
             content = msg.get("content", "")
@@ -261,12 +348,16 @@ class BaseAgent(ABC):
             state: Current agent state containing messages
 
         Returns:
-            List of message dictionaries ready for LLM context
+            List of message dictionaries ready for LLM context, led by a
+            "summary" entry when older turns have been summarized
         """
         messages = state.get("messages", [])
 
         # Convert Message TypedDicts to plain dicts
         history = []
+        summary = state.get("conversation_summary")
+        if summary:
+            history.append({"role": "summary", "content": summary, "agent_name": None})
         for msg in messages[:-1]:  # Exclude current message (it's handled separately)
             history.append(
                 {
@@ -303,12 +394,15 @@ class BaseAgent(ABC):
         # Check if KB service is available
         if not self.kb_service:
             self.logger.warning("kb_service_not_available")
-            # Try using the legacy search_articles function
+            # Fall back to the module-level search (async path: batched
+            # query embedding, no encoding or Qdrant I/O on the event loop)
             try:
-                from src.knowledge_base import search_articles
+                from src.knowledge_base import search_articles_vector_async
 
                 category = category or self.config.kb_category
-                results = search_articles(query=query, category=category, limit=limit)
+                results = await search_articles_vector_async(
+                    query=query, category=category, limit=limit
+                )
                 self.logger.info(
                     "kb_search_success_legacy",
                     query=query,
@@ -6,8 +6,6 @@ Generates vector embeddings for new and updated KB articles and loads them into
 Part of: STORY-002 Knowledge Base Swarm (TASK-210)
 """
 
-import uuid
-
 from src.agents.base import AgentConfig
 from src.agents.base.agent_types import AgentType
 from src.agents.base.base_agent import BaseAgent
@@ -17,10 +15,12 @@ from src.workflow.state import AgentState
 
 try:
     from qdrant_client import QdrantClient
-    from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
-    from sentence_transformers import SentenceTransformer
+    from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+    from src.embedding_models import embedding_models_available, get_embedding_model
+    from src.kb_vector_sync import KBVectorSync, chunk_text
 
-    EMBEDDING_AVAILABLE = True
+    EMBEDDING_AVAILABLE = embedding_models_available()
 except ImportError:
     EMBEDDING_AVAILABLE = False
 
@@ -34,7 +34,7 @@ class KBEmbedder(BaseAgent):
     - Updates embeddings for modified articles
     - Chunks long articles (>512 tokens)
     - Stores embeddings in Qdrant
-    - Handles batch processing
+    - Handles batch processing (incremental, see src/kb_vector_sync.py)
     """
 
     CHUNK_SIZE = 512  # tokens (words approximation)
@@ -77,9 +77,9 @@ class KBEmbedder(BaseAgent):
             )
             self.qdrant_client = None
 
-        # Initialize embedding model
+        # Shared embedding model (loaded once per process)
         try:
-            self.embedding_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+            self.embedding_model = get_embedding_model()
         except Exception as e:
             self.logger.error(
                 "embedding_model_initialization_failed", error=str(e), error_type=type(e).__name__
@@ -90,6 +90,13 @@ class KBEmbedder(BaseAgent):
             "kb_embedder_initialized", collection_name=getattr(self, "collection_name", "unknown")
         )
 
+    @property
+    def vector_sync(self) -> "KBVectorSync | None":
+        """Incremental sync into the collection (None if not initialized)"""
+        if not self.qdrant_client or not self.embedding_model:
+            return None
+        return KBVectorSync(self.qdrant_client, self.collection_name, self.embedding_model)
+
     async def process(self, state: AgentState) -> AgentState:
         """
         Process state and embed articles.
@@ -126,60 +133,38 @@ class KBEmbedder(BaseAgent):
         """
         Generate embeddings for article and store in Qdrant.
 
+        Unchanged chunks are not re-embedded; chunks the article no longer
+        has are deleted.
+
         Args:
             article: Article dict with id, title, content
 
         Returns:
             Result dict with success status
         """
-        if not self.qdrant_client or not self.embedding_model:
+        vector_sync = self.vector_sync
+        if not vector_sync:
             return {"success": False, "error": "Embedder not properly initialized"}
 
         article_id = str(article.get("id", article.get("article_id", "")))
-        title = article.get("title", "")
-        content = article.get("content", "")
-
-        # Combine title + content
-        full_text = f"{title}\n\n{content}"
-
-        # Check if needs chunking
-        word_count = len(full_text.split())
-        chunks = self._chunk_text(full_text) if word_count > self.CHUNK_SIZE else [full_text]
 
         try:
-            # Generate embeddings
-            embeddings = self.embedding_model.encode(chunks)
-
-            # Create points for Qdrant
-            points = []
-            for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=False)):
-                point = PointStruct(
-                    id=str(uuid.uuid4()),
-                    vector=embedding.tolist(),
-                    payload={
-                        "doc_id": article_id,
-                        "article_id": article_id,
-                        "title": title,
-                        "content": chunk,
-                        "category": article.get("category", ""),
-                        "tags": article.get("tags", []),
-                        "url": article.get("url", f"/kb/{article_id}"),
-                        "chunk_index": idx,
-                        "total_chunks": len(chunks),
-                    },
-                )
-                points.append(point)
-
-            # Upload to Qdrant
-            self.qdrant_client.upsert(collection_name=self.collection_name, points=points)
-
-            self.logger.info("article_embedded", article_id=article_id, chunks_created=len(chunks))
+            stats = await vector_sync.sync([article])
+            if stats["failed"]:
+                raise RuntimeError(f"{stats['failed']} chunks failed to embed")
+
+            self.logger.info(
+                "article_embedded",
+                article_id=article_id,
+                chunks_created=stats["chunks"],
+                embedded=stats["embedded"],
+            )
 
             return {
                 "success": True,
                 "article_id": article_id,
-                "chunks_created": len(chunks),
-                "embeddings_generated": len(embeddings),
+                "chunks_created": stats["chunks"],
+                "embeddings_generated": stats["embedded"],
             }
 
         except Exception as e:
@@ -201,20 +186,15 @@ class KBEmbedder(BaseAgent):
         Returns:
             List of text chunks
         """
-        words = text.split()
-        chunks = []
-
-        for i in range(0, len(words), self.CHUNK_SIZE - self.CHUNK_OVERLAP):
-            chunk_words = words[i : i + self.CHUNK_SIZE]
-            chunk = " ".join(chunk_words)
-            chunks.append(chunk)
-
-        return chunks
+        return chunk_text(text, self.CHUNK_SIZE, self.CHUNK_OVERLAP)
 
     async def batch_embed_articles(self, articles: list[dict]) -> dict:
         """
         Embed multiple articles in batch.
 
+        Chunks of all articles are encoded together in batches; unchanged
+        chunks are skipped.
+
         Args:
             articles: List of article dicts
 
@@ -223,15 +203,24 @@ class KBEmbedder(BaseAgent):
         """
         results = {"total": len(articles), "success": 0, "failed": 0, "total_chunks": 0}
 
-        for article in articles:
-            result = await self.embed_article(article)
-
-            if result["success"]:
-                results["success"] += 1
-                results["total_chunks"] += result.get("chunks_created", 0)
-            else:
-                results["failed"] += 1
+        vector_sync = self.vector_sync
+        if not vector_sync:
+            results["failed"] = len(articles)
+            return results
 
+        try:
+            stats = await vector_sync.sync(articles)
+        except Exception as e:
+            self.logger.error("batch_embedding_failed", error=str(e), error_type=type(e).__name__)
+            results["failed"] = len(articles)
+            return results
+
+        results["failed"] = len(stats["failed_article_ids"])
+        results["success"] = stats["articles"] - results["failed"]
+        results["total_chunks"] = stats["chunks"]
+        results.update(
+            embedded=stats["embedded"], unchanged=stats["unchanged"], deleted=stats["deleted"]
+        )
         return results
 
     async def delete_article_embeddings(self, article_id: str) -> bool:
@@ -22,10 +22,11 @@ from src.utils.logging.setup import get_logger
 from src.workflow.state import AgentState
 
 try:
-    from sentence_transformers import SentenceTransformer
     from sklearn.cluster import DBSCAN
 
-    CLUSTERING_AVAILABLE = True
+    from src.embedding_models import embedding_models_available, get_embedding_model
+
+    CLUSTERING_AVAILABLE = embedding_models_available()
 except ImportError:
     CLUSTERING_AVAILABLE = False
 
@@ -54,9 +55,9 @@ class FAQGenerator(BaseAgent):
         super().__init__(config)
         self.logger = get_logger(__name__)
 
-        # Initialize embedding model for clustering
+        # Shared embedding model for clustering (loaded once per process)
         if CLUSTERING_AVAILABLE:
-            self.embedding_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+            self.embedding_model = get_embedding_model()
         else:
             self.embedding_model = None
             self.logger.warning(
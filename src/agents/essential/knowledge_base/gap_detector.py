@@ -7,10 +7,13 @@ low KB match scores and clustering similar unanswered questions.
 Part of: STORY-002 Knowledge Base Swarm (TASK-207)
 """
 
+import asyncio
 import json
+import math
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.agents.base import AgentConfig
@@ -22,13 +25,140 @@ from src.utils.logging.setup import get_logger
 from src.workflow.state import AgentState
 
 try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.cluster import DBSCAN
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    from sklearn.cluster import DBSCAN, MiniBatchKMeans
 
-    CLUSTERING_AVAILABLE = True
+    from src.embedding_models import embedding_models_available, get_embedding_model
+
+    CLUSTERING_AVAILABLE = embedding_models_available()
 except ImportError:
     CLUSTERING_AVAILABLE = False
 
+# Up to this many queries DBSCAN runs on all of them (quadratic, exact)
+EXACT_CLUSTERING_LIMIT = 5000
+
+# Target queries per MiniBatchKMeans partition above the limit
+PARTITION_SIZE = 500
+
+
+def cluster_embeddings(
+    embeddings: np.ndarray,
+    eps: float = 0.3,
+    min_samples: int = 3,
+    exact_limit: int = EXACT_CLUSTERING_LIMIT,
+    partition_size: int = PARTITION_SIZE,
+) -> np.ndarray:
+    """
+    Density-cluster embeddings by cosine distance
+
+    Small inputs run DBSCAN directly. Larger ones are partitioned with
+    MiniBatchKMeans, DBSCAN runs within each partition, clusters split
+    across partitions are merged when their centroids are within `eps`, and
+    noise points within `eps` of a cluster centroid join it. That is roughly
+    linear in the number of queries instead of quadratic.
+
+    Args:
+        embeddings: (n, dim) array
+        eps: Max cosine distance between neighbors
+        min_samples: DBSCAN core point threshold
+        exact_limit: Largest input clustered with a single DBSCAN
+        partition_size: Target partition size for larger inputs
+
+    Returns:
+        Cluster label per row, -1 for noise
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    if len(vectors) <= exact_limit:
+        return DBSCAN(eps=eps, min_samples=min_samples, metric="cosine").fit(vectors).labels_
+
+    labels = np.full(len(vectors), -1)
+    cluster_count = 0
+    for members in _partition(vectors, partition_size):
+        if len(members) < min_samples:
+            continue
+        sub_labels = (
+            DBSCAN(eps=eps, min_samples=min_samples, metric="cosine").fit(vectors[members]).labels_
+        )
+        clustered = sub_labels >= 0
+        labels[members[clustered]] = sub_labels[clustered] + cluster_count
+        cluster_count += sub_labels.max() + 1 if clustered.any() else 0
+
+    if cluster_count == 0:
+        return labels
+
+    # Merge clusters whose centroids are within eps (split by partition boundaries)
+    clustered = labels >= 0
+    centroids = _centroids(vectors[clustered], labels[clustered], cluster_count)
+    rows, cols = [], []
+    for start in range(0, cluster_count, 1024):
+        block_rows, block_cols = np.nonzero(
+            centroids[start : start + 1024] @ centroids.T >= 1 - eps
+        )
+        rows.append(block_rows + start)
+        cols.append(block_cols)
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    graph = coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(cluster_count, cluster_count)
+    )
+    merged_count, merged = connected_components(graph, directed=False)
+    labels[clustered] = merged[labels[clustered]]
+
+    # Points left as noise because their partition held too few of their
+    # neighbors join the nearest cluster within eps (as DBSCAN border points)
+    centroids = _centroids(vectors[clustered], labels[clustered], merged_count)
+    noise = np.flatnonzero(~clustered)
+    for start in range(0, len(noise), 4096):
+        block = noise[start : start + 4096]
+        similarity = vectors[block] @ centroids.T
+        nearest = similarity.argmax(axis=1)
+        close = similarity[np.arange(len(block)), nearest] >= 1 - eps
+        labels[block[close]] = nearest[close]
+
+    return labels
+
+
+def _centroids(vectors: np.ndarray, labels: np.ndarray, count: int) -> np.ndarray:
+    """Unit-length mean vector per label"""
+    centroids = np.zeros((count, vectors.shape[1]), dtype=np.float32)
+    np.add.at(centroids, labels, vectors)
+    return centroids / np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+
+def _partition(vectors: np.ndarray, partition_size: int, max_depth: int = 3) -> list[np.ndarray]:
+    """
+    Split row indices into partitions of about partition_size with MiniBatchKMeans
+
+    Partitions more than twice the target size (e.g. diffuse noise that
+    k-means lumps together) are split again, so no single DBSCAN run
+    becomes quadratic in the whole input.
+    """
+    partitions = []
+    pending = [(np.arange(len(vectors)), 0)]
+    while pending:
+        members, depth = pending.pop()
+        if len(members) <= 2 * partition_size or depth == max_depth:
+            partitions.append(members)
+            continue
+
+        assignments = MiniBatchKMeans(
+            n_clusters=math.ceil(len(members) / partition_size),
+            init="random",
+            batch_size=1024,
+            n_init=1,
+            random_state=0,
+        ).fit_predict(vectors[members])
+
+        parts = [members[assignments == label] for label in np.unique(assignments)]
+        if len(parts) == 1:  # Could not split further
+            partitions.append(members)
+            continue
+        pending.extend((part, depth + 1) for part in parts)
+
+    return partitions
+
 
 class KBGapDetector(BaseAgent):
     """
@@ -43,6 +173,8 @@ class KBGapDetector(BaseAgent):
 
     LOW_MATCH_THRESHOLD = 0.7
     MIN_CLUSTER_SIZE = 3
+    QUERY_FETCH_SIZE = 2000  # rows per streamed chunk
+    EMBED_BATCH_SIZE = 256
 
     def __init__(self):
         """Initialize KB Gap Detector agent."""
@@ -56,9 +188,9 @@ class KBGapDetector(BaseAgent):
         super().__init__(config)
         self.logger = get_logger(__name__)
 
-        # Initialize embedding model for clustering
+        # Shared embedding model for clustering (loaded once per process)
         if CLUSTERING_AVAILABLE:
-            self.embedding_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+            self.embedding_model = get_embedding_model()
         else:
             self.embedding_model = None
             self.logger.warning(
@@ -133,6 +265,9 @@ class KBGapDetector(BaseAgent):
         """
         Get queries with low KB match scores.
 
+        One query: the first user message of every conversation in the
+        window (row_number() per conversation), streamed in chunks.
+
         Args:
             days: Look back period
 
@@ -141,26 +276,31 @@ class KBGapDetector(BaseAgent):
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
+        ranked = (
+            select(
+                Message.content,
+                func.row_number()
+                .over(
+                    partition_by=Message.conversation_id,
+                    order_by=(Message.created_at, Message.id),
+                )
+                .label("position"),
+            )
+            .join(Conversation, Conversation.id == Message.conversation_id)
+            .where(Conversation.created_at >= cutoff_date, Message.role == "user")
+            .subquery()
+        )
+        query = select(ranked.c.content).where(ranked.c.position == 1)
+
         try:
             async with get_db_session() as session:
-                # Query conversations with low KB scores
-                result = await session.execute(
-                    select(Conversation).where(Conversation.created_at >= cutoff_date)
+                result = await session.stream(
+                    query.execution_options(yield_per=self.QUERY_FETCH_SIZE)
                 )
-                conversations = result.scalars().all()
 
                 queries = []
-                for conv in conversations:
-                    # Get first user message
-                    msg_result = await session.execute(
-                        select(Message)
-                        .where(Message.conversation_id == conv.id, Message.role == "user")
-                        .limit(1)
-                    )
-                    first_msg = msg_result.scalar_one_or_none()
-
-                    if first_msg:
-                        queries.append(first_msg.content)
+                async for rows in result.partitions(self.QUERY_FETCH_SIZE):
+                    queries.extend(content for (content,) in rows if content)
 
                 self.logger.info("low_match_queries_retrieved", queries_count=len(queries))
 
@@ -176,6 +316,9 @@ class KBGapDetector(BaseAgent):
         """
         Cluster similar queries using embeddings.
 
+        Identical queries are embedded once; encoding and clustering run
+        off the event loop.
+
         Args:
             queries: List of query strings
 
@@ -186,17 +329,24 @@ class KBGapDetector(BaseAgent):
             return {}
 
         try:
-            # Generate embeddings
-            embeddings = self.embedding_model.encode(queries)
+            # Generate embeddings (once per distinct query, in batches)
+            unique_queries, inverse = np.unique(
+                np.asarray(queries, dtype=object), return_inverse=True
+            )
+            unique_embeddings = await asyncio.to_thread(
+                self.embedding_model.encode,
+                list(unique_queries),
+                batch_size=self.EMBED_BATCH_SIZE,
+            )
+            embeddings = np.asarray(unique_embeddings)[inverse]
 
-            # Cluster using DBSCAN
-            clustering = DBSCAN(eps=0.3, min_samples=self.MIN_CLUSTER_SIZE, metric="cosine").fit(
-                embeddings
+            labels = await asyncio.to_thread(
+                cluster_embeddings, embeddings, eps=0.3, min_samples=self.MIN_CLUSTER_SIZE
             )
 
             # Group queries by cluster
             clusters = {}
-            for idx, label in enumerate(clustering.labels_):
+            for idx, label in enumerate(labels):
                 if label == -1:  # Noise - skip
                     continue
 
@@ -207,8 +357,10 @@ class KBGapDetector(BaseAgent):
 
             self.logger.info(
                 "queries_clustered",
+                queries_count=len(queries),
+                distinct_queries=len(unique_queries),
                 clusters_count=len(clusters),
-                noise_count=list(clustering.labels_).count(-1),
+                noise_count=int((labels == -1).sum()),
             )
 
             return clusters
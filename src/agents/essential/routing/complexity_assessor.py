@@ -196,14 +196,15 @@ Output ONLY valid JSON."""
 
 Message: {message}
 
-{context_str if context_str else ""}
-
 Provide complexity assessment in JSON format."""
 
             response = await self.call_llm(
                 system_prompt=self._get_system_prompt(),
+                context=context_str,
                 user_message=prompt,
                 conversation_history=conversation_history,
+                cache_text=message,
+                cache_scope=context_str,
             )
 
             # Parse response
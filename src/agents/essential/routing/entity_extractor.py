@@ -210,6 +210,7 @@ Output ONLY valid JSON with the extracted entities. If no entities found, return
                 system_prompt=self._get_system_prompt(),
                 user_message=f"Extract entities from this message:\n\n{message}",
                 conversation_history=conversation_history,
+                cache_text=message,
             )
 
             # Parse response
@@ -135,38 +135,35 @@ class IntentClassifier(RoutingAgent):
 5. Extract entities (plan names, amounts, features, dates, numbers)
 6. Use customer context to disambiguate intents
 
-**Customer Context:**
-{customer_context}
-
 **Output Format (JSON only, no extra text):**
-{{
+{
     "domain": "support",
     "category": "billing",
     "subcategory": "subscription",
     "action": "upgrade",
-    "confidence_scores": {{
+    "confidence_scores": {
         "domain": 0.98,
         "category": 0.95,
         "subcategory": 0.92,
         "action": 0.90,
         "overall": 0.94
-    }},
+    },
     "alternative_intents": [
-        {{
+        {
             "domain": "sales",
             "category": "qualification",
             "subcategory": "pricing_inquiry",
             "confidence": 0.75,
             "reasoning": "Could also be sales if user is evaluating options"
-        }}
+        }
     ],
-    "entities": {{
+    "entities": {
         "plan_name": "premium",
         "team_size": 25,
         "action": "upgrade"
-    }},
+    },
     "reasoning": "User explicitly requesting plan upgrade with team expansion context"
-}}
+}
 
 **Important:** Output ONLY valid JSON. No markdown, no code blocks, just raw JSON."""
 
@@ -192,13 +189,11 @@ class IntentClassifier(RoutingAgent):
             # Update state with agent history
             state = self.update_state(state)
 
-            # Get customer context
+            # Format customer context for prompt (sent after the static system prompt so
+            # the provider can cache the prompt across customers)
             customer_context = state.get("customer_metadata", {})
             context_str = self._format_customer_context(customer_context)
 
-            # Build system prompt with context
-            system_prompt = self._get_system_prompt().format(customer_context=context_str)
-
             # Get message
             message = state.get("current_message", "")
 
@@ -211,9 +206,12 @@ class IntentClassifier(RoutingAgent):
 
             # Call LLM for classification
             response = await self.call_llm(
-                system_prompt=system_prompt,
+                system_prompt=self._get_system_prompt(),
+                context=f"**Customer Context**:\n{context_str}",
                 user_message=f"Classify this message into the hierarchical taxonomy:\n\n{message}",
                 conversation_history=conversation_history,
+                cache_text=message,
+                cache_scope=context_str,
             )
 
             # Parse response
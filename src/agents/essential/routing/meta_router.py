@@ -92,8 +92,6 @@ Examples:
 - Feature requests from engaged customers
 NOTE: This is for EXISTING paying customers having issues with OUR product, NOT prospects frustrated with competitors
 
-**Customer Context**: {customer_context}
-
 **CRITICAL - Conversation Continuity Rules** (HIGHEST PRIORITY):
 1. **ALWAYS check conversation history FIRST before classifying**
 2. If conversation history shows an ONGOING sales discussion (qualification, demos, pricing, features, company info), KEEP routing to SALES
@@ -152,12 +150,10 @@ Be concise. Output ONLY valid JSON, no markdown or extra text."""
             # Get customer context (if available)
             customer_context = state.get("customer_metadata", {})
 
-            # Format context for prompt
+            # Format context for prompt (sent after the static system prompt so
+            # the provider can cache the prompt across customers)
             context_str = self._format_customer_context(customer_context)
 
-            # Build system prompt with context
-            system_prompt = self._get_system_prompt().format(customer_context=context_str)
-
             # Get message
             message = state.get("current_message", "")
 
@@ -174,9 +170,12 @@ Be concise. Output ONLY valid JSON, no markdown or extra text."""
 
             # Call LLM for classification with conversation history
             response = await self.call_llm(
-                system_prompt=system_prompt,
+                system_prompt=self.build_system_prompt(),
+                context=f"**Customer Context**: {context_str}",
                 user_message=f"Classify this message:\n\n{message}",
                 conversation_history=conversation_history,
+                cache_text=message,
+                cache_scope=context_str,
             )
 
             # Parse response
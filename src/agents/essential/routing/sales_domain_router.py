@@ -206,13 +206,12 @@ Output ONLY valid JSON. Choose exactly ONE agent."""
 
 Message: {message}
 
-{context_str if context_str else ""}
-
 Classify into: qualification, education, objection, or progression.
 Consider any previous conversation context when making your routing decision."""
 
             response = await self.call_llm(
                 system_prompt=self._get_system_prompt(),
+                context=f"Context:\n{context_str}" if context_str else None,
                 user_message=prompt,
                 conversation_history=conversation_history,
             )
@@ -182,14 +182,15 @@ Analyze ONLY the message content and context. Output valid JSON."""
 
 Message: {message}
 
-{context_str if context_str else ""}
-
 Provide sentiment analysis in JSON format."""
 
             response = await self.call_llm(
                 system_prompt=self._get_system_prompt(),
+                context=context_str,
                 user_message=prompt,
                 conversation_history=conversation_history,
+                cache_text=message,
+                cache_scope=context_str,
             )
 
             # Parse response
@@ -185,13 +185,12 @@ Output ONLY valid JSON. Choose exactly ONE category."""
 
 Message: {message}
 
-{context_str if context_str else ""}
-
 Classify into: billing, technical, usage, integration, or account.
 Consider any previous conversation context when making your routing decision."""
 
             response = await self.call_llm(
                 system_prompt=self._get_system_prompt(),
+                context=f"Context:\n{context_str}" if context_str else None,
                 user_message=prompt,
                 conversation_history=conversation_history,
             )
@@ -1,22 +1,191 @@
 """
-Agent Loader - Ensures all agents are imported and registered.
+Agent Loader - Lazy agent loading backed by a registration manifest.
 
-This module imports all agent modules to trigger @AgentRegistry.register()
-decorators. Import this module to load all agents into the registry.
+Agent modules register themselves through @AgentRegistry.register()
+decorators, but importing all of them up front pulls heavy dependencies
+(sentence-transformers, sklearn, ...) into every worker. Instead, a
+manifest maps each registry name to the module that registers it, and
+AgentRegistry.get_agent() imports that module on first use.
+
+The manifest (agent_manifest.json, next to this file) is generated at
+build time by parsing the decorators - no agent module is imported:
+
+    python scripts/generate_agent_manifest.py
 
 Usage:
-    from src.agents import loader  # Loads all agents
-    # OR
+    from src.services.infrastructure.agent_registry import AgentRegistry
+    AgentRegistry.get_agent("meta_router")  # imports one module
+
+    # Eager loading is still available (smoke tests, registry validation)
     from src.agents.loader import load_all_agents
     load_all_agents()
 """
 
+import ast
 import importlib
+import json
+from pathlib import Path
+from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+MANIFEST_PATH = Path(__file__).with_name("agent_manifest.json")
+
+# Modules that register agents, by tier group. Order matters: when two
+# modules register the same name, the later one wins (as in the registry).
+AGENT_MODULES: dict[str, list[str]] = {
+    # =========================================================================
+    # TIER 1: ESSENTIAL - Routing Agents
+    # =========================================================================
+    "essential_routing": [
+        "src.agents.essential.routing.meta_router",
+        "src.agents.essential.routing.support_domain_router",
+        "src.agents.essential.routing.sales_domain_router",
+        "src.agents.essential.routing.cs_domain_router",
+        "src.agents.essential.routing.intent_classifier",
+        "src.agents.essential.routing.entity_extractor",
+        "src.agents.essential.routing.sentiment_analyzer",
+        "src.agents.essential.routing.escalation_decider",
+        "src.agents.essential.routing.complexity_assessor",
+        "src.agents.essential.routing.context_injector",
+        "src.agents.essential.routing.coordinator",
+        "src.agents.essential.routing.handoff_manager",
+    ],
+    # =========================================================================
+    # TIER 1: ESSENTIAL - Support Specialists
+    # =========================================================================
+    "essential_support": [
+        # Billing
+        "src.agents.essential.support.billing.upgrade_specialist",
+        "src.agents.essential.support.billing.refund_processor",
+        "src.agents.essential.support.billing.payment_troubleshooter",
+        "src.agents.essential.support.billing.invoice_generator",
+        "src.agents.essential.support.billing.pricing_explainer",
+        "src.agents.essential.support.billing.discount_negotiator",
+        "src.agents.essential.support.billing.downgrade_specialist",
+        # Technical
+        "src.agents.essential.support.technical.bug_triager",
+        "src.agents.essential.support.technical.crash_investigator",
+        "src.agents.essential.support.technical.sync_troubleshooter",
+        "src.agents.essential.support.technical.performance_optimizer",
+        "src.agents.essential.support.technical.login_specialist",
+        "src.agents.essential.support.technical.data_recovery_specialist",
+        "src.agents.essential.support.technical.browser_compatibility_specialist",
+        # Usage
+        "src.agents.essential.support.usage.feature_teacher",
+        "src.agents.essential.support.usage.onboarding_guide",
+        "src.agents.essential.support.usage.workflow_optimizer",
+        "src.agents.essential.support.usage.collaboration_expert",
+        "src.agents.essential.support.usage.export_specialist",
+        "src.agents.essential.support.usage.import_specialist",
+        # Integration
+        "src.agents.essential.support.integration.api_debugger",
+        "src.agents.essential.support.integration.webhook_troubleshooter",
+        "src.agents.essential.support.integration.oauth_specialist",
+        "src.agents.essential.support.integration.sdk_expert",
+        "src.agents.essential.support.integration.rate_limit_advisor",
+        # Account
+        "src.agents.essential.support.account.account_deletion_specialist",
+        "src.agents.essential.support.account.profile_manager",
+        "src.agents.essential.support.account.team_manager",
+        "src.agents.essential.support.account.permission_manager",
+        "src.agents.essential.support.account.security_advisor",
+        "src.agents.essential.support.account.sso_specialist",
+        "src.agents.essential.support.account.data_export_specialist",
+        "src.agents.essential.support.account.notification_configurator",
+        "src.agents.essential.support.account.audit_log_specialist",
+        "src.agents.essential.support.account.compliance_specialist",
+    ],
+    # =========================================================================
+    # TIER 2: REVENUE - Sales Agents
+    # =========================================================================
+    "revenue_sales": [
+        # Lead Qualification
+        "src.agents.revenue.sales.lead_qualification.inbound_qualifier",
+        "src.agents.revenue.sales.lead_qualification.bant_qualifier",
+        "src.agents.revenue.sales.lead_qualification.lead_scorer",
+        "src.agents.revenue.sales.lead_qualification.mql_to_sql_converter",
+        "src.agents.revenue.sales.lead_qualification.referral_detector",
+        "src.agents.revenue.sales.lead_qualification.disqualification_agent",
+        # Product Education
+        "src.agents.revenue.sales.product_education.feature_explainer",
+        "src.agents.revenue.sales.product_education.demo_preparer",
+        "src.agents.revenue.sales.product_education.use_case_matcher",
+        "src.agents.revenue.sales.product_education.roi_calculator",
+        "src.agents.revenue.sales.product_education.value_proposition",
+        # Objection Handling
+        "src.agents.revenue.sales.objection_handling.price_objection_handler",
+        "src.agents.revenue.sales.objection_handling.competitor_comparison_handler",
+        "src.agents.revenue.sales.objection_handling.integration_objection_handler",
+        "src.agents.revenue.sales.objection_handling.security_objection_handler",
+        "src.agents.revenue.sales.objection_handling.timing_objection_handler",
+        "src.agents.revenue.sales.objection_handling.feature_gap_handler",
+        # Deal Progression
+        "src.agents.revenue.sales.deal_progression.closer",
+        "src.agents.revenue.sales.deal_progression.trial_optimizer",
+        "src.agents.revenue.sales.deal_progression.proposal_generator",
+        "src.agents.revenue.sales.deal_progression.contract_negotiator",
+        "src.agents.revenue.sales.deal_progression.demo_scheduler",
+        "src.agents.revenue.sales.deal_progression.upsell_identifier",
+        # Competitive Intelligence
+        "src.agents.revenue.sales.competitive_intelligence.competitor_tracker",
+        "src.agents.revenue.sales.competitive_intelligence.feature_comparator",
+        "src.agents.revenue.sales.competitive_intelligence.pricing_analyzer",
+        "src.agents.revenue.sales.competitive_intelligence.migration_specialist",
+        "src.agents.revenue.sales.competitive_intelligence.positioning_advisor",
+        "src.agents.revenue.sales.competitive_intelligence.review_analyzer",
+        "src.agents.revenue.sales.competitive_intelligence.sentiment_tracker",
+    ],
+    # =========================================================================
+    # TIER 2: REVENUE - Customer Success Agents
+    # =========================================================================
+    "revenue_customer_success": [
+        # Health Monitoring
+        "src.agents.revenue.customer_success.health_monitoring.health_score",
+        "src.agents.revenue.customer_success.health_monitoring.engagement_tracker",
+        "src.agents.revenue.customer_success.health_monitoring.usage_analyzer",
+        "src.agents.revenue.customer_success.health_monitoring.risk_detector",
+        "src.agents.revenue.customer_success.health_monitoring.trend_analyzer",
+        # Onboarding
+        "src.agents.revenue.customer_success.onboarding.onboarding_coordinator",
+        "src.agents.revenue.customer_success.onboarding.setup_guide",
+        "src.agents.revenue.customer_success.onboarding.milestone_tracker",
+        "src.agents.revenue.customer_success.onboarding.integration_helper",
+        "src.agents.revenue.customer_success.onboarding.training_scheduler",
+        "src.agents.revenue.customer_success.onboarding.success_criteria_definer",
+        # Adoption
+        "src.agents.revenue.customer_success.adoption.feature_adoption",
+        "src.agents.revenue.customer_success.adoption.usage_optimizer",
+        "src.agents.revenue.customer_success.adoption.best_practice_advisor",
+        "src.agents.revenue.customer_success.adoption.workflow_consultant",
+        "src.agents.revenue.customer_success.adoption.power_user_identifier",
+        "src.agents.revenue.customer_success.adoption.adoption_gap_finder",
+        # Retention
+        "src.agents.revenue.customer_success.retention.renewal_manager",
+        "src.agents.revenue.customer_success.retention.churn_preventer",
+        "src.agents.revenue.customer_success.retention.win_back_specialist",
+        "src.agents.revenue.customer_success.retention.satisfaction_surveyor",
+        "src.agents.revenue.customer_success.retention.escalation_handler",
+        # Expansion
+        "src.agents.revenue.customer_success.expansion.upsell_identifier",
+        "src.agents.revenue.customer_success.expansion.cross_sell_advisor",
+        "src.agents.revenue.customer_success.expansion.growth_planner",
+        "src.agents.revenue.customer_success.expansion.roi_demonstrator",
+        "src.agents.revenue.customer_success.expansion.expansion_timing_advisor",
+        # Relationship
+        "src.agents.revenue.customer_success.relationship.account_manager",
+        "src.agents.revenue.customer_success.relationship.executive_sponsor",
+        "src.agents.revenue.customer_success.relationship.qbr_preparer",
+        "src.agents.revenue.customer_success.relationship.stakeholder_mapper",
+        "src.agents.revenue.customer_success.relationship.feedback_collector",
+        "src.agents.revenue.customer_success.relationship.advocate_developer",
+        "src.agents.revenue.customer_success.relationship.reference_builder",
+        "src.agents.revenue.customer_success.relationship.case_study_creator",
+    ],
+}
+
 # Track if agents have been loaded (prevent double loading)
 _agents_loaded = False
 
@@ -25,8 +194,8 @@ def load_all_agents():
     """
     Import all agent modules to trigger registration.
 
-    This function imports all agent packages, which triggers the
-    @AgentRegistry.register() decorators in each agent module.
+    Only needed when every agent class must be present in the registry at
+    once; normal lookups go through the manifest.
     """
     global _agents_loaded
 
@@ -39,200 +208,22 @@ def load_all_agents():
     loaded_count = 0
 
     try:
-        # =====================================================================
-        # TIER 1: ESSENTIAL - Routing Agents
-        # =====================================================================
-        routing_modules = [
-            "src.agents.essential.routing.meta_router",
-            "src.agents.essential.routing.support_domain_router",
-            "src.agents.essential.routing.sales_domain_router",
-            "src.agents.essential.routing.cs_domain_router",
-            "src.agents.essential.routing.intent_classifier",
-            "src.agents.essential.routing.entity_extractor",
-            "src.agents.essential.routing.sentiment_analyzer",
-            "src.agents.essential.routing.escalation_decider",
-            "src.agents.essential.routing.complexity_assessor",
-            "src.agents.essential.routing.context_injector",
-            "src.agents.essential.routing.coordinator",
-            "src.agents.essential.routing.handoff_manager",
-        ]
-        for module_name in routing_modules:
-            try:
-                importlib.import_module(module_name)
-                loaded_count += 1
-            except ImportError as e:
-                logger.debug("module_import_skipped", module=module_name, reason=str(e))
-
-        logger.debug("loaded_tier1_routing", count=loaded_count)
-
-        # =====================================================================
-        # TIER 1: ESSENTIAL - Support Specialists
-        # =====================================================================
-        support_modules = [
-            # Billing
-            "src.agents.essential.support.billing.upgrade_specialist",
-            "src.agents.essential.support.billing.refund_processor",
-            "src.agents.essential.support.billing.payment_troubleshooter",
-            "src.agents.essential.support.billing.invoice_generator",
-            "src.agents.essential.support.billing.pricing_explainer",
-            "src.agents.essential.support.billing.discount_negotiator",
-            "src.agents.essential.support.billing.downgrade_specialist",
-            # Technical
-            "src.agents.essential.support.technical.bug_triager",
-            "src.agents.essential.support.technical.crash_investigator",
-            "src.agents.essential.support.technical.sync_troubleshooter",
-            "src.agents.essential.support.technical.performance_optimizer",
-            "src.agents.essential.support.technical.login_specialist",
-            "src.agents.essential.support.technical.data_recovery_specialist",
-            "src.agents.essential.support.technical.browser_compatibility_specialist",
-            # Usage
-            "src.agents.essential.support.usage.feature_teacher",
-            "src.agents.essential.support.usage.onboarding_guide",
-            "src.agents.essential.support.usage.workflow_optimizer",
-            "src.agents.essential.support.usage.collaboration_expert",
-            "src.agents.essential.support.usage.export_specialist",
-            "src.agents.essential.support.usage.import_specialist",
-            # Integration
-            "src.agents.essential.support.integration.api_debugger",
-            "src.agents.essential.support.integration.webhook_troubleshooter",
-            "src.agents.essential.support.integration.oauth_specialist",
-            "src.agents.essential.support.integration.sdk_expert",
-            "src.agents.essential.support.integration.rate_limit_advisor",
-            # Account
-            "src.agents.essential.support.account.account_deletion_specialist",
-            "src.agents.essential.support.account.profile_manager",
-            "src.agents.essential.support.account.team_manager",
-            "src.agents.essential.support.account.permission_manager",
-            "src.agents.essential.support.account.security_advisor",
-            "src.agents.essential.support.account.sso_specialist",
-            "src.agents.essential.support.account.data_export_specialist",
-            "src.agents.essential.support.account.notification_configurator",
-            "src.agents.essential.support.account.audit_log_specialist",
-            "src.agents.essential.support.account.compliance_specialist",
-        ]
-        support_count = 0
-        for module_name in support_modules:
-            try:
-                importlib.import_module(module_name)
-                loaded_count += 1
-                support_count += 1
-            except ImportError as e:
-                logger.debug("module_import_skipped", module=module_name, reason=str(e))
-
-        logger.debug("loaded_tier1_support", count=support_count)
-
-        # =====================================================================
-        # TIER 2: REVENUE - Sales Agents
-        # =====================================================================
-        sales_modules = [
-            # Lead Qualification
-            "src.agents.revenue.sales.lead_qualification.inbound_qualifier",
-            "src.agents.revenue.sales.lead_qualification.bant_qualifier",
-            "src.agents.revenue.sales.lead_qualification.lead_scorer",
-            "src.agents.revenue.sales.lead_qualification.mql_to_sql_converter",
-            "src.agents.revenue.sales.lead_qualification.referral_detector",
-            "src.agents.revenue.sales.lead_qualification.disqualification_agent",
-            # Product Education
-            "src.agents.revenue.sales.product_education.feature_explainer",
-            "src.agents.revenue.sales.product_education.demo_preparer",
-            "src.agents.revenue.sales.product_education.use_case_matcher",
-            "src.agents.revenue.sales.product_education.roi_calculator",
-            "src.agents.revenue.sales.product_education.value_proposition",
-            # Objection Handling
-            "src.agents.revenue.sales.objection_handling.price_objection_handler",
-            "src.agents.revenue.sales.objection_handling.competitor_comparison_handler",
-            "src.agents.revenue.sales.objection_handling.integration_objection_handler",
-            "src.agents.revenue.sales.objection_handling.security_objection_handler",
-            "src.agents.revenue.sales.objection_handling.timing_objection_handler",
-            "src.agents.revenue.sales.objection_handling.feature_gap_handler",
-            # Deal Progression
-            "src.agents.revenue.sales.deal_progression.closer",
-            "src.agents.revenue.sales.deal_progression.trial_optimizer",
-            "src.agents.revenue.sales.deal_progression.proposal_generator",
-            "src.agents.revenue.sales.deal_progression.contract_negotiator",
-            "src.agents.revenue.sales.deal_progression.demo_scheduler",
-            "src.agents.revenue.sales.deal_progression.upsell_identifier",
-            # Competitive Intelligence
-            "src.agents.revenue.sales.competitive_intelligence.competitor_tracker",
-            "src.agents.revenue.sales.competitive_intelligence.feature_comparator",
-            "src.agents.revenue.sales.competitive_intelligence.pricing_analyzer",
-            "src.agents.revenue.sales.competitive_intelligence.migration_specialist",
-            "src.agents.revenue.sales.competitive_intelligence.positioning_advisor",
-            "src.agents.revenue.sales.competitive_intelligence.review_analyzer",
-            "src.agents.revenue.sales.competitive_intelligence.sentiment_tracker",
-        ]
-        sales_count = 0
-        for module_name in sales_modules:
-            try:
-                importlib.import_module(module_name)
-                loaded_count += 1
-                sales_count += 1
-            except ImportError as e:
-                logger.debug("module_import_skipped", module=module_name, reason=str(e))
-
-        logger.debug("loaded_tier2_sales", count=sales_count)
-
-        # =====================================================================
-        # TIER 2: REVENUE - Customer Success Agents
-        # =====================================================================
-        cs_modules = [
-            # Health Monitoring
-            "src.agents.revenue.customer_success.health_monitoring.health_score",
-            "src.agents.revenue.customer_success.health_monitoring.engagement_tracker",
-            "src.agents.revenue.customer_success.health_monitoring.usage_analyzer",
-            "src.agents.revenue.customer_success.health_monitoring.risk_detector",
-            "src.agents.revenue.customer_success.health_monitoring.trend_analyzer",
-            # Onboarding
-            "src.agents.revenue.customer_success.onboarding.onboarding_coordinator",
-            "src.agents.revenue.customer_success.onboarding.setup_guide",
-            "src.agents.revenue.customer_success.onboarding.milestone_tracker",
-            "src.agents.revenue.customer_success.onboarding.integration_helper",
-            "src.agents.revenue.customer_success.onboarding.training_scheduler",
-            "src.agents.revenue.customer_success.onboarding.success_criteria_definer",
-            # Adoption
-            "src.agents.revenue.customer_success.adoption.feature_adoption",
-            "src.agents.revenue.customer_success.adoption.usage_optimizer",
-            "src.agents.revenue.customer_success.adoption.best_practice_advisor",
-            "src.agents.revenue.customer_success.adoption.workflow_consultant",
-            "src.agents.revenue.customer_success.adoption.power_user_identifier",
-            "src.agents.revenue.customer_success.adoption.adoption_gap_finder",
-            # Retention
-            "src.agents.revenue.customer_success.retention.renewal_manager",
-            "src.agents.revenue.customer_success.retention.churn_preventer",
-            "src.agents.revenue.customer_success.retention.win_back_specialist",
-            "src.agents.revenue.customer_success.retention.satisfaction_surveyor",
-            "src.agents.revenue.customer_success.retention.escalation_handler",
-            # Expansion
-            "src.agents.revenue.customer_success.expansion.upsell_identifier",
-            "src.agents.revenue.customer_success.expansion.cross_sell_advisor",
-            "src.agents.revenue.customer_success.expansion.growth_planner",
-            "src.agents.revenue.customer_success.expansion.roi_demonstrator",
-            "src.agents.revenue.customer_success.expansion.expansion_timing_advisor",
-            # Relationship
-            "src.agents.revenue.customer_success.relationship.account_manager",
-            "src.agents.revenue.customer_success.relationship.executive_sponsor",
-            "src.agents.revenue.customer_success.relationship.qbr_preparer",
-            "src.agents.revenue.customer_success.relationship.stakeholder_mapper",
-            "src.agents.revenue.customer_success.relationship.feedback_collector",
-            "src.agents.revenue.customer_success.relationship.advocate_developer",
-            "src.agents.revenue.customer_success.relationship.reference_builder",
-            "src.agents.revenue.customer_success.relationship.case_study_creator",
-        ]
-        cs_count = 0
-        for module_name in cs_modules:
-            try:
-                importlib.import_module(module_name)
-                loaded_count += 1
-                cs_count += 1
-            except ImportError as e:
-                logger.debug("module_import_skipped", module=module_name, reason=str(e))
-
-        logger.debug("loaded_tier2_customer_success", count=cs_count)
+        for group, module_names in AGENT_MODULES.items():
+            group_count = 0
+            for module_name in module_names:
+                try:
+                    importlib.import_module(module_name)
+                    loaded_count += 1
+                    group_count += 1
+                except ImportError as e:
+                    logger.debug("module_import_skipped", module=module_name, reason=str(e))
+
+            logger.debug("loaded_agent_group", group=group, count=group_count)
 
         # Get final count from registry
         from src.services.infrastructure.agent_registry import AgentRegistry
 
-        total = len(AgentRegistry.list_agents())
+        total = len(AgentRegistry.get_loaded_agents())
         by_tier = AgentRegistry.get_tier_summary()
 
         logger.info("agents_loaded_successfully", total=total, by_tier=by_tier, modules_loaded=loaded_count)
@@ -245,5 +236,146 @@ def load_all_agents():
         raise
 
 
-# Auto-load on import
-load_all_agents()
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+
+class _ImportSimulator:
+    """
+    Replays what importing agent modules would register, without importing
+
+    Importing a module first runs its parent packages' __init__ files, and
+    several of those import whole sub-swarms. Top-level statements are
+    walked in source order, following imports of other src.agents modules,
+    so registrations (and which module wins a duplicate name) match a real
+    import.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.visited: set[str] = set()
+        self.manifest: dict[str, dict[str, Any]] = {}
+        self.group: str | None = None
+
+    def _source_path(self, module_name: str) -> Path | None:
+        base = self.root.joinpath(*module_name.split("."))
+        if (base / "__init__.py").exists():
+            return base / "__init__.py"
+        if base.with_suffix(".py").exists():
+            return base.with_suffix(".py")
+        return None
+
+    def visit(self, module_name: str) -> bool:
+        """Simulate importing a module. Returns False if it does not exist."""
+        if module_name in self.visited:
+            return True
+
+        path = self._source_path(module_name)
+        if path is None:
+            return False
+        self.visited.add(module_name)
+
+        package, _, _ = module_name.rpartition(".")
+        if package.startswith("src.agents"):
+            self.visit(package)
+
+        for node in ast.parse(path.read_text(encoding="utf-8")).body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    self._visit_if_agent_module(alias.name)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                self._visit_if_agent_module(node.module)
+                for alias in node.names:
+                    # "from package import submodule"
+                    submodule = f"{node.module}.{alias.name}"
+                    if self._source_path(submodule) is not None:
+                        self._visit_if_agent_module(submodule)
+            elif isinstance(node, ast.ClassDef):
+                for entry in _registrations(node):
+                    name = entry.pop("name")
+                    self.manifest[name] = {"module": module_name, "group": self.group, **entry}
+
+        return True
+
+    def _visit_if_agent_module(self, module_name: str) -> None:
+        if module_name.startswith("src.agents.") and module_name != "src.agents.loader":
+            self.visit(module_name)
+
+
+def _literal(node: ast.AST) -> Any:
+    return node.value if isinstance(node, ast.Constant) else None
+
+
+def _registrations(node: ast.ClassDef) -> list[dict[str, Any]]:
+    """Read @AgentRegistry.register(...) decorators on a class"""
+    found = []
+    for decorator in node.decorator_list:
+        if not (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr == "register"
+            and isinstance(decorator.func.value, ast.Name)
+            and decorator.func.value.id == "AgentRegistry"
+        ):
+            continue
+
+        kwargs = {kw.arg: _literal(kw.value) for kw in decorator.keywords}
+        name = _literal(decorator.args[0]) if decorator.args else kwargs.get("name")
+        if not isinstance(name, str):
+            raise ValueError(f"Non-literal agent name on class {node.name}")
+
+        found.append(
+            {
+                "name": name,
+                "class_name": node.name,
+                "tier": kwargs.get("tier"),
+                "category": kwargs.get("category"),
+            }
+        )
+    return found
+
+
+def build_manifest(root: Path | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Build the registration manifest for AGENT_MODULES without importing them
+
+    Args:
+        root: Project root containing the src/ package (defaults to this checkout)
+
+    Returns:
+        Mapping of agent name -> {"module", "class_name", "tier", "category", "group"},
+        where "group" is the AGENT_MODULES group whose loading first imports it
+    """
+    simulator = _ImportSimulator(root or Path(__file__).resolve().parents[2])
+
+    for group, module_names in AGENT_MODULES.items():
+        simulator.group = group
+        for module_name in module_names:
+            if not simulator.visit(module_name):
+                # Same as an ImportError in load_all_agents()
+                logger.debug("module_import_skipped", module=module_name, reason="not found")
+
+    return simulator.manifest
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> int:
+    """Generate the manifest and write it to disk. Returns the number of agents."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return len(manifest)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict[str, Any]] | None:
+    """
+    Read the manifest
+
+    Returns:
+        Manifest mapping, or None if it has not been generated
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning("agent_manifest_missing", path=str(path))
+        return None
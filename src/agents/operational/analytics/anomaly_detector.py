@@ -5,11 +5,19 @@ Detects anomalies in metrics using statistical methods (Z-score).
 Generates warnings for >2σ and critical alerts for >3σ deviations.
 """
 
-import math
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+
 from src.agents.base import AgentCapability, AgentConfig, AgentType, BaseAgent
+from src.agents.operational.analytics.timeseries import (
+    TimeSeries,
+    flatline_starts,
+    rate_changes,
+    summary_stats,
+    zscores,
+)
 from src.services.infrastructure.agent_registry import AgentRegistry
 from src.utils.logging.setup import get_logger
 from src.workflow.state import AgentState
@@ -35,6 +43,8 @@ class AnomalyDetectorAgent(BaseAgent):
     # Anomaly detection thresholds
     Z_SCORE_WARNING = 2.0
     Z_SCORE_CRITICAL = 3.0
+    RATE_Z_SCORE = 2.5
+    FLATLINE_WINDOW = 5
 
     # Anomaly types
     ANOMALY_TYPES = [
@@ -88,19 +98,22 @@ class AnomalyDetectorAgent(BaseAgent):
         # Adjust thresholds based on sensitivity
         z_warning, z_critical = self._get_thresholds(sensitivity)
 
+        # Convert once; every detector below works on the arrays
+        series = TimeSeries.from_points(time_series_data)
+
         # Calculate statistical baselines
-        statistics = self._calculate_statistics(time_series_data)
+        statistics = self._calculate_statistics(series)
 
         # Detect anomalies using Z-score
         z_score_anomalies = self._detect_z_score_anomalies(
-            time_series_data, statistics, z_warning, z_critical
+            series, statistics, z_warning, z_critical
         )
 
         # Detect rate of change anomalies
-        rate_anomalies = self._detect_rate_anomalies(time_series_data, statistics)
+        rate_anomalies = self._detect_rate_anomalies(series, statistics)
 
         # Detect pattern anomalies
-        pattern_anomalies = self._detect_pattern_anomalies(time_series_data)
+        pattern_anomalies = self._detect_pattern_anomalies(series)
 
         # Combine all anomalies
         all_anomalies = self._combine_anomalies(
@@ -158,64 +171,21 @@ class AnomalyDetectorAgent(BaseAgent):
         else:  # medium (default)
             return self.Z_SCORE_WARNING, self.Z_SCORE_CRITICAL
 
-    def _calculate_statistics(self, time_series_data: list[dict[str, Any]]) -> dict[str, Any]:
+    def _calculate_statistics(self, series: TimeSeries) -> dict[str, Any]:
         """
         Calculate statistical baselines for anomaly detection.
 
         Args:
-            time_series_data: Time series data points
+            series: Time series data
 
         Returns:
             Statistical measures
         """
-        if not time_series_data:
-            return {"count": 0, "mean": 0, "std_dev": 0, "min": 0, "max": 0, "median": 0}
-
-        # Extract values
-        values = [
-            point.get("value", 0)
-            for point in time_series_data
-            if isinstance(point.get("value"), (int, float))
-        ]
-
-        if not values:
-            return {"count": 0, "mean": 0, "std_dev": 0}
-
-        # Calculate basic statistics
-        count = len(values)
-        mean = sum(values) / count
-        variance = sum((x - mean) ** 2 for x in values) / count
-        std_dev = math.sqrt(variance)
-
-        # Calculate median
-        sorted_values = sorted(values)
-        mid = count // 2
-        median = (
-            sorted_values[mid] if count % 2 else (sorted_values[mid - 1] + sorted_values[mid]) / 2
-        )
-
-        # Calculate percentiles
-        p25_idx = int(count * 0.25)
-        p75_idx = int(count * 0.75)
-        p25 = sorted_values[p25_idx]
-        p75 = sorted_values[p75_idx]
-        iqr = p75 - p25
-
-        return {
-            "count": count,
-            "mean": round(mean, 2),
-            "std_dev": round(std_dev, 2),
-            "min": min(values),
-            "max": max(values),
-            "median": round(median, 2),
-            "p25": round(p25, 2),
-            "p75": round(p75, 2),
-            "iqr": round(iqr, 2),
-        }
+        return summary_stats(series.values)
 
     def _detect_z_score_anomalies(
         self,
-        time_series_data: list[dict[str, Any]],
+        series: TimeSeries,
         statistics: dict[str, Any],
         z_warning: float,
         z_critical: float,
@@ -224,7 +194,7 @@ class AnomalyDetectorAgent(BaseAgent):
         Detect anomalies using Z-score method.
 
         Args:
-            time_series_data: Time series data
+            series: Time series data
             statistics: Statistical measures
             z_warning: Warning threshold
             z_critical: Critical threshold
@@ -239,42 +209,36 @@ class AnomalyDetectorAgent(BaseAgent):
         if std_dev == 0:
             return anomalies  # No variation, no anomalies
 
-        for i, point in enumerate(time_series_data):
-            value = point.get("value")
-            if not isinstance(value, (int, float)):
-                continue
-
-            # Calculate Z-score
-            z_score = abs((value - mean) / std_dev)
-
-            if z_score >= z_warning:
-                severity = "critical" if z_score >= z_critical else "warning"
-                anomaly_type = "spike" if value > mean else "drop"
-
-                anomalies.append(
-                    {
-                        "index": i,
-                        "timestamp": point.get("timestamp", "unknown"),
-                        "value": value,
-                        "expected_value": mean,
-                        "deviation": round(value - mean, 2),
-                        "z_score": round(z_score, 2),
-                        "severity": severity,
-                        "type": anomaly_type,
-                        "method": "z_score",
-                    }
-                )
+        z_scores = zscores(series.values, mean, std_dev)
+
+        for i in np.flatnonzero(z_scores >= z_warning).tolist():
+            value = series.value_at(i)
+            z_score = float(z_scores[i])
+
+            anomalies.append(
+                {
+                    "index": i,
+                    "timestamp": series.timestamps[i],
+                    "value": value,
+                    "expected_value": mean,
+                    "deviation": round(value - mean, 2),
+                    "z_score": round(z_score, 2),
+                    "severity": "critical" if z_score >= z_critical else "warning",
+                    "type": "spike" if value > mean else "drop",
+                    "method": "z_score",
+                }
+            )
 
         return anomalies
 
     def _detect_rate_anomalies(
-        self, time_series_data: list[dict[str, Any]], statistics: dict[str, Any]
+        self, series: TimeSeries, statistics: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """
         Detect anomalies in rate of change.
 
         Args:
-            time_series_data: Time series data
+            series: Time series data
             statistics: Statistical measures
 
         Returns:
@@ -282,68 +246,44 @@ class AnomalyDetectorAgent(BaseAgent):
         """
         anomalies = []
 
-        if len(time_series_data) < 2:
-            return anomalies
-
-        # Calculate rate of change for all points
-        rates = []
-        for i in range(1, len(time_series_data)):
-            prev_val = time_series_data[i - 1].get("value", 0)
-            curr_val = time_series_data[i].get("value", 0)
-
-            if (
-                isinstance(prev_val, (int, float))
-                and isinstance(curr_val, (int, float))
-                and prev_val != 0
-            ):
-                rate = ((curr_val - prev_val) / abs(prev_val)) * 100
-                rates.append(rate)
-            else:
-                rates.append(0)
-
-        if not rates:
+        # Percent change between consecutive points (0 across gaps and zeros)
+        rates = rate_changes(series.values)
+        if not len(rates):
             return anomalies
 
-        # Calculate rate statistics
-        mean_rate = sum(rates) / len(rates)
-        rate_variance = sum((r - mean_rate) ** 2 for r in rates) / len(rates)
-        rate_std_dev = math.sqrt(rate_variance)
+        mean_rate = float(rates.mean())
+        rate_std_dev = float(rates.std())
 
         if rate_std_dev == 0:
             return anomalies
 
-        # Detect rate anomalies
-        for i, rate in enumerate(rates):
-            z_score = abs((rate - mean_rate) / rate_std_dev)
-
-            if z_score >= 2.5:  # Rate anomaly threshold
-                point_idx = i + 1
-                point = time_series_data[point_idx]
-
-                anomalies.append(
-                    {
-                        "index": point_idx,
-                        "timestamp": point.get("timestamp", "unknown"),
-                        "value": point.get("value"),
-                        "rate_of_change": round(rate, 2),
-                        "expected_rate": round(mean_rate, 2),
-                        "z_score": round(z_score, 2),
-                        "severity": "warning",
-                        "type": "trend_change",
-                        "method": "rate_of_change",
-                    }
-                )
+        rate_z_scores = zscores(rates, mean_rate, rate_std_dev)
+
+        for i in np.flatnonzero(rate_z_scores >= self.RATE_Z_SCORE).tolist():
+            point_idx = i + 1
+
+            anomalies.append(
+                {
+                    "index": point_idx,
+                    "timestamp": series.timestamps[point_idx],
+                    "value": series.value_at(point_idx),
+                    "rate_of_change": round(float(rates[i]), 2),
+                    "expected_rate": round(mean_rate, 2),
+                    "z_score": round(float(rate_z_scores[i]), 2),
+                    "severity": "warning",
+                    "type": "trend_change",
+                    "method": "rate_of_change",
+                }
+            )
 
         return anomalies
 
-    def _detect_pattern_anomalies(
-        self, time_series_data: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
+    def _detect_pattern_anomalies(self, series: TimeSeries) -> list[dict[str, Any]]:
         """
         Detect pattern-based anomalies.
 
         Args:
-            time_series_data: Time series data
+            series: Time series data
 
         Returns:
             List of pattern anomalies
@@ -351,41 +291,32 @@ class AnomalyDetectorAgent(BaseAgent):
         anomalies = []
 
         # Check for flatlines (no variation over period)
-        if len(time_series_data) >= 5:
-            for i in range(len(time_series_data) - 4):
-                window = time_series_data[i : i + 5]
-                values = [
-                    p.get("value") for p in window if isinstance(p.get("value"), (int, float))
-                ]
-
-                if len(values) == 5 and len(set(values)) == 1:
-                    # All values are identical
-                    anomalies.append(
-                        {
-                            "index": i,
-                            "timestamp": window[0].get("timestamp", "unknown"),
-                            "value": values[0],
-                            "severity": "warning",
-                            "type": "flatline",
-                            "method": "pattern",
-                            "message": "No variation detected over 5 consecutive points",
-                        }
-                    )
+        for i in flatline_starts(series.values, self.FLATLINE_WINDOW).tolist():
+            anomalies.append(
+                {
+                    "index": i,
+                    "timestamp": series.timestamps[i],
+                    "value": series.value_at(i),
+                    "severity": "warning",
+                    "type": "flatline",
+                    "method": "pattern",
+                    "message": "No variation detected over 5 consecutive points",
+                }
+            )
 
         # Check for missing data patterns
-        if len(time_series_data) >= 2:
-            for i, point in enumerate(time_series_data):
-                if point.get("value") is None or point.get("value") == "":
-                    anomalies.append(
-                        {
-                            "index": i,
-                            "timestamp": point.get("timestamp", "unknown"),
-                            "value": None,
-                            "severity": "warning",
-                            "type": "missing_data",
-                            "method": "pattern",
-                        }
-                    )
+        if len(series) >= 2:
+            for i in np.flatnonzero(series.missing).tolist():
+                anomalies.append(
+                    {
+                        "index": i,
+                        "timestamp": series.timestamps[i],
+                        "value": None,
+                        "severity": "warning",
+                        "type": "missing_data",
+                        "method": "pattern",
+                    }
+                )
 
         return anomalies
 
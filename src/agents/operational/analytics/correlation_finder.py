@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from src.agents.base import AgentCapability, AgentConfig, AgentType, BaseAgent
+from src.agents.operational.analytics.timeseries import correlate, pearson
 from src.services.infrastructure.agent_registry import AgentRegistry
 from src.utils.logging.setup import get_logger
 from src.workflow.state import AgentState
@@ -173,24 +174,22 @@ class CorrelationFinderAgent(BaseAgent):
         """
         Calculate Pearson correlation matrix.
 
+        All pairs are computed at once as a matrix product over the
+        normalized series (see timeseries.correlate).
+
         Args:
             metric_series: Metric time series
 
         Returns:
             Correlation matrix
         """
-        matrix = {}
-        metric_names = list(metric_series.keys())
-
-        for metric1 in metric_names:
-            matrix[metric1] = {}
-            for metric2 in metric_names:
-                correlation = self._calculate_pearson_correlation(
-                    metric_series[metric1], metric_series[metric2]
-                )
-                matrix[metric1][metric2] = round(correlation, 4)
+        metric_names, correlations = correlate(metric_series)
+        rows = correlations.round(4).tolist()
 
-        return matrix
+        return {
+            metric1: dict(zip(metric_names, row, strict=True))
+            for metric1, row in zip(metric_names, rows, strict=True)
+        }
 
     def _calculate_pearson_correlation(self, x: list[float], y: list[float]) -> float:
         """
@@ -203,27 +202,7 @@ class CorrelationFinderAgent(BaseAgent):
         Returns:
             Correlation coefficient (-1 to 1)
         """
-        if len(x) != len(y) or len(x) == 0:
-            return 0.0
-
-        n = len(x)
-
-        # Calculate means
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
-
-        # Calculate covariance and standard deviations
-        covariance = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        std_x = math.sqrt(sum((x[i] - mean_x) ** 2 for i in range(n)))
-        std_y = math.sqrt(sum((y[i] - mean_y) ** 2 for i in range(n)))
-
-        # Calculate correlation
-        if std_x == 0 or std_y == 0:
-            return 0.0
-
-        correlation = covariance / (std_x * std_y)
-
-        return correlation
+        return pearson(x, y)
 
     def _find_significant_correlations(
         self, correlation_matrix: dict[str, dict[str, float]], threshold: float, include_weak: bool
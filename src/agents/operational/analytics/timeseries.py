@@ -0,0 +1,213 @@
+"""
+Time Series - Array-backed statistics shared by the analytics agents
+
+The analytics agents receive metrics as lists of {"timestamp", "value"}
+dicts. TimeSeries converts such a list to NumPy arrays once; the functions
+below then compute summary statistics, z-scores, rate changes, rolling
+windows, linear fits and correlation matrices without Python-level loops
+over the points.
+
+Non-numeric values (None, "", strings) become NaN: they are excluded from
+statistics but keep their position, so anomaly indices still refer to the
+original points.
+
+Example:
+    series = TimeSeries.from_points(time_series_data)
+    stats = summary_stats(series.values)
+    outliers = np.flatnonzero(zscores(series.values, stats["mean"], stats["std_dev"]) >= 3)
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@dataclass(frozen=True)
+class TimeSeries:
+    """A metric's points as arrays"""
+
+    values: np.ndarray  # float64, NaN where the point has no numeric value
+    missing: np.ndarray  # bool, value is None or ""
+    timestamps: list[Any]
+
+    @classmethod
+    def from_points(cls, points: Sequence[dict[str, Any]]) -> "TimeSeries":
+        """Convert [{"timestamp": ..., "value": ...}, ...] (one pass over the points)"""
+        raw = [point.get("value") for point in points]
+        values = np.fromiter(
+            (v if isinstance(v, (int, float)) else np.nan for v in raw),
+            dtype=np.float64,
+            count=len(raw),
+        )
+        missing = np.fromiter((v is None or v == "" for v in raw), dtype=bool, count=len(raw))
+        timestamps = [point.get("timestamp", "unknown") for point in points]
+        return cls(values=values, missing=missing, timestamps=timestamps)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def numeric(self) -> np.ndarray:
+        """Numeric values only, in order"""
+        return self.values[~np.isnan(self.values)]
+
+    def value_at(self, index: int) -> float | None:
+        """Value of one point (None if it is not numeric)"""
+        value = float(self.values[index])
+        return None if np.isnan(value) else value
+
+
+def summary_stats(values: np.ndarray) -> dict[str, Any]:
+    """
+    Count, mean, population std dev, min, max, median and quartiles
+
+    Args:
+        values: Values (NaNs are ignored)
+
+    Returns:
+        Statistics rounded to 2 decimals (all zero for no values)
+    """
+    values = values[~np.isnan(values)]
+    count = len(values)
+    if not count:
+        return {"count": 0, "mean": 0, "std_dev": 0, "min": 0, "max": 0, "median": 0}
+
+    sorted_values = np.sort(values)
+    p25 = float(sorted_values[int(count * 0.25)])
+    p75 = float(sorted_values[int(count * 0.75)])
+
+    return {
+        "count": count,
+        "mean": round(float(values.mean()), 2),
+        "std_dev": round(float(values.std()), 2),
+        "min": float(sorted_values[0]),
+        "max": float(sorted_values[-1]),
+        "median": round(float(np.median(sorted_values)), 2),
+        "p25": round(p25, 2),
+        "p75": round(p75, 2),
+        "iqr": round(p75 - p25, 2),
+    }
+
+
+def zscores(values: np.ndarray, mean: float, std_dev: float) -> np.ndarray:
+    """Absolute z-score of every value (NaN stays NaN; std_dev must be non-zero)"""
+    return np.abs(values - mean) / std_dev
+
+
+def rate_changes(values: np.ndarray) -> np.ndarray:
+    """
+    Percent change from each point to the next
+
+    Returns:
+        Array of len(values) - 1; 0 where either point is not numeric or
+        the previous value is 0
+    """
+    if len(values) < 2:
+        return np.zeros(0)
+
+    prev, curr = values[:-1], values[1:]
+    valid = ~np.isnan(prev) & ~np.isnan(curr) & (prev != 0)
+    rates = np.zeros(len(prev))
+    np.divide(curr - prev, np.abs(prev), out=rates, where=valid)
+    return rates * 100
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of each full window (len(values) - window + 1 entries; NaN if a window has gaps)"""
+    if len(values) < window:
+        return np.zeros(0)
+    return sliding_window_view(values, window).mean(axis=1)
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Population std dev of each full window (see rolling_mean)"""
+    if len(values) < window:
+        return np.zeros(0)
+    return sliding_window_view(values, window).std(axis=1)
+
+
+def flatline_starts(values: np.ndarray, window: int = 5) -> np.ndarray:
+    """Start indices of windows whose values are all numeric and identical"""
+    if len(values) < window:
+        return np.zeros(0, dtype=np.intp)
+    same = values[1:] == values[:-1]  # NaN never equals, so gaps break a run
+    return np.flatnonzero(sliding_window_view(same, window - 1).all(axis=1))
+
+
+def linear_fit(values: np.ndarray) -> tuple[float, float, float]:
+    """
+    Least-squares line through (index, value)
+
+    Returns:
+        (slope, intercept, r_squared); slope and r_squared are 0 when
+        undefined (fewer than 2 points, or no variance)
+    """
+    n = len(values)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+
+    y_mean = float(values.mean())
+    dx = np.arange(n, dtype=np.float64) - (n - 1) / 2
+    dy = values - y_mean
+
+    denominator = float(dx @ dx)
+    slope = float(dx @ dy) / denominator if denominator else 0.0
+
+    ss_tot = float(dy @ dy)
+    residuals = dy - slope * dx
+    r_squared = 1 - float(residuals @ residuals) / ss_tot if ss_tot else 0.0
+
+    return slope, y_mean - slope * (n - 1) / 2, r_squared
+
+
+def correlation_matrix(data: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation between every pair of rows
+
+    Args:
+        data: 2-D array, one series per row
+
+    Returns:
+        Symmetric matrix; 0 for pairs involving a row without variance
+    """
+    centered = data - data.mean(axis=1, keepdims=True)
+    norms = np.sqrt(np.einsum("ij,ij->i", centered, centered))
+    scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms != 0)
+    normalized = centered * scale[:, None]
+    return np.clip(normalized @ normalized.T, -1.0, 1.0)
+
+
+def correlate(series: Mapping[str, Sequence[float]]) -> tuple[list[str], np.ndarray]:
+    """
+    Correlation matrix of named series
+
+    Series are correlated with the others of the same length; pairs of
+    different lengths (and empty series) get 0.
+
+    Returns:
+        (names, matrix) with matrix[i, j] the correlation of names[i] and names[j]
+    """
+    names = list(series)
+    matrix = np.zeros((len(names), len(names)))
+
+    by_length: dict[int, list[int]] = {}
+    for i, name in enumerate(names):
+        by_length.setdefault(len(series[name]), []).append(i)
+
+    for length, indices in by_length.items():
+        if length == 0:
+            continue
+        data = np.array([series[names[i]] for i in indices], dtype=np.float64)
+        matrix[np.ix_(indices, indices)] = correlation_matrix(data)
+
+    return names, matrix
+
+
+def pearson(x: Sequence[float], y: Sequence[float]) -> float:
+    """Pearson correlation of two series (0 if lengths differ, empty, or no variance)"""
+    if len(x) != len(y) or len(x) == 0:
+        return 0.0
+    return float(correlation_matrix(np.array([x, y], dtype=np.float64))[0, 1])
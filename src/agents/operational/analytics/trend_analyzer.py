@@ -8,7 +8,10 @@ Identifies seasonality patterns and growth trajectories.
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+
 from src.agents.base import AgentCapability, AgentConfig, AgentType, BaseAgent
+from src.agents.operational.analytics.timeseries import TimeSeries, linear_fit
 from src.services.infrastructure.agent_registry import AgentRegistry
 from src.utils.logging.setup import get_logger
 from src.workflow.state import AgentState
@@ -82,22 +85,25 @@ class TrendAnalyzerAgent(BaseAgent):
             analysis_types=analysis_types,
         )
 
+        # Convert once; the analyses below work on the arrays
+        series = TimeSeries.from_points(time_series_data)
+
         # Perform trend analyses
         trend_results = {}
         for analysis_type in analysis_types:
             if analysis_type in self.TREND_TYPES:
-                trend_results[analysis_type] = self._analyze_trend(time_series_data, analysis_type)
+                trend_results[analysis_type] = self._analyze_trend(series, analysis_type)
 
         # Detect seasonality if requested
         seasonality = None
         if detect_seasonality:
-            seasonality = self._detect_seasonality(time_series_data)
+            seasonality = self._detect_seasonality(series)
 
         # Calculate growth trajectory
-        growth_trajectory = self._calculate_growth_trajectory(time_series_data)
+        growth_trajectory = self._calculate_growth_trajectory(series)
 
         # Generate trend forecast
-        forecast = self._generate_forecast(time_series_data, growth_trajectory)
+        forecast = self._generate_forecast(series, growth_trajectory)
 
         # Identify significant trends
         significant_trends = self._identify_significant_trends(trend_results)
@@ -126,20 +132,18 @@ class TrendAnalyzerAgent(BaseAgent):
 
         return state
 
-    def _analyze_trend(
-        self, time_series_data: list[dict[str, Any]], analysis_type: str
-    ) -> dict[str, Any]:
+    def _analyze_trend(self, series: TimeSeries, analysis_type: str) -> dict[str, Any]:
         """
         Analyze trend for a specific period.
 
         Args:
-            time_series_data: Time series data
+            series: Time series data
             analysis_type: Type of analysis (wow, mom, yoy)
 
         Returns:
             Trend analysis results
         """
-        if not time_series_data or len(time_series_data) < 2:
+        if len(series) < 2:
             return {
                 "type": analysis_type,
                 "status": "insufficient_data",
@@ -151,14 +155,11 @@ class TrendAnalyzerAgent(BaseAgent):
         period_config["period_days"]
 
         # Extract latest values
-        latest_values = [
-            p.get("value", 0)
-            for p in time_series_data[-7:]
-            if isinstance(p.get("value"), (int, float))
-        ]
+        latest_values = series.values[-7:]
+        latest_values = latest_values[~np.isnan(latest_values)]
 
         # For mock data, simulate period comparison
-        current_avg = sum(latest_values) / len(latest_values) if latest_values else 0
+        current_avg = float(latest_values.mean()) if latest_values.size else 0
 
         # Simulate previous period (in production, query historical data)
         import random
@@ -198,17 +199,17 @@ class TrendAnalyzerAgent(BaseAgent):
             else "neutral",
         }
 
-    def _detect_seasonality(self, time_series_data: list[dict[str, Any]]) -> dict[str, Any] | None:
+    def _detect_seasonality(self, series: TimeSeries) -> dict[str, Any] | None:
         """
         Detect seasonality patterns in data.
 
         Args:
-            time_series_data: Time series data
+            series: Time series data
 
         Returns:
             Seasonality analysis or None
         """
-        if len(time_series_data) < 14:  # Need at least 2 weeks
+        if len(series) < 14:  # Need at least 2 weeks
             return None
 
         # Mock seasonality detection - in production, use FFT or autocorrelation
@@ -252,19 +253,17 @@ class TrendAnalyzerAgent(BaseAgent):
         }
         return patterns.get(pattern_type, [])
 
-    def _calculate_growth_trajectory(
-        self, time_series_data: list[dict[str, Any]]
-    ) -> dict[str, Any]:
+    def _calculate_growth_trajectory(self, series: TimeSeries) -> dict[str, Any]:
         """
         Calculate overall growth trajectory.
 
         Args:
-            time_series_data: Time series data
+            series: Time series data
 
         Returns:
             Growth trajectory analysis
         """
-        if len(time_series_data) < 2:
+        if len(series) < 2:
             return {
                 "status": "insufficient_data",
                 "trajectory": "unknown",
@@ -275,11 +274,9 @@ class TrendAnalyzerAgent(BaseAgent):
             }
 
         # Extract values
-        values = [
-            p.get("value", 0) for p in time_series_data if isinstance(p.get("value"), (int, float))
-        ]
+        values = series.numeric
 
-        if not values:
+        if not values.size:
             return {
                 "status": "no_data",
                 "trajectory": "unknown",
@@ -290,24 +287,9 @@ class TrendAnalyzerAgent(BaseAgent):
             }
 
         # Calculate simple linear regression
-        n = len(values)
-        x = list(range(n))
-        y = values
-
-        # Calculate slope
-        x_mean = sum(x) / n
-        y_mean = sum(y) / n
-
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-
-        slope = numerator / denominator if denominator != 0 else 0
-
-        # Calculate R-squared
-        y_pred = [slope * xi + (y_mean - slope * x_mean) for xi in x]
-        ss_res = sum((y[i] - y_pred[i]) ** 2 for i in range(n))
-        ss_tot = sum((y[i] - y_mean) ** 2 for i in range(n))
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+        slope, _, r_squared = linear_fit(values)
+        y_mean = float(values.mean())
+        start_value, end_value = float(values[0]), float(values[-1])
 
         # Determine trajectory
         if slope > y_mean * 0.01:  # >1% growth per period
@@ -318,9 +300,9 @@ class TrendAnalyzerAgent(BaseAgent):
             trajectory = "stable"
 
         # Calculate CAGR (Compound Annual Growth Rate)
-        if len(values) >= 2 and values[0] > 0:
+        if len(values) >= 2 and start_value > 0:
             periods = len(values) - 1
-            cagr = ((values[-1] / values[0]) ** (1 / periods) - 1) * 100
+            cagr = ((end_value / start_value) ** (1 / periods) - 1) * 100
         else:
             cagr = 0
 
@@ -329,39 +311,37 @@ class TrendAnalyzerAgent(BaseAgent):
             "slope": round(slope, 4),
             "r_squared": round(r_squared, 3),
             "cagr": round(cagr, 2),
-            "start_value": values[0],
-            "end_value": values[-1],
-            "total_change": round(values[-1] - values[0], 2),
+            "start_value": start_value,
+            "end_value": end_value,
+            "total_change": round(end_value - start_value, 2),
             "total_change_pct": round(
-                ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0, 2
+                ((end_value - start_value) / start_value * 100) if start_value != 0 else 0, 2
             ),
             "fit_quality": "good" if r_squared > 0.7 else "moderate" if r_squared > 0.4 else "poor",
         }
 
     def _generate_forecast(
-        self, time_series_data: list[dict[str, Any]], growth_trajectory: dict[str, Any]
+        self, series: TimeSeries, growth_trajectory: dict[str, Any]
     ) -> dict[str, Any]:
         """
         Generate simple trend-based forecast.
 
         Args:
-            time_series_data: Historical data
+            series: Historical data
             growth_trajectory: Growth trajectory analysis
 
         Returns:
             Forecast data
         """
-        if not time_series_data or growth_trajectory.get("status") == "insufficient_data":
+        if not len(series) or growth_trajectory.get("status") == "insufficient_data":
             return {"status": "unavailable", "message": "Insufficient data for forecasting"}
 
         # Get current value
-        values = [
-            p.get("value", 0) for p in time_series_data if isinstance(p.get("value"), (int, float))
-        ]
-        if not values:
+        values = series.numeric
+        if not values.size:
             return {"status": "no_data"}
 
-        current_value = values[-1]
+        current_value = float(values[-1])
         slope = growth_trajectory.get("slope", 0)
 
         # Forecast next 3 periods
@@ -6,12 +6,12 @@ passwords, API keys, email addresses, and phone numbers.
 Uses pattern matching and Claude Sonnet for contextual PII detection.
 """
 
-import re
 from datetime import UTC, datetime
 from typing import Any
 
 from src.agents.base import AgentCapability, AgentConfig, AgentType, BaseAgent
 from src.services.infrastructure.agent_registry import AgentRegistry
+from src.utils import pii_scanner
 from src.utils.logging.setup import get_logger
 from src.workflow.state import AgentState
 
@@ -36,33 +36,9 @@ class PIIDetectorAgent(BaseAgent):
     Audit: Logs all PII detections for compliance
     """
 
-    # PII patterns (regex)
-    PII_PATTERNS = {
-        "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b|\b\d{9}\b"),
-        "credit_card": re.compile(r"\b(?:\d{4}[-\s]?){3}\d{4}\b"),
-        "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
-        "phone": re.compile(r"\b(?:\+?1[-.]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"),
-        "ip_address": re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"),
-        "api_key": re.compile(r"\b[A-Za-z0-9]{32,}\b"),
-        "password": re.compile(r"(?:password|pwd|pass)\s*[:=]\s*[^\s]+", re.IGNORECASE),
-        "address": re.compile(
-            r"\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)\b", re.IGNORECASE
-        ),
-        "zipcode": re.compile(r"\b\d{5}(?:-\d{4})?\b"),
-    }
-
-    # PII sensitivity levels
-    SENSITIVITY_LEVELS = {
-        "ssn": "critical",
-        "credit_card": "critical",
-        "password": "critical",
-        "api_key": "critical",
-        "email": "high",
-        "phone": "high",
-        "address": "medium",
-        "ip_address": "medium",
-        "zipcode": "low",
-    }
+    # PII patterns and sensitivity levels (scanned in one pass, see src/utils/pii_scanner.py)
+    PII_PATTERNS = pii_scanner.COMPILED_PATTERNS
+    SENSITIVITY_LEVELS = pii_scanner.SENSITIVITY_LEVELS
 
     def __init__(self):
         config = AgentConfig(
@@ -163,54 +139,16 @@ class PIIDetectorAgent(BaseAgent):
 
     def _detect_pii(self, content: str, sensitivity_threshold: str) -> list[dict[str, Any]]:
         """
-        Detect PII in content using pattern matching.
+        Detect PII in content with a single pass of the combined pattern.
 
         Args:
             content: Content to scan
             sensitivity_threshold: Minimum sensitivity level to detect
 
         Returns:
-            List of PII detections
+            List of PII detections, sorted by position
         """
-        detections = []
-        threshold_levels = ["critical", "high", "medium", "low"]
-        min_threshold_index = threshold_levels.index(sensitivity_threshold)
-
-        for pii_type, pattern in self.PII_PATTERNS.items():
-            sensitivity = self.SENSITIVITY_LEVELS.get(pii_type, "low")
-            sensitivity_index = threshold_levels.index(sensitivity)
-
-            # Skip if below threshold
-            if sensitivity_index < min_threshold_index:
-                continue
-
-            matches = pattern.finditer(content)
-            for match in matches:
-                detection = {
-                    "type": pii_type,
-                    "value": match.group(0),
-                    "start_position": match.start(),
-                    "end_position": match.end(),
-                    "sensitivity": sensitivity,
-                    "detected_at": datetime.now(UTC).isoformat(),
-                    "redaction_token": f"[REDACTED:{pii_type.upper()}]",
-                }
-
-                # Add validation for specific types
-                if pii_type == "credit_card":
-                    detection["validated"] = self._validate_credit_card(match.group(0))
-                elif pii_type == "ssn":
-                    detection["validated"] = self._validate_ssn(match.group(0))
-                else:
-                    detection["validated"] = True
-
-                if detection["validated"]:
-                    detections.append(detection)
-
-        # Sort by position
-        detections.sort(key=lambda x: x["start_position"])
-
-        return detections
+        return pii_scanner.detect_pii(content, sensitivity_threshold)
 
     def _validate_credit_card(self, card_number: str) -> bool:
         """
@@ -222,25 +160,7 @@ class PIIDetectorAgent(BaseAgent):
         Returns:
             True if valid, False otherwise
         """
-        # Remove spaces and hyphens
-        digits = re.sub(r"[\s-]", "", card_number)
-
-        if not digits.isdigit() or len(digits) < 13 or len(digits) > 19:
-            return False
-
-        # Luhn algorithm
-        total = 0
-        reverse_digits = digits[::-1]
-
-        for i, digit in enumerate(reverse_digits):
-            n = int(digit)
-            if i % 2 == 1:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            total += n
-
-        return total % 10 == 0
+        return pii_scanner.validate_credit_card(card_number)
 
     def _validate_ssn(self, ssn: str) -> bool:
         """
@@ -252,28 +172,7 @@ class PIIDetectorAgent(BaseAgent):
         Returns:
             True if valid format, False otherwise
         """
-        # Remove hyphens
-        digits = re.sub(r"-", "", ssn)
-
-        if len(digits) != 9:
-            return False
-
-        # Check for invalid SSNs
-        invalid_ssns = [
-            "000000000",
-            "111111111",
-            "222222222",
-            "333333333",
-            "444444444",
-            "555555555",
-            "666666666",
-            "777777777",
-            "888888888",
-            "999999999",
-            "123456789",
-        ]
-
-        return digits not in invalid_ssns
+        return pii_scanner.validate_ssn(ssn)
 
     def _redact_pii(
         self, content: str, detections: list[dict[str, Any]], redaction_mode: str
@@ -289,32 +188,7 @@ class PIIDetectorAgent(BaseAgent):
         Returns:
             Redacted content
         """
-        if not detections:
-            return content
-
-        redacted = content
-
-        # Process in reverse order to maintain positions
-        for detection in reversed(detections):
-            start = detection["start_position"]
-            end = detection["end_position"]
-            value = detection["value"]
-
-            if redaction_mode == "full":
-                # Full redaction
-                replacement = detection["redaction_token"]
-            elif redaction_mode == "partial":
-                # Partial redaction (show last 4 digits for some types)
-                if detection["type"] in ["credit_card", "ssn"]:
-                    replacement = f"***-{value[-4:]}"
-                else:
-                    replacement = detection["redaction_token"]
-            else:  # hash mode
-                replacement = f"[HASH:{hash(value) % 10000:04d}]"
-
-            redacted = redacted[:start] + replacement + redacted[end:]
-
-        return redacted
+        return pii_scanner.redact_pii(content, detections, redaction_mode)
 
     def _generate_audit_log(self, detections: list[dict[str, Any]]) -> dict[str, Any]:
         """
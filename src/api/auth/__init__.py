@@ -25,7 +25,10 @@ from src.api.auth.permissions import (
     require_scopes,
 )
 from src.api.auth.redis_client import (
+    LocalRateLimiter,
+    RateLimitDecision,
     RateLimiter,
+    RateLimitWindow,
     SessionCache,
     TokenBlacklist,
     close_redis_client,
@@ -39,10 +42,13 @@ __all__ = [
     "APIKeyManager",
     # JWT
     "JWTManager",
+    "LocalRateLimiter",
     # Passwords
     "PasswordManager",
     # Permissions
     "PermissionScope",
+    "RateLimitDecision",
+    "RateLimitWindow",
     "RateLimiter",
     "SessionCache",
     "TokenBlacklist",
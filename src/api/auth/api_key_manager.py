@@ -5,8 +5,14 @@ This module provides utilities for generating and validating API keys
 for programmatic authentication.
 """
 
+import asyncio
+import hashlib
+import hmac
 import secrets
+import time
 from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+from uuid import UUID
 
 from passlib.context import CryptContext
 
@@ -21,6 +27,79 @@ settings = get_settings()
 api_key_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
 
+class _VerifiedKey(NamedTuple):
+    key_id: UUID
+    key_hash: str
+    expires: float
+
+
+class VerifiedKeyCache:
+    """
+    Short-lived cache of API keys that passed bcrypt verification.
+
+    A bcrypt verify at 12 rounds costs a few hundred milliseconds of CPU,
+    and integrations present the same key on every call. Entries are keyed
+    by an HMAC-SHA256 of the presented key (with a per-process random
+    secret), so the plain key is never held and a fingerprint is useless
+    outside this process.
+
+    A hit only proves that the presented key matches the stored hash it
+    was checked against: the caller still loads the key row and checks it
+    is active, unexpired and not deleted. Rotation changes the stored hash
+    and so misses the entry; revoke/rotate also call invalidate() to drop
+    it immediately.
+    """
+
+    TTL_SECONDS = 60
+    MAX_ENTRIES = 10_000
+
+    def __init__(self, ttl_seconds: float = TTL_SECONDS, max_entries: int = MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._secret = secrets.token_bytes(32)
+        self._entries: dict[str, _VerifiedKey] = {}
+
+    def _fingerprint(self, plain_key: str) -> str:
+        return hmac.new(self._secret, plain_key.encode(), hashlib.sha256).hexdigest()
+
+    def is_verified(self, plain_key: str, key_id: UUID, key_hash: str) -> bool:
+        """Whether plain_key was recently verified against this key's current hash"""
+        fingerprint = self._fingerprint(plain_key)
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return False
+        if entry.expires <= time.monotonic():
+            del self._entries[fingerprint]
+            return False
+        return entry.key_id == key_id and hmac.compare_digest(entry.key_hash, key_hash)
+
+    def add(self, plain_key: str, key_id: UUID, key_hash: str) -> None:
+        """Remember a successful verification for ttl_seconds"""
+        if len(self._entries) >= self.max_entries:
+            # Drop the oldest entry (dicts keep insertion order)
+            del self._entries[next(iter(self._entries))]
+        self._entries[self._fingerprint(plain_key)] = _VerifiedKey(
+            key_id, key_hash, time.monotonic() + self.ttl_seconds
+        )
+
+    def invalidate(self, key_id: UUID) -> None:
+        """Forget every verification of a key (call on revoke/rotate)"""
+        stale = [fp for fp, entry in self._entries.items() if entry.key_id == key_id]
+        for fingerprint in stale:
+            del self._entries[fingerprint]
+        if stale:
+            logger.debug("api_key_cache_invalidated", key_id=str(key_id))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_key_cache = VerifiedKeyCache()
+
+
 class APIKeyManager:
     """
     API key generation and validation manager.
@@ -172,6 +251,23 @@ class APIKeyManager:
 
         return is_valid
 
+    @classmethod
+    async def verify_api_key_async(cls, plain_key: str, hashed_key: str) -> bool:
+        """
+        Verify an API key in a worker thread.
+
+        bcrypt releases the GIL, so running it off the event loop keeps other
+        requests moving while a key is checked.
+
+        Args:
+            plain_key: Plain text API key from request
+            hashed_key: Bcrypt hashed key from database
+
+        Returns:
+            True if key matches, False otherwise
+        """
+        return await asyncio.to_thread(cls.verify_api_key, plain_key, hashed_key)
+
     @classmethod
     def extract_prefix(cls, api_key: str) -> str:
         """
@@ -10,8 +10,15 @@ Provides Redis client for:
 Single global connection pool for performance.
 """
 
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from src.core.config import get_settings
 from src.utils.logging.setup import get_logger
@@ -92,6 +99,154 @@ async def close_redis_client() -> None:
         logger.info("redis_client_closed")
 
 
+# Blacklist entries short enough to be access tokens are also indexed
+# (sorted set, score = expiry epoch) and announced on a channel, so each
+# worker can keep an in-process copy (see RevokedTokenCache)
+BLACKLIST_INDEX = "blacklist:index"
+BLACKLIST_CHANNEL = "blacklist:events"
+
+
+def _str(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RevokedTokenCache:
+    """
+    In-process copy of recently blacklisted token IDs.
+
+    get_current_user checks the blacklist on every request while
+    revocations are rare, so each worker keeps the revoked JTIs in a set
+    and answers without a network call. The copy is loaded from
+    BLACKLIST_INDEX and kept current from BLACKLIST_CHANNEL by a background
+    subscription (subscribed before loading, so nothing is missed).
+
+    Only entries expiring within horizon_seconds (the access token
+    lifetime) are mirrored; rotated refresh tokens live for weeks and are
+    checked against Redis directly on the refresh route.
+
+    lookup() returns None - meaning "ask Redis" - until the first load, and
+    when the subscription has been down for more than
+    max_staleness_seconds. Within that bound a Redis outage does not cost
+    a failed round trip per request.
+    """
+
+    HEARTBEAT_SECONDS = 5.0
+    MAX_RECONNECT_SECONDS = 30.0
+
+    def __init__(self, horizon_seconds: int, max_staleness_seconds: float):
+        self.horizon_seconds = horizon_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self._revoked: dict[str, float] = {}  # jti -> expiry (epoch seconds)
+        self._task: asyncio.Task | None = None
+        self._loaded = False
+        self._connected = False
+        self._healthy_at = 0.0  # monotonic time the subscription was last seen alive
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """Mark a token revoked until expires_at (epoch seconds)"""
+        if expires_at > time.time():
+            self._revoked[jti] = expires_at
+
+    def lookup(self, jti: str) -> bool | None:
+        """Whether jti is revoked, or None if the copy cannot be trusted"""
+        if not self._loaded:
+            return None
+        if not self._connected and time.monotonic() - self._healthy_at > self.max_staleness_seconds:
+            return None
+
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._revoked[jti]
+            return False
+        return True
+
+    async def start(self) -> None:
+        """Start following the blacklist in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="revoked_token_cache")
+
+    async def stop(self) -> None:
+        """Stop following; lookups fall back to Redis"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loaded = self._connected = False
+        self._revoked.clear()
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                client = await get_redis_client()
+                if client is None:
+                    return
+                await self._follow(client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._connected = False
+                logger.warning(
+                    "token_blacklist_subscription_lost", error=str(e), retry_in_seconds=delay
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RECONNECT_SECONDS)
+
+    async def _follow(self, client: Redis) -> None:
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(BLACKLIST_CHANNEL)
+            await self._load(client)
+            self._connected = True
+            self._healthy_at = last_ping = time.monotonic()
+            logger.info("token_blacklist_cache_synced", entries=len(self._revoked))
+
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.HEARTBEAT_SECONDS
+                )
+                now = time.monotonic()
+                if message is not None:
+                    self._healthy_at = now
+                    if message["type"] == "message":
+                        jti, expires_at = _str(message["data"]).split()
+                        self.add(jti, float(expires_at))
+
+                # PING on the subscribed connection detects a silent drop
+                if now - last_ping >= self.HEARTBEAT_SECONDS:
+                    await pubsub.ping()
+                    last_ping = now
+                    self._prune()
+                if now - self._healthy_at > 3 * self.HEARTBEAT_SECONDS:
+                    raise ConnectionError("blacklist subscription stopped responding")
+        finally:
+            await pubsub.aclose()
+
+    async def _load(self, client: Redis) -> None:
+        entries = await client.zrangebyscore(BLACKLIST_INDEX, time.time(), "+inf", withscores=True)
+        self._revoked = {_str(jti): float(expires_at) for jti, expires_at in entries}
+        self._loaded = True
+
+    def _prune(self) -> None:
+        now = time.time()
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revoked_tokens = RevokedTokenCache(
+    horizon_seconds=settings.jwt.access_token_expire_minutes * 60,
+    max_staleness_seconds=settings.redis.token_blacklist_max_staleness_seconds,
+)
+
+
 class TokenBlacklist:
     """
     Token blacklist for JWT revocation.
@@ -105,6 +260,9 @@ class TokenBlacklist:
         """
         Add token to blacklist.
 
+        Tokens expiring within the access token lifetime are also indexed
+        and published for the workers' RevokedTokenCache (same round trip).
+
         Args:
             jti: JWT ID (from token payload)
             ttl_seconds: Time to live (match token expiration)
@@ -122,18 +280,31 @@ class TokenBlacklist:
             return
 
         key = f"blacklist:token:{jti}"
+        now = time.time()
+        expires_at = now + ttl_seconds
+
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(key, ttl_seconds, "1")
+        if ttl_seconds <= revoked_tokens.horizon_seconds:
+            pipe.zadd(BLACKLIST_INDEX, {jti: expires_at})
+            pipe.zremrangebyscore(BLACKLIST_INDEX, "-inf", now)
+            pipe.publish(BLACKLIST_CHANNEL, f"{jti} {expires_at}")
+        await pipe.execute()
 
-        await client.setex(key, ttl_seconds, "1")
+        if ttl_seconds <= revoked_tokens.horizon_seconds:
+            revoked_tokens.add(jti, expires_at)
 
         logger.info("token_blacklisted", jti=jti, ttl_seconds=ttl_seconds)
 
     @staticmethod
-    async def is_blacklisted(jti: str) -> bool:
+    async def is_blacklisted(jti: str, *, cached: bool = False) -> bool:
         """
         Check if token is blacklisted.
 
         Args:
             jti: JWT ID (from token payload)
+            cached: Answer from the in-process RevokedTokenCache when it is
+                current (access tokens only; falls back to Redis otherwise)
 
         Returns:
             True if blacklisted, False otherwise
@@ -145,15 +316,18 @@ class TokenBlacklist:
         if not settings.redis.token_blacklist_enabled:
             return False
 
-        client = await get_redis_client()
-        if client is None:
-            # If Redis is unavailable, we cannot check blacklist
-            # Return False to allow token (fail open for availability)
-            return False
+        exists = revoked_tokens.lookup(jti) if cached else None
 
-        key = f"blacklist:token:{jti}"
+        if exists is None:
+            client = await get_redis_client()
+            if client is None:
+                # If Redis is unavailable, we cannot check blacklist
+                # Return False to allow token (fail open for availability)
+                return False
+
+            key = f"blacklist:token:{jti}"
 
-        exists = await client.exists(key)
+            exists = await client.exists(key)
 
         if exists:
             logger.warning("blacklisted_token_used", jti=jti)
@@ -161,6 +335,109 @@ class TokenBlacklist:
         return bool(exists)
 
 
+@dataclass(frozen=True)
+class RateLimitWindow:
+    """A limit of `limit` requests per `period_seconds`"""
+
+    name: str
+    limit: int
+    period_seconds: int
+
+
+@dataclass(frozen=True)
+class WindowStatus:
+    """State of one window after a check"""
+
+    window: RateLimitWindow
+    remaining: int  # requests allowed right now
+    reset_seconds: int  # until the window is back to its full allowance
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of checking a request against several windows at once"""
+
+    allowed: bool
+    windows: list[WindowStatus] = field(default_factory=list)
+    exceeded: RateLimitWindow | None = None
+    retry_after: int = 0  # seconds until a request would be allowed
+    counted: bool = True  # False if Redis did not count the request
+
+    @classmethod
+    def unlimited(cls, windows: list[RateLimitWindow]) -> "RateLimitDecision":
+        """Allow without counting (rate limiting disabled or Redis unavailable)"""
+        return cls(
+            allowed=True,
+            windows=[WindowStatus(w, w.limit, w.period_seconds) for w in windows],
+            counted=False,
+        )
+
+
+# GCRA (generic cell rate algorithm) over several windows in one round trip.
+# Each window stores a theoretical arrival time (TAT, microseconds) in one
+# hash; a request is allowed only if it fits every window, and TATs are
+# advanced only when it is. Unlike fixed-window counters this has no 2x
+# burst at window edges. TIME makes all workers share Redis's clock.
+#
+# KEYS[1]: hash of TATs, one field per window period
+# ARGV:    limit_1, period_seconds_1, limit_2, period_seconds_2, ...
+# Returns: {allowed, exceeded window (1-based, 0 if allowed), retry_after_ms,
+#           remaining_1, reset_ms_1, remaining_2, reset_ms_2, ...}
+MULTI_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local count = #ARGV / 2
+local fields = {}
+for i = 1, count do
+  fields[i] = ARGV[2 * i]
+end
+local stored = redis.call('HMGET', KEYS[1], unpack(fields))
+
+local bases, intervals, periods = {}, {}, {}
+local exceeded, retry_after = 0, 0
+for i = 1, count do
+  local period = tonumber(ARGV[2 * i]) * 1000000
+  local interval = period / tonumber(ARGV[2 * i - 1])
+  local base = math.max(tonumber(stored[i]) or now, now)
+  local wait = base + interval - now - period
+  if wait > 0.5 and wait > retry_after then
+    exceeded, retry_after = i, wait
+  end
+  bases[i], intervals[i], periods[i] = base, interval, period
+end
+
+local reply = {exceeded == 0 and 1 or 0, exceeded, math.ceil(retry_after / 1000)}
+local ttl = 0
+for i = 1, count do
+  local tat = bases[i]
+  if exceeded == 0 then
+    tat = tat + intervals[i]
+    redis.call('HSET', KEYS[1], fields[i], string.format('%.0f', tat))
+  end
+  local used = tat - now
+  ttl = math.max(ttl, used)
+  reply[#reply + 1] = math.max(0, math.floor((periods[i] - used) / intervals[i] + 1e-6))
+  reply[#reply + 1] = math.ceil(used / 1000)
+end
+if exceeded == 0 then
+  redis.call('PEXPIRE', KEYS[1], math.ceil(ttl / 1000) + 1)
+end
+return reply
+"""
+
+
+_window_script = None
+
+
+def _multi_window_script(client: Redis):
+    """MULTI_WINDOW_SCRIPT registered on the current client (EVALSHA, loads on first use)"""
+    global _window_script
+
+    if _window_script is None or _window_script.registered_client is not client:
+        _window_script = client.register_script(MULTI_WINDOW_SCRIPT)
+    return _window_script
+
+
 class RateLimiter:
     """
     Rate limiting using token bucket algorithm.
@@ -227,6 +504,67 @@ class RateLimiter:
 
         return is_allowed, current_count, remaining
 
+    @staticmethod
+    async def check_rate_limits(key: str, windows: list[RateLimitWindow]) -> RateLimitDecision:
+        """
+        Check a request against several windows atomically.
+
+        One EVALSHA per request (see MULTI_WINDOW_SCRIPT), replacing one
+        check_rate_limit call per window.
+
+        Args:
+            key: Rate limit key (e.g., "user:123" or "ip:1.2.3.4")
+            windows: Windows to enforce
+
+        Returns:
+            RateLimitDecision with remaining/reset per window
+
+        Example:
+            >>> decision = await RateLimiter.check_rate_limits(
+            ...     "user:123",
+            ...     [RateLimitWindow("minute", 60, 60), RateLimitWindow("hour", 1000, 3600)],
+            ... )
+            >>> if not decision.allowed:
+            ...     raise HTTPException(429, f"Retry in {decision.retry_after}s")
+        """
+        if not settings.redis.rate_limit_enabled:
+            return RateLimitDecision.unlimited(windows)
+
+        client = await get_redis_client()
+        if client is None:
+            # If Redis is unavailable, allow all requests (fail open)
+            logger.warning("rate_limit_unavailable", message="Redis not available")
+            return RateLimitDecision.unlimited(windows)
+
+        args = []
+        for window in windows:
+            args += [window.limit, window.period_seconds]
+
+        try:
+            reply = await _multi_window_script(client)(keys=[f"ratelimit:{key}"], args=args)
+        except RedisError as e:
+            logger.error("rate_limit_check_failed", key=key, error=str(e))
+            return RateLimitDecision.unlimited(windows)
+
+        allowed, exceeded, retry_after_ms = (int(v) for v in reply[:3])
+        statuses = [
+            WindowStatus(
+                window=window,
+                remaining=int(reply[3 + 2 * i]),
+                reset_seconds=math.ceil(int(reply[4 + 2 * i]) / 1000),
+            )
+            for i, window in enumerate(windows)
+        ]
+        decision = RateLimitDecision(
+            allowed=bool(allowed),
+            windows=statuses,
+            exceeded=windows[exceeded - 1] if exceeded else None,
+            retry_after=math.ceil(retry_after_ms / 1000),
+        )
+
+        # Rejections are logged by the caller (the middleware's 429 has the tier and path)
+        return decision
+
     @staticmethod
     async def reset_rate_limit(key: str) -> None:
         """
@@ -270,6 +608,97 @@ class RateLimiter:
         return ttl if ttl > 0 else None
 
 
+@dataclass
+class _LocalBucket:
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    blocked_window: RateLimitWindow | None = None
+
+
+class LocalRateLimiter:
+    """
+    In-process pre-check in front of RateLimiter.check_rate_limits.
+
+    Sheds requests this worker already knows Redis would reject, without a
+    round trip:
+
+    - a token bucket at the first window's rate, debited only for requests
+      Redis allowed. This worker sees a subset of a client's traffic, so an
+      empty local bucket means the client is over the shared limit too.
+    - the retry-after of the last Redis rejection: GCRA admits nothing for
+      that key until then, on any worker.
+
+    It never rejects a request Redis would allow (up to clock drift).
+    """
+
+    MAX_KEYS = 10_000
+
+    def __init__(self, max_keys: int = MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, _LocalBucket] = OrderedDict()
+
+    def check(self, key: str, windows: list[RateLimitWindow]) -> RateLimitDecision | None:
+        """Return a rejection if the request can be shed locally, else None"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return None
+
+        now = time.monotonic()
+        if bucket.blocked_until > now:
+            return self._reject(bucket.blocked_window, bucket.blocked_until - now)
+
+        window = windows[0]
+        rate = window.limit / window.period_seconds
+        tokens = min(window.limit, bucket.tokens + (now - bucket.updated) * rate)
+        if tokens < 1 - 1e-9:
+            return self._reject(window, (1 - tokens) / rate)
+        return None
+
+    def record(self, key: str, windows: list[RateLimitWindow], decision: RateLimitDecision):
+        """
+        Update the key's bucket from a Redis decision
+
+        Fail-open decisions (Redis down or erroring) are ignored: Redis did
+        not count them, so debiting the bucket would make this worker shed
+        clients on its own for the rest of the outage.
+        """
+        if not decision.counted:
+            return
+
+        now = time.monotonic()
+        window = windows[0]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _LocalBucket(tokens=window.limit, updated=now)
+        else:
+            rate = window.limit / window.period_seconds
+            bucket.tokens = min(window.limit, bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+            self._buckets.move_to_end(key)
+
+        if decision.allowed:
+            bucket.tokens -= 1
+        elif decision.exceeded is not None:
+            bucket.blocked_until = now + decision.retry_after
+            bucket.blocked_window = decision.exceeded
+
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    @staticmethod
+    def _reject(window: RateLimitWindow, wait: float) -> RateLimitDecision:
+        return RateLimitDecision(
+            allowed=False,
+            windows=[WindowStatus(window, 0, math.ceil(wait))],
+            exceeded=window,
+            retry_after=max(1, math.ceil(wait)),
+        )
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
 class SessionCache:
     """
     Session caching for frequently accessed data.
@@ -28,7 +28,7 @@ from src.services.domain.conversation.domain_service import ConversationDomainSe
 from src.services.domain.customer.domain_service import CustomerDomainService
 from src.services.infrastructure.analytics_service import AnalyticsService
 from src.services.infrastructure.customer_service import CustomerInfrastructureService
-from src.workflow.engine import AgentWorkflowEngine
+from src.workflow.engine import get_workflow_engine
 
 # ===== CURRENT USER EXTRACTION =====
 
@@ -101,8 +101,8 @@ async def get_conversation_application_service(
     customer_service = CustomerInfrastructureService(uow)
     analytics_service = AnalyticsService(uow)
 
-    # Create workflow engine
-    workflow_engine = AgentWorkflowEngine()
+    # Shared workflow engine (agents and graph are built once per process)
+    workflow_engine = get_workflow_engine()
 
     # Create and return application service
     return ConversationApplicationService(
@@ -4,16 +4,19 @@ Authentication Dependencies - Dependency injection for FastAPI
 This module provides FastAPI dependencies for authentication and authorization.
 """
 
+import time
+
 from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from src.api.auth.api_key_manager import APIKeyManager
+from src.api.auth.api_key_manager import APIKeyManager, verified_key_cache
 from src.api.auth.jwt import JWTManager
 from src.api.auth.redis_client import TokenBlacklist
 from src.database.models.api_key import APIKey
 from src.database.models.user import User, UserStatus
 from src.database.unit_of_work import get_unit_of_work
 from src.utils.logging.setup import get_logger
+from src.utils.monitoring.prometheus_metrics import record_api_key_auth
 
 logger = get_logger(__name__)
 
@@ -80,8 +83,8 @@ async def get_current_user(
         logger.warning("token_missing_jti")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token format")
 
-    # Check if token is blacklisted (revoked)
-    if await TokenBlacklist.is_blacklisted(jti):
+    # Check if token is blacklisted (revoked) - in-process when the local copy is current
+    if await TokenBlacklist.is_blacklisted(jti, cached=True):
         logger.warning("blacklisted_token_rejected", jti=jti)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -221,6 +224,17 @@ async def verify_api_key(
         async def api_route(api_key: APIKey = Depends(verify_api_key)):
             return {"api_key_id": api_key.id}
     """
+    start = time.perf_counter()
+    path = "rejected"
+    try:
+        api_key, path = await _authenticate_api_key(x_api_key, request)
+        return api_key
+    finally:
+        record_api_key_auth(path, time.perf_counter() - start)
+
+
+async def _authenticate_api_key(x_api_key: str, request: Request | None) -> tuple[APIKey, str]:
+    """Look up and verify an API key; returns the key and the path taken (cache_hit/bcrypt)"""
     # Validate API key format
     is_valid, error = APIKeyManager.validate_api_key_format(x_api_key)
     if not is_valid:
@@ -238,10 +252,16 @@ async def verify_api_key(
             logger.warning("api_key_not_found", prefix=prefix)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
-        # Verify API key hash
-        if not APIKeyManager.verify_api_key(x_api_key, api_key.key_hash):
-            logger.warning("api_key_verification_failed", prefix=prefix, key_id=str(api_key.id))
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
+        # Verify API key hash (bcrypt off the event loop, skipped if recently verified)
+        path = "cache_hit"
+        if not verified_key_cache.is_verified(x_api_key, api_key.id, api_key.key_hash):
+            path = "bcrypt"
+            if not await APIKeyManager.verify_api_key_async(x_api_key, api_key.key_hash):
+                logger.warning("api_key_verification_failed", prefix=prefix, key_id=str(api_key.id))
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key"
+                )
+            verified_key_cache.add(x_api_key, api_key.id, api_key.key_hash)
 
         # Check if API key is valid (active, not expired, not deleted)
         if not api_key.is_valid():
@@ -252,6 +272,7 @@ async def verify_api_key(
                 is_expired=api_key.is_expired(),
                 deleted_at=api_key.deleted_at,
             )
+            verified_key_cache.invalidate(api_key.id)
 
             if api_key.is_expired():
                 raise HTTPException(
@@ -276,9 +297,10 @@ async def verify_api_key(
             key_name=api_key.name,
             user_id=str(api_key.user_id),
             client_ip=client_ip,
+            cache_hit=path == "cache_hit",
         )
 
-        return api_key
+        return api_key, path
 
 
 async def get_user_from_api_key(api_key: APIKey = Depends(verify_api_key)) -> User:
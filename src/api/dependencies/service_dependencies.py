@@ -5,7 +5,6 @@ Provides application service instances for route handlers.
 """
 
 from collections.abc import AsyncGenerator
-from functools import lru_cache
 
 from src.database.connection import get_db_session
 from src.database.unit_of_work import UnitOfWork
@@ -15,19 +14,18 @@ from src.services.domain.conversation.domain_service import ConversationDomainSe
 from src.services.domain.customer.domain_service import CustomerDomainService
 from src.services.infrastructure.analytics_service import AnalyticsService
 from src.services.infrastructure.customer_service import CustomerInfrastructureService
-from src.workflow.engine import AgentWorkflowEngine
+from src.workflow.engine import AgentWorkflowEngine, get_workflow_engine
 
 
 # Cached workflow engine - created once and reused across requests
-@lru_cache
 def get_cached_workflow_engine() -> AgentWorkflowEngine:
     """
-    Returns a cached workflow engine instance.
+    Returns the process-wide workflow engine.
 
-    This is expensive to create (17+ agents), so we cache it
-    and reuse the same instance across all requests.
+    This is expensive to create (~40 agents plus graph compilation), so
+    it is built once per worker (at startup) and shared by all requests.
     """
-    return AgentWorkflowEngine()
+    return get_workflow_engine()
 
 
 async def get_conversation_application_service() -> AsyncGenerator[
@@ -15,7 +15,9 @@ Configured with:
 """
 
 # Add project root to sys.path to allow direct execution
+import asyncio
 import sys
+import time
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent.parent
@@ -25,6 +27,7 @@ if str(project_root) not in sys.path:
 from fastapi import FastAPI
 
 from src.api.auth import close_redis_client, get_redis_client
+from src.api.auth.redis_client import revoked_tokens
 from src.api.error_handlers import setup_error_handlers
 
 # Import middleware
@@ -194,12 +197,42 @@ async def startup_event():
             rate_limiting_enabled=settings.redis.rate_limit_enabled,
             token_blacklist_enabled=settings.redis.token_blacklist_enabled,
         )
+        if settings.redis.token_blacklist_enabled and settings.redis.token_blacklist_cache_enabled:
+            await revoked_tokens.start()
     else:
         logger.warning(
             "redis_not_available",
             message="Redis is disabled or unavailable. Rate limiting and token blacklist will not work.",
         )
 
+    # Build the shared workflow engine off the event loop so the first
+    # conversation request does not pay for agent construction
+    if settings.api.warm_workflow_engine:
+        logger.info("workflow_engine_warmup_started")
+        try:
+            from src.workflow.engine import get_workflow_engine
+
+            warmup_start = time.perf_counter()
+            engine = await asyncio.to_thread(get_workflow_engine)
+            logger.info(
+                "workflow_engine_warmed",
+                agents=len(engine.graph.agents),
+                duration_ms=int((time.perf_counter() - warmup_start) * 1000),
+            )
+        except Exception as e:
+            # Not fatal - the engine is built lazily on first use instead
+            logger.warning("workflow_engine_warmup_failed", error=str(e), exc_info=True)
+
+    # Load the shared embedding model before the first KB search needs it
+    if settings.embedding.warm_on_startup:
+        try:
+            from src.embedding_models import warm_up_embedding_models
+
+            await asyncio.to_thread(warm_up_embedding_models)
+        except Exception as e:
+            # Not fatal - the model is loaded lazily on first use instead
+            logger.warning("embedding_model_warmup_failed", error=str(e), exc_info=True)
+
     # Log CORS configuration
     logger.info(
         "cors_configuration",
@@ -251,6 +284,7 @@ async def shutdown_event():
 
     # Close Redis connection
     logger.info("redis_shutdown_started")
+    await revoked_tokens.stop()
     await close_redis_client()
     logger.info("redis_connection_closed")
 
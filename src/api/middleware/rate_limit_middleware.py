@@ -2,7 +2,9 @@
 Rate Limiting Middleware - Request rate limiting per user/IP
 
 This middleware enforces rate limits based on user tier, API key, or IP address.
-Uses Redis for distributed rate limiting with token bucket algorithm.
+Uses Redis for distributed rate limiting: every window (minute, hour, day) is
+checked atomically in one round trip with GCRA, and an in-process pre-check
+sheds clients already known to be over their limit.
 """
 
 import time
@@ -10,7 +12,7 @@ import time
 from fastapi import HTTPException, Request, status
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from src.api.auth import RateLimiter
+from src.api.auth import LocalRateLimiter, RateLimitDecision, RateLimiter, RateLimitWindow
 from src.api.auth.jwt import JWTManager
 from src.core.config import get_settings
 from src.utils.logging.setup import get_logger
@@ -57,6 +59,21 @@ RATE_LIMITS = {
 }
 
 
+# Windows enforced for every tier: (name, period in seconds); limits come
+# from RATE_LIMITS[tier]["requests_per_<name>"]
+RATE_LIMIT_WINDOWS = (("minute", 60), ("hour", 3600), ("day", 86400))
+
+# Header suffix, error title and log event per window
+_WINDOW_LABELS = {
+    "minute": ("", "Rate limit exceeded", "rate_limit_exceeded"),
+    "hour": ("-Hour", "Hourly rate limit exceeded", "hourly_rate_limit_exceeded"),
+    "day": ("-Day", "Daily rate limit exceeded", "daily_rate_limit_exceeded"),
+}
+
+# Per-worker pre-check in front of Redis
+local_rate_limiter = LocalRateLimiter()
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -129,6 +146,62 @@ def get_tier_limits(tier: str) -> dict:
     return RATE_LIMITS.get(tier, RATE_LIMITS["free"])
 
 
+def get_tier_windows(tier: str) -> list[RateLimitWindow]:
+    """
+    Get rate limit windows for a tier (shortest first).
+
+    Args:
+        tier: Rate limit tier
+
+    Returns:
+        List of windows to check together
+    """
+    limits = get_tier_limits(tier)
+    return [
+        RateLimitWindow(name, limits[f"requests_per_{name}"], period)
+        for name, period in RATE_LIMIT_WINDOWS
+    ]
+
+
+def rate_limit_exceeded(
+    decision: RateLimitDecision, key: str, tier: str, path: str
+) -> HTTPException:
+    """
+    Build the 429 response for a rejected request.
+
+    Args:
+        decision: Rejecting decision (decision.exceeded is the window hit)
+        key: Rate limit key
+        tier: Rate limit tier
+        path: Request path
+
+    Returns:
+        HTTPException to raise
+    """
+    window = decision.exceeded
+    suffix, title, event = _WINDOW_LABELS[window.name]
+    retry_after = decision.retry_after or window.period_seconds
+
+    logger.warning(event, key=key, tier=tier, path=path, limit=window.limit, reset_in=retry_after)
+
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "error": title,
+            "message": f"Too many requests. Maximum {window.limit} requests per {window.name} allowed.",
+            "tier": tier,
+            "limit": window.limit,
+            "reset_in_seconds": retry_after,
+        },
+        headers={
+            f"X-RateLimit-Limit{suffix}": str(window.limit),
+            f"X-RateLimit-Remaining{suffix}": "0",
+            f"X-RateLimit-Reset{suffix}": str(int(time.time()) + retry_after),
+            "Retry-After": str(retry_after),
+        },
+    )
+
+
 # =============================================================================
 # RATE LIMIT MIDDLEWARE
 # =============================================================================
@@ -172,130 +245,33 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Get rate limit key and tier
         rate_limit_key, tier = get_rate_limit_key(request)
-        limits = get_tier_limits(tier)
+        windows = get_tier_windows(tier)
 
         logger.debug("rate_limit_check", key=rate_limit_key, tier=tier, path=request.url.path)
 
-        # Check minute limit (primary limit)
-        allowed, current_count, remaining = await RateLimiter.check_rate_limit(
-            key=f"{rate_limit_key}:minute",
-            max_requests=limits["requests_per_minute"],
-            window_seconds=60,
-        )
-
-        if not allowed:
-            # Get reset time
-            reset_time = await RateLimiter.get_reset_time(f"{rate_limit_key}:minute")
-
-            logger.warning(
-                "rate_limit_exceeded",
-                key=rate_limit_key,
-                tier=tier,
-                path=request.url.path,
-                current=current_count,
-                limit=limits["requests_per_minute"],
-                reset_in=reset_time,
-            )
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "Rate limit exceeded",
-                    "message": f"Too many requests. Maximum {limits['requests_per_minute']} requests per minute allowed.",
-                    "tier": tier,
-                    "limit": limits["requests_per_minute"],
-                    "reset_in_seconds": reset_time or 60,
-                },
-                headers={
-                    "X-RateLimit-Limit": str(limits["requests_per_minute"]),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(time.time()) + (reset_time or 60)),
-                    "Retry-After": str(reset_time or 60),
-                },
-            )
-
-        # Check hour limit (secondary limit)
-        hour_allowed, hour_current, hour_remaining = await RateLimiter.check_rate_limit(
-            key=f"{rate_limit_key}:hour",
-            max_requests=limits["requests_per_hour"],
-            window_seconds=3600,
-        )
-
-        if not hour_allowed:
-            reset_time = await RateLimiter.get_reset_time(f"{rate_limit_key}:hour")
-
-            logger.warning(
-                "hourly_rate_limit_exceeded",
-                key=rate_limit_key,
-                tier=tier,
-                current=hour_current,
-                limit=limits["requests_per_hour"],
-            )
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "Hourly rate limit exceeded",
-                    "message": f"Too many requests. Maximum {limits['requests_per_hour']} requests per hour allowed.",
-                    "tier": tier,
-                    "limit": limits["requests_per_hour"],
-                    "reset_in_seconds": reset_time or 3600,
-                },
-                headers={
-                    "X-RateLimit-Limit-Hour": str(limits["requests_per_hour"]),
-                    "X-RateLimit-Remaining-Hour": "0",
-                    "Retry-After": str(reset_time or 3600),
-                },
-            )
-
-        # Check daily limit (tertiary limit)
-        day_allowed, day_current, day_remaining = await RateLimiter.check_rate_limit(
-            key=f"{rate_limit_key}:day",
-            max_requests=limits["requests_per_day"],
-            window_seconds=86400,
-        )
-
-        if not day_allowed:
-            reset_time = await RateLimiter.get_reset_time(f"{rate_limit_key}:day")
-
-            logger.warning(
-                "daily_rate_limit_exceeded",
-                key=rate_limit_key,
-                tier=tier,
-                current=day_current,
-                limit=limits["requests_per_day"],
-            )
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "Daily rate limit exceeded",
-                    "message": f"Too many requests. Maximum {limits['requests_per_day']} requests per day allowed.",
-                    "tier": tier,
-                    "limit": limits["requests_per_day"],
-                    "reset_in_seconds": reset_time or 86400,
-                },
-                headers={
-                    "X-RateLimit-Limit-Day": str(limits["requests_per_day"]),
-                    "X-RateLimit-Remaining-Day": "0",
-                    "Retry-After": str(reset_time or 86400),
-                },
-            )
+        # Shed locally if this worker already knows the client is over its limit
+        precheck = settings.redis.rate_limit_local_precheck
+        decision = local_rate_limiter.check(rate_limit_key, windows) if precheck else None
 
-        # Request allowed - process it
-        response = await call_next(request)
+        # Otherwise check every window in one Redis round trip
+        if decision is None:
+            decision = await RateLimiter.check_rate_limits(rate_limit_key, windows)
+            if precheck:
+                local_rate_limiter.record(rate_limit_key, windows, decision)
 
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(limits["requests_per_minute"])
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
+        if not decision.allowed:
+            raise rate_limit_exceeded(decision, rate_limit_key, tier, request.url.path)
 
-        # Add hourly and daily limits
-        response.headers["X-RateLimit-Limit-Hour"] = str(limits["requests_per_hour"])
-        response.headers["X-RateLimit-Remaining-Hour"] = str(hour_remaining)
+        # Request allowed - process it
+        response = await call_next(request)
 
-        response.headers["X-RateLimit-Limit-Day"] = str(limits["requests_per_day"])
-        response.headers["X-RateLimit-Remaining-Day"] = str(day_remaining)
+        # Add rate limit headers to response (minute window unsuffixed)
+        now = int(time.time())
+        for window_status in decision.windows:
+            suffix = _WINDOW_LABELS[window_status.window.name][0]
+            response.headers[f"X-RateLimit-Limit{suffix}"] = str(window_status.window.limit)
+            response.headers[f"X-RateLimit-Remaining{suffix}"] = str(window_status.remaining)
+            response.headers[f"X-RateLimit-Reset{suffix}"] = str(now + window_status.reset_seconds)
 
         # Add tier information
         response.headers["X-RateLimit-Tier"] = tier
@@ -31,6 +31,7 @@ from src.api.auth import (
     TokenBlacklist,
     get_role_scopes,
 )
+from src.api.auth.api_key_manager import verified_key_cache
 from src.api.dependencies import get_current_user
 from src.api.models.auth_models import (
     APIKeyCreateRequest,
@@ -1011,6 +1012,7 @@ async def revoke_api_key(key_id: UUID, current_user: User = Depends(get_current_
         # Revoke (soft delete)
         await uow.api_keys.revoke_key(key_id)
         await uow.commit()
+        verified_key_cache.invalidate(key_id)
 
         logger.info("api_key_revoked", user_id=str(current_user.id), key_id=str(key_id))
 
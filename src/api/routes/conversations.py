@@ -4,6 +4,7 @@ Conversation routes - HTTP endpoints for conversations
 All endpoints require authentication via JWT token or API key.
 """
 
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -14,6 +15,7 @@ from src.api.error_handlers import map_error_to_http
 from src.api.models import ChatRequest, ChatResponse, EscalateRequest
 from src.database.models.user import User, UserRole
 from src.database.schemas.conversation import ConversationInDB, ConversationWithMessages
+from src.database.schemas.message import MessageSearchResults
 from src.services.application.conversation_service import ConversationApplicationService
 from src.utils.logging.setup import get_logger
 
@@ -191,6 +193,11 @@ async def add_message(
         )
         raise map_error_to_http(result.error)
 
+    # Commit the turn now, then fold turns that just left the history window
+    # into the summary in the background (an LLM call the response skips)
+    await service.uow.commit()
+    service.history.schedule_summary_update(conversation_id)
+
     logger.info(
         "add_message_success",
         conversation_id=str(conversation_id),
@@ -400,6 +407,58 @@ async def list_conversations(
     return result.value
 
 
+@router.get(
+    "/messages/search",
+    response_model=MessageSearchResults,
+    summary="Search messages",
+    description="Ranked full-text and substring search over message content. Admin only.",
+)
+async def search_messages(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    conversation_id: UUID | None = Query(None, description="Filter by conversation"),
+    agent_name: str | None = Query(None, description="Filter by agent"),
+    role: str | None = Query(
+        None, pattern="^(user|assistant|system)$", description="Filter by role"
+    ),
+    start_date: datetime | None = Query(None, description="Messages created at or after"),
+    end_date: datetime | None = Query(None, description="Messages created before"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    offset: int = Query(0, ge=0, le=10000, description="Results to skip"),
+    current_user: User = Depends(get_current_user_or_api_key),
+    service: ConversationApplicationService = Depends(get_conversation_application_service),
+) -> MessageSearchResults:
+    """Search messages across conversations
+
+    Requires an admin user. Words and "quoted phrases" are matched with
+    Postgres full-text search, longer terms also as substrings. Snippets
+    wrap matched words in <mark></mark>. Page with limit/offset while
+    has_more is true.
+    """
+    if current_user.role not in (UserRole.SUPER_ADMIN, UserRole.ADMIN):
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    result = await service.search_messages(
+        q,
+        conversation_id=conversation_id,
+        agent_name=agent_name,
+        role=role,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        offset=offset,
+    )
+
+    if result.is_failure:
+        logger.warning(
+            "search_messages_failed",
+            user_id=str(current_user.id),
+            error_type=type(result.error).__name__,
+        )
+        raise map_error_to_http(result.error)
+
+    return result.value
+
+
 @router.delete("/conversations/{conversation_id}", status_code=200)
 async def delete_conversation(
     conversation_id: UUID,
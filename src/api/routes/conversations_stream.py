@@ -5,7 +5,6 @@ Real-time AI response streaming for chat conversations.
 All endpoints require authentication via JWT token or API key.
 """
 
-import asyncio
 import json
 from collections.abc import AsyncGenerator
 from uuid import UUID
@@ -77,7 +76,11 @@ async def stream_conversation_response(
     Stream conversation response as Server-Sent Events
 
     Yields SSE-formatted events:
-    - content: AI response chunks
+    - content: AI response chunks, forwarded as the LLM generates them.
+      A content event with "replace": true carries the text so far in
+      "accumulated" and supersedes everything streamed before it (sent for
+      the final response, and with empty text when a retry discards a
+      failed attempt).
     - agent_switch: Agent handoff events
     - done: Completion event with metadata
     - error: Error events
@@ -89,8 +92,8 @@ async def stream_conversation_response(
             message_length=len(message),
         )
 
-        # CRITICAL FIX: Fetch conversation WITH messages for context continuity
-        conversation = await service.uow.conversations.get_with_messages(conversation_id)
+        # History comes from a windowed query below - don't load every message
+        conversation = await service.uow.conversations.get_without_messages(conversation_id)
         if not conversation:
             error_event = {"type": "error", "error": "Conversation not found"}
             yield f"data: {json.dumps(error_event)}\n\n"
@@ -104,23 +107,14 @@ async def stream_conversation_response(
             yield f"data: {json.dumps(error_event)}\n\n"
             return
 
-        # Build conversation history from existing messages for multi-turn context
-        conversation_history = []
-        if conversation.messages:
-            for msg in conversation.messages:
-                conversation_history.append(
-                    {
-                        "role": msg.role,
-                        "content": msg.content,
-                        "timestamp": msg.created_at.isoformat() if msg.created_at else None,
-                        "agent_name": getattr(msg, "agent_name", None),
-                    }
-                )
-            logger.debug(
-                "stream_conversation_history_built",
-                conversation_id=str(conversation_id),
-                history_count=len(conversation_history),
-            )
+        # Recent messages verbatim plus a summary of older turns for multi-turn context
+        conversation_history, conversation_summary = await service.history.get_context(conversation)
+        logger.debug(
+            "stream_conversation_history_built",
+            conversation_id=str(conversation_id),
+            history_count=len(conversation_history),
+            has_summary=conversation_summary is not None,
+        )
 
         # Save user message
         await service.uow.messages.create_message(
@@ -135,18 +129,44 @@ async def stream_conversation_response(
             {"role": "user", "content": message, "timestamp": None, "agent_name": None}
         )
 
-        # Execute workflow with streaming
-        # Note: For now, we'll simulate streaming by chunking the response
+        # Execute workflow with real token streaming
         # CRITICAL: Pass conversation_history for multi-turn context
+        accumulated = ""
+        agent_result = None
 
-        agent_result = await service.workflow_engine.execute(
+        async for event in service.workflow_engine.execute_stream(
             message=message,
             context={
                 "conversation_id": str(conversation.id),
                 "customer_id": str(conversation.customer_id),
                 "conversation_history": conversation_history,
+                "conversation_summary": conversation_summary,
             },
-        )
+        ):
+            if event["type"] == "token":
+                accumulated += event["chunk"]
+                content_event = {
+                    "type": "content",
+                    "chunk": event["chunk"],
+                    "accumulated": accumulated,
+                }
+                yield f"data: {json.dumps(content_event)}\n\n"
+
+            elif event["type"] == "reset":
+                # Workflow retried - discard what the failed attempt streamed,
+                # on the client too
+                if accumulated:
+                    accumulated = ""
+                    content_event = {
+                        "type": "content",
+                        "chunk": "",
+                        "accumulated": "",
+                        "replace": True,
+                    }
+                    yield f"data: {json.dumps(content_event)}\n\n"
+
+            elif event["type"] == "result":
+                agent_result = event["result"]
 
         # Extract response data
         response_text = agent_result.get("agent_response", "")
@@ -158,21 +178,18 @@ async def stream_conversation_response(
         escalation_reason = agent_result.get("escalation_reason")
         should_escalate = agent_result.get("should_escalate", False)
 
-        # Stream response in chunks (simulated streaming)
-        words = response_text.split()
-        accumulated = ""
-
-        for _i, word in enumerate(words):
-            chunk = word + " "
-            accumulated += chunk
-
-            # Send content chunk
-            content_event = {"type": "content", "chunk": chunk, "accumulated": accumulated.strip()}
+        # The final response is authoritative. It differs from the streamed
+        # text when nothing was streamed (router answered, non-streaming
+        # agent) or the agent post-processed the LLM output.
+        if response_text and response_text != accumulated:
+            content_event = {
+                "type": "content",
+                "chunk": response_text if not accumulated else "",
+                "accumulated": response_text,
+                "replace": bool(accumulated),
+            }
             yield f"data: {json.dumps(content_event)}\n\n"
 
-            # Small delay to simulate real-time streaming
-            await asyncio.sleep(0.05)
-
         # Save agent response to database
         agent_name = agent_path[-1] if agent_path else "router"
         agent_message = await service.uow.messages.create_message(
@@ -237,6 +254,10 @@ async def stream_conversation_response(
         }
         yield f"data: {json.dumps(done_event)}\n\n"
 
+        # Fold turns that just left the history window into the summary,
+        # after the turn is committed and the client has its answer
+        service.history.schedule_summary_update(conversation.id)
+
         logger.info(
             "stream_conversation_completed",
             conversation_id=str(conversation_id),
@@ -276,9 +297,9 @@ async def stream_message_response(
 
     Example events:
     ```
-    data: {"type": "content", "chunk": "I ", "accumulated": "I"}
+    data: {"type": "content", "chunk": "I", "accumulated": "I"}
 
-    data: {"type": "content", "chunk": "can ", "accumulated": "I can"}
+    data: {"type": "content", "chunk": " can", "accumulated": "I can"}
 
     data: {"type": "done", "messageId": "...", "metadata": {...}}
     ```
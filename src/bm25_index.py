@@ -0,0 +1,295 @@
+"""
+BM25 Index - Inverted-index keyword search over KB articles
+
+Replaces the linear substring scan in src/knowledge_base.py. The index
+is built once (or loaded from a serialized file) and reused across
+requests; a query only touches the postings of its own terms.
+
+Scoring:
+- Okapi BM25 over title + content, with title terms weighted higher
+- Category filtering via per-category postings
+- Additive boost when the query mentions one of the article's tags
+
+Results use the same dict shape as VectorStore.search(), so the index can
+serve as the lexical half of a hybrid search.
+"""
+
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Short, high-frequency words that carry no signal for KB lookups
+STOPWORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "can",
+        "do",
+        "does",
+        "for",
+        "from",
+        "how",
+        "i",
+        "if",
+        "in",
+        "is",
+        "it",
+        "my",
+        "of",
+        "on",
+        "or",
+        "our",
+        "the",
+        "this",
+        "to",
+        "we",
+        "what",
+        "when",
+        "where",
+        "why",
+        "with",
+        "you",
+        "your",
+    ]
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase, split on non-alphanumerics and drop stopwords"""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _normalize_tag(tag: str) -> str:
+    """Normalize a tag the same way query n-grams are built ("API-Key" -> "api key")"""
+    return " ".join(_TOKEN_RE.findall(tag.lower()))
+
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index
+
+    Example:
+        index = BM25Index.from_articles(load_articles())
+        results = index.search("refund my payment", category="billing", limit=3)
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        title_weight: int = 3,
+        tag_boost: float = 2.0,
+    ):
+        """
+        Initialize empty index
+
+        Args:
+            k1: Term-frequency saturation
+            b: Document-length normalization
+            title_weight: How many times title terms count towards term frequency
+            tag_boost: Score added per tag mentioned in the query
+        """
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.tag_boost = tag_boost
+
+        self.docs: list[dict[str, Any]] = []
+        self.doc_lengths: list[int] = []
+        self.avg_doc_length = 0.0
+
+        # term -> {doc_index: term_frequency}
+        self.postings: dict[str, dict[int, int]] = {}
+        self.idf: dict[str, float] = {}
+        # category -> sorted doc indices
+        self.category_postings: dict[str, list[int]] = {}
+        # normalized tag ("api key") -> doc indices
+        self.tag_postings: dict[str, list[int]] = {}
+        self._max_tag_words = 0
+        self._category_sets: dict[str, set[int]] = {}
+
+    # ------------------------------------------------------------------
+    # Build / serialize
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_articles(cls, articles: list[dict[str, Any]], **kwargs) -> "BM25Index":
+        """Build an index from article dicts (id, title, content, category, tags)"""
+        index = cls(**kwargs)
+        index.add_articles(articles)
+        return index
+
+    def add_articles(self, articles: list[dict[str, Any]]) -> None:
+        """Add articles and recompute corpus statistics"""
+        for article in articles:
+            doc = len(self.docs)
+            self.docs.append(
+                {
+                    "doc_id": str(article.get("doc_id", article.get("id"))),
+                    "title": article["title"],
+                    "content": article["content"],
+                    "category": article["category"],
+                    "tags": article.get("tags", []),
+                }
+            )
+
+            terms = Counter(tokenize(article["content"]))
+            for term in tokenize(article["title"]):
+                terms[term] += self.title_weight
+
+            self.doc_lengths.append(sum(terms.values()))
+            for term, tf in terms.items():
+                self.postings.setdefault(term, {})[doc] = tf
+
+            self.category_postings.setdefault(article["category"], []).append(doc)
+            for tag in article.get("tags", []):
+                tag_key = _normalize_tag(tag)
+                if tag_key:
+                    self.tag_postings.setdefault(tag_key, []).append(doc)
+
+        self._compute_stats()
+
+    def _compute_stats(self) -> None:
+        n = len(self.docs)
+        self.avg_doc_length = sum(self.doc_lengths) / n if n else 0.0
+        self._max_tag_words = max((len(t.split()) for t in self.tag_postings), default=0)
+        self._category_sets = {cat: set(docs) for cat, docs in self.category_postings.items()}
+        self.idf = {
+            term: math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Serialize to JSON (atomic replace)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "params": {
+                "k1": self.k1,
+                "b": self.b,
+                "title_weight": self.title_weight,
+                "tag_boost": self.tag_boost,
+            },
+            "docs": self.docs,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+            "category_postings": self.category_postings,
+            "tag_postings": self.tag_postings,
+        }
+
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BM25Index":
+        """Load an index written by save()"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        index = cls(**data["params"])
+        index.docs = data["docs"]
+        index.doc_lengths = data["doc_lengths"]
+        # JSON object keys are strings - restore integer doc indices
+        index.postings = {
+            term: {int(doc): tf for doc, tf in docs.items()}
+            for term, docs in data["postings"].items()
+        }
+        index.category_postings = data["category_postings"]
+        index.tag_postings = data["tag_postings"]
+        index._compute_stats()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def score(self, query: str, category: str | None = None) -> dict[int, float]:
+        """
+        Score documents matching the query
+
+        Args:
+            query: Free-text query
+            category: Restrict to one category
+
+        Returns:
+            Mapping of doc index -> BM25 score (only docs with score > 0)
+        """
+        allowed = None
+        if category:
+            allowed = self._category_sets.get(category)
+            if not allowed:
+                return {}
+
+        scores: dict[int, float] = {}
+        k1, b, avg_len = self.k1, self.b, self.avg_doc_length or 1.0
+
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf[term]
+            for doc, tf in docs.items():
+                if allowed is not None and doc not in allowed:
+                    continue
+                norm = k1 * (1 - b + b * self.doc_lengths[doc] / avg_len)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        # Tag boosts: look up every query n-gram up to the longest tag
+        if self.tag_boost and self.tag_postings:
+            words = _TOKEN_RE.findall(query.lower())
+            mentioned = {
+                " ".join(words[i : i + n])
+                for n in range(1, self._max_tag_words + 1)
+                for i in range(len(words) - n + 1)
+            }
+            for tag in mentioned:
+                for doc in self.tag_postings.get(tag, ()):
+                    if allowed is not None and doc not in allowed:
+                        continue
+                    scores[doc] = scores.get(doc, 0.0) + self.tag_boost
+
+        return scores
+
+    def search(self, query: str, category: str | None = None, limit: int = 3) -> list[dict]:
+        """
+        Top-k BM25 search
+
+        Args:
+            query: Free-text query
+            category: Restrict to one category
+            limit: Max results
+
+        Returns:
+            Articles with "similarity_score" (BM25 squashed into 0-1) and
+            raw "bm25_score"
+        """
+        scores = self.score(query, category)
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+        return [
+            {
+                **self.docs[doc],
+                # Saturating map to 0-1 so scores sit next to cosine similarities
+                "similarity_score": round(score / (score + 10.0), 3),
+                "bm25_score": round(score, 3),
+            }
+            for doc, score in ranked
+        ]
@@ -58,6 +58,10 @@ class APIConfig(BaseSettings):
     rate_limit_requests: int = Field(default=100, ge=1)
     rate_limit_period: int = Field(default=60, ge=1)
 
+    # Build the shared workflow engine (agents + compiled graph) at startup
+    # instead of on the first conversation request
+    warm_workflow_engine: bool = Field(default=True)
+
     @field_validator("cors_origins")
     @classmethod
     def validate_cors_origins(cls, v: list[str]) -> list[str]:
@@ -127,6 +131,13 @@ class QdrantConfig(BaseSettings):
     distance_metric: Literal["cosine", "euclid", "dot"] = Field(default="cosine")
     timeout: int = Field(default=30, ge=1)
     prefer_grpc: bool = Field(default=True)
+    local_index_path: str = Field(
+        default="data/kb_index", description="Directory of the in-process KB vector index"
+    )
+    local_index_mode: Literal["primary", "fallback", "disabled"] = Field(
+        default="primary",
+        description="primary: search locally first; fallback: only when Qdrant fails",
+    )
 
     @field_validator("url")
     @classmethod
@@ -229,6 +240,152 @@ class CacheConfig(BaseSettings):
     )
 
 
+class SemanticCacheConfig(BaseSettings):
+    """Semantic response cache for deterministic routing agents"""
+
+    enabled: bool = Field(default=False)
+    redis_url: str | None = Field(
+        default=None, description="Redis URL (defaults to REDIS_URL when unset)"
+    )
+    agents: list[str] = Field(
+        default=[
+            "meta_router",
+            "intent_classifier",
+            "sentiment_analyzer",
+            "entity_extractor",
+            "complexity_assessor",
+        ],
+        description="Agents allowed to serve cached responses",
+    )
+    similarity_threshold: float = Field(default=0.95, ge=0.0, le=1.0)
+    ttl: int = Field(default=86400, ge=1, description="Entry TTL in seconds")
+    max_entries_per_agent: int = Field(default=5000, ge=1)
+    sync_interval: int = Field(
+        default=300, ge=1, description="Seconds between reloads of entries written by other workers"
+    )
+    embedding_model: str = Field(default="all-MiniLM-L6-v2")
+
+    model_config = SettingsConfigDict(
+        env_prefix="SEMANTIC_CACHE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+class LLMRoutingConfig(BaseSettings):
+    """Latency-aware backend routing and hedging (see src/llm/backend_router.py)"""
+
+    enabled: bool = Field(
+        default=False, description="Pick a backend per call instead of always current_backend"
+    )
+    hedge_tiers: list[str] = Field(
+        default=[], description="Model tiers whose calls are hedged on a second backend"
+    )
+    ewma_alpha: float = Field(
+        default=0.2,
+        gt=0.0,
+        le=1.0,
+        description="Weight of the newest sample in latency/error EWMAs",
+    )
+    failure_threshold: int = Field(
+        default=3, ge=1, description="Consecutive failures that eject a backend"
+    )
+    max_error_rate: float = Field(
+        default=0.5, gt=0.0, le=1.0, description="Error-rate EWMA that ejects a backend"
+    )
+    cooldown_seconds: float = Field(
+        default=30.0, ge=0.0, description="How long an ejected backend gets no traffic"
+    )
+    switch_ratio: float = Field(
+        default=1.5,
+        ge=1.0,
+        description="How many times faster another backend must be to take traffic from "
+        "the current one",
+    )
+    hedge_delay_ms: float = Field(
+        default=1000.0, ge=0.0, description="Hedge delay until a backend has enough latency samples"
+    )
+    min_hedge_delay_ms: float = Field(
+        default=50.0, ge=0.0, description="Lower bound on the p95-based hedge delay"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="LLM_ROUTING_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+class WorkflowConfig(BaseSettings):
+    """Workflow execution (see src/workflow/checkpointing.py and src/workflow/analysis.py)"""
+
+    checkpointer: Literal["memory", "redis", "none"] = Field(
+        default="memory", description="Where node-level checkpoints are kept for retries"
+    )
+    checkpoint_redis_url: str | None = Field(
+        default=None, description="Redis URL for checkpoints (defaults to REDIS_URL when unset)"
+    )
+    checkpoint_ttl_minutes: int = Field(
+        default=60, ge=1, description="Expiry of Redis checkpoints left by crashed workers"
+    )
+    pre_routing_analyzers: list[
+        Literal[
+            "sentiment_analyzer", "entity_extractor", "complexity_assessor", "intent_classifier"
+        ]
+    ] = Field(
+        default=[],
+        description="Analyzers run concurrently before the router (see src/workflow/analysis.py). "
+        "Each adds one LLM call per turn and the stage adds its slowest analyzer's latency, "
+        "so none run by default",
+    )
+    analysis_timeout_seconds: float = Field(
+        default=10.0, gt=0.0, description="Shared time budget for the pre-routing analysis stage"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="WORKFLOW_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+class EmbeddingConfig(BaseSettings):
+    """Shared sentence-transformers model (see src/embedding_models.py)"""
+
+    model: str = Field(default="all-MiniLM-L6-v2", description="Default embedding model")
+    device: str | None = Field(
+        default=None, description="torch device (cpu, cuda, mps); auto-detected when unset"
+    )
+    num_threads: int | None = Field(
+        default=None, ge=1, le=64, description="CPU inference threads (library default when unset)"
+    )
+    backend: Literal["torch", "onnx"] = Field(
+        default="torch", description="onnx requires optimum[onnxruntime]; falls back to torch"
+    )
+    quantize_int8: bool = Field(default=False, description="int8 CPU inference")
+    onnx_quantized_file: str = Field(
+        default="onnx/model_qint8_avx512_vnni.onnx",
+        description="Quantized ONNX export to load when backend=onnx and quantize_int8",
+    )
+    warm_on_startup: bool = Field(
+        default=False, description="Load and exercise the default model at API startup"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="EMBEDDING_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
 class JWTConfig(BaseSettings):
     """JWT authentication configuration"""
 
@@ -273,9 +430,18 @@ class RedisConfig(BaseSettings):
 
     # Rate limiting
     rate_limit_enabled: bool = Field(default=True)
+    rate_limit_local_precheck: bool = Field(
+        default=True, description="Shed clients known to be over their limit before Redis"
+    )
 
     # Token blacklist
     token_blacklist_enabled: bool = Field(default=True)
+    token_blacklist_cache_enabled: bool = Field(
+        default=True, description="Keep an in-process copy of revoked access tokens"
+    )
+    token_blacklist_max_staleness_seconds: int = Field(
+        default=30, ge=0, description="Trust the in-process copy this long after losing Redis"
+    )
 
     @field_validator("url")
     @classmethod
@@ -571,6 +737,10 @@ class Settings(BaseSettings):
     sentry: SentryConfig = Field(default_factory=SentryConfig)
     notification: NotificationConfig = Field(default_factory=NotificationConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
+    semantic_cache: SemanticCacheConfig = Field(default_factory=SemanticCacheConfig)
+    llm_routing: LLMRoutingConfig = Field(default_factory=LLMRoutingConfig)
+    embedding: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
+    workflow: WorkflowConfig = Field(default_factory=WorkflowConfig)
     context_enrichment: ContextEnrichmentConfig = Field(default_factory=ContextEnrichmentConfig)
     vastai: VastAIConfig = Field(default_factory=VastAIConfig)
     modal: ModalConfig = Field(default_factory=ModalConfig)
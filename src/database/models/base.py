@@ -5,7 +5,7 @@ Base SQLAlchemy model
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, Index, text
+from sqlalchemy import Column, DateTime, Index, inspect, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base, declared_attr
 from sqlalchemy.sql import func
@@ -108,7 +108,18 @@ class BaseModel(Base, TimestampMixin, AuditMixin):
         Returns:
             Dictionary representation of model
         """
-        data = {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        # Deferred columns (e.g. Message.search_vector) are skipped unless loaded
+        state = inspect(self)
+        skipped = {
+            prop.columns[0].name
+            for prop in state.mapper.column_attrs
+            if prop.deferred and prop.key in state.unloaded
+        }
+        data = {
+            column.name: getattr(self, column.name)
+            for column in self.__table__.columns
+            if column.name not in skipped
+        }
 
         if exclude_deleted:
             # Remove audit fields from output
@@ -122,6 +122,11 @@ class Conversation(BaseModel):
             name="check_conversation_sentiment_range",
         ),
         Index("idx_conversations_started_at_desc", "started_at", postgresql_using="btree"),
+        Index(
+            "idx_conversations_started_at_agents",
+            "started_at",
+            postgresql_include=["agents_involved"],
+        ),  # Covering index for agent usage stats (index-only scan)
         Index(
             "idx_conversations_active_old",
             "status",
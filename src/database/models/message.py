@@ -7,6 +7,7 @@ import uuid
 from sqlalchemy import (
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -15,8 +16,8 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from src.database.models.base import BaseModel
@@ -42,6 +43,11 @@ class Message(BaseModel):
     role = Column(String(20), nullable=False)  # user, assistant, system
     content = Column(Text, nullable=False)
 
+    # Full-text search vector, maintained by Postgres (not loaded with the row)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+    )
+
     # Agent Information
     agent_name = Column(String(50), nullable=True, index=True)
 
@@ -79,6 +85,14 @@ class Message(BaseModel):
         ),
         Index("idx_messages_conversation_created", "conversation_id", "created_at"),
         Index("idx_messages_agent_created", "agent_name", "created_at"),
+        # Ranked full-text search and substring (ILIKE) search, see MessageRepository.search
+        Index("idx_messages_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_messages_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -5,8 +5,9 @@ Conversation repository - Business logic for conversation data access
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import noload, selectinload
 
 from src.database.base import BaseRepository
 from src.database.models import Conversation
@@ -81,6 +82,50 @@ class ConversationRepository(BaseRepository[Conversation]):
         )
         return result.scalar_one_or_none()
 
+    async def get_without_messages(self, conversation_id: UUID) -> Conversation | None:
+        """
+        Get conversation without loading its messages
+
+        Conversation.messages is eagerly loaded by default; this skips it
+        for callers that read history through MessageRepository.get_recent().
+        The returned instance's `messages` is empty for the rest of the session.
+
+        Args:
+            conversation_id: Conversation UUID
+
+        Returns:
+            Conversation or None
+        """
+        result = await self.session.execute(
+            select(Conversation)
+            .where(Conversation.id == conversation_id)
+            .options(noload(Conversation.messages))
+        )
+        return result.scalar_one_or_none()
+
+    async def update_history_summary(self, conversation_id: UUID, summary: dict) -> None:
+        """
+        Store the rolling summary of older turns in extra_metadata
+
+        Merges into the JSONB column server-side, so other metadata keys are
+        kept and the conversation is not reloaded.
+
+        Args:
+            conversation_id: Conversation UUID
+            summary: Summary record (see ConversationHistoryService)
+        """
+        await self.session.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(
+                extra_metadata=Conversation.extra_metadata.op("||")(
+                    bindparam("summary_patch", {"history_summary": summary}, type_=JSONB)
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.flush()
+
     async def get_with_customer(self, conversation_id: UUID) -> Conversation | None:
         """
         Get conversation with customer relationship (eager loading)
@@ -205,60 +250,114 @@ class ConversationRepository(BaseRepository[Conversation]):
             Statistics dictionary
         """
         since = datetime.now(UTC) - timedelta(days=days)
-
-        # Total conversations
-        total_result = await self.session.execute(
-            select(func.count(Conversation.id)).where(Conversation.started_at >= since)
-        )
-        total_conversations = total_result.scalar()
-
-        # By status
-        status_result = await self.session.execute(
-            select(Conversation.status, func.count(Conversation.id))
-            .where(Conversation.started_at >= since)
-            .group_by(Conversation.status)
-        )
-        by_status = {row[0]: row[1] for row in status_result}
+        in_window = Conversation.started_at >= since
+        statuses = ("active", "resolved", "escalated")
+
+        # Totals, per-status counts and averages in one scan
+        # (avg() skips NULLs, matching the old IS NOT NULL filters)
+        totals = (
+            await self.session.execute(
+                select(
+                    func.count(Conversation.id).label("total"),
+                    *[
+                        func.count(Conversation.id)
+                        .filter(Conversation.status == status)
+                        .label(status)
+                        for status in statuses
+                    ],
+                    func.avg(Conversation.resolution_time_seconds).label("avg_resolution"),
+                    func.avg(Conversation.sentiment_avg).label("avg_sentiment"),
+                ).where(in_window)
+            )
+        ).one()
+        by_status = {
+            status: getattr(totals, status) for status in statuses if getattr(totals, status)
+        }
 
         # By intent
         intent_result = await self.session.execute(
             select(Conversation.primary_intent, func.count(Conversation.id))
-            .where(and_(Conversation.started_at >= since, Conversation.primary_intent.isnot(None)))
+            .where(and_(in_window, Conversation.primary_intent.isnot(None)))
             .group_by(Conversation.primary_intent)
         )
         by_intent = {row[0]: row[1] for row in intent_result}
 
-        # Average resolution time
-        avg_resolution_result = await self.session.execute(
-            select(func.avg(Conversation.resolution_time_seconds)).where(
-                and_(
-                    Conversation.started_at >= since,
-                    Conversation.resolution_time_seconds.isnot(None),
-                )
-            )
-        )
-        avg_resolution_time = avg_resolution_result.scalar() or 0
+        return {
+            "total_conversations": totals.total,
+            "by_status": by_status,
+            "by_intent": by_intent,
+            "avg_resolution_time_seconds": int(totals.avg_resolution or 0),
+            "avg_sentiment": round(float(totals.avg_sentiment or 0), 2),
+        }
+
+    async def get_support_history_stats(self, customer_id: UUID, top_issues: int = 3) -> dict:
+        """
+        Aggregate a customer's support history in the database
+
+        Two queries regardless of history size: one aggregate row and one
+        grouped top-intents query. No conversation rows are loaded.
 
-        # Average sentiment
-        avg_sentiment_result = await self.session.execute(
-            select(func.avg(Conversation.sentiment_avg)).where(
-                and_(Conversation.started_at >= since, Conversation.sentiment_avg.isnot(None))
+        Args:
+            customer_id: Customer UUID
+            top_issues: Number of most common intents to return
+
+        Returns:
+            Dict with total/resolved/escalated/open counts, average resolution
+            time in seconds (None if no resolved conversations), last
+            conversation start and most common intents
+        """
+        where = Conversation.customer_id == customer_id
+
+        totals = (
+            await self.session.execute(
+                select(
+                    func.count(Conversation.id).label("total"),
+                    func.count(Conversation.id)
+                    .filter(Conversation.status == "resolved")
+                    .label("resolved"),
+                    func.count(Conversation.id)
+                    .filter(Conversation.status == "escalated")
+                    .label("escalated"),
+                    func.count(Conversation.id)
+                    .filter(Conversation.status.in_(["active", "waiting"]))
+                    .label("open"),
+                    func.avg(Conversation.resolution_time_seconds).label("avg_resolution"),
+                    func.max(Conversation.started_at).label("last_started_at"),
+                ).where(where)
             )
-        )
-        avg_sentiment = avg_sentiment_result.scalar() or 0
+        ).one()
+
+        most_common_issues: list[str] = []
+        if totals.total:
+            intent_count = func.count(Conversation.id)
+            intent_result = await self.session.execute(
+                select(Conversation.primary_intent)
+                .where(and_(where, Conversation.primary_intent.isnot(None)))
+                .group_by(Conversation.primary_intent)
+                .order_by(intent_count.desc(), Conversation.primary_intent)
+                .limit(top_issues)
+            )
+            most_common_issues = list(intent_result.scalars().all())
 
         return {
-            "total_conversations": total_conversations,
-            "by_status": by_status,
-            "by_intent": by_intent,
-            "avg_resolution_time_seconds": int(avg_resolution_time),
-            "avg_sentiment": round(float(avg_sentiment), 2),
+            "total_conversations": totals.total or 0,
+            "resolved_conversations": totals.resolved or 0,
+            "escalated_conversations": totals.escalated or 0,
+            "open_conversations": totals.open or 0,
+            "avg_resolution_time_seconds": (
+                float(totals.avg_resolution) if totals.avg_resolution is not None else None
+            ),
+            "last_conversation": totals.last_started_at,
+            "most_common_issues": most_common_issues,
         }
 
     async def get_agent_usage_stats(self, days: int = 7) -> dict:
         """
         Get statistics on which agents are used most
 
+        Counts are computed in Postgres by unnesting agents_involved; the
+        time filter is served by idx_conversations_started_at_agents.
+
         Args:
             days: Number of days to analyze
 
@@ -267,17 +366,13 @@ class ConversationRepository(BaseRepository[Conversation]):
         """
         since = datetime.now(UTC) - timedelta(days=days)
 
+        agent = func.unnest(Conversation.agents_involved).label("agent")
+        usage = select(agent).where(Conversation.started_at >= since).subquery()
+
         result = await self.session.execute(
-            select(Conversation).where(
-                and_(Conversation.started_at >= since, Conversation.agents_involved.isnot(None))
-            )
+            select(usage.c.agent, func.count().label("count"))
+            .group_by(usage.c.agent)
+            .order_by(func.count().desc())
         )
-        conversations = result.scalars().all()
-
-        # Count agent usage
-        agent_counts = {}
-        for conv in conversations:
-            for agent in conv.agents_involved or []:
-                agent_counts[agent] = agent_counts.get(agent, 0) + 1
 
-        return agent_counts
+        return dict(result)
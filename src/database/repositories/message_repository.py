@@ -5,11 +5,24 @@ Message repository - Business logic for message data access
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import and_, case, func, or_, select, tuple_
 
 from src.database.base import BaseRepository
 from src.database.models import Message
 
+# Text search configuration of messages.search_vector (must match the migration)
+SEARCH_CONFIG = "english"
+
+# ts_headline options for search snippets
+SNIPPET_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# pg_trgm needs at least one trigram to use the index for ILIKE
+MIN_SUBSTRING_LENGTH = 3
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class MessageRepository(BaseRepository[Message]):
     """Repository for message operations"""
@@ -66,6 +79,66 @@ class MessageRepository(BaseRepository[Message]):
         )
         return list(result.scalars().all())
 
+    async def get_recent(
+        self,
+        conversation_id: UUID,
+        limit: int = 10,
+        before: tuple[datetime, UUID] | None = None,
+    ) -> list[Message]:
+        """
+        Get the last N messages of a conversation (keyset pagination)
+
+        Reads at most `limit` rows from idx_messages_conversation_created,
+        however long the conversation is. Pass the (created_at, id) of the
+        oldest message of one page as `before` to get the page preceding it.
+
+        Args:
+            conversation_id: Conversation UUID
+            limit: Maximum messages to return
+            before: Only messages strictly older than this (created_at, id) cursor
+
+        Returns:
+            List of messages in chronological order
+        """
+        query = select(Message).where(Message.conversation_id == conversation_id)
+        if before is not None:
+            query = query.where(tuple_(Message.created_at, Message.id) < tuple_(*before))
+
+        result = await self.session.execute(
+            query.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit)
+        )
+        return list(reversed(result.scalars().all()))
+
+    async def get_range(
+        self,
+        conversation_id: UUID,
+        after: tuple[datetime, UUID] | None = None,
+        before: tuple[datetime, UUID] | None = None,
+        limit: int = 100,
+    ) -> list[Message]:
+        """
+        Get messages between two (created_at, id) keyset cursors
+
+        Args:
+            conversation_id: Conversation UUID
+            after: Only messages strictly newer than this cursor
+            before: Only messages strictly older than this cursor
+            limit: Maximum messages to return (oldest first)
+
+        Returns:
+            List of messages in chronological order
+        """
+        query = select(Message).where(Message.conversation_id == conversation_id)
+        if after is not None:
+            query = query.where(tuple_(Message.created_at, Message.id) > tuple_(*after))
+        if before is not None:
+            query = query.where(tuple_(Message.created_at, Message.id) < tuple_(*before))
+
+        result = await self.session.execute(
+            query.order_by(Message.created_at.asc(), Message.id.asc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def get_latest_message(self, conversation_id: UUID) -> Message | None:
         """
         Get the most recent message in conversation
@@ -199,6 +272,79 @@ class MessageRepository(BaseRepository[Message]):
             "message_count": row.message_count or 0,
         }
 
+    async def search(
+        self,
+        query: str,
+        *,
+        conversation_id: UUID | None = None,
+        agent_name: str | None = None,
+        role: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[tuple[Message, float, str]]:
+        """
+        Ranked search over message content
+
+        Words and phrases are matched with the full-text index
+        (idx_messages_search_vector, websearch syntax: "quoted phrase",
+        -excluded, or); queries of MIN_SUBSTRING_LENGTH+ characters also match
+        as substrings through the trigram index (idx_messages_content_trgm).
+        Results are ordered by relevance, newest first on ties. Snippets are
+        only computed for the returned page.
+
+        Args:
+            query: Search text
+            conversation_id: Only messages of this conversation
+            agent_name: Only messages from this agent
+            role: Only messages with this role (user, assistant, system)
+            start_date: Only messages created at or after this time
+            end_date: Only messages created before this time
+            limit: Page size
+            offset: Results to skip
+
+        Returns:
+            List of (message, rank, snippet) with matched words in the
+            snippet wrapped in <mark></mark>
+        """
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        matches = Message.search_vector.bool_op("@@")(ts_query)
+        if len(query.strip()) >= MIN_SUBSTRING_LENGTH:
+            matches = or_(
+                matches, Message.content.ilike(f"%{_escape_like(query.strip())}%", escape="\\")
+            )
+
+        filters = [matches]
+        if conversation_id is not None:
+            filters.append(Message.conversation_id == conversation_id)
+        if agent_name is not None:
+            filters.append(Message.agent_name == agent_name)
+        if role is not None:
+            filters.append(Message.role == role)
+        if start_date is not None:
+            filters.append(Message.created_at >= start_date)
+        if end_date is not None:
+            filters.append(Message.created_at < end_date)
+
+        rank = func.ts_rank_cd(Message.search_vector, ts_query)
+        page = (
+            select(Message.id, rank.label("rank"))
+            .where(*filters)
+            .order_by(rank.desc(), Message.created_at.desc(), Message.id.desc())
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        snippet = func.ts_headline(SEARCH_CONFIG, Message.content, ts_query, SNIPPET_OPTIONS)
+        result = await self.session.execute(
+            select(Message, page.c.rank, snippet.label("snippet"))
+            .join(page, Message.id == page.c.id)
+            .order_by(page.c.rank.desc(), Message.created_at.desc(), Message.id.desc())
+        )
+        return [(message, float(rank), snippet) for message, rank, snippet in result.all()]
+
     async def search_content(self, search_term: str, limit: int = 50) -> list[Message]:
         """
         Search messages by content
@@ -208,12 +354,6 @@ class MessageRepository(BaseRepository[Message]):
             limit: Maximum results
 
         Returns:
-            List of matching messages
+            List of matching messages, most relevant first (see search())
         """
-        result = await self.session.execute(
-            select(Message)
-            .where(Message.content.ilike(f"%{search_term}%"))
-            .order_by(Message.created_at.desc())
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        return [message for message, _, _ in await self.search(search_term, limit=limit)]
@@ -101,6 +101,8 @@ from src.database.schemas.message import (
     MessageCreate,
     MessageInDB,
     MessageResponse,
+    MessageSearchHit,
+    MessageSearchResults,
     MessageSentimentDistribution,
     MessageUpdate,
 )
@@ -295,6 +297,8 @@ __all__ = [
     "MessageCreate",
     "MessageInDB",
     "MessageResponse",
+    "MessageSearchHit",
+    "MessageSearchResults",
     "MessageSentimentDistribution",
     "MessageUpdate",
     "PaymentBase",
@@ -62,6 +62,23 @@ class MessageResponse(MessageInDB):
     pass
 
 
+class MessageSearchHit(MessageInDB):
+    """Message matching a search, with its relevance and highlighted snippet"""
+
+    rank: float = 0.0
+    snippet: str = ""
+
+
+class MessageSearchResults(BaseModel):
+    """One page of message search results"""
+
+    query: str
+    results: list[MessageSearchHit] = Field(default_factory=list)
+    limit: int
+    offset: int
+    has_more: bool = False
+
+
 class MessageSentimentDistribution(BaseModel):
     """Message sentiment distribution for a conversation"""
 
@@ -0,0 +1,192 @@
+"""
+Embedding Model Registry - One shared sentence-transformers model per process
+
+VectorStore, the semantic response cache and the KB agents (KBEmbedder,
+FAQGenerator, KBGapDetector) all embed with the same model. Loading it
+separately in each of them keeps several copies of the weights per worker,
+so they get it from here instead:
+- Models are loaded lazily on first use, once per (model name) per process
+- Device, thread count and backend come from EmbeddingConfig (EMBEDDING_*)
+- Optional CPU int8 inference: quantized ONNX export, or dynamic torch
+  quantization of the Linear layers
+- warm_up_embedding_models() loads and exercises the default model ahead of
+  the first request (called from API startup)
+
+Query embeddings for a model share one QueryEmbeddingService, so its cache
+is shared too.
+"""
+
+import importlib.util
+import threading
+import time
+
+from src.core.config import get_settings
+from src.embedding_service import QueryEmbeddingService
+from src.utils.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+# Canonical model name -> loaded model / query service
+_models: dict[str, object] = {}
+_query_services: dict[str, QueryEmbeddingService] = {}
+_lock = threading.Lock()
+
+
+def embedding_models_available() -> bool:
+    """Check whether sentence-transformers is installed (without importing it)"""
+    return importlib.util.find_spec("sentence_transformers") is not None
+
+
+def canonical_model_name(model_name: str | None) -> str:
+    """
+    Resolve a model name
+
+    "all-MiniLM-L6-v2" and "sentence-transformers/all-MiniLM-L6-v2" are the
+    same model and must share one registry entry.
+    """
+    name = model_name or get_settings().embedding.model
+    return name if "/" in name else f"sentence-transformers/{name}"
+
+
+def get_embedding_model(model_name: str | None = None):
+    """
+    Get the shared SentenceTransformer for a model, loading it on first use
+
+    Args:
+        model_name: sentence-transformers model (defaults to EMBEDDING_MODEL)
+
+    Returns:
+        Loaded SentenceTransformer
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    name = canonical_model_name(model_name)
+
+    model = _models.get(name)
+    if model is None:
+        with _lock:
+            model = _models.get(name)
+            if model is None:
+                model = _load_model(name)
+                _models[name] = model
+    return model
+
+
+def get_query_embedding_service(model_name: str | None = None) -> QueryEmbeddingService:
+    """
+    Get the shared batched, cached query embedder for a model
+
+    Args:
+        model_name: sentence-transformers model (defaults to EMBEDDING_MODEL)
+
+    Returns:
+        QueryEmbeddingService over the shared model
+    """
+    name = canonical_model_name(model_name)
+
+    service = _query_services.get(name)
+    if service is None:
+        model = get_embedding_model(name)
+        with _lock:
+            service = _query_services.get(name)
+            if service is None:
+                service = QueryEmbeddingService(model)
+                _query_services[name] = service
+    return service
+
+
+def warm_up_embedding_models(model_names: list[str] | None = None) -> dict[str, int]:
+    """
+    Load models and run one encode so the first request does not pay for it
+
+    Blocking - call it from a worker thread in async code.
+
+    Args:
+        model_names: Models to warm (defaults to EMBEDDING_MODEL)
+
+    Returns:
+        Mapping of model name -> warm-up time in milliseconds
+    """
+    timings = {}
+    for model_name in model_names or [None]:
+        start = time.perf_counter()
+        get_embedding_model(model_name).encode(["warm up"], convert_to_numpy=True)
+        timings[canonical_model_name(model_name)] = int((time.perf_counter() - start) * 1000)
+
+    logger.info("embedding_models_warmed", models=timings)
+    return timings
+
+
+def loaded_models() -> list[str]:
+    """Get the names of models loaded in this process"""
+    return list(_models)
+
+
+def clear_embedding_models() -> None:
+    """Drop all loaded models and query services (for testing)"""
+    with _lock:
+        _models.clear()
+        _query_services.clear()
+
+
+def _load_model(name: str):
+    """Load a model according to EmbeddingConfig"""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    config = get_settings().embedding
+
+    if config.num_threads:
+        torch.set_num_threads(config.num_threads)
+
+    start = time.perf_counter()
+    backend = config.backend
+
+    if backend == "onnx":
+        try:
+            model = SentenceTransformer(name, device=config.device, **_onnx_kwargs(config))
+        except Exception as e:
+            # Missing optimum/onnxruntime or no ONNX export for this model
+            logger.warning(
+                "embedding_onnx_load_failed",
+                model=name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            backend = "torch"
+
+    if backend == "torch":
+        model = SentenceTransformer(name, device=config.device)
+        if config.quantize_int8 and model.device.type == "cpu":
+            torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+
+    logger.info(
+        "embedding_model_loaded",
+        model=name,
+        backend=backend,
+        device=config.device or "auto",
+        quantized=config.quantize_int8,
+        num_threads=config.num_threads,
+        duration_ms=int((time.perf_counter() - start) * 1000),
+    )
+    return model
+
+
+def _onnx_kwargs(config) -> dict:
+    """SentenceTransformer arguments for the ONNX Runtime backend"""
+    model_kwargs = {}
+
+    if config.quantize_int8:
+        model_kwargs["file_name"] = config.onnx_quantized_file
+
+    if config.num_threads:
+        import onnxruntime
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = config.num_threads
+        model_kwargs["session_options"] = session_options
+
+    return {"backend": "onnx", "model_kwargs": model_kwargs}
@@ -0,0 +1,247 @@
+"""
+Query Embedding Service - Batched, cached sentence-transformers encoding
+
+Sits between the request handlers and the SentenceTransformer model:
+- Micro-batches concurrent queries into a single encode() call
+- Runs encoding in a worker thread so the event loop never blocks
+- Keeps a bounded LRU cache of normalized query -> vector
+
+Used by VectorStore for query embeddings. Hit rate and batch sizes are
+exported through src/utils/monitoring/prometheus_metrics.py.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.logging.setup import get_logger
+from src.utils.monitoring.prometheus_metrics import record_embedding_batch, record_embedding_lookup
+
+logger = get_logger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """
+    Normalize a query for cache lookups
+
+    Lowercases and collapses whitespace so "How do I  reset my password?"
+    and "how do i reset my password?" share a cache entry.
+    """
+    return _WHITESPACE_RE.sub(" ", text.strip().lower())
+
+
+class QueryEmbeddingService:
+    """
+    Batched, cached query embedding on top of a SentenceTransformer model
+
+    Concurrent embed() calls that arrive within `batch_window_ms` of each
+    other are encoded together. A batch is flushed early once it reaches
+    `max_batch_size`. Identical normalized queries in flight at the same
+    time share one slot in the batch.
+
+    Normalization only builds the cache key: the model always encodes the
+    query text as given, on both the async and the sync path.
+
+    Example:
+        service = QueryEmbeddingService(SentenceTransformer("all-MiniLM-L6-v2"))
+        vector = await service.embed("How do I upgrade?")
+    """
+
+    def __init__(
+        self,
+        model,
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 32,
+        cache_size: int = 2048,
+        max_workers: int = 1,
+    ):
+        """
+        Initialize embedding service
+
+        Args:
+            model: Loaded SentenceTransformer (anything with encode())
+            batch_window_ms: How long to wait for more queries before encoding
+            max_batch_size: Flush immediately once this many queries are pending
+            cache_size: Maximum cached vectors (0 disables caching)
+            max_workers: Encoding threads. One is usually right: the model is
+                         already parallel internally and batching does the rest.
+        """
+        self.model = model
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.cache_size = cache_size
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="embedding")
+
+        # LRU cache shared by the async and sync paths
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Pending batch for the running event loop: key -> (text, future)
+        self._pending: dict[str, tuple[str, asyncio.Future]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def embed(self, text: str) -> list[float]:
+        """
+        Embed a query without blocking the event loop
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+        """
+        key = normalize_query(text)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        # Same query already waiting for the next batch - share its result
+        pending = self._pending.get(key)
+        if pending is not None:
+            future = pending[1]
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = (text, future)
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await asyncio.shield(future)
+
+    def embed_sync(self, text: str) -> list[float]:
+        """
+        Embed a query from synchronous code (scripts, sync search paths)
+
+        Uses the same cache as embed() but encodes inline.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+        """
+        key = normalize_query(text)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        vector = self._encode([text])[0]
+        self._cache_put(key, vector)
+        return vector
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "cache_size": len(self._cache),
+            "cache_capacity": self.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached vectors (e.g. after switching models)"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Batching
+    # ------------------------------------------------------------------
+
+    def _flush(self) -> None:
+        """Hand the pending batch to the encoder thread"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = {}
+
+        asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: dict[str, tuple[str, asyncio.Future]]) -> None:
+        """Encode one batch off-loop and resolve its futures"""
+        keys = list(batch)
+        texts = [text for text, _ in batch.values()]
+        loop = asyncio.get_running_loop()
+
+        try:
+            vectors = await loop.run_in_executor(self._executor, self._encode, texts)
+        except Exception as e:
+            logger.error(
+                "embedding_batch_failed",
+                batch_size=len(keys),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, vector in zip(keys, vectors, strict=True):
+            self._cache_put(key, vector)
+            future = batch[key][1]
+            if not future.done():
+                future.set_result(vector)
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
+        """Run the model on a batch (called in the worker thread or inline)"""
+        start_time = time.time()
+        embeddings = self.model.encode(texts, convert_to_numpy=True)
+        record_embedding_batch(len(texts), time.time() - start_time)
+        return embeddings.tolist()
+
+    # ------------------------------------------------------------------
+    # LRU cache
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> list[float] | None:
+        if self.cache_size <= 0:
+            return None
+
+        with self._cache_lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+
+        hit = vector is not None
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        record_embedding_lookup(hit)
+
+        return vector
+
+    def _cache_put(self, key: str, vector: list[float]) -> None:
+        if self.cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
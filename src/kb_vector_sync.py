@@ -0,0 +1,366 @@
+"""
+KB Vector Sync - Incremental, content-hashed sync of KB articles into Qdrant
+
+Articles are split into chunks with deterministic point IDs
+(uuid5 of article ID + chunk index). Every point carries the hash of what
+produced it (text, payload and embedding model) in its payload, so the
+collection itself is the manifest:
+
+- Chunks whose hash matches the stored one are skipped (not re-embedded)
+- New or changed chunks are embedded in batches across articles, and each
+  batch is upserted while the next one is encoded (bounded concurrency)
+- Points no longer produced by any synced article are deleted
+  (e.g. an article got shorter, was deactivated, or was written by an
+  older indexer with other point IDs)
+
+Each upserted batch stores vectors and hashes together, so an interrupted
+sync resumes where it stopped: the next run skips what was already written.
+
+Example:
+    sync = KBVectorSync(client, "kb_articles", get_embedding_model())
+    stats = await sync.sync(articles, prune=True)  # full corpus
+    await sync.sync([article])  # one article, prunes only its own chunks
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from qdrant_client.models import FieldCondition, Filter, MatchAny, PointIdsList, PointStruct
+
+from src.embedding_models import canonical_model_name
+from src.utils.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 512  # words (token approximation)
+CHUNK_OVERLAP = 50  # words
+
+# Namespace for deterministic chunk point IDs
+_POINT_NAMESPACE = uuid.UUID("6f1c2a54-6f7e-4d5e-9d0a-6b1c3b2f7a10")
+
+ProgressCallback = Callable[[dict[str, Any]], None]
+
+
+@dataclass
+class ArticleChunk:
+    """One point to write: the text to embed and its payload"""
+
+    point_id: str
+    article_id: str
+    text: str
+    payload: dict[str, Any]
+
+
+def chunk_text(text: str, size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
+    """
+    Split text into chunks of `size` words, consecutive chunks sharing `overlap` words
+
+    Args:
+        text: Full text
+        size: Words per chunk
+        overlap: Words repeated at the start of the next chunk
+
+    Returns:
+        List of chunks (a single chunk for short text)
+    """
+    words = text.split()
+    if len(words) <= size:
+        return [text]
+    return [" ".join(words[i : i + size]) for i in range(0, len(words), size - overlap)]
+
+
+def chunk_point_id(article_id: str, chunk_index: int) -> str:
+    """Deterministic Qdrant point ID of an article chunk"""
+    return str(uuid.uuid5(_POINT_NAMESPACE, f"{article_id}:{chunk_index}"))
+
+
+def build_chunks(article: dict[str, Any], model_name: str | None = None) -> list[ArticleChunk]:
+    """
+    Split an article into chunks with hashed payloads
+
+    The title is prepended to every chunk's embedded text; the payload's
+    `content` is the chunk itself (the whole content for short articles).
+    The embedding model is part of the hash, so changing it re-embeds
+    every chunk on the next sync.
+
+    Args:
+        article: Dict with id (or article_id), title, content and optional
+                 category, tags, url
+        model_name: Embedding model the chunks are embedded with
+                    (defaults to EMBEDDING_MODEL)
+
+    Returns:
+        Chunks in order
+    """
+    article_id = str(article.get("id", article.get("article_id", "")))
+    title = article.get("title", "")
+    contents = chunk_text(article.get("content", ""))
+    model = canonical_model_name(model_name)
+
+    chunks = []
+    for idx, content in enumerate(contents):
+        text = f"{title}\n\n{content}"
+        payload = {
+            "doc_id": article_id,
+            "article_id": article_id,
+            "title": title,
+            "content": content,
+            "category": article.get("category", ""),
+            "tags": article.get("tags") or [],
+            "url": article.get("url") or f"/kb/{article_id}",
+            "chunk_index": idx,
+            "total_chunks": len(contents),
+        }
+        payload["content_hash"] = hashlib.sha256(
+            json.dumps([model, text, payload], sort_keys=True, default=str).encode()
+        ).hexdigest()
+        chunks.append(
+            ArticleChunk(
+                point_id=chunk_point_id(article_id, idx),
+                article_id=article_id,
+                text=text,
+                payload=payload,
+            )
+        )
+    return chunks
+
+
+class KBVectorSync:
+    """Incrementally syncs articles into a Qdrant collection (see module docstring)"""
+
+    def __init__(
+        self,
+        client,
+        collection_name: str,
+        embedding_model,
+        embed_batch_size: int = 64,
+        upsert_concurrency: int = 4,
+        progress: ProgressCallback | None = None,
+        model_name: str | None = None,
+    ):
+        """
+        Initialize sync
+
+        Args:
+            client: QdrantClient
+            collection_name: Target collection
+            embedding_model: SentenceTransformer (shared, see src/embedding_models.py)
+            embed_batch_size: Chunks per encode() call and per upsert
+            upsert_concurrency: Upserts in flight while the next batch is encoded
+            progress: Called with the running stats after every batch
+            model_name: Name of embedding_model, hashed into every chunk
+                        (defaults to EMBEDDING_MODEL)
+        """
+        self.client = client
+        self.collection_name = collection_name
+        self.embedding_model = embedding_model
+        self.embed_batch_size = embed_batch_size
+        self.upsert_concurrency = upsert_concurrency
+        self.progress = progress
+        self.model_name = model_name
+
+    async def sync(
+        self, articles: list[dict[str, Any]], prune: bool = False, force: bool = False
+    ) -> dict[str, Any]:
+        """
+        Embed and upsert new or changed chunks, delete stale ones
+
+        Args:
+            articles: Articles to sync
+            prune: The articles are the whole corpus - also delete points of
+                   articles not in the list. Otherwise only stale chunks of
+                   the given articles are deleted.
+            force: Re-embed unchanged chunks too
+
+        Returns:
+            Stats: articles, chunks, unchanged, embedded, failed, deleted,
+            failed_article_ids, duration_ms
+        """
+        start = time.perf_counter()
+        chunks = [chunk for article in articles for chunk in build_chunks(article, self.model_name)]
+        article_ids = {chunk.article_id for chunk in chunks}
+        manifest = await self.load_manifest(None if prune else article_ids)
+
+        pending = [
+            chunk
+            for chunk in chunks
+            if force or manifest.get(chunk.point_id) != chunk.payload["content_hash"]
+        ]
+        wanted = {chunk.point_id for chunk in chunks}
+        stale = [point_id for point_id in manifest if point_id not in wanted]
+
+        stats = {
+            "articles": len(article_ids),
+            "chunks": len(chunks),
+            "unchanged": len(chunks) - len(pending),
+            "embedded": 0,
+            "failed": 0,
+            "deleted": 0,
+            "failed_article_ids": [],
+        }
+        logger.info(
+            "kb_vector_sync_planned",
+            collection=self.collection_name,
+            articles=stats["articles"],
+            chunks=stats["chunks"],
+            to_embed=len(pending),
+            to_delete=len(stale),
+        )
+
+        await self._embed_and_upsert(pending, stats)
+
+        # Delete last: until the new points are in, the old ones keep serving
+        if stale:
+            stats["deleted"] = await self._delete_points(stale)
+
+        stats["duration_ms"] = int((time.perf_counter() - start) * 1000)
+        logger.info(
+            "kb_vector_sync_completed",
+            collection=self.collection_name,
+            **{k: v for k, v in stats.items() if k != "failed_article_ids"},
+        )
+        return stats
+
+    async def load_manifest(self, article_ids: set[str] | None = None) -> dict[str, str | None]:
+        """
+        Read point ID -> content hash from the collection (payload only, no vectors)
+
+        Args:
+            article_ids: Only points of these articles (None = whole collection)
+
+        Returns:
+            Dict of point ID to stored content hash (None for points
+            written without one)
+        """
+        if article_ids is not None and not article_ids:
+            return {}
+
+        scroll_filter = None
+        if article_ids is not None:
+            scroll_filter = Filter(
+                must=[FieldCondition(key="doc_id", match=MatchAny(any=sorted(article_ids)))]
+            )
+
+        manifest: dict[str, str | None] = {}
+        offset = None
+        while True:
+            points, offset = await asyncio.to_thread(
+                self.client.scroll,
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=1000,
+                offset=offset,
+                with_payload=["content_hash"],
+                with_vectors=False,
+            )
+            for point in points:
+                manifest[str(point.id)] = (point.payload or {}).get("content_hash")
+            if offset is None:
+                return manifest
+
+    async def delete_articles(self, article_ids: list[str]) -> None:
+        """Delete every point of the given articles"""
+        if not article_ids:
+            return
+        await asyncio.to_thread(
+            self.client.delete,
+            collection_name=self.collection_name,
+            points_selector=Filter(
+                must=[FieldCondition(key="doc_id", match=MatchAny(any=list(article_ids)))]
+            ),
+        )
+        logger.info("kb_vector_articles_deleted", article_count=len(article_ids))
+
+    async def _embed_and_upsert(self, chunks: list[ArticleChunk], stats: dict[str, Any]) -> None:
+        """Encode batches in a worker thread, upserting each while the next is encoded"""
+        semaphore = asyncio.Semaphore(self.upsert_concurrency)
+        upserts: list[asyncio.Task] = []
+
+        async def upsert(batch: list[ArticleChunk], vectors) -> None:
+            points = [
+                PointStruct(id=chunk.point_id, vector=vector.tolist(), payload=chunk.payload)
+                for chunk, vector in zip(batch, vectors, strict=True)
+            ]
+            try:
+                await asyncio.to_thread(
+                    self.client.upsert, collection_name=self.collection_name, points=points
+                )
+                stats["embedded"] += len(batch)
+            except Exception as e:
+                self._record_failure(batch, stats, e)
+            finally:
+                semaphore.release()
+            self._report(stats)
+
+        for i in range(0, len(chunks), self.embed_batch_size):
+            batch = chunks[i : i + self.embed_batch_size]
+            await semaphore.acquire()
+            try:
+                vectors = await asyncio.to_thread(
+                    self.embedding_model.encode,
+                    [chunk.text for chunk in batch],
+                    batch_size=self.embed_batch_size,
+                    convert_to_numpy=True,
+                )
+            except Exception as e:
+                semaphore.release()
+                self._record_failure(batch, stats, e)
+                self._report(stats)
+                continue
+            upserts.append(asyncio.create_task(upsert(batch, vectors)))
+
+        if upserts:
+            await asyncio.gather(*upserts)
+
+    async def _delete_points(self, point_ids: list[str]) -> int:
+        """Delete points by ID in batches; returns how many were deleted"""
+        deleted = 0
+        for i in range(0, len(point_ids), 1000):
+            batch = point_ids[i : i + 1000]
+            try:
+                await asyncio.to_thread(
+                    self.client.delete,
+                    collection_name=self.collection_name,
+                    points_selector=PointIdsList(points=batch),
+                )
+                deleted += len(batch)
+            except Exception as e:
+                logger.warning(
+                    "kb_vector_sync_delete_failed",
+                    point_count=len(batch),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        return deleted
+
+    @staticmethod
+    def _record_failure(batch: list[ArticleChunk], stats: dict[str, Any], error: Exception) -> None:
+        stats["failed"] += len(batch)
+        failed = set(stats["failed_article_ids"])
+        stats["failed_article_ids"].extend(
+            {chunk.article_id for chunk in batch if chunk.article_id not in failed}
+        )
+        logger.warning(
+            "kb_vector_sync_batch_failed",
+            chunk_count=len(batch),
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+
+    def _report(self, stats: dict[str, Any]) -> None:
+        done = stats["unchanged"] + stats["embedded"] + stats["failed"]
+        logger.info(
+            "kb_vector_sync_progress",
+            done=done,
+            total=stats["chunks"],
+            embedded=stats["embedded"],
+            failed=stats["failed"],
+        )
+        if self.progress is not None:
+            self.progress({**stats, "done": done})
@@ -1,15 +1,42 @@
 """
 Knowledge Base - Search and retrieve articles
 vector search.. Falls back to keyword search if needed.
+Semantic search uses the in-process LocalVectorIndex when one has been
+built (see scripts/embed_articles.py), and Qdrant otherwise.
 """
 
 import json
-
+import threading
+import time
+from pathlib import Path
+
+from src.bm25_index import BM25Index
+from src.core.config import get_settings
+from src.embedding_models import get_query_embedding_service
+from src.local_vector_index import LocalVectorIndex
 from src.vector_store import VectorStore
 
 # Global vector store instance (initialized on first use)
 _vector_store = None
 
+# Global in-process index (False = tried and unavailable)
+_local_index: LocalVectorIndex | bool | None = None
+
+# Global keyword index (reused across requests, reloaded when its file changes)
+_keyword_index: BM25Index | None = None
+_keyword_index_mtime: float | None = None  # None = built from data/articles.json
+_keyword_index_checked = 0.0
+_keyword_index_lock = threading.Lock()
+
+# Serialized keyword index, written next to the local vector index
+KEYWORD_INDEX_FILE = "bm25.json"
+
+# Minimum seconds between checks for a new keyword index file
+KEYWORD_INDEX_RELOAD_INTERVAL = 5.0
+
+# Reciprocal rank fusion constant for hybrid search
+RRF_K = 60
+
 
 def get_vector_store() -> VectorStore:
     """Get or initialize vector store singleton"""
@@ -23,6 +50,116 @@ def get_vector_store() -> VectorStore:
     return _vector_store
 
 
+def get_local_index() -> LocalVectorIndex | None:
+    """Get or load the in-process vector index (None if not built or disabled)"""
+    global _local_index
+    if _local_index is None:
+        settings = get_settings()
+        if settings.qdrant.local_index_mode == "disabled":
+            _local_index = False
+        else:
+            try:
+                _local_index = LocalVectorIndex(
+                    settings.qdrant.local_index_path, expected_model=settings.embedding.model
+                )
+            except FileNotFoundError:
+                _local_index = False
+            except Exception as e:
+                print(f"Warning: Could not load local vector index: {e}")
+                _local_index = False
+    return _local_index or None
+
+
+def _search_local(query: str, category: str | None, limit: int) -> list[dict] | None:
+    """
+    Search the in-process index
+
+    The query is embedded through the shared query embedding service, so
+    this works without a VectorStore (e.g. when Qdrant is unreachable).
+
+    Returns:
+        Results, or None if the local index is unavailable
+    """
+    index = get_local_index()
+    if index is None:
+        return None
+
+    query_vector = get_query_embedding_service().embed_sync(query)
+    return _search_index(index, query_vector, category, limit)
+
+
+async def _search_local_async(query: str, category: str | None, limit: int) -> list[dict] | None:
+    """Async variant of _search_local (query embedding batched off-loop)"""
+    index = get_local_index()
+    if index is None:
+        return None
+
+    query_vector = await get_query_embedding_service().embed(query)
+    return _search_index(index, query_vector, category, limit)
+
+
+def _search_index(
+    index: LocalVectorIndex, query_vector: list[float], category: str | None, limit: int
+) -> list[dict]:
+    """Search the in-process index, retrying without the category if it has no hits"""
+    results = index.search(query_vector, category=category, limit=limit, score_threshold=0.3)
+
+    # If no results, try without category filter
+    if not results and category:
+        results = index.search(query_vector, category=None, limit=limit, score_threshold=0.3)
+
+    return results
+
+
+def get_keyword_index() -> BM25Index:
+    """
+    Get the BM25 keyword index singleton
+
+    Loads the serialized index written by scripts/embed_articles.py when
+    present, otherwise builds one from data/articles.json. Like the local
+    vector index, it is reloaded when the file's mtime changes (checked at
+    most every KEYWORD_INDEX_RELOAD_INTERVAL seconds); if the new file
+    cannot be read, the current index keeps serving.
+    """
+    global _keyword_index, _keyword_index_mtime, _keyword_index_checked
+
+    now = time.monotonic()
+    if _keyword_index is not None and now - _keyword_index_checked < KEYWORD_INDEX_RELOAD_INTERVAL:
+        return _keyword_index
+
+    with _keyword_index_lock:
+        if (
+            _keyword_index is not None
+            and now - _keyword_index_checked < KEYWORD_INDEX_RELOAD_INTERVAL
+        ):
+            return _keyword_index
+        _keyword_index_checked = now
+
+        index_file = Path(get_settings().qdrant.local_index_path) / KEYWORD_INDEX_FILE
+        try:
+            mtime = index_file.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if _keyword_index is not None and mtime == _keyword_index_mtime:
+            return _keyword_index
+
+        if mtime is None:
+            _keyword_index = BM25Index.from_articles(load_articles())
+        else:
+            try:
+                _keyword_index = BM25Index.load(index_file)
+            except Exception as e:
+                if _keyword_index is not None:
+                    print(f"Warning: Could not reload keyword index: {e}, keeping current one")
+                    return _keyword_index
+                print(f"Warning: Could not load keyword index: {e}, rebuilding")
+                _keyword_index = BM25Index.from_articles(load_articles())
+
+        _keyword_index_mtime = mtime
+        return _keyword_index
+
+
 def load_articles() -> list[dict]:
     """Load articles from JSON file (for keyword search fallback)"""
     try:
@@ -52,9 +189,25 @@ def search_articles_vector(query: str, category: str | None = None, limit: int =
     vs = get_vector_store()
 
     if vs is None:
+        try:
+            results = _search_local(query, category, limit)
+            if results:
+                return results
+        except Exception as e:
+            print(f"Local vector search error: {e}")
         print("Vector search not available, falling back to keyword search")
         return search_articles_keyword(query, category, limit)
 
+    mode = get_settings().qdrant.local_index_mode
+
+    if mode == "primary":
+        try:
+            results = _search_local(query, category, limit)
+            if results is not None:
+                return results
+        except Exception as e:
+            print(f"Local vector search error: {e}, trying Qdrant")
+
     try:
         # Use lower threshold for better recall
         results = vs.search(
@@ -69,6 +222,77 @@ def search_articles_vector(query: str, category: str | None = None, limit: int =
             print(f"No results in '{category}', searching all categories...")
             results = vs.search(query=query, category=None, limit=limit, score_threshold=0.3)
 
+        # VectorStore.search() reports Qdrant errors as empty results
+        if not results and mode == "fallback":
+            local_results = _search_local(query, category, limit)
+            if local_results:
+                return local_results
+
+        return results
+
+    except Exception as e:
+        print(f"Vector search error: {e}, falling back to keyword search")
+        return search_articles_keyword(query, category, limit)
+
+
+async def search_articles_vector_async(
+    query: str, category: str | None = None, limit: int = 3
+) -> list[dict]:
+    """
+    Search articles using vector similarity, for callers on the event loop
+
+    Same fallbacks as search_articles_vector(), but the query embedding is
+    batched through the embedding service and the Qdrant round trip runs
+    in a worker thread.
+
+    Args:
+        query: Search query (user's question)
+        category: Filter by category (billing, technical, usage)
+        limit: Maximum number of results
+
+    Returns:
+        List of matching articles with similarity scores
+    """
+    vs = get_vector_store()
+
+    if vs is None:
+        try:
+            results = await _search_local_async(query, category, limit)
+            if results:
+                return results
+        except Exception as e:
+            print(f"Local vector search error: {e}")
+        print("Vector search not available, falling back to keyword search")
+        return search_articles_keyword(query, category, limit)
+
+    mode = get_settings().qdrant.local_index_mode
+
+    if mode == "primary":
+        try:
+            results = await _search_local_async(query, category, limit)
+            if results is not None:
+                return results
+        except Exception as e:
+            print(f"Local vector search error: {e}, trying Qdrant")
+
+    try:
+        results = await vs.search_async(
+            query=query, category=category, limit=limit, score_threshold=0.3
+        )
+
+        # If no results, try without category filter
+        if not results and category:
+            print(f"No results in '{category}', searching all categories...")
+            results = await vs.search_async(
+                query=query, category=None, limit=limit, score_threshold=0.3
+            )
+
+        # VectorStore.search_async() reports Qdrant errors as empty results
+        if not results and mode == "fallback":
+            local_results = await _search_local_async(query, category, limit)
+            if local_results:
+                return local_results
+
         return results
 
     except Exception as e:
@@ -80,6 +304,9 @@ def search_articles_keyword(query: str, category: str | None = None, limit: int
     """
     Search articles by keyword matching (FALLBACK)
 
+    Uses the prebuilt BM25 inverted index, so a query only touches the
+    postings of its own terms.
+
     Args:
         query: Search query (user's question)
         category: Filter by category (billing, technical, usage)
@@ -88,70 +315,56 @@ def search_articles_keyword(query: str, category: str | None = None, limit: int
     Returns:
         List of matching articles, sorted by relevance
     """
-    articles = load_articles()
+    return get_keyword_index().search(query, category=category, limit=limit)
 
-    if not articles:
-        return []
 
-    # Filter by category if provided
-    if category:
-        articles = [a for a in articles if a["category"] == category]
-
-    # Convert query to lowercase for matching
-    query_lower = query.lower()
-    query_words = set(query_lower.split())
-
-    # Score each article
-    results = []
-    for article in articles:
-        score = 0
-
-        # Check title (highest weight)
-        if query_lower in article["title"].lower():
-            score += 10
-
-        # Check content
-        if query_lower in article["content"].lower():
-            score += 5
-
-        # Check tags
-        for tag in article["tags"]:
-            if tag.lower() in query_lower or query_lower in tag.lower():
-                score += 3
-
-        # Check individual words
-        content_lower = (article["title"] + " " + article["content"]).lower()
-        for word in query_words:
-            if len(word) > 2 and word in content_lower:  # Skip short words
-                score += 1
-
-        if score > 0:
-            results.append({"article": article, "score": score})
-
-    # Sort by score (highest first)
-    results.sort(key=lambda x: x["score"], reverse=True)
-
-    # Return top results (convert to same format as vector search)
-    formatted_results = []
-    for r in results[:limit]:
-        article = r["article"]
-        formatted_results.append(
-            {
-                "doc_id": article["id"],
-                "title": article["title"],
-                "content": article["content"],
-                "category": article["category"],
-                "tags": article.get("tags", []),
-                "similarity_score": r["score"] / 20,  # Normalize to 0-1 range
-            }
-        )
+def search_articles_hybrid(query: str, category: str | None = None, limit: int = 3) -> list[dict]:
+    """
+    Search articles with vector + BM25 results fused by reciprocal rank
 
-    return formatted_results
+    Each result keeps the similarity_score of its best-ranked source and
+    gains an "rrf_score" used for ordering. An article contributes one rank
+    term per source (its best-ranked hit), however many chunks matched.
+
+    Args:
+        query: Search query (user's question)
+        category: Filter by category (billing, technical, usage)
+        limit: Maximum number of results
+
+    Returns:
+        List of matching articles, sorted by fused rank
+    """
+    # Over-fetch so fusion has candidates from both sides
+    candidates = max(limit * 3, 10)
+    vector_results = search_articles_vector(query, category, candidates)
+    keyword_results = search_articles_keyword(query, category, candidates)
+
+    fused: dict[str, dict] = {}
+    for results in (vector_results, keyword_results):
+        seen: set[str] = set()
+        rank = 0
+        for result in results:
+            doc_id = result["doc_id"]
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            rank += 1
+            entry = fused.get(doc_id)
+            if entry is None:
+                entry = fused[doc_id] = {**result, "rrf_score": 0.0}
+            entry["rrf_score"] += 1.0 / (RRF_K + rank)
+
+    ranked = sorted(fused.values(), key=lambda r: r["rrf_score"], reverse=True)
+    return ranked[:limit]
 
 
 # Main search function (use this in your agent)
 def search_articles(
-    query: str, category: str | None = None, limit: int = 3, use_vector: bool = True
+    query: str,
+    category: str | None = None,
+    limit: int = 3,
+    use_vector: bool = True,
+    hybrid: bool = False,
 ) -> list[dict]:
     """
     Search articles (automatically chooses best method)
@@ -161,10 +374,13 @@ def search_articles(
         category: Filter by category
         limit: Max results
         use_vector: Use vector search if available (default: True)
+        hybrid: Fuse vector and BM25 results (default: False)
 
     Returns:
         List of matching articles
     """
+    if hybrid:
+        return search_articles_hybrid(query, category, limit)
     if use_vector:
         return search_articles_vector(query, category, limit)
     else:
@@ -0,0 +1,198 @@
+"""
+Backend Router - Latency-aware backend selection and hedging
+
+UnifiedLLMClient sends every call to litellm_config.current_backend unless
+routing is enabled (LLM_ROUTING_ENABLED). The router keeps statistics for
+each backend from every call the client makes:
+
+- Latency: exponentially weighted moving average (EWMA) of successful
+  calls, and a window of recent latencies for the p95.
+- Errors: EWMA of the failure rate and the count of consecutive failures.
+  A backend is ejected for cooldown_seconds when either reaches its limit
+  (failure_threshold, max_error_rate). Once the cooldown ends it takes
+  traffic again, and the next failure ejects it again.
+
+With routing enabled, each call goes to the best healthy backend. The
+current backend stays first unless it is ejected or another backend is
+more than switch_ratio times faster: Anthropic and vLLM serve different
+models at different prices, so a small latency gap does not move traffic.
+
+Hedging: calls for latency-critical model tiers (LLM_ROUTING_HEDGE_TIERS)
+go to the first backend and, if it has not answered within its p95
+latency, to the second one as well. The first success wins and the other
+request is cancelled.
+
+Part of: Phase 2 - LiteLLM Multi-Backend Abstraction Layer
+"""
+
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from src.core.config import LLMRoutingConfig, get_settings
+from src.llm.litellm_config import LLMBackend
+
+logger = structlog.get_logger(__name__)
+
+RECENT_WINDOW = 200
+MIN_P95_SAMPLES = 20
+
+
+@dataclass
+class BackendStats:
+    """Running statistics for one backend"""
+
+    latency_ms: float | None = None
+    error_rate: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=RECENT_WINDOW))
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    calls: int = 0
+
+
+class BackendRouter:
+    """
+    Per-backend latency and error tracking for routing and hedging.
+
+    Usage:
+        >>> router = BackendRouter()
+        >>> router.record(LLMBackend.VLLM, latency_ms=850.0, success=True)
+        >>> router.rank([LLMBackend.ANTHROPIC, LLMBackend.VLLM], preferred=LLMBackend.VLLM)
+        [<LLMBackend.VLLM: 'vllm'>, <LLMBackend.ANTHROPIC: 'anthropic'>]
+        >>> router.hedge_delay(LLMBackend.VLLM)  # seconds
+        1.0
+    """
+
+    def __init__(self, config: LLMRoutingConfig | None = None):
+        self.config = config or get_settings().llm_routing
+        self._stats: dict[LLMBackend, BackendStats] = {b: BackendStats() for b in LLMBackend}
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def should_hedge(self, model_tier: str) -> bool:
+        """Whether calls for this model tier are hedged by default"""
+        return self.config.enabled and model_tier in self.config.hedge_tiers
+
+    def record(self, backend: LLMBackend, latency_ms: float, success: bool) -> None:
+        """
+        Record a finished call.
+
+        Args:
+            backend: Backend that served the call
+            latency_ms: Call latency in milliseconds
+            success: Whether the call succeeded
+        """
+        stats = self._stats[backend]
+        alpha = self.config.ewma_alpha
+        stats.calls += 1
+        stats.error_rate += alpha * ((0.0 if success else 1.0) - stats.error_rate)
+
+        if success:
+            stats.consecutive_failures = 0
+            stats.recent.append(latency_ms)
+            stats.latency_ms = (
+                latency_ms
+                if stats.latency_ms is None
+                else stats.latency_ms + alpha * (latency_ms - stats.latency_ms)
+            )
+            return
+
+        stats.consecutive_failures += 1
+        if (
+            stats.consecutive_failures >= self.config.failure_threshold
+            or stats.error_rate >= self.config.max_error_rate
+        ):
+            stats.ejected_until = time.monotonic() + self.config.cooldown_seconds
+            logger.warning(
+                "llm_backend_ejected",
+                backend=backend.value,
+                consecutive_failures=stats.consecutive_failures,
+                error_rate=round(stats.error_rate, 3),
+                cooldown_seconds=self.config.cooldown_seconds,
+            )
+
+    def record_abandoned(self, backend: LLMBackend, latency_ms: float) -> None:
+        """
+        Record a call cancelled before it finished (e.g. a hedge loser).
+
+        Its latency is only a lower bound, so it can raise the latency EWMA
+        but never lower it, and it stays out of the p95 window. Without this,
+        a backend that always loses hedges would keep its old, fast EWMA.
+        """
+        stats = self._stats[backend]
+        if stats.latency_ms is not None and latency_ms > stats.latency_ms:
+            stats.latency_ms += self.config.ewma_alpha * (latency_ms - stats.latency_ms)
+
+    def is_healthy(self, backend: LLMBackend) -> bool:
+        """False while the backend is ejected"""
+        return time.monotonic() >= self._stats[backend].ejected_until
+
+    def rank(self, candidates: list[LLMBackend], preferred: LLMBackend) -> list[LLMBackend]:
+        """
+        Order backends for a call, best first.
+
+        Healthy backends come first, by latency EWMA with every backend but
+        the preferred one penalized by switch_ratio. A backend with no
+        latency samples yet ranks first if preferred and last otherwise.
+        Ejected backends follow, soonest back first, as a last resort.
+
+        Args:
+            candidates: Backends that can take the call
+            preferred: The selected backend (litellm_config.current_backend)
+
+        Returns:
+            candidates, reordered
+        """
+
+        def score(backend: LLMBackend) -> float:
+            latency = self._stats[backend].latency_ms
+            if backend == preferred:
+                return latency or 0.0
+            return float("inf") if latency is None else latency * self.config.switch_ratio
+
+        healthy = sorted((b for b in candidates if self.is_healthy(b)), key=score)
+        ejected = sorted(
+            (b for b in candidates if not self.is_healthy(b)),
+            key=lambda b: self._stats[b].ejected_until,
+        )
+        return healthy + ejected
+
+    def hedge_delay(self, backend: LLMBackend) -> float:
+        """
+        Seconds to wait on a backend before hedging.
+
+        The p95 of its recent latencies once there are enough samples,
+        hedge_delay_ms before that; never below min_hedge_delay_ms.
+        """
+        recent = self._stats[backend].recent
+        if len(recent) >= MIN_P95_SAMPLES:
+            delay_ms = statistics.quantiles(recent, n=20)[-1]
+        else:
+            delay_ms = self.config.hedge_delay_ms
+        return max(delay_ms, self.config.min_hedge_delay_ms) / 1000
+
+    def get_stats(self) -> dict[str, Any]:
+        """Routing statistics per backend"""
+        return {
+            backend.value: {
+                "healthy": self.is_healthy(backend),
+                "calls": stats.calls,
+                "latency_ewma_ms": (
+                    round(stats.latency_ms, 2) if stats.latency_ms is not None else None
+                ),
+                "error_rate_ewma": round(stats.error_rate, 4),
+                "consecutive_failures": stats.consecutive_failures,
+                "hedge_delay_ms": round(self.hedge_delay(backend) * 1000, 2),
+            }
+            for backend, stats in self._stats.items()
+        }
+
+    def reset(self) -> None:
+        """Forget all statistics"""
+        self._stats = {b: BackendStats() for b in LLMBackend}
@@ -13,10 +13,17 @@ Features:
 - Cost tracking
 - Metrics collection
 - Response streaming support
+- Coalescing of identical concurrent calls (single-flight)
+- Provider prompt caching (cache_control breakpoints, cached-token accounting)
+- Latency-aware backend routing and hedged requests (see backend_router.py)
 
 Part of: Phase 2 - LiteLLM Multi-Backend Abstraction Layer
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import time
 from collections.abc import AsyncIterator
 from typing import Any
@@ -25,13 +32,53 @@ import litellm
 import structlog
 from litellm import acompletion
 
-from src.llm.litellm_config import LLMBackend, litellm_config
+from src.llm.backend_router import BackendRouter
+from src.llm.litellm_config import LLMBackend, ModelConfig, litellm_config
 from src.utils.cost_tracking import cost_tracker
 from src.utils.monitoring.metrics import llm_metrics
+from src.utils.monitoring.prometheus_metrics import record_llm_hedge
 
 logger = structlog.get_logger(__name__)
 
 
+def cached_text(text: str) -> dict[str, Any]:
+    """
+    Text content block that ends a prompt-cache breakpoint.
+
+    Anthropic caches the prompt prefix up to each block marked with
+    cache_control (up to 4 per request); later calls with the same prefix
+    read it at a fraction of the input price. For vLLM the blocks are
+    flattened to plain text and its automatic prefix caching applies.
+    """
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def message_text(content: str | list[dict[str, Any]] | None) -> str:
+    """Plain text of a message's content (string or list of text blocks)"""
+    if isinstance(content, list):
+        return "\n\n".join(str(block.get("text", "")) for block in content)
+    return "" if content is None else str(content)
+
+
+def cache_usage(usage: Any) -> tuple[int, int]:
+    """
+    Prompt tokens read from and written to the provider cache.
+
+    LiteLLM reports Anthropic cache reads/writes as cache_read_input_tokens
+    and cache_creation_input_tokens (both included in prompt_tokens);
+    OpenAI-compatible servers report reads as prompt_tokens_details.cached_tokens.
+
+    Returns:
+        (cache_read_tokens, cache_write_tokens)
+    """
+    read = getattr(usage, "cache_read_input_tokens", None)
+    if read is None:
+        details = getattr(usage, "prompt_tokens_details", None)
+        read = getattr(details, "cached_tokens", None) if details is not None else None
+    write = getattr(usage, "cache_creation_input_tokens", None)
+    return int(read or 0), int(write or 0)
+
+
 class UnifiedLLMClient:
     """
     Unified LLM client using LiteLLM abstraction.
@@ -56,6 +103,10 @@ class UnifiedLLMClient:
     Backend Switching:
         >>> client.switch_backend(LLMBackend.VLLM)
         >>> # Now all calls use vLLM
+
+    With routing enabled (LLM_ROUTING_ENABLED) the current backend is the
+    preferred one: calls move to the other backend while it is ejected or
+    much slower, and latency-critical tiers can be hedged on both.
     """
 
     def __init__(self):
@@ -66,26 +117,43 @@ class UnifiedLLMClient:
         litellm.telemetry = False  # Disable LiteLLM telemetry
         litellm.set_verbose = False  # Reduce logging noise
 
+        # In-flight calls by coalescing key (single-flight)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # Per-backend latency/error statistics for routing and hedging
+        self.router = BackendRouter()
+
         logger.info("unified_llm_client_initialized")
 
     async def chat_completion(
         self,
-        messages: list[dict[str, str]],
+        messages: list[dict[str, Any]],
         model_tier: str = "haiku",
         temperature: float | None = None,
         max_tokens: int | None = None,
         stream: bool = False,
+        coalesce: bool = True,
+        hedge: bool | None = None,
         **kwargs,
     ) -> str:
         """
         Unified chat completion across backends.
 
         Args:
-            messages: List of message dicts [{"role": "user", "content": "..."}]
+            messages: List of message dicts [{"role": "user", "content": "..."}].
+                      Content may be a list of text blocks; blocks built with
+                      cached_text() mark prompt-cache breakpoints.
             model_tier: Model tier (haiku/sonnet/opus for Anthropic, ignored for vLLM)
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens to generate
-            stream: Enable streaming (not yet implemented)
+            stream: Ignored; use chat_completion_stream() for streaming
+            coalesce: Share the result with identical concurrent calls (default: True).
+                      While a call for the same model, sampling params and messages
+                      is in flight, this call awaits it instead of hitting the backend.
+            hedge: Send the call to a second backend if the first is slower than
+                   its p95 latency, and keep whichever answers first. Defaults to
+                   the LLM_ROUTING_HEDGE_TIERS setting; needs routing enabled and
+                   a second healthy backend.
             **kwargs: Additional parameters passed to LiteLLM
 
         Returns:
@@ -111,12 +179,77 @@ class UnifiedLLMClient:
             ... )
         """
         start_time = time.time()
-        model_config = self.config.get_model_config(model_tier)
+        backends = self._route()
+        if hedge is None:
+            hedge = self.router.should_hedge(model_tier)
+        if not (hedge and len(backends) > 1 and self.router.is_healthy(backends[1])):
+            backends = backends[:1]
+
+        attempts = [
+            (backend, *self._call_params(backend, messages, model_tier, temperature, max_tokens))
+            for backend in backends
+        ]
+        for _, call_params, _ in attempts:
+            # Merge additional kwargs
+            call_params.update(kwargs)
+
+        backend, call_params, model_config = attempts[0]
+
+        if not coalesce:
+            return await self._complete(attempts, start_time)
+
+        # Single-flight: identical concurrent calls share one backend request
+        key = self._coalescing_key(call_params)
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._complete(attempts, start_time))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._release_inflight, key))
+        else:
+            llm_metrics.track_coalesced_call(backend=backend.value, model=model_config.model_name)
+            logger.info(
+                "llm_call_coalesced",
+                backend=backend.value,
+                model=model_config.model_name,
+                key=key[:12],
+            )
+
+        # Shield so one caller's cancellation doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def _route(self) -> list[LLMBackend]:
+        """
+        Backends to try for a call, best first.
+
+        Only the current backend unless routing is enabled; then every
+        available backend, ranked by the router.
+        """
+        preferred = self.config.current_backend
+        if not self.router.enabled:
+            return [preferred]
+        candidates = [preferred] + [b for b in self.config.available_backends() if b != preferred]
+        return self.router.rank(candidates, preferred)
+
+    def _call_params(
+        self,
+        backend: LLMBackend,
+        messages: list[dict[str, Any]],
+        model_tier: str,
+        temperature: float | None,
+        max_tokens: int | None,
+    ) -> tuple[dict[str, Any], ModelConfig]:
+        """
+        Build LiteLLM parameters for a call on one backend.
+
+        Returns:
+            (call_params, model_config)
+        """
+        model_config = self.config.get_model_config(model_tier, backend)
 
-        # Build call parameters
         call_params = {
             "model": model_config.model_name,
-            "messages": messages,
+            "messages": self._backend_messages(messages, backend),
             "temperature": temperature if temperature is not None else model_config.temperature,
             "max_tokens": max_tokens if max_tokens is not None else model_config.max_tokens,
             "timeout": model_config.timeout,
@@ -132,13 +265,94 @@ class UnifiedLLMClient:
         if model_config.api_key:
             call_params["api_key"] = model_config.api_key
 
-        # Merge additional kwargs
-        call_params.update(kwargs)
+        return call_params, model_config
+
+    async def _complete(
+        self, attempts: list[tuple[LLMBackend, dict[str, Any], ModelConfig]], start_time: float
+    ) -> str:
+        """Run a call on its backend, hedged when a second backend is given."""
+        if len(attempts) == 1:
+            return await self._execute_completion(*attempts[0], start_time)
+        return await self._hedged_completion(attempts, start_time)
+
+    async def _hedged_completion(
+        self, attempts: list[tuple[LLMBackend, dict[str, Any], ModelConfig]], start_time: float
+    ) -> str:
+        """
+        Run a call on the first backend, hedged on the second.
+
+        The second request starts once the first has run for the first
+        backend's hedge delay, or as soon as the first fails. The first
+        success is returned and the other request is cancelled.
+
+        Raises:
+            Exception: The last error if both requests fail
+        """
+        primary, backup = attempts[0][0], attempts[1][0]
+        delay = self.router.hedge_delay(primary)
+
+        first = asyncio.ensure_future(self._execute_completion(*attempts[0], start_time))
+        tasks = {first: primary}
+        try:
+            await asyncio.wait([first], timeout=delay)
+            if first.done() and first.exception() is None:
+                return first.result()
+
+            logger.info(
+                "llm_call_hedged",
+                primary=primary.value,
+                hedge=backup.value,
+                delay_ms=round(delay * 1000, 2),
+                primary_failed=first.done(),
+            )
+            second = asyncio.ensure_future(self._execute_completion(*attempts[1], time.time()))
+            tasks[second] = backup
+
+            error: BaseException | None = first.exception() if first.done() else None
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        outcome = "hedge" if task is second else "primary"
+                        record_llm_hedge(primary.value, outcome)
+                        logger.info("llm_hedge_won", backend=tasks[task].value, outcome=outcome)
+                        return task.result()
+                    error = task.exception()
+
+            record_llm_hedge(primary.value, "failed")
+            raise error
+        finally:
+            # Cancel the loser (or both, if this call was cancelled)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _execute_completion(
+        self,
+        backend: LLMBackend,
+        call_params: dict[str, Any],
+        model_config: ModelConfig,
+        start_time: float,
+    ) -> str:
+        """
+        Perform one completion call with metrics and cost tracking.
+
+        Args:
+            backend: Backend the call goes to
+            call_params: Fully built LiteLLM parameters
+            model_config: Resolved model configuration
+            start_time: time.time() when the caller started
+
+        Returns:
+            Response content as string
+        """
+        messages = call_params["messages"]
 
         try:
             logger.info(
                 "llm_call_started",
-                backend=self.config.current_backend.value,
+                backend=backend.value,
                 model=model_config.model_name,
                 messages_count=len(messages),
                 temperature=call_params["temperature"],
@@ -153,47 +367,61 @@ class UnifiedLLMClient:
 
             # Calculate latency
             latency_ms = (time.time() - start_time) * 1000
+            self.router.record(backend, latency_ms, success=True)
 
             # Extract usage information
             usage = response.usage
             input_tokens = usage.prompt_tokens
             output_tokens = usage.completion_tokens
+            cache_read_tokens, cache_write_tokens = cache_usage(usage)
 
             # Track metrics
             llm_metrics.track_call(
-                backend=self.config.current_backend.value,
+                backend=backend.value,
                 model=model_config.model_name,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 latency_ms=latency_ms,
                 success=True,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
             )
 
             # Track costs
-            if self.config.current_backend == LLMBackend.ANTHROPIC:
+            if backend == LLMBackend.ANTHROPIC:
                 cost_tracker.add_anthropic_call(
                     model=model_config.model_name,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
+                    cache_read_tokens=cache_read_tokens,
+                    cache_write_tokens=cache_write_tokens,
                 )
 
             logger.info(
                 "llm_call_success",
-                backend=self.config.current_backend.value,
+                backend=backend.value,
                 model=model_config.model_name,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
                 latency_ms=round(latency_ms, 2),
             )
 
             return content
 
+        except asyncio.CancelledError:
+            # Hedge loser or abandoned call: no result, but it was at least this slow
+            self.router.record_abandoned(backend, (time.time() - start_time) * 1000)
+            raise
+
         except Exception as e:
             latency_ms = (time.time() - start_time) * 1000
+            self.router.record(backend, latency_ms, success=False)
 
             # Track failed call
             llm_metrics.track_call(
-                backend=self.config.current_backend.value,
+                backend=backend.value,
                 model=model_config.model_name,
                 input_tokens=0,
                 output_tokens=0,
@@ -204,7 +432,7 @@ class UnifiedLLMClient:
 
             logger.error(
                 "llm_call_failed",
-                backend=self.config.current_backend.value,
+                backend=backend.value,
                 model=model_config.model_name,
                 error=str(e),
                 error_type=type(e).__name__,
@@ -214,26 +442,213 @@ class UnifiedLLMClient:
 
             raise
 
+    @staticmethod
+    def _backend_messages(
+        messages: list[dict[str, Any]], backend: LLMBackend
+    ) -> list[dict[str, Any]]:
+        """
+        Adapt messages to a backend.
+
+        Anthropic gets text blocks and cache_control as built. Other backends
+        get each message's blocks joined into plain text: their chat templates
+        expect string content, and vLLM caches shared prefixes on its own.
+        """
+        if backend == LLMBackend.ANTHROPIC:
+            return messages
+        return [
+            {**m, "content": message_text(m["content"])}
+            if isinstance(m.get("content"), list)
+            else m
+            for m in messages
+        ]
+
+    @staticmethod
+    def _coalescing_key(call_params: dict[str, Any]) -> str:
+        """
+        Build the single-flight key for a call.
+
+        Covers everything that shapes the output: model, sampling params,
+        endpoint, extra kwargs and the messages with whitespace normalized.
+        Credentials, timeouts and retry counts are left out.
+        """
+        ignored = {"messages", "api_key", "timeout", "num_retries"}
+        payload = {
+            "messages": [
+                {
+                    "role": m.get("role"),
+                    "content": " ".join(message_text(m.get("content")).split()),
+                }
+                for m in call_params["messages"]
+            ],
+            "params": {k: v for k, v in call_params.items() if k not in ignored},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _release_inflight(self, key: str, task: asyncio.Future) -> None:
+        """Drop a finished call from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
+
     async def chat_completion_stream(
-        self, messages: list[dict[str, str]], model_tier: str = "haiku", **kwargs
+        self,
+        messages: list[dict[str, Any]],
+        model_tier: str = "haiku",
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs,
     ) -> AsyncIterator[str]:
         """
-        Streaming chat completion (future implementation).
+        Streaming chat completion across backends.
+
+        Yields content deltas as the backend produces them. Token usage,
+        metrics and costs are recorded once the stream is exhausted, using
+        the usage block of the final chunk when the backend reports one and
+        LiteLLM's token counter otherwise.
 
         Args:
-            messages: List of message dicts
-            model_tier: Model tier
-            **kwargs: Additional parameters
+            messages: List of message dicts [{"role": "user", "content": "..."}]
+            model_tier: Model tier (haiku/sonnet/opus for Anthropic, ignored for vLLM)
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters passed to LiteLLM
+
+        Messages may use text blocks and cache breakpoints as in chat_completion().
+        With routing enabled the stream goes to the best-ranked backend; streams
+        are not hedged.
 
         Yields:
-            Response chunks as they arrive
+            Response text chunks as they arrive
 
-        Note:
-            Not yet implemented - placeholder for future streaming support
+        Raises:
+            Exception: If the LLM call fails before or during streaming
+
+        Examples:
+            >>> async for chunk in llm_client.chat_completion_stream(
+            ...     messages=[{"role": "user", "content": "Hello"}],
+            ...     model_tier="haiku",
+            ... ):
+            ...     print(chunk, end="")
         """
-        raise NotImplementedError(
-            "Streaming support not yet implemented. Use chat_completion() for now."
+        start_time = time.time()
+        backend = self._route()[0]
+        call_params, model_config = self._call_params(
+            backend, messages, model_tier, temperature, max_tokens
         )
+        call_params["stream"] = True
+        call_params["stream_options"] = {"include_usage": True}
+        call_params.update(kwargs)
+
+        content_parts: list[str] = []
+        usage = None
+        first_token_ms: float | None = None
+
+        try:
+            logger.info(
+                "llm_stream_started",
+                backend=backend.value,
+                model=model_config.model_name,
+                messages_count=len(messages),
+                temperature=call_params["temperature"],
+                max_tokens=call_params["max_tokens"],
+            )
+
+            response = await acompletion(**call_params)
+
+            async for chunk in response:
+                # The final chunk carries usage and usually no choices
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+
+                if not chunk.choices:
+                    continue
+
+                delta = chunk.choices[0].delta
+                text = getattr(delta, "content", None)
+                if not text:
+                    continue
+
+                if first_token_ms is None:
+                    first_token_ms = (time.time() - start_time) * 1000
+
+                content_parts.append(text)
+                yield text
+
+            latency_ms = (time.time() - start_time) * 1000
+            self.router.record(backend, latency_ms, success=True)
+            content = "".join(content_parts)
+
+            cache_read_tokens = cache_write_tokens = 0
+            if usage:
+                input_tokens = usage.prompt_tokens
+                output_tokens = usage.completion_tokens
+                cache_read_tokens, cache_write_tokens = cache_usage(usage)
+            else:
+                input_tokens = litellm.token_counter(
+                    model=model_config.model_name, messages=call_params["messages"]
+                )
+                output_tokens = litellm.token_counter(model=model_config.model_name, text=content)
+
+            llm_metrics.track_call(
+                backend=backend.value,
+                model=model_config.model_name,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                latency_ms=latency_ms,
+                success=True,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
+            )
+
+            if backend == LLMBackend.ANTHROPIC:
+                cost_tracker.add_anthropic_call(
+                    model=model_config.model_name,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cache_read_tokens=cache_read_tokens,
+                    cache_write_tokens=cache_write_tokens,
+                )
+
+            logger.info(
+                "llm_stream_success",
+                backend=backend.value,
+                model=model_config.model_name,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                first_token_ms=round(first_token_ms, 2) if first_token_ms is not None else None,
+                latency_ms=round(latency_ms, 2),
+            )
+
+        except Exception as e:
+            latency_ms = (time.time() - start_time) * 1000
+            self.router.record(backend, latency_ms, success=False)
+
+            llm_metrics.track_call(
+                backend=backend.value,
+                model=model_config.model_name,
+                input_tokens=0,
+                output_tokens=0,
+                latency_ms=latency_ms,
+                success=False,
+                error=str(e),
+            )
+
+            logger.error(
+                "llm_stream_failed",
+                backend=backend.value,
+                model=model_config.model_name,
+                error=str(e),
+                error_type=type(e).__name__,
+                chunks_received=len(content_parts),
+                latency_ms=round(latency_ms, 2),
+                exc_info=True,
+            )
+
+            raise
 
     def switch_backend(self, backend: LLMBackend) -> None:
         """
@@ -124,13 +124,16 @@ class LiteLLMConfig:
             vllm_models=list(self.models[LLMBackend.VLLM].keys()),
         )
 
-    def get_model_config(self, model_tier: str = "haiku") -> ModelConfig:
+    def get_model_config(
+        self, model_tier: str = "haiku", backend: LLMBackend | None = None
+    ) -> ModelConfig:
         """
-        Get model configuration for current backend.
+        Get model configuration for a backend.
 
         Args:
             model_tier: Model tier for Anthropic (haiku/sonnet/opus)
                        Ignored for vLLM (always uses qwen)
+            backend: Backend to use (default: current backend)
 
         Returns:
             ModelConfig for the selected model
@@ -144,9 +147,10 @@ class LiteLLMConfig:
             >>> config.switch_backend(LLMBackend.VLLM)
             >>> vllm_config = config.get_model_config()  # tier ignored for vLLM
         """
-        backend_models = self.models[self.current_backend]
+        backend = backend or self.current_backend
+        backend_models = self.models[backend]
 
-        if self.current_backend == LLMBackend.ANTHROPIC:
+        if backend == LLMBackend.ANTHROPIC:
             # Use requested tier, fallback to haiku if invalid
             config = backend_models.get(model_tier, backend_models["haiku"])
         else:  # vLLM
@@ -226,6 +230,15 @@ class LiteLLMConfig:
         """Check if vLLM endpoint is configured"""
         return self.vllm_endpoint is not None
 
+    def available_backends(self) -> list[LLMBackend]:
+        """Backends that can take calls (Anthropic with an API key, vLLM with an endpoint)"""
+        available = []
+        if self.models[LLMBackend.ANTHROPIC]["haiku"].api_key:
+            available.append(LLMBackend.ANTHROPIC)
+        if self.is_vllm_configured():
+            available.append(LLMBackend.VLLM)
+        return available
+
     def get_backend_info(self) -> dict[str, Any]:
         """
         Get current backend information.
@@ -0,0 +1,407 @@
+"""
+Semantic Response Cache - Reuse routing classifications for near-duplicate messages
+
+Routing agents (meta router, intent classifier, sentiment analyzer, entity
+extractor, complexity assessor) run a low-temperature LLM call per message
+and most messages are near-duplicates ("how do I reset my password").
+This cache stores their raw JSON responses keyed on agent name and an
+embedding of the message, and serves a stored response when a new message
+is similar enough.
+
+Storage:
+    Redis, one key per entry with a TTL, plus one vector index hash per agent:
+        <prefix>:<agent>:<scope>:<entry_id> -> {"message", "response"}
+        <prefix>:index:<agent> -> {"<scope>:<entry_id>": {"vector", "expires"}}
+    entry_id is a hash of the normalized message, so exact repeats hit with a
+    single GET and no embedding. For similarity lookups every worker keeps an
+    in-memory matrix of the vectors. A background task reloads it from the
+    agent's index hash every sync_interval seconds, to pick up entries written
+    by other workers - lookups never wait for it, and the reload neither
+    scans the keyspace nor transfers responses. Index fields of expired
+    entries are dropped by the reload.
+
+Scope lets an agent partition entries by the prompt context that changes
+its answer (e.g. customer plan). Entries only match within the same scope.
+
+Enabled per agent through SEMANTIC_CACHE_ENABLED / SEMANTIC_CACHE_AGENTS.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from src.core.config import get_settings
+from src.embedding_service import normalize_query
+from src.utils.logging.setup import get_logger
+from src.utils.monitoring.prometheus_metrics import record_semantic_cache_lookup
+
+logger = get_logger(__name__)
+
+
+def _digest(text: str, length: int = 16) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:length]
+
+
+def _parse_json_response(response: str) -> dict | None:
+    """Parse a routing agent response, tolerating markdown code fences"""
+    cleaned = response.strip()
+    if cleaned.startswith("```"):
+        cleaned = "\n".join(
+            line for line in cleaned.split("\n") if not line.strip().startswith("```")
+        )
+    try:
+        parsed = json.loads(cleaned)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+class _ScopeEntries:
+    """In-memory vectors for one (agent, scope), insertion-ordered for eviction"""
+
+    def __init__(self):
+        self.vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._matrix: np.ndarray | None = None
+        self._ids: list[str] = []
+
+    def add(self, entry_id: str, vector: np.ndarray, max_entries: int) -> None:
+        self.vectors[entry_id] = vector
+        self.vectors.move_to_end(entry_id)
+        while len(self.vectors) > max_entries:
+            self.vectors.popitem(last=False)
+        self._matrix = None
+
+    def discard(self, entry_id: str) -> None:
+        if self.vectors.pop(entry_id, None) is not None:
+            self._matrix = None
+
+    def best_match(self, query: np.ndarray) -> tuple[str, float] | None:
+        if not self.vectors:
+            return None
+        if self._matrix is None:
+            self._ids = list(self.vectors)
+            self._matrix = np.stack([self.vectors[i] for i in self._ids])
+        scores = self._matrix @ query
+        best = int(np.argmax(scores))
+        return self._ids[best], float(scores[best])
+
+
+class SemanticResponseCache:
+    """
+    Redis-backed cache of routing agent responses with embedding similarity lookup
+
+    Never raises: Redis or embedding failures are logged and treated as misses,
+    so a cache outage only costs the LLM call it would have saved.
+
+    Example:
+        cache = SemanticResponseCache(redis_client, embedder, agents={"intent_classifier"})
+        response = await cache.get("intent_classifier", message)
+        if response is None:
+            response = await call_llm(...)
+            await cache.set("intent_classifier", message, response)
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        embedder=None,
+        agents: set[str] | list[str] | None = None,
+        similarity_threshold: float = 0.95,
+        ttl: int = 86400,
+        max_entries_per_agent: int = 5000,
+        sync_interval: float = 300.0,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        key_prefix: str = "semcache",
+    ):
+        """
+        Initialize semantic cache
+
+        Args:
+            redis_client: redis.asyncio client (decode_responses=True)
+            embedder: Object with async embed(text) -> list[float]. Defaults to the
+                      shared QueryEmbeddingService for `embedding_model`, loaded on first use.
+            agents: Agent names allowed to use the cache (None = all)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            ttl: Entry TTL in seconds
+            max_entries_per_agent: In-memory vectors kept per agent and scope
+            sync_interval: Seconds between reloads of entries from Redis
+            embedding_model: sentence-transformers model for the default embedder
+            key_prefix: Redis key prefix
+        """
+        self.redis = redis_client
+        self.agents = set(agents) if agents is not None else None
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries_per_agent = max_entries_per_agent
+        self.sync_interval = sync_interval
+        self.embedding_model = embedding_model
+        self.key_prefix = key_prefix
+
+        self._embedder = embedder
+        self._embedder_lock = asyncio.Lock()
+
+        # agent -> scope digest -> entries
+        self._entries: dict[str, dict[str, _ScopeEntries]] = {}
+        self._last_sync: dict[str, float] = {}
+        self._sync_tasks: dict[str, asyncio.Task] = {}
+
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def is_enabled_for(self, agent: str) -> bool:
+        """Check the per-agent enable list"""
+        return self.agents is None or agent in self.agents
+
+    async def get(self, agent: str, message: str, scope: str | None = None) -> str | None:
+        """
+        Look up a stored response for a message
+
+        Args:
+            agent: Agent name
+            message: Raw user message
+            scope: Optional context the response depends on
+
+        Returns:
+            Stored response text, or None on miss
+        """
+        if not self.is_enabled_for(agent):
+            return None
+
+        scope_id = _digest(scope or "")
+        try:
+            # Exact repeat: one GET, no embedding
+            raw = await self.redis.get(self._key(agent, scope_id, self._entry_id(message)))
+            if raw is not None:
+                return self._hit(agent, "exact", json.loads(raw)["response"])
+
+            query = self._normalize(await self._embed(message))
+            self._maybe_sync(agent)
+
+            entries = self._entries.get(agent, {}).get(scope_id)
+            match = entries.best_match(query) if entries else None
+            if match is not None and match[1] >= self.similarity_threshold:
+                entry_id, score = match
+                raw = await self.redis.get(self._key(agent, scope_id, entry_id))
+                if raw is not None:
+                    logger.debug(
+                        "semantic_cache_hit",
+                        agent=agent,
+                        similarity=round(score, 4),
+                        cached_message=json.loads(raw)["message"][:50],
+                    )
+                    return self._hit(agent, "semantic", json.loads(raw)["response"])
+                # Expired in Redis since the last sync
+                entries.discard(entry_id)
+                await self.redis.hdel(self._index_key(agent), f"{scope_id}:{entry_id}")
+
+        except Exception as e:
+            self._error("semantic_cache_get_failed", agent, e)
+
+        self.stats["misses"] += 1
+        record_semantic_cache_lookup(agent, "miss")
+        return None
+
+    async def set(self, agent: str, message: str, response: str, scope: str | None = None) -> bool:
+        """
+        Store a response
+
+        Only JSON object responses are stored - a malformed classification
+        would otherwise be replayed to every similar message for the TTL.
+
+        Args:
+            agent: Agent name
+            message: Raw user message
+            response: LLM response text
+            scope: Optional context the response depends on
+
+        Returns:
+            True if stored
+        """
+        if not self.is_enabled_for(agent) or _parse_json_response(response) is None:
+            return False
+
+        scope_id = _digest(scope or "")
+        entry_id = self._entry_id(message)
+        try:
+            vector = self._normalize(await self._embed(message))
+            payload = {"message": normalize_query(message), "response": response}
+            await self.redis.set(
+                self._key(agent, scope_id, entry_id), json.dumps(payload), ex=self.ttl
+            )
+            indexed = {
+                "vector": base64.b64encode(vector.tobytes()).decode("ascii"),
+                "expires": time.time() + self.ttl,
+            }
+            index_key = self._index_key(agent)
+            await self.redis.hset(index_key, f"{scope_id}:{entry_id}", json.dumps(indexed))
+            await self.redis.expire(index_key, self.ttl)
+        except Exception as e:
+            self._error("semantic_cache_set_failed", agent, e)
+            return False
+
+        self._scope_entries(agent, scope_id).add(entry_id, vector, self.max_entries_per_agent)
+        self.stats["stores"] += 1
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss counters"""
+        lookups = self.stats["exact_hits"] + self.stats["semantic_hits"] + self.stats["misses"]
+        hits = self.stats["exact_hits"] + self.stats["semantic_hits"]
+        return {
+            **self.stats,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": {
+                agent: sum(len(e.vectors) for e in scopes.values())
+                for agent, scopes in self._entries.items()
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _key(self, agent: str, scope_id: str, entry_id: str) -> str:
+        return f"{self.key_prefix}:{agent}:{scope_id}:{entry_id}"
+
+    def _index_key(self, agent: str) -> str:
+        return f"{self.key_prefix}:index:{agent}"
+
+    @staticmethod
+    def _entry_id(message: str) -> str:
+        return _digest(normalize_query(message), 32)
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _scope_entries(self, agent: str, scope_id: str) -> _ScopeEntries:
+        return self._entries.setdefault(agent, {}).setdefault(scope_id, _ScopeEntries())
+
+    def _hit(self, agent: str, kind: str, response: str) -> str:
+        self.stats[f"{kind}_hits"] += 1
+        record_semantic_cache_lookup(agent, kind)
+        return response
+
+    def _error(self, event: str, agent: str, error: Exception) -> None:
+        self.stats["errors"] += 1
+        logger.warning(event, agent=agent, error=str(error), error_type=type(error).__name__)
+
+    async def _embed(self, text: str) -> list[float]:
+        if self._embedder is None:
+            async with self._embedder_lock:
+                if self._embedder is None:
+                    self._embedder = await asyncio.to_thread(self._load_embedder)
+        return await self._embedder.embed(text)
+
+    def _load_embedder(self):
+        from src.embedding_models import get_query_embedding_service
+
+        logger.info("semantic_cache_loading_embedder", model=self.embedding_model)
+        return get_query_embedding_service(self.embedding_model)
+
+    def _maybe_sync(self, agent: str) -> None:
+        """Start a background reload of an agent's vectors if the local copy is stale"""
+        now = time.monotonic()
+        last = self._last_sync.get(agent)
+        if last is not None and now - last < self.sync_interval:
+            return
+        if agent in self._sync_tasks:
+            return
+        self._last_sync[agent] = now
+
+        task = asyncio.create_task(self.sync(agent))
+        self._sync_tasks[agent] = task
+        task.add_done_callback(lambda _: self._sync_tasks.pop(agent, None))
+
+    async def sync(self, agent: str) -> None:
+        """
+        Reload an agent's vectors from its Redis index
+
+        get() runs this in the background every sync_interval seconds.
+        Failures are logged and leave the current vectors in place.
+        """
+        try:
+            index_key = self._index_key(agent)
+            now = time.time()
+            scopes: dict[str, _ScopeEntries] = {}
+            expired = []
+
+            for field, raw in (await self.redis.hgetall(index_key)).items():
+                indexed = json.loads(raw)
+                if indexed["expires"] <= now:
+                    expired.append(field)
+                    continue
+                scope_id, _, entry_id = field.partition(":")
+                vector = np.frombuffer(base64.b64decode(indexed["vector"]), dtype=np.float32)
+                scopes.setdefault(scope_id, _ScopeEntries()).add(
+                    entry_id, vector, self.max_entries_per_agent
+                )
+
+            if expired:
+                await self.redis.hdel(index_key, *expired)
+        except Exception as e:
+            self._error("semantic_cache_sync_failed", agent, e)
+            return
+
+        self._entries[agent] = scopes
+        logger.debug(
+            "semantic_cache_synced",
+            agent=agent,
+            entries=sum(len(e.vectors) for e in scopes.values()),
+            expired=len(expired),
+        )
+
+
+# Global instance (False = disabled or unavailable)
+_semantic_cache: SemanticResponseCache | bool | None = None
+
+
+def get_semantic_cache() -> SemanticResponseCache | None:
+    """
+    Get the process-wide semantic cache
+
+    Returns:
+        SemanticResponseCache, or None when disabled in settings or Redis
+        is not installed
+    """
+    global _semantic_cache
+
+    if _semantic_cache is None:
+        settings = get_settings()
+        config = settings.semantic_cache
+        _semantic_cache = False
+
+        if config.enabled:
+            try:
+                import redis.asyncio as redis
+
+                client = redis.from_url(
+                    config.redis_url or settings.redis.url,
+                    password=settings.redis.password,
+                    decode_responses=True,
+                )
+                _semantic_cache = SemanticResponseCache(
+                    client,
+                    agents=config.agents,
+                    similarity_threshold=config.similarity_threshold,
+                    ttl=config.ttl,
+                    max_entries_per_agent=config.max_entries_per_agent,
+                    sync_interval=config.sync_interval,
+                    embedding_model=config.embedding_model,
+                )
+                logger.info("semantic_cache_enabled", agents=config.agents)
+            except ImportError:
+                logger.warning("semantic_cache_redis_not_available")
+
+    return _semantic_cache or None
@@ -0,0 +1,290 @@
+"""
+Local Vector Index - In-process brute-force ANN over KB embeddings
+
+The KB is a few thousand articles, so the whole vector set fits in memory
+and an exact dot product over a float32 matrix is faster than a Qdrant
+round trip. Used by src/knowledge_base.py as a fast path (or fallback)
+for semantic search.
+
+On-disk layout (written by scripts/embed_articles.py):
+    <path>/vectors.npy      float32 [N, D], rows L2-normalized
+    <path>/payloads.json    {"model": ..., "dim": D, "payloads": [...N dicts]}
+
+vectors.npy is memory-mapped, so every uvicorn worker shares the same
+page-cache pages and cold start does not copy the matrix. The sidecar is
+written last; its mtime is the reload signal.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.embedding_models import canonical_model_name
+from src.utils.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+VECTORS_FILE = "vectors.npy"
+PAYLOADS_FILE = "payloads.json"
+
+
+class LocalVectorIndex:
+    """
+    Exact cosine-similarity index backed by a memory-mapped NumPy matrix
+
+    Supports category filtering through precomputed per-category row
+    arrays and hot reload when the files on disk are replaced.
+
+    Example:
+        index = LocalVectorIndex("data/kb_index")
+        results = index.search(query_vector, category="billing", limit=3)
+    """
+
+    def __init__(
+        self, path: str | Path, reload_interval: float = 5.0, expected_model: str | None = None
+    ):
+        """
+        Load index from disk
+
+        Args:
+            path: Directory containing vectors.npy and payloads.json
+            reload_interval: Minimum seconds between on-disk change checks
+            expected_model: Embedding model used for queries. An index built
+                            with a different model is refused.
+
+        Raises:
+            FileNotFoundError: If the index files do not exist
+            ValueError: If vectors and payloads do not line up, or the index
+                        was built with a model other than expected_model
+        """
+        self.path = Path(path)
+        self.reload_interval = reload_interval
+        self.expected_model = expected_model
+
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._loaded_mtime = 0.0
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Build / load
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def build(articles: list[dict[str, Any]], path: str | Path, model: str | None = None) -> int:
+        """
+        Write an index for embedded articles
+
+        Files are written to temporaries and moved into place, payloads
+        last, so readers never see a half-written index.
+
+        Args:
+            articles: Dicts with "embedding" plus title/content/category/tags
+            path: Output directory
+            model: Embedding model name, recorded for sanity checks
+
+        Returns:
+            Number of indexed articles
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        vectors = np.asarray([a["embedding"] for a in articles], dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("Articles must all have embeddings of the same dimension")
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+
+        payloads = [
+            {
+                "doc_id": str(a.get("doc_id", a.get("id"))),
+                "title": a["title"],
+                "content": a["content"],
+                "category": a["category"],
+                "tags": a.get("tags", []),
+            }
+            for a in articles
+        ]
+
+        vectors_tmp = path / f".{VECTORS_FILE}.tmp"
+        with open(vectors_tmp, "wb") as f:
+            np.save(f, vectors)
+        vectors_tmp.replace(path / VECTORS_FILE)
+
+        payloads_tmp = path / f".{PAYLOADS_FILE}.tmp"
+        with open(payloads_tmp, "w", encoding="utf-8") as f:
+            json.dump({"model": model, "dim": int(vectors.shape[1]), "payloads": payloads}, f)
+        payloads_tmp.replace(path / PAYLOADS_FILE)
+
+        return len(payloads)
+
+    def _load(self) -> None:
+        """(Re)load vectors and payloads from disk"""
+        payloads_path = self.path / PAYLOADS_FILE
+        mtime = payloads_path.stat().st_mtime
+
+        with open(payloads_path, encoding="utf-8") as f:
+            sidecar = json.load(f)
+
+        self._check_model(sidecar.get("model"))
+
+        vectors = np.load(self.path / VECTORS_FILE, mmap_mode="r")
+        payloads = sidecar["payloads"]
+
+        if vectors.shape[0] != len(payloads):
+            raise ValueError(
+                f"Index mismatch: {vectors.shape[0]} vectors vs {len(payloads)} payloads"
+            )
+
+        by_category: dict[str, list[int]] = {}
+        for row, payload in enumerate(payloads):
+            by_category.setdefault(payload["category"], []).append(row)
+
+        # Swap in one assignment so concurrent searches see a consistent index
+        self._state = (
+            vectors,
+            payloads,
+            {cat: np.asarray(rows, dtype=np.int64) for cat, rows in by_category.items()},
+        )
+        self.model = sidecar.get("model")
+        self.dim = int(sidecar.get("dim", vectors.shape[1]))
+        self._loaded_mtime = mtime
+
+        logger.info(
+            "local_vector_index_loaded",
+            path=str(self.path),
+            articles=len(payloads),
+            dim=self.dim,
+            categories=len(by_category),
+        )
+
+    def _check_model(self, model: str | None) -> None:
+        """Refuse an index whose vectors live in another model's embedding space"""
+        if self.expected_model is None:
+            return
+
+        if model is None:
+            logger.warning(
+                "local_vector_index_model_unknown",
+                path=str(self.path),
+                expected_model=self.expected_model,
+            )
+            return
+
+        if canonical_model_name(model) != canonical_model_name(self.expected_model):
+            logger.error(
+                "local_vector_index_model_mismatch",
+                path=str(self.path),
+                index_model=model,
+                expected_model=self.expected_model,
+            )
+            raise ValueError(
+                f"Index built with embedding model {model!r}, "
+                f"but queries use {self.expected_model!r}"
+            )
+
+    def maybe_reload(self) -> bool:
+        """
+        Reload if the files on disk changed (rate-limited by reload_interval)
+
+        Returns:
+            True if a reload happened
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return False
+
+        with self._lock:
+            if now - self._last_check < self.reload_interval:
+                return False
+            self._last_check = now
+
+            try:
+                mtime = (self.path / PAYLOADS_FILE).stat().st_mtime
+            except FileNotFoundError:
+                return False
+
+            if mtime == self._loaded_mtime:
+                return False
+
+            try:
+                self._load()
+                return True
+            except Exception as e:
+                # Keep serving the old index if the new one is unreadable
+                logger.error(
+                    "local_vector_index_reload_failed",
+                    path=str(self.path),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return False
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    def search(
+        self,
+        query_vector: list[float] | np.ndarray,
+        category: str | None = None,
+        limit: int = 5,
+        score_threshold: float = 0.0,
+    ) -> list[dict]:
+        """
+        Cosine-similarity search
+
+        Args:
+            query_vector: Query embedding (need not be normalized)
+            category: Restrict to one category
+            limit: Max results
+            score_threshold: Minimum similarity score (0-1)
+
+        Returns:
+            Results in the same shape as VectorStore.search()
+        """
+        self.maybe_reload()
+        vectors, payloads, by_category = self._state
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0 or limit <= 0:
+            return []
+        query = query / norm
+
+        if category:
+            rows = by_category.get(category)
+            if rows is None:
+                return []
+            scores = vectors[rows] @ query
+        else:
+            rows = None
+            scores = vectors @ query
+
+        k = min(limit, scores.shape[0])
+        if k == 0:
+            return []
+
+        # Partial sort: O(N) selection, then sort only the top k
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for i in top:
+            score = float(scores[i])
+            if score < score_threshold:
+                break
+            row = int(rows[i]) if rows is not None else int(i)
+            results.append({**payloads[row], "similarity_score": round(score, 3)})
+
+        return results
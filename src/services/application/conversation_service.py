@@ -11,9 +11,11 @@ from src.core.errors import BusinessRuleError, InternalError, NotFoundError
 from src.core.events import get_event_bus
 from src.core.result import Result
 from src.database.schemas.conversation import ConversationInDB, ConversationWithMessages
+from src.database.schemas.message import MessageInDB, MessageSearchHit, MessageSearchResults
 from src.database.unit_of_work import UnitOfWork
 from src.services.domain.conversation.domain_service import ConversationDomainService
 from src.services.infrastructure.analytics_service import AnalyticsService
+from src.services.infrastructure.conversation_history_service import ConversationHistoryService
 from src.services.infrastructure.customer_service import CustomerInfrastructureService
 from src.utils.logging.setup import get_logger
 from src.workflow.engine import AgentWorkflowEngine
@@ -38,6 +40,7 @@ class ConversationApplicationService:
         self.customer_service = customer_service
         self.workflow_engine = workflow_engine
         self.analytics_service = analytics_service
+        self.history = ConversationHistoryService(uow)
         self._event_bus = None  # Lazy initialization
         self.logger = get_logger(__name__)
 
@@ -295,7 +298,11 @@ class ConversationApplicationService:
             )
 
     async def add_message(self, conversation_id: UUID, message: str) -> Result[dict[str, Any]]:
-        """Add message to existing conversation"""
+        """Add message to existing conversation
+
+        The caller commits the turn, then calls
+        history.schedule_summary_update() to fold older turns into the summary.
+        """
         try:
             self.logger.info(
                 "add_message_started",
@@ -307,8 +314,8 @@ class ConversationApplicationService:
             if validation_result.is_failure:
                 return Result.fail(validation_result.error)
 
-            # CRITICAL FIX: Fetch conversation WITH messages for context continuity
-            conversation = await self.uow.conversations.get_with_messages(conversation_id)
+            # History comes from a windowed query below - don't load every message
+            conversation = await self.uow.conversations.get_without_messages(conversation_id)
             if not conversation:
                 self.logger.warning("conversation_not_found", conversation_id=str(conversation_id))
                 return Result.fail(
@@ -329,23 +336,17 @@ class ConversationApplicationService:
                     )
                 )
 
-            # Build conversation history from existing messages BEFORE adding the new one
-            # This provides context to the agents about what has been discussed
-            conversation_history = []
-            for msg in conversation.messages:
-                conversation_history.append(
-                    {
-                        "role": msg.role,
-                        "content": msg.content,
-                        "timestamp": msg.created_at.isoformat() if msg.created_at else None,
-                        "agent_name": getattr(msg, "agent_name", None),
-                    }
-                )
+            # Build conversation history BEFORE adding the new message: the last
+            # HISTORY_WINDOW messages verbatim plus a summary of older turns
+            conversation_history, conversation_summary = await self.history.get_context(
+                conversation
+            )
 
             self.logger.debug(
                 "conversation_history_loaded",
                 conversation_id=str(conversation_id),
                 message_count=len(conversation_history),
+                has_summary=conversation_summary is not None,
             )
 
             await self.uow.messages.create_message(
@@ -376,6 +377,7 @@ class ConversationApplicationService:
                     "customer_id": str(conversation.customer_id),
                     "customer_metadata": customer_metadata,
                     "conversation_history": conversation_history,
+                    "conversation_summary": conversation_summary,
                 },
             )
 
@@ -770,6 +772,71 @@ class ConversationApplicationService:
                 )
             )
 
+    async def search_messages(
+        self,
+        query: str,
+        *,
+        conversation_id: UUID | None = None,
+        agent_name: str | None = None,
+        role: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Result[MessageSearchResults]:
+        """Search message content, ranked, with highlighted snippets
+
+        Returns:
+            Result containing one page of MessageSearchResults
+        """
+        try:
+            # One extra row tells whether there is a next page without a COUNT(*)
+            rows = await self.uow.messages.search(
+                query,
+                conversation_id=conversation_id,
+                agent_name=agent_name,
+                role=role,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit + 1,
+                offset=offset,
+            )
+
+            hits = [
+                MessageSearchHit(
+                    **MessageInDB.model_validate(message).model_dump(), rank=rank, snippet=snippet
+                )
+                for message, rank, snippet in rows[:limit]
+            ]
+
+            self.logger.info(
+                "messages_searched",
+                result_count=len(hits),
+                offset=offset,
+                conversation_id=str(conversation_id) if conversation_id else None,
+                agent_name=agent_name,
+            )
+
+            return Result.ok(
+                MessageSearchResults(
+                    query=query,
+                    results=hits,
+                    limit=limit,
+                    offset=offset,
+                    has_more=len(rows) > limit,
+                )
+            )
+
+        except Exception as e:
+            self.logger.error("search_messages_failed", error=str(e), exc_info=True)
+            return Result.fail(
+                InternalError(
+                    message=f"Failed to search messages: {e!s}",
+                    operation="search_messages",
+                    component="ConversationApplicationService",
+                )
+            )
+
     async def delete_conversation(self, conversation_id: UUID) -> Result[None]:
         """Delete a conversation and its messages"""
         try:
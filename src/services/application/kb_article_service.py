@@ -26,6 +26,7 @@ from src.core.errors import (
 from src.core.result import Result
 from src.database.models.kb_article import KBArticle, KBUsage
 from src.database.unit_of_work import get_unit_of_work
+from src.kb_vector_sync import KBVectorSync, ProgressCallback
 from src.services.infrastructure.knowledge_base_service import KnowledgeBaseService
 from src.utils.logging.setup import get_logger
 from src.vector_store import VectorStore
@@ -66,12 +67,18 @@ class KBArticleService:
         # (kb_service is read-only, we need write access)
         try:
             self.vector_store = VectorStore()
+            self.vector_sync = KBVectorSync(
+                self.vector_store.client,
+                self.vector_store.collection_name,
+                self.vector_store.embedding_model,
+            )
             self.vector_store_available = True
         except Exception as e:
             self.logger.warning(
                 "vector_store_initialization_failed", error=str(e), error_type=type(e).__name__
             )
             self.vector_store = None
+            self.vector_sync = None
             self.vector_store_available = False
 
         self.logger.info(
@@ -298,8 +305,16 @@ class KBArticleService:
 
                 await uow.flush()  # Ensure changes are persisted
 
-            # Remove from Qdrant (TODO: implement delete by doc_id)
-            # For now, Qdrant entries become stale (filtered by is_active in search)
+            # Remove from Qdrant (a full sync would also prune it)
+            if self.vector_store_available:
+                try:
+                    await self.vector_sync.delete_articles([str(article_id)])
+                except Exception as e:
+                    self.logger.warning(
+                        "kb_article_vector_delete_failed",
+                        article_id=str(article_id),
+                        error=str(e),
+                    )
 
             self.logger.info(
                 "kb_article_deleted_successfully",
@@ -617,11 +632,19 @@ class KBArticleService:
             }
         )
 
-    async def sync_all_to_vector_store(self) -> Result[dict[str, Any]]:
+    async def sync_all_to_vector_store(
+        self, progress: ProgressCallback | None = None, force: bool = False
+    ) -> Result[dict[str, Any]]:
         """
         Sync all active articles from DB to Qdrant
 
-        Use this to rebuild the vector index or after Qdrant downtime.
+        Incremental (see src/kb_vector_sync.py): only new or changed chunks
+        are embedded, chunks of deleted or deactivated articles are removed.
+        Safe to re-run after an interrupted sync - it resumes where it stopped.
+
+        Args:
+            progress: Called with running stats after every embedded batch
+            force: Re-embed unchanged chunks too (e.g. after an embedding model change)
 
         Returns:
             Result with sync stats
@@ -637,7 +660,7 @@ class KBArticleService:
             )
 
         try:
-            self.logger.info("kb_vector_sync_started")
+            self.logger.info("kb_vector_sync_started", force=force)
 
             # Get all active articles from DB
             from sqlalchemy import select
@@ -645,36 +668,23 @@ class KBArticleService:
             async with get_unit_of_work() as uow:
                 query = select(KBArticle).where(KBArticle.is_active == 1)
                 result = await uow.session.execute(query)
-                articles = result.scalars().all()
-
-            self.logger.info("kb_vector_sync_articles_loaded", count=len(articles))
+                documents = [self._article_document(a) for a in result.scalars().all()]
 
-            # Prepare documents for Qdrant
-            documents = []
-            for article in articles:
-                # Generate embedding
-                embedding = self.vector_store.generate_embedding(
-                    f"{article.title} {article.content}"
-                )
+            self.logger.info("kb_vector_sync_articles_loaded", count=len(documents))
 
-                documents.append(
-                    {
-                        "id": str(article.id),
-                        "doc_id": str(article.id),
-                        "embedding": embedding,
-                        "title": article.title,
-                        "content": article.content,
-                        "category": article.category,
-                        "tags": article.tags or [],
-                    }
-                )
-
-            # Upsert to Qdrant
-            self.vector_store.upsert_documents(documents)
-
-            self.logger.info("kb_vector_sync_completed", synced_count=len(documents))
-
-            return Result.ok({"synced_count": len(documents), "total_articles": len(articles)})
+            self.vector_sync.progress = progress
+            try:
+                stats = await self.vector_sync.sync(documents, prune=True, force=force)
+            finally:
+                self.vector_sync.progress = None
+
+            return Result.ok(
+                {
+                    **stats,
+                    "synced_count": stats["embedded"],
+                    "total_articles": len(documents),
+                }
+            )
 
         except Exception as e:
             self.logger.error("kb_vector_sync_failed", error=str(e), exc_info=True)
@@ -803,25 +813,24 @@ class KBArticleService:
 
         return Result.ok(None)
 
+    @staticmethod
+    def _article_document(article: KBArticle) -> dict[str, Any]:
+        """Article fields that go into the vector index"""
+        return {
+            "id": str(article.id),
+            "title": article.title,
+            "content": article.content,
+            "category": article.category,
+            "tags": article.tags or [],
+            "url": article.url,
+        }
+
     async def _index_article_in_vector_store(self, article: KBArticle) -> Result[None]:
-        """Index a single article in Qdrant"""
+        """Index a single article in Qdrant (re-embeds only changed chunks)"""
         try:
-            # Generate embedding
-            embedding = self.vector_store.generate_embedding(f"{article.title} {article.content}")
-
-            # Prepare document
-            document = {
-                "id": str(article.id),
-                "doc_id": str(article.id),
-                "embedding": embedding,
-                "title": article.title,
-                "content": article.content,
-                "category": article.category,
-                "tags": article.tags or [],
-            }
-
-            # Upsert to Qdrant
-            self.vector_store.upsert_documents([document])
+            stats = await self.vector_sync.sync([self._article_document(article)])
+            if stats["failed"]:
+                raise RuntimeError(f"{stats['failed']} chunks failed to index")
 
             return Result.ok(None)
 
@@ -3,8 +3,16 @@ Agent registry for dynamic agent discovery and instantiation.
 
 This module provides a centralized registry for all agents in the system,
 enabling dynamic discovery, instantiation, and management of agents.
+
+Agent modules are imported lazily: the registration manifest generated by
+src/agents/loader.py tells get_agent() which module registers a name, and
+metadata queries are answered from the manifest without importing anything.
 """
 
+import importlib
+import threading
+from typing import Any
+
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -21,6 +29,10 @@ class AgentRegistry:
     _agents: dict[str, type] = {}
     _metadata: dict[str, dict] = {}
 
+    # name -> {"module", "class_name", "tier", "category", "group"}; None = not read yet
+    _manifest: dict[str, dict] | None = None
+    _import_lock = threading.RLock()
+
     @classmethod
     def register(cls, name: str, tier: str | None = None, category: str | None = None):
         """
@@ -66,10 +78,43 @@ class AgentRegistry:
 
         return decorator
 
+    @classmethod
+    def _get_manifest(cls) -> dict[str, dict]:
+        """Read the registration manifest once (falls back to eager loading)"""
+        if cls._manifest is None:
+            from src.agents.loader import load_all_agents, load_manifest
+
+            manifest = load_manifest()
+            cls._manifest = manifest or {}
+            if manifest is None:
+                # No generated manifest (e.g. a dev checkout) - import everything
+                load_all_agents()
+        return cls._manifest
+
+    @classmethod
+    def _import_agent(cls, name: str) -> type | None:
+        """Import the module that registers `name`, per the manifest"""
+        entry = cls._get_manifest().get(name)
+        if entry is None:
+            return None
+
+        with cls._import_lock:
+            if name not in cls._agents:
+                try:
+                    importlib.import_module(entry["module"])
+                except ImportError as e:
+                    logger.warning(
+                        "agent_import_failed", name=name, module=entry["module"], error=str(e)
+                    )
+                    return None
+                logger.debug("agent_imported_on_demand", name=name, module=entry["module"])
+
+        return cls._agents.get(name)
+
     @classmethod
     def get_agent(cls, name: str) -> type | None:
         """
-        Get agent class by name.
+        Get agent class by name, importing its module on first use.
 
         Args:
             name: Agent name
@@ -77,23 +122,51 @@ class AgentRegistry:
         Returns:
             Agent class or None if not found
         """
-        agent_class = cls._agents.get(name)
+        agent_class = cls._agents.get(name) or cls._import_agent(name)
 
         if agent_class is None:
             logger.warning("agent_not_found", name=name)
 
         return agent_class
 
+    @classmethod
+    def get_loaded_agents(cls) -> dict[str, type]:
+        """
+        Get agents whose modules have already been imported.
+
+        Returns:
+            Dictionary mapping agent names to agent classes
+        """
+        return cls._agents.copy()
+
     @classmethod
     def get_all_agents(cls) -> dict[str, type]:
         """
-        Get all registered agents.
+        Get all registered agents, importing every agent module.
 
         Returns:
             Dictionary mapping agent names to agent classes
         """
+        for name in cls._get_manifest():
+            if name not in cls._agents:
+                cls._import_agent(name)
         return cls._agents.copy()
 
+    @classmethod
+    def _all_metadata(cls) -> dict[str, dict]:
+        """Manifest metadata overlaid with metadata of imported agents"""
+        merged: dict[str, dict[str, Any]] = {
+            name: {
+                "tier": entry.get("tier"),
+                "category": entry.get("category"),
+                "class_name": entry.get("class_name"),
+                "module": entry.get("module"),
+            }
+            for name, entry in cls._get_manifest().items()
+        }
+        merged.update(cls._metadata)
+        return merged
+
     @classmethod
     def get_agents_by_tier(cls, tier: str) -> list[str]:
         """
@@ -105,7 +178,9 @@ class AgentRegistry:
         Returns:
             List of agent names in the tier
         """
-        return [name for name, metadata in cls._metadata.items() if metadata.get("tier") == tier]
+        return [
+            name for name, metadata in cls._all_metadata().items() if metadata.get("tier") == tier
+        ]
 
     @classmethod
     def get_agents_by_category(cls, category: str) -> list[str]:
@@ -119,7 +194,9 @@ class AgentRegistry:
             List of agent names in the category
         """
         return [
-            name for name, metadata in cls._metadata.items() if metadata.get("category") == category
+            name
+            for name, metadata in cls._all_metadata().items()
+            if metadata.get("category") == category
         ]
 
     @classmethod
@@ -133,7 +210,7 @@ class AgentRegistry:
         Returns:
             Agent metadata dictionary or None if not found
         """
-        return cls._metadata.get(name)
+        return cls._metadata.get(name) or cls._all_metadata().get(name)
 
     @classmethod
     def list_agents(cls) -> list[dict]:
@@ -144,8 +221,8 @@ class AgentRegistry:
             List of dictionaries with agent information
         """
         return [
-            {"name": name, "class": agent_class.__name__, **cls._metadata.get(name, {})}
-            for name, agent_class in cls._agents.items()
+            {"name": name, "class": metadata["class_name"], **metadata}
+            for name, metadata in cls._all_metadata().items()
         ]
 
     @classmethod
@@ -153,10 +230,12 @@ class AgentRegistry:
         """
         Clear all registered agents.
 
-        Useful for testing.
+        Also disables the manifest, so the registry only knows agents
+        registered afterwards. Useful for testing.
         """
         cls._agents.clear()
         cls._metadata.clear()
+        cls._manifest = {}
         logger.info("agent_registry_cleared")
 
     @classmethod
@@ -168,7 +247,7 @@ class AgentRegistry:
             Dictionary mapping tier names to agent counts
         """
         summary = {}
-        for metadata in cls._metadata.values():
+        for metadata in cls._all_metadata().values():
             tier = metadata.get("tier", "unknown")
             summary[tier] = summary.get(tier, 0) + 1
         return summary
@@ -182,7 +261,7 @@ class AgentRegistry:
             Dictionary mapping category names to agent counts
         """
         summary = {}
-        for metadata in cls._metadata.values():
+        for metadata in cls._all_metadata().values():
             category = metadata.get("category", "unknown")
             summary[category] = summary.get(category, 0) + 1
         return summary
@@ -329,6 +329,10 @@ class BackendManager:
                 )
                 for backend in LLMBackend
             },
+            "routing": {
+                "enabled": self.llm_client.router.enabled,
+                "backends": self.llm_client.router.get_stats(),
+            },
         }
 
         # Add available models for current backend
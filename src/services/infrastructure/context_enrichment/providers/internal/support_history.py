@@ -4,7 +4,6 @@ Support history provider.
 Fetches customer support interaction history and satisfaction metrics from database.
 """
 
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -64,83 +63,25 @@ class SupportHistoryProvider(BaseContextProvider):
         try:
             uow = UnitOfWork(session)
 
-            # Fetch all conversations
-            conversations = await uow.conversations.find_by(customer_id=customer_id)
+            # Aggregated in SQL - no conversation rows are loaded
+            stats = await uow.conversations.get_support_history_stats(customer_id)
 
-            if not conversations:
+            if not stats["total_conversations"]:
                 return self._get_fallback_data()
 
-            # Calculate stats
-            total_conversations = len(conversations)
-
-            resolved = sum(
-                1 for conv in conversations if hasattr(conv, "status") and conv.status == "resolved"
-            )
-
-            escalated = sum(
-                1 for conv in conversations if hasattr(conv, "escalated") and conv.escalated
-            )
-
-            open_tickets = sum(
-                1
-                for conv in conversations
-                if hasattr(conv, "status") and conv.status in ["active", "waiting"]
-            )
-
-            # Calculate average resolution time
-            resolution_times = []
-            for conv in conversations:
-                if (
-                    hasattr(conv, "resolved_at")
-                    and conv.resolved_at
-                    and hasattr(conv, "started_at")
-                    and conv.started_at
-                ):
-                    delta = conv.resolved_at - conv.started_at
-                    resolution_times.append(delta.total_seconds() / 60)  # minutes
-
-            avg_resolution_time = (
-                sum(resolution_times) / len(resolution_times) if resolution_times else 0.0
-            )
-
-            # Get last conversation
-            sorted_convs = sorted(
-                conversations,
-                key=lambda c: c.started_at if hasattr(c, "started_at") else datetime.min,
-                reverse=True,
-            )
-            last_conversation = sorted_convs[0].started_at if sorted_convs else None
-
-            # Get CSAT scores
-            csat_scores = [
-                conv.csat_score
-                for conv in conversations
-                if hasattr(conv, "csat_score") and conv.csat_score is not None
-            ]
-
-            last_csat = csat_scores[0] if csat_scores else None
-            avg_csat = sum(csat_scores) / len(csat_scores) if csat_scores else None
-
-            # Get most common issues (from primary_intent)
-            intent_counts = {}
-            for conv in conversations:
-                if hasattr(conv, "primary_intent") and conv.primary_intent:
-                    intent = conv.primary_intent
-                    intent_counts[intent] = intent_counts.get(intent, 0) + 1
-
-            most_common_issues = sorted(intent_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-            most_common_issues = [issue for issue, count in most_common_issues]
+            avg_resolution_seconds = stats["avg_resolution_time_seconds"] or 0.0
 
             return {
-                "total_conversations": total_conversations,
-                "resolved_conversations": resolved,
-                "avg_resolution_time_minutes": round(avg_resolution_time, 1),
-                "most_common_issues": most_common_issues,
-                "last_conversation": last_conversation,
-                "last_csat": last_csat,
-                "avg_csat": round(avg_csat, 1) if avg_csat else None,
-                "escalation_count": escalated,
-                "open_tickets": open_tickets,
+                "total_conversations": stats["total_conversations"],
+                "resolved_conversations": stats["resolved_conversations"],
+                "avg_resolution_time_minutes": round(avg_resolution_seconds / 60, 1),
+                "most_common_issues": stats["most_common_issues"],
+                "last_conversation": stats["last_conversation"],
+                # Conversations carry no CSAT column yet
+                "last_csat": None,
+                "avg_csat": None,
+                "escalation_count": stats["escalated_conversations"],
+                "open_tickets": stats["open_conversations"],
             }
 
         except Exception as e:
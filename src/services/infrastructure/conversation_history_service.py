@@ -0,0 +1,295 @@
+"""
+Conversation History Service - Windowed history with a rolling summary
+
+Agents only see the last HISTORY_WINDOW messages of a conversation (see
+BaseAgent._format_conversation_history), so loading every message per turn
+is wasted DB, ORM and serialization work that grows with the conversation.
+This service keeps per-turn cost constant:
+- The window is read with a keyset query (MessageRepository.get_recent)
+- Older turns are folded into a summary stored in
+  conversation.extra_metadata["history_summary"] as they leave the window,
+  a few messages at a time, in a background task with its own unit of work
+  (the summarizer is an LLM call; the turn must not wait for it)
+
+Summary record:
+    {
+        "text": "...",
+        "through": {"created_at": "<iso>", "id": "<uuid>"},  # last folded message
+        "message_count": 42,  # messages folded so far
+    }
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.database.models import Conversation, Message
+from src.database.unit_of_work import UnitOfWork, get_unit_of_work
+from src.utils.logging.setup import get_logger
+
+# Messages passed verbatim to agents (matches BaseAgent's history limit)
+HISTORY_WINDOW = 10
+
+# Fold messages into the summary once this many have left the window
+SUMMARY_BATCH_SIZE = 6
+
+# Upper bound on messages folded per turn (lets old conversations catch up gradually)
+MAX_FOLD_PER_TURN = 24
+
+# Summary length cap in characters
+MAX_SUMMARY_CHARS = 2000
+
+_SUMMARY_PROMPT = """You maintain a running summary of a customer support conversation.
+
+Current summary:
+{summary}
+
+Newer messages:
+{messages}
+
+Rewrite the summary so it also covers the newer messages. Keep the customer's \
+goals, account details, problems, what was tried, and open questions. \
+At most 150 words, plain prose, no preamble."""
+
+Summarizer = Callable[[str | None, list[dict[str, Any]]], Awaitable[str]]
+
+# Background folds in flight, by conversation (also keeps the tasks referenced)
+_summary_tasks: dict[UUID, asyncio.Task] = {}
+
+
+def message_to_history(msg: Message) -> dict[str, Any]:
+    """Convert a Message row to the history dict agents receive"""
+    return {
+        "role": msg.role,
+        "content": msg.content,
+        "timestamp": msg.created_at.isoformat() if msg.created_at else None,
+        "agent_name": getattr(msg, "agent_name", None),
+    }
+
+
+def _format_messages(messages: list[dict[str, Any]]) -> str:
+    lines = []
+    for msg in messages:
+        role = "Customer" if msg["role"] == "user" else "Agent"
+        lines.append(f"{role}: {msg['content'][:1000]}")
+    return "\n".join(lines)
+
+
+async def summarize_with_llm(summary: str | None, messages: list[dict[str, Any]]) -> str:
+    """Fold messages into the summary with the fast model tier"""
+    from src.llm.client import llm_client
+
+    prompt = _SUMMARY_PROMPT.format(
+        summary=summary or "(none yet)", messages=_format_messages(messages)
+    )
+    return await llm_client.chat_completion(
+        messages=[{"role": "user", "content": prompt}],
+        model_tier="haiku",
+        temperature=0.0,
+        max_tokens=300,
+    )
+
+
+def summarize_extractive(summary: str | None, messages: list[dict[str, Any]]) -> str:
+    """Fallback: append a one-line digest per message, keeping the newest text"""
+    digest = "\n".join(
+        line if len(line) <= 200 else line[:200] + "..."
+        for line in _format_messages(messages).splitlines()
+    )
+    text = f"{summary}\n{digest}" if summary else digest
+    return text[-MAX_SUMMARY_CHARS:]
+
+
+class ConversationHistoryService:
+    """
+    Loads the history window for a turn and maintains the rolling summary
+
+    Example:
+        history = ConversationHistoryService(uow)
+        window, summary = await history.get_context(conversation)
+        ...  # add the user message and the agent response
+        await uow.commit()
+        history.schedule_summary_update(conversation.id)
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        window_size: int = HISTORY_WINDOW,
+        summary_batch_size: int = SUMMARY_BATCH_SIZE,
+        summarizer: Summarizer | None = None,
+    ):
+        """
+        Initialize history service
+
+        Args:
+            uow: Unit of Work for message and conversation access
+            window_size: Messages passed to agents verbatim
+            summary_batch_size: Messages outside the window before a fold
+            summarizer: Async (summary, messages) -> summary. Defaults to an
+                        LLM summary, falling back to an extractive digest.
+        """
+        self.uow = uow
+        self.window_size = window_size
+        self.summary_batch_size = summary_batch_size
+        self.summarizer = summarizer or summarize_with_llm
+        self.logger = get_logger(__name__)
+
+    async def get_context(
+        self, conversation: Conversation
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Get the history window and summary of older turns
+
+        Args:
+            conversation: Conversation (messages need not be loaded)
+
+        Returns:
+            (last window_size messages as history dicts, summary text or None)
+        """
+        recent = await self.uow.messages.get_recent(conversation.id, limit=self.window_size)
+        summary = self._stored_summary(conversation)
+
+        self.logger.debug(
+            "conversation_history_window_loaded",
+            conversation_id=str(conversation.id),
+            message_count=len(recent),
+            summarized_messages=summary.get("message_count", 0),
+        )
+
+        return [message_to_history(msg) for msg in recent], summary.get("text")
+
+    async def update_summary(self, conversation: Conversation) -> bool:
+        """
+        Fold messages that have left the window into the summary
+
+        Runs in this service's unit of work; turns use
+        schedule_summary_update() instead. Reads at most window_size plus
+        MAX_FOLD_PER_TURN rows. The reads and the write each run in a short
+        savepoint; the summarizer (an LLM call) runs between them with no
+        savepoint open. Failures are logged, never raised - the next turn
+        retries.
+
+        Args:
+            conversation: Conversation the messages were added to
+
+        Returns:
+            True if the summary was updated
+        """
+        try:
+            # Savepoints: a failed read or write must not poison the caller's transaction
+            async with self.uow.session.begin_nested():
+                pending = await self._pending_messages(conversation)
+            if not pending:
+                return False
+
+            summary = self._stored_summary(conversation)
+            history = [message_to_history(msg) for msg in pending]
+            try:
+                text = await self.summarizer(summary.get("text"), history)
+            except Exception as e:
+                self.logger.warning(
+                    "conversation_summary_llm_failed", error=str(e), error_type=type(e).__name__
+                )
+                text = summarize_extractive(summary.get("text"), history)
+
+            last = pending[-1]
+            record = {
+                "text": text[:MAX_SUMMARY_CHARS],
+                "through": {"created_at": last.created_at.isoformat(), "id": str(last.id)},
+                "message_count": summary.get("message_count", 0) + len(pending),
+            }
+            async with self.uow.session.begin_nested():
+                await self.uow.conversations.update_history_summary(conversation.id, record)
+
+            # Keep the in-session copy current (the UPDATE skips the ORM)
+            conversation.extra_metadata = {
+                **(conversation.extra_metadata or {}),
+                "history_summary": record,
+            }
+
+            self.logger.info(
+                "conversation_summary_updated",
+                conversation_id=str(conversation.id),
+                folded_messages=len(pending),
+                summarized_messages=record["message_count"],
+            )
+            return True
+
+        except Exception as e:
+            self.logger.warning(
+                "conversation_summary_update_failed",
+                conversation_id=str(conversation.id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
+    def schedule_summary_update(self, conversation_id: UUID) -> asyncio.Task:
+        """
+        Fold the summary in a background task with its own unit of work
+
+        Call after the turn is committed (the fold only sees committed
+        messages) and before or after responding - the turn never waits for
+        the summarizer. At most one fold per conversation runs at a time in
+        this process; a turn that finds one in flight leaves its messages to
+        the next turn.
+
+        Args:
+            conversation_id: Conversation the turn was added to
+
+        Returns:
+            The fold's task (the one already in flight, if any)
+        """
+        task = _summary_tasks.get(conversation_id)
+        if task is None:
+            task = asyncio.create_task(self._update_summary_detached(conversation_id))
+            _summary_tasks[conversation_id] = task
+            task.add_done_callback(lambda _: _summary_tasks.pop(conversation_id, None))
+        return task
+
+    async def _update_summary_detached(self, conversation_id: UUID) -> bool:
+        """update_summary() in a new unit of work, with this service's settings"""
+        try:
+            async with get_unit_of_work(self.uow.current_user_id) as uow:
+                conversation = await uow.conversations.get_without_messages(conversation_id)
+                if conversation is None:
+                    return False
+                history = ConversationHistoryService(
+                    uow,
+                    window_size=self.window_size,
+                    summary_batch_size=self.summary_batch_size,
+                    summarizer=self.summarizer,
+                )
+                return await history.update_summary(conversation)
+        except Exception as e:
+            self.logger.warning(
+                "conversation_summary_update_failed",
+                conversation_id=str(conversation_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
+    async def _pending_messages(self, conversation: Conversation) -> list[Message]:
+        """Messages between the summary and the window, or [] if too few to fold"""
+        window = await self.uow.messages.get_recent(conversation.id, limit=self.window_size)
+        if len(window) < self.window_size:
+            return []
+
+        through = self._stored_summary(conversation).get("through")
+        pending = await self.uow.messages.get_range(
+            conversation.id,
+            after=(datetime.fromisoformat(through["created_at"]), UUID(through["id"]))
+            if through
+            else None,
+            before=(window[0].created_at, window[0].id),
+            limit=MAX_FOLD_PER_TURN,
+        )
+        return pending if len(pending) >= self.summary_batch_size else []
+
+    @staticmethod
+    def _stored_summary(conversation: Conversation) -> dict[str, Any]:
+        return (conversation.extra_metadata or {}).get("history_summary") or {}
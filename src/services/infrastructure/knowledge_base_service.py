@@ -101,7 +101,7 @@ class KnowledgeBaseService:
             )
 
             start_time = time.time()
-            results = self.vector_store.search(
+            results = await self.vector_store.search_async(
                 query=query, category=category, limit=limit, score_threshold=score_threshold
             )
             duration_ms = (time.time() - start_time) * 1000
@@ -8,11 +8,27 @@ Provides persistent, reliable job tracking with:
 - Error handling and retry logic
 - Performance monitoring
 - Graceful fallback to in-memory for development
+
+Redis layout (key_prefix defaults to "job:"):
+    job:<job_id>                           JSON job document
+    job:idx:created                        ZSET job_id -> created_at timestamp
+    job:idx:status:<status>                ZSET, same scores
+    job:idx:type:<job_type>                ZSET, same scores
+    job:idx:status_type:<status>:<type>    ZSET, same scores
+
+Every filter combination maps to exactly one index, so a listing page is
+one ZREVRANGEBYSCORE plus one MGET. Index entries for jobs that expired
+through their TTL are pruned lazily when listing or cleaning up.
+
+Jobs written before the indexes existed are added by rebuild_indexes(),
+which the first store to initialize against a Redis runs once (claimed
+through the job:idx:built marker key).
 """
 
 import asyncio
 import contextlib
 import json
+import math
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
@@ -43,6 +59,16 @@ class JobType(str, Enum):
     BATCH_EXECUTION = "batch_execution"
 
 
+TERMINAL_STATUSES = frozenset(
+    {
+        JobStatus.COMPLETED.value,
+        JobStatus.FAILED.value,
+        JobStatus.CANCELLED.value,
+        JobStatus.TIMEOUT.value,
+    }
+)
+
+
 class JobNotFoundError(Exception):
     """Raised when job ID is not found"""
 
@@ -139,6 +165,15 @@ class RedisJobStore:
 
             self._initialized = True
 
+            # Index jobs created before the indexes existed (once per Redis)
+            marker = self._index_key("built")
+            if await self._redis.set(marker, "1", nx=True):
+                try:
+                    await self.rebuild_indexes()
+                except JobStoreError:
+                    # Listing still works for new jobs; the next store retries
+                    await self._redis.delete(marker)
+
             # Start cleanup task
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
 
@@ -165,6 +200,67 @@ class RedisJobStore:
         """Get Redis key for job ID"""
         return f"{self.key_prefix}{job_id!s}"
 
+    def _index_key(self, *parts: str) -> str:
+        """Get Redis key for a secondary index"""
+        return f"{self.key_prefix}idx:{':'.join(parts)}"
+
+    def _index_for(self, status: str | None = None, job_type: str | None = None) -> str:
+        """Pick the one index that serves a status/type filter combination"""
+        if status and job_type:
+            return self._index_key("status_type", status, job_type)
+        if status:
+            return self._index_key("status", status)
+        if job_type:
+            return self._index_key("type", job_type)
+        return self._index_key("created")
+
+    def _indexes_of(self, job: dict[str, Any]) -> list[str]:
+        """All index keys a job belongs to"""
+        return [
+            self._index_for(),
+            self._index_for(status=job["status"]),
+            self._index_for(job_type=job["job_type"]),
+            self._index_for(status=job["status"], job_type=job["job_type"]),
+        ]
+
+    @staticmethod
+    def _score(job: dict[str, Any]) -> float:
+        """Index score: creation time as a UNIX timestamp"""
+        return datetime.fromisoformat(job["created_at"]).timestamp()
+
+    @staticmethod
+    def _parse_cursor(cursor: str) -> tuple[float, str]:
+        """
+        Split a next_cursor ("<score>:<job_id>") into its score and job ID
+
+        Raises:
+            ValueError: If the cursor was not produced by list_jobs_page()
+        """
+        score_str, _, after_id = cursor.partition(":")
+        try:
+            score = float(score_str)
+        except ValueError:
+            score = math.nan
+        if not after_id or not math.isfinite(score):
+            raise ValueError(f"invalid cursor: {cursor!r}")
+        return score, after_id
+
+    def _remove_from_indexes(self, pipe, job_id: str, job: dict[str, Any] | None):
+        """Queue index removals on a pipeline (all status/type indexes if job is unknown)"""
+        if job is not None:
+            keys = self._indexes_of(job)
+        else:
+            keys = [self._index_for()]
+            keys += [self._index_for(status=s.value) for s in JobStatus]
+            keys += [self._index_for(job_type=t.value) for t in JobType]
+            keys += [
+                self._index_for(status=s.value, job_type=t.value)
+                for s in JobStatus
+                for t in JobType
+            ]
+        for key in keys:
+            pipe.zrem(key, job_id)
+
     async def create_job(
         self,
         job_type: JobType,
@@ -215,13 +311,21 @@ class RedisJobStore:
         }
 
         try:
-            # Store in Redis as JSON
+            # Store as JSON and index it in one round trip
             key = self._get_key(job_id)
-            await self._redis.set(key, json.dumps(job_data, default=str))
+            score = self._score(job_data)
+
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.set(key, json.dumps(job_data, default=str))
+
+                # Set TTL if specified (for cleanup)
+                if ttl_hours:
+                    pipe.expire(key, int(ttl_hours * 3600))
 
-            # Set TTL if specified (for cleanup)
-            if ttl_hours:
-                await self._redis.expire(key, int(ttl_hours * 3600))
+                for index_key in self._indexes_of(job_data):
+                    pipe.zadd(index_key, {str(job_id): score})
+
+                await pipe.execute()
 
             logger.info(
                 "job_created",
@@ -303,6 +407,7 @@ class RedisJobStore:
         try:
             # Get current job data
             job_data = await self.get_job(job_id)
+            previous_status = job_data["status"]
 
             # Update fields
             if status is not None:
@@ -335,13 +440,29 @@ class RedisJobStore:
             # Update additional fields
             job_data.update(kwargs)
 
-            # Save back to Redis
+            # Save back to Redis, moving the job between status indexes
             key = self._get_key(job_id)
-            await self._redis.set(key, json.dumps(job_data, default=str))
 
-            # Apply TTL for completed jobs
-            if status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                await self._redis.expire(key, int(self.default_ttl.total_seconds()))
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.set(key, json.dumps(job_data, default=str))
+
+                # Apply TTL for completed jobs
+                if status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
+                    pipe.expire(key, int(self.default_ttl.total_seconds()))
+
+                if job_data["status"] != previous_status:
+                    member = str(job_id)
+                    score = self._score(job_data)
+                    job_type = job_data["job_type"]
+                    pipe.zrem(self._index_for(status=previous_status), member)
+                    pipe.zrem(self._index_for(status=previous_status, job_type=job_type), member)
+                    pipe.zadd(self._index_for(status=job_data["status"]), {member: score})
+                    pipe.zadd(
+                        self._index_for(status=job_data["status"], job_type=job_type),
+                        {member: score},
+                    )
+
+                await pipe.execute()
 
             logger.debug(
                 "job_updated",
@@ -371,7 +492,13 @@ class RedisJobStore:
 
         try:
             key = self._get_key(job_id)
-            await self._redis.delete(key)
+            data = await self._redis.get(key)
+            job = json.loads(data) if data else None
+
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                self._remove_from_indexes(pipe, str(job_id), job)
+                await pipe.execute()
 
             logger.info("job_deleted", job_id=str(job_id))
 
@@ -383,7 +510,7 @@ class RedisJobStore:
         self, status: JobStatus | None = None, job_type: JobType | None = None, limit: int = 100
     ) -> list[dict[str, Any]]:
         """
-        List jobs with optional filtering.
+        List jobs with optional filtering, newest first.
 
         Args:
             status: Filter by status
@@ -393,53 +520,180 @@ class RedisJobStore:
         Returns:
             List of job data dictionaries
         """
+        page = await self.list_jobs_page(status=status, job_type=job_type, limit=limit)
+        return page["jobs"]
+
+    async def list_jobs_page(
+        self,
+        status: JobStatus | None = None,
+        job_type: JobType | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        List one page of jobs, newest first.
+
+        Reads the matching secondary index with ZREVRANGEBYSCORE and fetches
+        the documents with a single MGET.
+
+        Args:
+            status: Filter by status
+            job_type: Filter by job type
+            limit: Page size
+            cursor: next_cursor from the previous page (None for the first page)
+
+        Returns:
+            Dict with "jobs" and "next_cursor" (None on the last page)
+
+        Raises:
+            ValueError: If limit is less than 1 or the cursor is malformed
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+
+        max_score: float | str = "+inf"
+        after_id = None
+        if cursor:
+            max_score, after_id = self._parse_cursor(cursor)
+
         if not self._initialized:
             await self.initialize()
 
-        try:
-            # Scan all job keys
-            pattern = f"{self.key_prefix}*"
-            keys = []
+        index_key = self._index_for(
+            status=status.value if status else None,
+            job_type=job_type.value if job_type else None,
+        )
 
-            async for key in self._redis.scan_iter(match=pattern, count=100):
-                keys.append(key)
+        try:
+            jobs: list[dict[str, Any]] = []
+            fetch = limit + 1
+            while True:
+                raw = await self._redis.zrevrangebyscore(
+                    index_key, max_score, "-inf", start=0, num=fetch, withscores=True
+                )
+                # Members sharing the cursor's score come back in reverse
+                # lexical order; those >= the cursor member were already served
+                entries = [
+                    (member, score)
+                    for member, score in raw
+                    if after_id is None or score != max_score or member < after_id
+                ]
+                exhausted = len(raw) < fetch
+                if not entries:
+                    if exhausted:
+                        break
+                    # The whole batch was ties already served - widen it
+                    fetch *= 2
+                    continue
 
-                if len(keys) >= limit * 2:  # Get extra for filtering
+                # One more than needed tells whether there is a next page
+                needed = limit + 1 - len(jobs)
+                exhausted = exhausted and len(entries) <= needed
+                entries = entries[:needed]
+                docs = await self._redis.mget([self._get_key(m) for m, _ in entries])
+
+                stale = []
+                next_cursor = None
+                for (member, score), doc in zip(entries, docs, strict=True):
+                    if doc is None:
+                        stale.append(member)
+                    elif len(jobs) < limit:
+                        jobs.append(json.loads(doc))
+                        last_served = f"{score!r}:{member}"
+                    else:
+                        next_cursor = last_served
+                        break
+
+                if stale:
+                    # Documents expired through TTL - drop their index entries
+                    await self._prune_index_entries(stale)
+
+                if next_cursor is not None:
+                    return {"jobs": jobs, "next_cursor": next_cursor}
+                if exhausted:
                     break
 
-            # Get job data
-            jobs = []
-            for key in keys[: limit * 2]:
-                try:
-                    data = await self._redis.get(key)
-                    if data:
-                        job = json.loads(data)
+                # Only expired entries held us short - continue past them
+                max_score, after_id = entries[-1][1], entries[-1][0]
+                fetch = limit + 1 - len(jobs)
 
-                        # Apply filters
-                        if status and job.get("status") != status.value:
-                            continue
-                        if job_type and job.get("job_type") != job_type.value:
-                            continue
+            return {"jobs": jobs, "next_cursor": None}
+
+        except Exception as e:
+            logger.error("job_listing_failed", error=str(e), exc_info=True)
+            return {"jobs": [], "next_cursor": None}
+
+    async def _prune_index_entries(self, job_ids: list[str]):
+        """Remove index entries whose job documents no longer exist"""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                self._remove_from_indexes(pipe, job_id, None)
+            await pipe.execute()
+
+    async def rebuild_indexes(self, batch_size: int = 500) -> int:
+        """
+        Add every stored job to its secondary indexes.
+
+        SCANs the job documents, so it is meant for one-off backfills (see
+        initialize()) rather than the request path. Safe to re-run: ZADD of
+        an existing entry only rewrites its score.
+
+        Args:
+            batch_size: Keys per SCAN page and MGET
+
+        Returns:
+            Number of jobs indexed
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        index_prefix = self._index_key("")
+        indexed = 0
 
-                        jobs.append(job)
+        async def index_batch(keys: list[str]) -> int:
+            docs = await self._redis.mget(keys)
+            count = 0
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for doc in docs:
+                    if doc is None:
+                        continue
+                    job = json.loads(doc)
+                    score = self._score(job)
+                    for index_key in self._indexes_of(job):
+                        pipe.zadd(index_key, {job["job_id"]: score})
+                    count += 1
+                await pipe.execute()
+            return count
 
-                        if len(jobs) >= limit:
-                            break
-                except Exception:
+        try:
+            batch: list[str] = []
+            async for key in self._redis.scan_iter(match=f"{self.key_prefix}*", count=batch_size):
+                if key.startswith(index_prefix):
                     continue
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    indexed += await index_batch(batch)
+                    batch = []
+            if batch:
+                indexed += await index_batch(batch)
 
-            return jobs
+            logger.info("job_indexes_rebuilt", count=indexed)
+            return indexed
 
         except Exception as e:
-            logger.error("job_listing_failed", error=str(e), exc_info=True)
-            return []
+            logger.error("job_index_rebuild_failed", error=str(e), indexed=indexed, exc_info=True)
+            raise JobStoreError(f"Failed to rebuild job indexes: {e}") from e
 
-    async def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
+    async def cleanup_old_jobs(self, max_age_hours: int = 24, batch_size: int = 500) -> int:
         """
-        Clean up jobs older than max_age_hours.
+        Clean up finished jobs that completed more than max_age_hours ago.
+
+        Only jobs created before the cutoff can have completed before it,
+        so candidates come from the creation-time index instead of a scan.
 
         Args:
             max_age_hours: Maximum age in hours
+            batch_size: Jobs fetched per MGET
 
         Returns:
             Number of jobs cleaned up
@@ -451,34 +705,33 @@ class RedisJobStore:
         deleted_count = 0
 
         try:
-            # Scan all job keys
-            pattern = f"{self.key_prefix}*"
+            candidates = await self._redis.zrangebyscore(
+                self._index_for(), "-inf", cutoff.timestamp()
+            )
 
-            async for key in self._redis.scan_iter(match=pattern, count=100):
-                try:
-                    data = await self._redis.get(key)
-                    if not data:
-                        continue
+            for start in range(0, len(candidates), batch_size):
+                batch = candidates[start : start + batch_size]
+                docs = await self._redis.mget([self._get_key(job_id) for job_id in batch])
 
-                    job = json.loads(data)
-
-                    # Check if job is old enough and completed/failed
-                    completed_at = job.get("completed_at")
-                    status = job.get("status")
-
-                    if completed_at and status in [
-                        JobStatus.COMPLETED.value,
-                        JobStatus.FAILED.value,
-                        JobStatus.CANCELLED.value,
-                        JobStatus.TIMEOUT.value,
-                    ]:
-                        completed_time = datetime.fromisoformat(completed_at)
-                        if completed_time < cutoff:
-                            await self._redis.delete(key)
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for job_id, doc in zip(batch, docs, strict=True):
+                        if doc is None:
+                            # Already expired - only the index entries remain
+                            self._remove_from_indexes(pipe, job_id, None)
+                            continue
+
+                        job = json.loads(doc)
+                        completed_at = job.get("completed_at")
+                        if (
+                            completed_at
+                            and job.get("status") in TERMINAL_STATUSES
+                            and datetime.fromisoformat(completed_at) < cutoff
+                        ):
+                            pipe.delete(self._get_key(job_id))
+                            self._remove_from_indexes(pipe, job_id, job)
                             deleted_count += 1
 
-                except Exception:
-                    continue
+                    await pipe.execute()
 
             if deleted_count > 0:
                 logger.info("jobs_cleaned_up", count=deleted_count, max_age_hours=max_age_hours)
@@ -613,7 +866,22 @@ class InMemoryJobStore:
     async def list_jobs(
         self, status: JobStatus | None = None, job_type: JobType | None = None, limit: int = 100
     ) -> list[dict[str, Any]]:
-        """List jobs from memory"""
+        """List jobs from memory, newest first"""
+        page = await self.list_jobs_page(status=status, job_type=job_type, limit=limit)
+        return page["jobs"]
+
+    async def list_jobs_page(
+        self,
+        status: JobStatus | None = None,
+        job_type: JobType | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """List one page of jobs from memory, same cursor format as RedisJobStore"""
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        after = RedisJobStore._parse_cursor(cursor) if cursor else None
+
         jobs = list(self._jobs.values())
 
         # Apply filters
@@ -622,7 +890,21 @@ class InMemoryJobStore:
         if job_type:
             jobs = [j for j in jobs if j["job_type"] == job_type.value]
 
-        return jobs[:limit]
+        # Same order as a ZREVRANGEBYSCORE over (created_at, job_id)
+        keyed = sorted(
+            ((RedisJobStore._score(j), j["job_id"], j) for j in jobs),
+            key=lambda item: (item[0], item[1]),
+            reverse=True,
+        )
+        if after:
+            keyed = [item for item in keyed if (item[0], item[1]) < after]
+
+        page = [job.copy() for _, _, job in keyed[:limit]]
+        next_cursor = None
+        if len(keyed) > limit and page:
+            next_cursor = f"{keyed[limit - 1][0]!r}:{keyed[limit - 1][1]}"
+
+        return {"jobs": page, "next_cursor": next_cursor}
 
     async def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """Clean up old jobs from memory"""
@@ -36,6 +36,7 @@ class CostCalculator:
     - Anthropic Claude 3 Haiku: $0.25 / $1.25 per 1M tokens (input/output)
     - Anthropic Claude 3.5 Sonnet: $3.00 / $15.00 per 1M tokens
     - Anthropic Claude 3 Opus: $15.00 / $75.00 per 1M tokens
+    - Prompt cache: writes at 1.25x and reads at 0.1x the input price
     - vLLM (Vast.ai RTX 3090): ~$0.15/hour average
     """
 
@@ -46,6 +47,10 @@ class CostCalculator:
         "claude-3-opus-20240229": (15.00, 75.00),
     }
 
+    # Prompt cache pricing relative to the input price
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.10
+
     # vLLM pricing per hour (Vast.ai average)
     VLLM_HOURLY_RATE = 0.16  # RTX 3090 average
 
@@ -54,14 +59,18 @@ class CostCalculator:
         model: str,
         input_tokens: int,
         output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
         """
         Calculate cost for Anthropic API call.
 
         Args:
             model: Model name
-            input_tokens: Number of input tokens
+            input_tokens: Number of input tokens (including cached ones)
             output_tokens: Number of output tokens
+            cache_read_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Cost in USD
@@ -81,8 +90,14 @@ class CostCalculator:
             model, CostCalculator.ANTHROPIC_PRICING["claude-3-haiku-20240307"]
         )
 
-        # Calculate cost
-        cost = (input_tokens / 1_000_000) * input_price + (output_tokens / 1_000_000) * output_price
+        # Calculate cost (cached input tokens are billed at their own rates)
+        uncached_tokens = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+        input_units = (
+            uncached_tokens
+            + cache_write_tokens * CostCalculator.CACHE_WRITE_MULTIPLIER
+            + cache_read_tokens * CostCalculator.CACHE_READ_MULTIPLIER
+        )
+        cost = (input_units / 1_000_000) * input_price + (output_tokens / 1_000_000) * output_price
 
         return round(cost, 6)
 
@@ -137,6 +152,7 @@ class CostTracker:
             "vllm": 0.0,
         }
         self.budget_limit = budget_limit
+        self.cache_tokens: dict[str, int] = {"read": 0, "write": 0}
         self.cost_history: list[CostEntry] = []
         self.max_history = 10000
 
@@ -150,21 +166,29 @@ class CostTracker:
         model: str,
         input_tokens: int,
         output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
         """
         Track cost of Anthropic API call.
 
         Args:
             model: Model name
-            input_tokens: Number of input tokens
+            input_tokens: Number of input tokens (including cached ones)
             output_tokens: Number of output tokens
+            cache_read_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Cost of this call
         """
-        cost = CostCalculator.calculate_anthropic_cost(model, input_tokens, output_tokens)
+        cost = CostCalculator.calculate_anthropic_cost(
+            model, input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+        )
 
         self.costs["anthropic"] += cost
+        self.cache_tokens["read"] += cache_read_tokens
+        self.cache_tokens["write"] += cache_write_tokens
 
         # Add to history
         entry = CostEntry(
@@ -174,6 +198,8 @@ class CostTracker:
                 "model": model,
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
+                "cache_read_tokens": cache_read_tokens,
+                "cache_write_tokens": cache_write_tokens,
             },
         )
         self._add_to_history(entry)
@@ -183,6 +209,8 @@ class CostTracker:
             model=model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
             cost=cost,
             total_anthropic=self.costs["anthropic"],
             total_overall=self.get_total_cost(),
@@ -253,6 +281,8 @@ class CostTracker:
             "budget_limit": self.budget_limit,
             "remaining": round(remaining, 6),
             "budget_used_percent": round((total / self.budget_limit) * 100, 2),
+            "cache_read_tokens": self.cache_tokens["read"],
+            "cache_write_tokens": self.cache_tokens["write"],
         }
 
     def get_budget_status(self) -> dict[str, any]:
@@ -346,6 +376,7 @@ class CostTracker:
             "anthropic": 0.0,
             "vllm": 0.0,
         }
+        self.cache_tokens = {"read": 0, "write": 0}
         self.cost_history.clear()
 
         logger.info(
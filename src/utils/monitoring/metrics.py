@@ -2,7 +2,7 @@
 LLM Metrics Tracking Module
 
 Tracks LLM usage metrics across all backends:
-- Token usage (input/output)
+- Token usage (input/output, prompt-cache reads/writes)
 - Latency
 - Cost
 - Error rates
@@ -33,6 +33,8 @@ class LLMCallMetrics:
     timestamp: datetime = field(default_factory=datetime.utcnow)
     success: bool = True
     error: str | None = None
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 class LLMMetricsTracker:
@@ -56,6 +58,8 @@ class LLMMetricsTracker:
                 "failed_calls": 0,
                 "total_input_tokens": 0,
                 "total_output_tokens": 0,
+                "total_cache_read_tokens": 0,
+                "total_cache_write_tokens": 0,
                 "total_latency_ms": 0,
                 "errors": defaultdict(int),
             }
@@ -71,6 +75,9 @@ class LLMMetricsTracker:
             }
         )
 
+        # Calls served by an identical in-flight request (single-flight)
+        self.coalesced_calls: dict[str, int] = defaultdict(int)
+
         logger.info("llm_metrics_tracker_initialized")
 
     def track_call(
@@ -82,6 +89,8 @@ class LLMMetricsTracker:
         latency_ms: float,
         success: bool = True,
         error: str | None = None,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> None:
         """
         Track a single LLM call.
@@ -89,11 +98,13 @@ class LLMMetricsTracker:
         Args:
             backend: Backend name (anthropic, vllm)
             model: Model name
-            input_tokens: Number of input tokens
+            input_tokens: Number of input tokens (including cached ones)
             output_tokens: Number of output tokens
             latency_ms: Latency in milliseconds
             success: Whether call succeeded
             error: Error message if failed
+            cache_read_tokens: Input tokens served from the provider's prompt cache
+            cache_write_tokens: Input tokens written to the provider's prompt cache
         """
         # Create metrics object
         metrics = LLMCallMetrics(
@@ -104,6 +115,8 @@ class LLMMetricsTracker:
             latency_ms=latency_ms,
             success=success,
             error=error,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
 
         # Add to recent calls
@@ -119,6 +132,8 @@ class LLMMetricsTracker:
             backend_stats["successful_calls"] += 1
             backend_stats["total_input_tokens"] += input_tokens
             backend_stats["total_output_tokens"] += output_tokens
+            backend_stats["total_cache_read_tokens"] += cache_read_tokens
+            backend_stats["total_cache_write_tokens"] += cache_write_tokens
             backend_stats["total_latency_ms"] += latency_ms
         else:
             backend_stats["failed_calls"] += 1
@@ -145,10 +160,26 @@ class LLMMetricsTracker:
             model=model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
             latency_ms=latency_ms,
             success=success,
         )
 
+    def track_coalesced_call(self, backend: str, model: str) -> None:
+        """
+        Track a call that shared the result of an identical in-flight call.
+
+        Coalesced calls are not counted in track_call(): no tokens were
+        spent and no request reached the backend.
+
+        Args:
+            backend: Backend name (anthropic, vllm)
+            model: Model name
+        """
+        self.coalesced_calls[backend] += 1
+
+        logger.debug("llm_call_coalesced_tracked", backend=backend, model=model)
+
     def get_backend_stats(self, backend: str) -> dict[str, Any]:
         """
         Get aggregated statistics for a backend.
@@ -166,6 +197,9 @@ class LLMMetricsTracker:
                 "successful_calls": 0,
                 "failed_calls": 0,
                 "total_tokens": 0,
+                "cache_read_tokens": 0,
+                "cache_write_tokens": 0,
+                "cache_hit_rate": 0.0,
                 "avg_latency_ms": 0,
                 "error_rate": 0.0,
             }
@@ -178,6 +212,10 @@ class LLMMetricsTracker:
             else 0
         )
         error_rate = stats["failed_calls"] / total_calls if total_calls > 0 else 0.0
+        cache_read = stats["total_cache_read_tokens"]
+        cache_hit_rate = (
+            cache_read / stats["total_input_tokens"] if stats["total_input_tokens"] > 0 else 0.0
+        )
 
         return {
             "total_calls": total_calls,
@@ -186,8 +224,12 @@ class LLMMetricsTracker:
             "total_input_tokens": stats["total_input_tokens"],
             "total_output_tokens": stats["total_output_tokens"],
             "total_tokens": total_tokens,
+            "cache_read_tokens": cache_read,
+            "cache_write_tokens": stats["total_cache_write_tokens"],
+            "cache_hit_rate": round(cache_hit_rate, 4),
             "avg_latency_ms": round(avg_latency, 2),
             "error_rate": round(error_rate, 4),
+            "coalesced_calls": self.coalesced_calls.get(backend, 0),
             "top_errors": dict(
                 sorted(stats["errors"].items(), key=lambda x: x[1], reverse=True)[:5]
             ),
@@ -246,6 +288,8 @@ class LLMMetricsTracker:
                 "total_tokens": total_tokens,
                 "backends_active": len(backend_stats),
                 "models_used": len(model_stats),
+                "coalesced_calls": sum(self.coalesced_calls.values()),
+                "cache_read_tokens": sum(s["cache_read_tokens"] for s in backend_stats.values()),
             },
             "by_backend": backend_stats,
             "by_model": model_stats,
@@ -269,6 +313,8 @@ class LLMMetricsTracker:
                 "model": call.model,
                 "input_tokens": call.input_tokens,
                 "output_tokens": call.output_tokens,
+                "cache_read_tokens": call.cache_read_tokens,
+                "cache_write_tokens": call.cache_write_tokens,
                 "latency_ms": call.latency_ms,
                 "success": call.success,
                 "error": call.error,
@@ -282,6 +328,7 @@ class LLMMetricsTracker:
         self.recent_calls.clear()
         self.backend_metrics.clear()
         self.model_metrics.clear()
+        self.coalesced_calls.clear()
         logger.info("llm_metrics_reset")
 
 
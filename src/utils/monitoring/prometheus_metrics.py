@@ -10,6 +10,8 @@ Metrics Categories:
 - Workflow executions (counter, histogram)
 - Database queries (counter, histogram)
 - External API calls (counter, histogram)
+- Query embeddings (cache hit rate, batch size)
+- Semantic response cache (routing agent hits)
 - Business metrics (conversations, customers, etc.)
 - System metrics (memory, CPU, etc.)
 
@@ -140,6 +142,14 @@ workflow_executions_in_progress = Gauge(
     registry=registry,
 )
 
+# Graph nodes on workflow retries: re-executed, or skipped thanks to a checkpoint
+workflow_retry_nodes_total = Counter(
+    "workflow_retry_nodes_total",
+    "Graph nodes on workflow retries",
+    ["outcome"],
+    registry=registry,
+)
+
 
 # =============================================================================
 # DATABASE METRICS
@@ -216,6 +226,51 @@ external_api_duration_seconds = Histogram(
     registry=registry,
 )
 
+# Hedged LLM calls by primary backend and outcome (primary, hedge, failed)
+llm_hedged_requests_total = Counter(
+    "llm_hedged_requests_total",
+    "LLM calls that were hedged on a second backend",
+    ["backend", "outcome"],
+    registry=registry,
+)
+
+
+# =============================================================================
+# EMBEDDING METRICS
+# =============================================================================
+
+# Query embedding cache lookups
+embedding_cache_lookups_total = Counter(
+    "embedding_cache_lookups_total",
+    "Query embedding cache lookups",
+    ["result"],
+    registry=registry,
+)
+
+# Queries encoded per model call
+embedding_batch_size = Histogram(
+    "embedding_batch_size",
+    "Number of queries encoded per embedding model call",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+    registry=registry,
+)
+
+# Embedding model call duration
+embedding_encode_duration_seconds = Histogram(
+    "embedding_encode_duration_seconds",
+    "Embedding model encode duration in seconds",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=registry,
+)
+
+# Semantic response cache lookups for routing agents
+semantic_cache_lookups_total = Counter(
+    "semantic_cache_lookups_total",
+    "Semantic response cache lookups",
+    ["agent", "result"],
+    registry=registry,
+)
+
 
 # =============================================================================
 # AUTHENTICATION METRICS
@@ -226,6 +281,15 @@ auth_attempts_total = Counter(
     "auth_attempts_total", "Total authentication attempts", ["method", "status"], registry=registry
 )
 
+# API key authentication duration by code path (cache_hit, bcrypt, rejected)
+api_key_auth_duration_seconds = Histogram(
+    "api_key_auth_duration_seconds",
+    "API key authentication duration in seconds",
+    ["path"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=registry,
+)
+
 # Active sessions
 active_sessions = Gauge("active_sessions", "Active user sessions", registry=registry)
 
@@ -391,11 +455,43 @@ def record_auth_attempt(method: str, success: bool):
     auth_attempts_total.labels(method=method, status=status).inc()
 
 
+def record_api_key_auth(path: str, duration: float):
+    """Record API key authentication (path: cache_hit, bcrypt, rejected)"""
+    api_key_auth_duration_seconds.labels(path=path).observe(duration)
+
+
 def record_rate_limit_hit(tier: str, endpoint: str):
     """Record rate limit hit"""
     rate_limit_hits_total.labels(tier=tier, endpoint=endpoint).inc()
 
 
+def record_embedding_lookup(hit: bool):
+    """Record query embedding cache lookup"""
+    embedding_cache_lookups_total.labels(result="hit" if hit else "miss").inc()
+
+
+def record_embedding_batch(size: int, duration: float):
+    """Record embedding model call"""
+    embedding_batch_size.observe(size)
+    embedding_encode_duration_seconds.observe(duration)
+
+
+def record_semantic_cache_lookup(agent: str, result: str):
+    """Record semantic response cache lookup (result: exact, semantic, miss)"""
+    semantic_cache_lookups_total.labels(agent=agent, result=result).inc()
+
+
+def record_llm_hedge(backend: str, outcome: str):
+    """Record a hedged LLM call (outcome: primary, hedge, failed)"""
+    llm_hedged_requests_total.labels(backend=backend, outcome=outcome).inc()
+
+
+def record_workflow_retry_nodes(reexecuted: int, skipped: int):
+    """Record nodes re-executed and skipped (resumed from checkpoint) on a retry"""
+    workflow_retry_nodes_total.labels(outcome="reexecuted").inc(reexecuted)
+    workflow_retry_nodes_total.labels(outcome="skipped").inc(skipped)
+
+
 def record_db_query(operation: str, table: str, duration: float):
     """Record database query"""
     db_queries_total.labels(operation=operation, table=table).inc()
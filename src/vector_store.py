@@ -2,8 +2,12 @@
 Vector Store - Qdrant Cloud client wrapper for semantic search
 Uses sentence-transformers for local embeddings (no OpenAI needed)
 Uses centralized configuration for Qdrant connection
+Query embeddings go through QueryEmbeddingService (batched + cached)
+The embedding model is shared process-wide (src/embedding_models.py)
 """
 
+import asyncio
+
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
@@ -14,23 +18,21 @@ from qdrant_client.models import (
     PointStruct,
     VectorParams,
 )
-from sentence_transformers import SentenceTransformer
 
 from src.core.config import get_settings
+from src.embedding_models import get_embedding_model, get_query_embedding_service
 
 
 class VectorStore:
     """Wrapper for Qdrant Cloud vector database with local embeddings"""
 
-    def __init__(
-        self, collection_name: str = "kb_articles", embedding_model: str = "all-MiniLM-L6-v2"
-    ):
+    def __init__(self, collection_name: str = "kb_articles", embedding_model: str | None = None):
         """
         Initialize vector store with Qdrant Cloud
 
         Args:
             collection_name: Qdrant collection name
-            embedding_model: sentence-transformers model name
+            embedding_model: sentence-transformers model name (defaults to EMBEDDING_MODEL)
                 - all-MiniLM-L6-v2: 384 dim, fast, good quality (RECOMMENDED)
         """
         self.collection_name = collection_name
@@ -47,16 +49,21 @@ class VectorStore:
         )
         print("✓ Connected to Qdrant Cloud")
 
-        # Load embedding model (downloads ~80MB first time)
-        print(f"Loading embedding model: {embedding_model}...")
-        self.embedding_model = SentenceTransformer(embedding_model)
+        # Shared embedding model (loaded once per process, ~80MB download first time)
+        self.embedding_model = get_embedding_model(embedding_model)
         self.vector_size = self.embedding_model.get_sentence_embedding_dimension()
-        print(f"✓ Model loaded (vector size: {self.vector_size})")
+        print(f"✓ Embedding model ready (vector size: {self.vector_size})")
+
+        # Batched, cached query embeddings (off the event loop), shared per model
+        self.embedding_service = get_query_embedding_service(embedding_model)
 
     def generate_embedding(self, text: str) -> list[float]:
         """
         Generate embedding vector for text
 
+        Used for documents. Queries should go through embed_query() /
+        embed_query_async() so they hit the query cache.
+
         Args:
             text: Text to embed
 
@@ -66,6 +73,14 @@ class VectorStore:
         embedding = self.embedding_model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a search query (cached, encoded inline)"""
+        return self.embedding_service.embed_sync(query)
+
+    async def embed_query_async(self, query: str) -> list[float]:
+        """Embed a search query (cached, micro-batched, off the event loop)"""
+        return await self.embedding_service.embed(query)
+
     def create_collection(self, recreate: bool = False):
         """Create collection if it doesn't exist"""
         try:
@@ -94,6 +109,13 @@ class VectorStore:
                     field_schema=PayloadSchemaType.KEYWORD,
                 )
                 print("✓ Category index created")
+
+                # Article ID index (incremental sync reads and deletes by article)
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name="doc_id",
+                    field_schema=PayloadSchemaType.KEYWORD,
+                )
             else:
                 print(f"✓ Collection '{self.collection_name}' already exists")
 
@@ -158,48 +180,96 @@ class VectorStore:
             score_threshold: Minimum similarity score (0-1)
 
         Returns:
-            List of matched documents with scores
+            List of matched documents with scores, one per article (its
+            best-matching chunk)
         """
         try:
-            # Generate query embedding
-            query_vector = self.generate_embedding(query)
-
-            # Build filter if category provided
-            query_filter = None
-            if category:
-                query_filter = Filter(
-                    must=[FieldCondition(key="category", match=MatchValue(value=category))]
-                )
+            query_vector = self.embed_query(query)
+            return self._query_articles(query_vector, category, limit, score_threshold)
 
-            # Search (using query_points instead of deprecated search method)
-            results = self.client.query_points(
-                collection_name=self.collection_name,
-                query=query_vector,
-                query_filter=query_filter,
-                limit=limit,
-                score_threshold=score_threshold,
-            ).points
-
-            # Format results
-            documents = []
-            for hit in results:
-                documents.append(
-                    {
-                        "doc_id": hit.payload["doc_id"],
-                        "title": hit.payload["title"],
-                        "content": hit.payload["content"],
-                        "category": hit.payload["category"],
-                        "tags": hit.payload.get("tags", []),
-                        "similarity_score": round(hit.score, 3),
-                    }
-                )
+        except Exception as e:
+            print(f"❌ Error searching: {e}")
+            return []
+
+    async def search_async(
+        self, query: str, category: str | None = None, limit: int = 5, score_threshold: float = 0.5
+    ) -> list[dict]:
+        """
+        Semantic search for async callers
+
+        Same contract as search(), but the query embedding is batched with
+        other in-flight queries and neither encoding nor the Qdrant round
+        trip runs on the event loop.
 
-            return documents
+        Args:
+            query: Search query (plain text)
+            category: Filter by category (billing, technical, usage, api)
+            limit: Max results
+            score_threshold: Minimum similarity score (0-1)
+
+        Returns:
+            List of matched documents with scores
+        """
+        try:
+            query_vector = await self.embed_query_async(query)
+
+            return await asyncio.to_thread(
+                self._query_articles, query_vector, category, limit, score_threshold
+            )
 
         except Exception as e:
             print(f"❌ Error searching: {e}")
             return []
 
+    @staticmethod
+    def _category_filter(category: str | None) -> Filter | None:
+        """Build Qdrant filter for an optional category"""
+        if not category:
+            return None
+        return Filter(must=[FieldCondition(key="category", match=MatchValue(value=category))])
+
+    def _query_articles(
+        self,
+        query_vector: list[float],
+        category: str | None,
+        limit: int,
+        score_threshold: float,
+    ) -> list[dict]:
+        """
+        Query the collection for the best-matching articles
+
+        Points are article chunks (see src/kb_vector_sync.py), so hits are
+        grouped by doc_id: an article takes one result slot, represented by
+        its best-scoring chunk.
+        """
+        response = self.client.query_points_groups(
+            collection_name=self.collection_name,
+            group_by="doc_id",
+            query=query_vector,
+            query_filter=self._category_filter(category),
+            limit=limit,
+            group_size=1,
+            score_threshold=score_threshold,
+        )
+        return self._format_hits(group.hits[0] for group in response.groups)
+
+    @staticmethod
+    def _format_hits(hits) -> list[dict]:
+        """Convert Qdrant scored points to result dicts"""
+        documents = []
+        for hit in hits:
+            documents.append(
+                {
+                    "doc_id": hit.payload["doc_id"],
+                    "title": hit.payload["title"],
+                    "content": hit.payload["content"],
+                    "category": hit.payload["category"],
+                    "tags": hit.payload.get("tags", []),
+                    "similarity_score": round(hit.score, 3),
+                }
+            )
+        return documents
+
     def get_collection_info(self) -> dict:
         """Get collection statistics"""
         try:
@@ -14,7 +14,7 @@ The workflow engine is stateless and focuses purely on executing
 AI agent workflows and returning structured results.
 """
 
-from src.workflow.engine import AgentWorkflowEngine
+from src.workflow.engine import AgentWorkflowEngine, get_workflow_engine
 from src.workflow.exceptions import (
     AgentExecutionError,
     AgentTimeoutError,
@@ -30,4 +30,5 @@ __all__ = [
     "InvalidStateError",
     "RoutingError",
     "WorkflowException",
+    "get_workflow_engine",
 ]
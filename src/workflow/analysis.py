@@ -0,0 +1,197 @@
+"""
+Pre-Routing Analysis - Run the message analyzers concurrently before routing
+
+Sentiment, entity, complexity and intent analysis each read only the
+incoming message, history and customer metadata, so they can run side by
+side. The stage costs max(analyzer latency) instead of the sum, bounded by
+one shared timeout budget.
+
+The stage is opt-in (WORKFLOW_PRE_ROUTING_ANALYZERS, empty by default):
+every analyzer is one more LLM call per turn, and the router and domain
+routers work without their outputs. Enable the analyzers whose fields
+you rely on downstream (e.g. sentiment for escalation decisions).
+
+Each analyzer works on its own copy of the state. Their outputs are merged
+back with explicit per-key rules:
+- Keys owned by an analyzer (ANALYZER_OUTPUT_KEYS) are taken from that
+  analyzer only. Ownership is disjoint, so merges never conflict.
+- agent_history: analyzers that completed are appended in declaration order
+- current_agent, turn_count: kept from the input - analysis is not an agent hop
+- Everything else an analyzer writes is dropped
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from src.utils.logging.setup import get_logger
+from src.workflow.state import AgentState
+
+logger = get_logger(__name__)
+
+# State keys each analyzer is allowed to contribute
+ANALYZER_OUTPUT_KEYS: dict[str, tuple[str, ...]] = {
+    "sentiment_analyzer": (
+        "sentiment_score",
+        "emotion",
+        "urgency",
+        "satisfaction",
+        "politeness",
+        "sentiment_indicators",
+        "sentiment_reasoning",
+        "sentiment_metadata",
+    ),
+    "entity_extractor": ("extracted_entities",),
+    "complexity_assessor": (
+        "complexity_score",
+        "complexity_level",
+        "multi_agent_needed",
+        "estimated_resolution_time",
+        "skill_requirements",
+        "complexity_factors",
+        "complexity_reasoning",
+        "complexity_metadata",
+    ),
+    "intent_classifier": (
+        "intent_domain",
+        "intent_category",
+        "intent_subcategory",
+        "intent_action",
+        "intent_confidence_scores",
+        "intent_alternatives",
+        "intent_entities",
+        "intent_reasoning",
+        "intent_metadata",
+    ),
+}
+
+# Keys every agent touches through BaseAgent.update_state()
+_KEEP_KEYS = ("current_agent", "turn_count")
+
+
+class PreRoutingAnalysis:
+    """
+    LangGraph node that fans out to the analyzers and merges their outputs
+
+    An analyzer that raises or misses the deadline contributes nothing; the
+    stage itself never fails the workflow. Which analyzers completed, failed
+    or timed out is recorded in state["analysis_metadata"].
+
+    Example:
+        analysis = PreRoutingAnalysis({"sentiment_analyzer": SentimentAnalyzer()}, timeout=5)
+        state = await analysis.process(state)
+    """
+
+    def __init__(self, analyzers: dict[str, Any], timeout: float = 10.0):
+        """
+        Initialize analysis stage
+
+        Args:
+            analyzers: Agent name -> agent instance, in merge order. Names must
+                       appear in ANALYZER_OUTPUT_KEYS.
+            timeout: Shared budget in seconds for the whole stage
+
+        Raises:
+            ValueError: If an analyzer has no declared output keys
+        """
+        unknown = [name for name in analyzers if name not in ANALYZER_OUTPUT_KEYS]
+        if unknown:
+            raise ValueError(f"No merge rules for analyzers: {unknown}")
+
+        self.analyzers = analyzers
+        self.timeout = timeout
+
+    async def process(self, state: AgentState) -> AgentState:
+        """Run all analyzers concurrently and merge their outputs into state"""
+        if not self.analyzers:
+            return state
+
+        start_time = time.monotonic()
+
+        tasks = {
+            asyncio.ensure_future(agent.process(self._isolated_copy(state))): name
+            for name, agent in self.analyzers.items()
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.timeout)
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        outputs: dict[str, AgentState] = {}
+        failed: list[str] = []
+        for task in done:
+            name = tasks[task]
+            if task.exception() is not None:
+                failed.append(name)
+                logger.warning(
+                    "pre_routing_analyzer_failed",
+                    analyzer=name,
+                    error=str(task.exception()),
+                    error_type=type(task.exception()).__name__,
+                )
+            else:
+                outputs[name] = task.result()
+
+        timed_out = [tasks[task] for task in pending]
+        merged = self.merge(state, outputs)
+
+        latency_ms = int((time.monotonic() - start_time) * 1000)
+        merged["analysis_metadata"] = {
+            "completed": [name for name in self.analyzers if name in outputs],
+            "failed": failed,
+            "timed_out": timed_out,
+            "latency_ms": latency_ms,
+        }
+
+        logger.info(
+            "pre_routing_analysis_completed",
+            completed=len(outputs),
+            failed=failed,
+            timed_out=timed_out,
+            latency_ms=latency_ms,
+        )
+
+        return merged
+
+    def merge(self, state: AgentState, outputs: dict[str, AgentState]) -> AgentState:
+        """
+        Merge analyzer outputs into a copy of the input state
+
+        Args:
+            state: State the analyzers started from
+            outputs: Analyzer name -> state it returned
+
+        Returns:
+            Merged state
+        """
+        merged = dict(state)
+        history = list(state.get("agent_history", []))
+
+        # Iterate in declaration order so agent_history is deterministic
+        for name in self.analyzers:
+            output = outputs.get(name)
+            if output is None:
+                continue
+
+            for key in ANALYZER_OUTPUT_KEYS[name]:
+                if key in output:
+                    merged[key] = output[key]
+
+            if name not in history:
+                history.append(name)
+
+        merged["agent_history"] = history
+        for key in _KEEP_KEYS:
+            if key in state:
+                merged[key] = state[key]
+
+        return merged
+
+    @staticmethod
+    def _isolated_copy(state: AgentState) -> AgentState:
+        """Copy state so in-place updates by one analyzer are invisible to the others"""
+        copy = dict(state)
+        copy["agent_history"] = list(state.get("agent_history", []))
+        return copy
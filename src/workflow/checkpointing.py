@@ -0,0 +1,81 @@
+"""
+Workflow Checkpointing - Node-level AgentState checkpoints for retries
+
+With a checkpointer, LangGraph saves AgentState after every completed node.
+When an attempt fails or times out, AgentWorkflowEngine resumes the same
+thread from the last checkpoint, so only the interrupted node runs again
+instead of the analyzers, meta router and domain router as well.
+
+Savers (WORKFLOW_CHECKPOINTER):
+- memory: InMemorySaver, per worker process (default)
+- redis:  AsyncRedisSaver from langgraph-checkpoint-redis (needs Redis Stack);
+          falls back to memory if the package is not installed
+- none:   no checkpoints, retries restart the graph
+
+Checkpoints only live as long as one execute() call - the engine deletes
+the thread once it returns or gives up.
+"""
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from src.core.config import get_settings
+from src.utils.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_checkpointer():
+    """
+    Create the configured checkpointer
+
+    Returns:
+        LangGraph checkpoint saver, or None when checkpointing is disabled
+    """
+    settings = get_settings()
+    config = settings.workflow
+
+    if config.checkpointer == "none":
+        logger.info("workflow_checkpointing_disabled")
+        return None
+
+    if config.checkpointer == "redis":
+        try:
+            from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+        except ImportError:
+            logger.warning(
+                "redis_checkpointer_unavailable",
+                message="langgraph-checkpoint-redis not installed, using in-memory checkpoints",
+            )
+        else:
+            logger.info("workflow_checkpointing_enabled", saver="redis")
+            return AsyncRedisSaver(
+                redis_url=config.checkpoint_redis_url or settings.redis.url,
+                ttl={"default_ttl": config.checkpoint_ttl_minutes},
+            )
+
+    logger.info("workflow_checkpointing_enabled", saver="memory")
+    return InMemorySaver()
+
+
+async def setup_checkpointer(checkpointer) -> None:
+    """Create indexes etc. for savers that need it (no-op for the others)"""
+    setup = getattr(checkpointer, "asetup", None)
+    if setup is not None:
+        await setup()
+
+
+async def delete_checkpoints(checkpointer, thread_id: str) -> None:
+    """
+    Delete all checkpoints of a finished execution
+
+    Failures are logged and ignored - Redis checkpoints expire on their own.
+    """
+    try:
+        await checkpointer.adelete_thread(thread_id)
+    except Exception as e:
+        logger.debug(
+            "workflow_checkpoint_cleanup_failed",
+            thread_id=thread_id,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
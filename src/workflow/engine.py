@@ -18,9 +18,13 @@ This engine is called by application services which handle:
 """
 
 import asyncio
+import threading
+from collections.abc import AsyncIterator
 from typing import Any
 
 from src.utils.logging.setup import get_logger
+from src.utils.monitoring.prometheus_metrics import record_workflow_retry_nodes
+from src.workflow.checkpointing import create_checkpointer, delete_checkpoints, setup_checkpointer
 from src.workflow.exceptions import (
     AgentExecutionError,
     AgentTimeoutError,
@@ -30,6 +34,13 @@ from src.workflow.graph import SupportGraph
 from src.workflow.result_handler import AgentResultHandler
 from src.workflow.state import AgentState, create_initial_state
 from src.workflow.state_manager import WorkflowStateManager
+from src.workflow.streaming import emit_reset, reset_token_sink, set_token_sink
+
+# Marks the end of a streaming execution in the token queue
+_STREAM_DONE = object()
+
+# Default for AgentWorkflowEngine(checkpointer=...): use WORKFLOW_CHECKPOINTER
+_CONFIGURED = object()
 
 
 class AgentWorkflowEngine:
@@ -52,6 +63,15 @@ class AgentWorkflowEngine:
     - No database access
     - Pure AI coordination
 
+    Because it is stateless, one instance (compiled graph plus agents) is
+    shared by every request in a worker - use get_workflow_engine().
+    Request-scoped data lives in the AgentState built per execute() call.
+
+    The graph routes each message straight to the meta router. Analyzers
+    that enrich the state first (sentiment, entities, complexity, intent)
+    are opt-in through WORKFLOW_PRE_ROUTING_ANALYZERS: each costs one more
+    LLM call per turn, and the stage adds its slowest analyzer's latency.
+
     Example usage:
         engine = AgentWorkflowEngine(timeout=30, max_retries=2)
         result = await engine.execute(
@@ -61,7 +81,13 @@ class AgentWorkflowEngine:
         # result is a structured dict ready for use
     """
 
-    def __init__(self, timeout: int = 30, max_retries: int = 2, enable_logging: bool = True):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 2,
+        enable_logging: bool = True,
+        checkpointer: Any = _CONFIGURED,
+    ):
         """
         Initialize workflow engine
 
@@ -69,13 +95,21 @@ class AgentWorkflowEngine:
             timeout: Maximum execution time in seconds (default: 30)
             max_retries: Number of retry attempts on failure (default: 2)
             enable_logging: Enable detailed logging (default: True)
+            checkpointer: LangGraph checkpoint saver used to resume retries from
+                          the last completed node (default: WORKFLOW_CHECKPOINTER,
+                          None to always restart the graph)
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.enable_logging = enable_logging
 
+        if checkpointer is _CONFIGURED:
+            checkpointer = create_checkpointer()
+        self.checkpointer = checkpointer
+        self._checkpointer_ready = checkpointer is None
+
         # Initialize components
-        self.graph = SupportGraph()
+        self.graph = SupportGraph(checkpointer=checkpointer)
         self.result_handler = AgentResultHandler()
         self.state_manager = WorkflowStateManager()
 
@@ -96,6 +130,9 @@ class AgentWorkflowEngine:
         3. Parses and validates results
         4. Returns structured output
 
+        With a checkpointer, a retry resumes from the last completed node
+        instead of re-running the analyzers and routers that already succeeded.
+
         The workflow is STATELESS - all context must be provided
         in the context parameter. Results are returned, not stored.
 
@@ -141,16 +178,45 @@ class AgentWorkflowEngine:
             self.logger.error("workflow_state_creation_failed", error=str(e), exc_info=True)
             raise
 
-        # Execute with retry logic
+        if not self._checkpointer_ready:
+            await setup_checkpointer(self.checkpointer)
+            self._checkpointer_ready = True
+
+        # One checkpoint thread per execution; retries resume it
+        run_config = self.graph.thread_config()
+        try:
+            return await self._execute_with_retries(initial_state, run_config)
+        finally:
+            if run_config is not None:
+                await delete_checkpoints(self.checkpointer, run_config["configurable"]["thread_id"])
+
+    async def _execute_with_retries(
+        self, initial_state: AgentState, run_config: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Run the workflow, retrying on timeouts and errors (internal method)"""
         for attempt in range(self.max_retries + 1):
             try:
+                graph_input = initial_state
                 if attempt > 0:
                     self.logger.info(
                         "workflow_retry_attempt", attempt=attempt, max_retries=self.max_retries
                     )
+                    # Tokens streamed by the failed attempt are stale
+                    emit_reset()
+
+                    if run_config is not None:
+                        if await self._can_resume(run_config):
+                            graph_input = None  # Continue from the last checkpoint
+                        else:
+                            # Start over on an empty thread
+                            await delete_checkpoints(
+                                self.checkpointer, run_config["configurable"]["thread_id"]
+                            )
 
                 # Run workflow with timeout
-                final_state = await self._execute_with_timeout(initial_state, timeout=self.timeout)
+                final_state = await self._execute_with_timeout(
+                    graph_input, timeout=self.timeout, config=run_config
+                )
 
                 # Parse and validate result
                 result = self.result_handler.parse_result(final_state)
@@ -223,13 +289,111 @@ class AgentWorkflowEngine:
                         original_error=e,
                     ) from e
 
-    async def _execute_with_timeout(self, initial_state: AgentState, timeout: int) -> AgentState:
+    async def execute_stream(
+        self, message: str, context: dict[str, Any] | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Execute agent workflow, yielding LLM tokens as they are generated
+
+        Runs execute() with a token sink installed, so specialist agents
+        stream their LLM output while the graph is still running. The
+        retry, timeout and validation behaviour is identical to execute().
+
+        Args:
+            message: User's message to process
+            context: Same context dictionary accepted by execute()
+
+        Yields:
+            Stream events:
+                - {"type": "token", "agent": str, "chunk": str}
+                - {"type": "reset"} when a retry discards earlier tokens
+                - {"type": "result", "result": dict} once, as the last event
+
+        Raises:
+            AgentTimeoutError, AgentExecutionError, InvalidStateError:
+                Same as execute(), raised after all pending tokens are yielded
+
+        Example:
+            async for event in engine.execute_stream("How do I upgrade?"):
+                if event["type"] == "token":
+                    print(event["chunk"], end="")
+        """
+        sink: asyncio.Queue = asyncio.Queue()
+
+        # The task copies the current context, so the sink must be set first
+        sink_token = set_token_sink(sink)
+        try:
+            task = asyncio.create_task(self.execute(message, context))
+        finally:
+            reset_token_sink(sink_token)
+
+        task.add_done_callback(lambda _: sink.put_nowait(_STREAM_DONE))
+
+        try:
+            while True:
+                event = await sink.get()
+                if event is _STREAM_DONE:
+                    break
+                yield event
+
+            yield {"type": "result", "result": task.result()}
+
+        finally:
+            # Consumer went away (client disconnect) - stop the workflow
+            if not task.done():
+                task.cancel()
+                self.logger.info("workflow_stream_cancelled")
+
+    async def _can_resume(self, run_config: dict[str, Any]) -> bool:
+        """
+        Check whether a failed attempt left a checkpoint to resume from
+
+        Records how many nodes the retry re-executes and how many it skips.
+        A thread with no checkpoint, or one whose graph already finished
+        (e.g. the result failed validation), is not resumable.
+
+        Args:
+            run_config: Config of the failed attempt
+
+        Returns:
+            True if the graph should be resumed with the same config
+        """
+        try:
+            snapshot = await self.graph.app.aget_state(run_config)
+        except Exception as e:
+            self.logger.warning(
+                "workflow_checkpoint_read_failed", error=str(e), error_type=type(e).__name__
+            )
+            return False
+
+        # Each superstep runs one node here; step 0 is the checkpoint before the first
+        completed_nodes = max(snapshot.metadata.get("step", 0), 0) if snapshot.metadata else 0
+
+        if not snapshot.next:
+            record_workflow_retry_nodes(reexecuted=completed_nodes, skipped=0)
+            return False
+
+        record_workflow_retry_nodes(reexecuted=len(snapshot.next), skipped=completed_nodes)
+        self.logger.info(
+            "workflow_resuming_from_checkpoint",
+            completed_nodes=completed_nodes,
+            next_nodes=list(snapshot.next),
+        )
+        return True
+
+    async def _execute_with_timeout(
+        self,
+        initial_state: AgentState | None,
+        timeout: int,
+        config: dict[str, Any] | None = None,
+    ) -> AgentState:
         """
         Execute workflow with timeout (internal method)
 
         Args:
-            initial_state: Initial state to execute
+            initial_state: Initial state to execute (None resumes from the checkpoint)
             timeout: Timeout in seconds
+            config: Checkpoint thread config (None without a checkpointer)
 
         Returns:
             Final state after execution
@@ -240,26 +404,31 @@ class AgentWorkflowEngine:
         try:
             # Run graph with timeout
             # LangGraph invoke is synchronous, so we wrap it
-            final_state = await asyncio.wait_for(self._run_graph(initial_state), timeout=timeout)
+            final_state = await asyncio.wait_for(
+                self._run_graph(initial_state, config), timeout=timeout
+            )
             return final_state
 
         except TimeoutError:
             self.logger.error("workflow_timeout", timeout_seconds=timeout)
             raise
 
-    async def _run_graph(self, state: AgentState) -> AgentState:
+    async def _run_graph(
+        self, state: AgentState | None, config: dict[str, Any] | None = None
+    ) -> AgentState:
         """
         Run LangGraph workflow asynchronously
 
         Uses LangGraph's ainvoke() method for async execution.
 
         Args:
-            state: Initial state
+            state: Initial state (None resumes the config's thread)
+            config: Checkpoint thread config
 
         Returns:
             Final state after graph execution
         """
-        return await self.graph.app.ainvoke(state)
+        return await self.graph.app.ainvoke(state, config)
 
     def classify_intent(self, message: str) -> dict[str, Any]:
         """
@@ -295,8 +464,8 @@ class AgentWorkflowEngine:
         # Create minimal state
         state = create_initial_state(message)
 
-        # Run just router
-        router = MetaRouter()
+        # Run just router (reuse the graph's instance)
+        router = getattr(self.graph, "router", None) or MetaRouter()
         result_state = router.process(state)
 
         classification = {
@@ -467,6 +636,32 @@ class AgentWorkflowEngine:
         return (intent_conf + response_conf) / 2.0
 
 
+# Process-wide engine, created on first use (or at startup via warm-up)
+_workflow_engine: AgentWorkflowEngine | None = None
+_workflow_engine_lock = threading.Lock()
+
+
+def get_workflow_engine() -> AgentWorkflowEngine:
+    """
+    Get the shared workflow engine for this worker process
+
+    Building an engine instantiates every agent and compiles the LangGraph
+    graph, so it happens once per process instead of once per request.
+    Thread-safe, so startup can build it off the event loop.
+
+    Returns:
+        AgentWorkflowEngine instance
+    """
+    global _workflow_engine
+
+    if _workflow_engine is None:
+        with _workflow_engine_lock:
+            if _workflow_engine is None:
+                _workflow_engine = AgentWorkflowEngine()
+
+    return _workflow_engine
+
+
 if __name__ == "__main__":
     # Test the workflow engine
     print("=" * 70)
@@ -6,15 +6,17 @@ This module provides backward compatibility with the original SupportGraph
 interface while using the new 4-tier agent system.
 """
 
+import uuid
 from typing import Any
 
 from langgraph.graph import END, StateGraph
 
-# CRITICAL: Import agents module to trigger registration decorators
-# This must happen before accessing AgentRegistry.get_agent()
-import src.agents  # noqa: F401 - Side effect import for agent registration
+# AgentRegistry.get_agent() imports agent modules on demand via the manifest
+from src.core.config import get_settings
 from src.services.infrastructure.agent_registry import AgentRegistry
 from src.utils.logging.setup import get_logger
+from src.workflow.analysis import PreRoutingAnalysis
+from src.workflow.checkpointing import delete_checkpoints
 from src.workflow.state import AgentState, create_initial_state
 
 
@@ -32,18 +34,45 @@ class SupportGraph:
     - Tier 4 (Advanced): Content, Competitive Intel, ML/Predictive
 
     Routing Pattern:
+    - Analysis → Router (opt-in): configured analyzers run concurrently
+      before the router (see src/workflow/analysis.py)
     - Single-hop: Router → Specialist → END
     - Router can answer directly: Router → END
     - Low confidence: Router → Escalation → END
     """
 
-    def __init__(self):
-        """Initialize graph with new tier-based agents"""
+    def __init__(
+        self,
+        pre_routing_analyzers: tuple[str, ...] | None = None,
+        analysis_timeout: float | None = None,
+        checkpointer=None,
+    ):
+        """
+        Initialize graph with new tier-based agents
+
+        Args:
+            pre_routing_analyzers: Analyzers to run concurrently before the router
+                                   (default: WORKFLOW_PRE_ROUTING_ANALYZERS, which is
+                                   empty - route straight away)
+            analysis_timeout: Shared time budget in seconds for the analysis stage
+                              (default: WORKFLOW_ANALYSIS_TIMEOUT_SECONDS)
+            checkpointer: Optional LangGraph checkpoint saver. When set, every
+                          invocation needs a thread_id (see thread_config()).
+        """
+        self.checkpointer = checkpointer
+
         self.logger = get_logger(__name__)
         self.logger.info("support_graph_initializing", architecture="tier-based")
 
+        workflow_settings = get_settings().workflow
+        if pre_routing_analyzers is None:
+            pre_routing_analyzers = tuple(workflow_settings.pre_routing_analyzers)
+        if analysis_timeout is None:
+            analysis_timeout = workflow_settings.analysis_timeout_seconds
+
         # Load agents from registry
         self._load_agents()
+        self._load_analyzers(pre_routing_analyzers, analysis_timeout)
 
         # Build LangGraph workflow
         self.app = self._build_graph()
@@ -119,6 +148,18 @@ class SupportGraph:
                     "agent_not_found_in_registry", agent_name=new_name, legacy_name=legacy_name
                 )
 
+    def _load_analyzers(self, names: tuple[str, ...], timeout: float):
+        """Load the pre-routing analyzers from AgentRegistry"""
+        analyzers = {}
+        for name in names:
+            agent_class = AgentRegistry.get_agent(name)
+            if agent_class:
+                analyzers[name] = agent_class()
+            else:
+                self.logger.warning("analyzer_not_found_in_registry", agent_name=name)
+
+        self.analysis = PreRoutingAnalysis(analyzers, timeout=timeout)
+
     def _build_graph(self) -> StateGraph:
         """
         Build the LangGraph workflow using new tier-based agents
@@ -135,8 +176,13 @@ class SupportGraph:
         for agent_name, agent in self.agents.items():
             workflow.add_node(agent_name, agent.process)
 
-        # Entry point - always start with router
-        workflow.set_entry_point("router")
+        # Entry point - fan out to the analyzers, then route
+        if self.analysis.analyzers:
+            workflow.add_node("analysis", self.analysis.process)
+            workflow.set_entry_point("analysis")
+            workflow.add_edge("analysis", "router")
+        else:
+            workflow.set_entry_point("router")
 
         # Routing function - decides where to go after router
         def route_from_router(state: AgentState) -> str:
@@ -198,12 +244,26 @@ class SupportGraph:
             if agent_name not in domain_routers:
                 workflow.add_edge(agent_name, END)
 
-        # Compile the graph
-        compiled = workflow.compile()
+        # Compile the graph (checkpoints AgentState after each node if enabled)
+        compiled = workflow.compile(checkpointer=self.checkpointer)
         self.logger.debug("langgraph_workflow_compiled")
 
         return compiled
 
+    def thread_config(self, thread_id: str | None = None) -> dict[str, Any] | None:
+        """
+        Build the invocation config for one checkpointed execution
+
+        Args:
+            thread_id: Checkpoint thread (a new one if omitted)
+
+        Returns:
+            Config with the thread_id, or None without a checkpointer
+        """
+        if self.checkpointer is None:
+            return None
+        return {"configurable": {"thread_id": thread_id or str(uuid.uuid4())}}
+
     async def run(
         self,
         message: str,
@@ -249,8 +309,9 @@ class SupportGraph:
         )
 
         # Execute workflow
+        config = self.thread_config()
         try:
-            final_state = await self.app.ainvoke(initial_state)
+            final_state = await self.app.ainvoke(initial_state, config)
 
             self.logger.info(
                 "workflow_execution_completed",
@@ -270,6 +331,10 @@ class SupportGraph:
             )
             raise
 
+        finally:
+            if config is not None:
+                await delete_checkpoints(self.checkpointer, config["configurable"]["thread_id"])
+
     def get_response(self, message: str) -> str:
         """
         Simple interface - just get the response text
@@ -59,8 +59,9 @@ class AgentState(TypedDict, total=False):
     # ===== CONVERSATION =====
     conversation_id: str
     customer_id: str
-    messages: list[Message]  # Full conversation history
+    messages: list[Message]  # Recent conversation history (windowed)
     current_message: str  # User's latest message
+    conversation_summary: str | None  # Summary of turns older than the window
 
     # ===== ROUTING =====
     current_agent: AgentType  # Which agent is handling this now
@@ -73,6 +74,35 @@ class AgentState(TypedDict, total=False):
     entities: dict[str, Any]  # Extracted entities (plan_type, feature, etc.)
     sentiment: float  # -1 (negative) to 1 (positive)
 
+    # ===== PRE-ROUTING ANALYSIS (see src/workflow/analysis.py) =====
+    sentiment_score: float
+    emotion: str
+    urgency: str  # "low", "medium", "high", "critical"
+    satisfaction: float
+    politeness: float
+    sentiment_indicators: dict[str, Any]
+    sentiment_reasoning: str
+    sentiment_metadata: dict[str, Any]
+    extracted_entities: dict[str, Any]
+    complexity_score: int  # 1-10
+    complexity_level: str
+    multi_agent_needed: bool
+    estimated_resolution_time: str
+    skill_requirements: list[str]
+    complexity_factors: list[str]
+    complexity_reasoning: str
+    complexity_metadata: dict[str, Any]
+    intent_domain: str | None
+    intent_category: str | None
+    intent_subcategory: str | None
+    intent_action: str | None
+    intent_confidence_scores: dict[str, float]
+    intent_alternatives: list[dict[str, Any]]
+    intent_entities: dict[str, Any]
+    intent_reasoning: str
+    intent_metadata: dict[str, Any]
+    analysis_metadata: dict[str, Any]  # completed / failed / timed_out analyzers
+
     # ===== CONTEXT =====
     customer_metadata: dict[str, Any]  # plan, account_age, tier, etc.
     kb_results: list[dict]  # Knowledge base search results
@@ -106,6 +136,7 @@ def create_initial_state(
         context: Optional additional context including:
             - customer_metadata: Customer info (plan, etc.)
             - conversation_history: List of previous messages for multi-turn context
+            - conversation_summary: Summary of turns older than conversation_history
 
     Returns:
         Initial AgentState ready for workflow execution
@@ -118,9 +149,11 @@ def create_initial_state(
     # Extract context if provided
     customer_metadata = {}
     conversation_history = []
+    conversation_summary = None
     if context:
         customer_metadata = context.get("customer_metadata", {})
         conversation_history = context.get("conversation_history", [])
+        conversation_summary = context.get("conversation_summary")
 
     # Set defaults for customer metadata
     if "plan" not in customer_metadata:
@@ -154,6 +187,7 @@ def create_initial_state(
         customer_id=customer_id,
         messages=messages,  # Now includes full conversation history
         current_message=message,
+        conversation_summary=conversation_summary,
         # Routing
         current_agent="router",  # Always start with router
         agent_history=[],
@@ -56,6 +56,7 @@ class WorkflowStateManager:
                 - customer_id: Customer identifier
                 - customer_metadata: Customer info (plan, etc.)
                 - conversation_history: Previous messages
+                - conversation_summary: Summary of older turns
 
         Returns:
             Initial AgentState
@@ -0,0 +1,71 @@
+"""
+Workflow Token Streaming - Per-execution token sink
+
+Carries LLM tokens from agents up to whoever is consuming a streaming
+workflow execution, without threading a callback through AgentState or
+the LangGraph nodes.
+
+The sink lives in a ContextVar. AgentWorkflowEngine.execute_stream() sets
+it before the graph runs; asyncio tasks spawned by LangGraph inherit the
+context, so BaseAgent.call_llm() can find it and push tokens. Outside a
+streaming execution the sink is unset and agents fall back to ordinary
+non-streaming completions.
+
+Event shapes pushed into the sink:
+    {"type": "token", "agent": "billing_agent", "chunk": "Hello"}
+    {"type": "reset"}   # previous tokens are stale (e.g. workflow retry)
+"""
+
+import asyncio
+from contextvars import ContextVar
+
+_token_sink: ContextVar[asyncio.Queue | None] = ContextVar("workflow_token_sink", default=None)
+
+
+def get_token_sink() -> asyncio.Queue | None:
+    """Return the active token sink, or None outside a streaming execution"""
+    return _token_sink.get()
+
+
+def set_token_sink(sink: asyncio.Queue | None):
+    """
+    Install a token sink for the current context
+
+    Args:
+        sink: Queue that receives stream events, or None to disable
+
+    Returns:
+        ContextVar token for reset_token_sink()
+    """
+    return _token_sink.set(sink)
+
+
+def reset_token_sink(token) -> None:
+    """Restore the token sink that was active before set_token_sink()"""
+    _token_sink.reset(token)
+
+
+def is_streaming() -> bool:
+    """True when the current execution has a token consumer"""
+    return _token_sink.get() is not None
+
+
+def emit_token(agent_name: str, chunk: str) -> None:
+    """
+    Push a token chunk to the active sink (no-op when not streaming)
+
+    Args:
+        agent_name: Agent that produced the chunk
+        chunk: Text delta from the LLM
+    """
+    sink = _token_sink.get()
+    if sink is not None:
+        sink.put_nowait({"type": "token", "agent": agent_name, "chunk": chunk})
+
+
+def emit_reset() -> None:
+    """Tell the consumer that tokens sent so far are stale (no-op when not streaming)"""
+    sink = _token_sink.get()
+    if sink is not None:
+        sink.put_nowait({"type": "reset"})
+
@@ -178,11 +178,16 @@ def mock_db_session(monkeypatch):
 @pytest.fixture
 def mock_embedding_model():
     """Mock sentence transformer model"""
+    from src.embedding_models import clear_embedding_models
+
+    # The shared model registry must not hand out (or keep) a real model
+    clear_embedding_models()
     with patch('sentence_transformers.SentenceTransformer') as mock:
         mock_instance = MagicMock()
         mock_instance.encode.return_value = [[0.1] * 384]  # 384-dim embedding
         mock.return_value = mock_instance
         yield mock_instance
+    clear_embedding_models()
 
 
 @pytest.fixture
@@ -14,7 +14,7 @@ class TestKBEmbedder:
     @pytest.fixture
     def kb_embedder(self, mock_embedding_model):
         """KB Embedder instance"""
-        with mock.patch('src.agents.essential.knowledge_base.embedder.SentenceTransformer'):
+        with mock.patch('src.agents.essential.knowledge_base.embedder.get_embedding_model'):
             with mock.patch('src.agents.essential.knowledge_base.embedder.QdrantClient'):
                 embedder = KBEmbedder()
                 if embedder.embedding_model:
@@ -2,8 +2,14 @@
 Unit tests for KB Gap Detector agent.
 """
 
+from contextlib import asynccontextmanager
+
+import numpy as np
 import pytest
-from src.agents.essential.knowledge_base.gap_detector import KBGapDetector
+from sqlalchemy.dialects import postgresql
+
+from src.agents.essential.knowledge_base import gap_detector
+from src.agents.essential.knowledge_base.gap_detector import KBGapDetector, cluster_embeddings
 from src.workflow.state import create_initial_state
 
 
@@ -11,7 +17,7 @@ class TestKBGapDetector:
     """Test suite for KB Gap Detector agent"""
 
     @pytest.fixture
-    def kb_gap_detector(self):
+    def kb_gap_detector(self, mock_embedding_model):
         """KB Gap Detector instance"""
         return KBGapDetector()
 
@@ -68,3 +74,63 @@ class TestKBGapDetector:
 
         assert "kb_gaps" in updated_state
         assert "gaps_detected" in updated_state
+
+    @pytest.mark.asyncio
+    async def test_low_match_queries_single_streamed_query(self, kb_gap_detector, monkeypatch):
+        """First user messages come from one window-function query"""
+        statements = []
+
+        class FakeStream:
+            async def partitions(self, size):
+                yield [("How do I export?",), (None,)]
+                yield [("Refund please",)]
+
+        class FakeSession:
+            async def stream(self, statement):
+                statements.append(str(statement.compile(dialect=postgresql.dialect())))
+                return FakeStream()
+
+        @asynccontextmanager
+        async def fake_get_db_session():
+            yield FakeSession()
+
+        monkeypatch.setattr(gap_detector, "get_db_session", fake_get_db_session)
+
+        queries = await kb_gap_detector._get_low_match_queries(days=30)
+
+        assert queries == ["How do I export?", "Refund please"]
+        assert len(statements) == 1
+        assert "row_number() OVER (PARTITION BY messages.conversation_id" in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_cluster_queries_embeds_distinct_queries_once(self, kb_gap_detector):
+        """Duplicate queries are encoded once and still counted per occurrence"""
+        vectors = {"export data": [1.0, 0.0], "refund": [0.0, 1.0]}
+        encoded = []
+
+        def encode(texts, batch_size=32):
+            encoded.extend(texts)
+            return np.array([vectors[text] for text in texts])
+
+        kb_gap_detector.embedding_model.encode = encode
+        queries = ["export data"] * 4 + ["refund"] * 3
+
+        clusters = await kb_gap_detector._cluster_queries(queries)
+
+        assert sorted(encoded) == ["export data", "refund"]
+        assert sorted(len(q) for q in clusters.values()) == [3, 4]
+
+
+def test_partitioned_clustering_matches_exact():
+    """Partitioned path finds the same topics as a single DBSCAN run"""
+    rng = np.random.default_rng(0)
+    topics = rng.normal(size=(12, 64))
+    assignment = rng.integers(0, 12, 3000)
+    embeddings = topics[assignment] + rng.normal(scale=0.02, size=(3000, 64))
+
+    exact = cluster_embeddings(embeddings)
+    partitioned = cluster_embeddings(embeddings, exact_limit=0, partition_size=100)
+
+    assert len(set(exact)) == len(set(partitioned)) == 12
+    for topic in range(12):
+        assert len(set(partitioned[assignment == topic])) == 1
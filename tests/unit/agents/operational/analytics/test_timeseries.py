@@ -0,0 +1,133 @@
+"""
+Unit tests for the array-backed time-series statistics.
+
+Checks the vectorized helpers against straightforward reference
+computations and the analytics agents that use them.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.agents.operational.analytics.anomaly_detector import AnomalyDetectorAgent
+from src.agents.operational.analytics.correlation_finder import CorrelationFinderAgent
+from src.agents.operational.analytics.timeseries import (
+    TimeSeries,
+    correlate,
+    flatline_starts,
+    linear_fit,
+    pearson,
+    rate_changes,
+    rolling_mean,
+    rolling_std,
+    summary_stats,
+)
+from src.agents.operational.analytics.trend_analyzer import TrendAnalyzerAgent
+
+
+def _points(values):
+    return [{"timestamp": f"t{i}", "value": v} for i, v in enumerate(values)]
+
+
+def _reference_pearson(x, y):
+    mx, my = sum(x) / len(x), sum(y) / len(y)
+    cov = sum((a - mx) * (b - my) for a, b in zip(x, y, strict=True))
+    sx = math.sqrt(sum((a - mx) ** 2 for a in x))
+    sy = math.sqrt(sum((b - my) ** 2 for b in y))
+    return cov / (sx * sy) if sx and sy else 0.0
+
+
+def test_from_points_keeps_positions():
+    series = TimeSeries.from_points(_points([1, None, "", "n/a", 2.5]))
+
+    assert np.isnan(series.values[1:4]).all()
+    assert series.missing.tolist() == [False, True, True, False, False]
+    assert series.numeric.tolist() == [1.0, 2.5]
+    assert series.value_at(1) is None
+    assert series.timestamps[4] == "t4"
+
+
+def test_summary_stats():
+    stats = summary_stats(np.array([4.0, 1.0, np.nan, 3.0, 2.0]))
+
+    assert stats["count"] == 4
+    assert stats["mean"] == 2.5
+    assert stats["std_dev"] == round(math.sqrt(1.25), 2)
+    assert (stats["min"], stats["max"], stats["median"]) == (1.0, 4.0, 2.5)
+    assert (stats["p25"], stats["p75"]) == (2.0, 4.0)
+    assert summary_stats(np.array([]))["count"] == 0
+
+
+def test_rate_changes_skip_gaps_and_zeros():
+    rates = rate_changes(np.array([100.0, 150.0, 0.0, 10.0, np.nan, 5.0]))
+
+    assert rates.tolist() == [50.0, -100.0, 0.0, 0.0, 0.0]
+
+
+def test_rolling_windows_and_flatlines():
+    values = np.array([1.0, 2.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, np.nan, 3.0])
+
+    assert rolling_mean(values, 3)[:2].tolist() == [2.0, 8 / 3]
+    assert rolling_std(values, 3)[3] == 0.0
+    assert flatline_starts(values, 5).tolist() == [2, 3]
+
+
+def test_linear_fit():
+    slope, intercept, r_squared = linear_fit(np.array([1.0, 3.0, 5.0, 7.0]))
+
+    assert (slope, intercept, r_squared) == pytest.approx((2.0, 1.0, 1.0))
+    assert linear_fit(np.array([5.0, 5.0])) == (0.0, 5.0, 0.0)
+
+
+def test_correlation_matrix_matches_pairwise():
+    rng = random.Random(7)
+    base = [rng.gauss(100, 20) for _ in range(50)]
+    series = {
+        "a": base,
+        "b": [v * 1.2 + rng.gauss(0, 10) for v in base],
+        "c": [100 - v * 0.5 + rng.gauss(0, 5) for v in base],
+        "flat": [1.0] * 50,
+        "short": base[:10],
+    }
+
+    names, matrix = correlate(series)
+
+    for i, x in enumerate(names):
+        for j, y in enumerate(names):
+            same_length = len(series[x]) == len(series[y])
+            expected = _reference_pearson(series[x], series[y]) if same_length else 0.0
+            assert matrix[i, j] == pytest.approx(expected, abs=1e-9)
+    assert pearson(series["a"], series["b"]) == pytest.approx(matrix[0, 1])
+
+
+def test_anomaly_detector_uses_arrays():
+    agent = AnomalyDetectorAgent()
+    values = [10.0, 11.0, 10.0, 12.0, 11.0, 10.0, 11.0, 60.0, 10.0, None, 11.0, 10.0]
+    series = TimeSeries.from_points(_points(values))
+
+    stats = agent._calculate_statistics(series)
+    z_anomalies = agent._detect_z_score_anomalies(series, stats, 2.0, 3.0)
+    rate_anomalies = agent._detect_rate_anomalies(series, stats)
+    pattern_anomalies = agent._detect_pattern_anomalies(series)
+
+    assert [(a["index"], a["type"], a["severity"]) for a in z_anomalies] == [
+        (7, "spike", "critical")
+    ]
+    assert [a["index"] for a in rate_anomalies] == [7]
+    assert [(a["index"], a["type"]) for a in pattern_anomalies] == [(9, "missing_data")]
+
+
+def test_trend_and_correlation_agents():
+    series = TimeSeries.from_points(_points([100, 110, None, 130, 140]))
+    trajectory = TrendAnalyzerAgent()._calculate_growth_trajectory(series)
+
+    assert trajectory["trajectory"] == "growing"
+    assert trajectory["start_value"] == 100.0
+    assert trajectory["total_change_pct"] == 40.0
+
+    matrix = CorrelationFinderAgent()._calculate_correlation_matrix(
+        {"x": [1.0, 2.0, 3.0], "y": [3.0, 2.0, 1.0]}
+    )
+    assert matrix == {"x": {"x": 1.0, "y": -1.0}, "y": {"x": -1.0, "y": 1.0}}
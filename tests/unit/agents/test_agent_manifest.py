@@ -0,0 +1,89 @@
+"""
+Unit tests for the agent registration manifest and lazy AgentRegistry lookups
+"""
+
+import sys
+
+import pytest
+
+from src.agents.loader import build_manifest, load_manifest
+from src.services.infrastructure.agent_registry import AgentRegistry
+
+
+@pytest.fixture
+def registry_state():
+    """Snapshot and restore the class-level registry state"""
+    saved = (
+        AgentRegistry._agents.copy(),
+        AgentRegistry._metadata.copy(),
+        AgentRegistry._manifest,
+    )
+    yield
+    AgentRegistry._agents = saved[0]
+    AgentRegistry._metadata = saved[1]
+    AgentRegistry._manifest = saved[2]
+
+
+def test_committed_manifest_is_up_to_date():
+    """Regenerate with scripts/generate_agent_manifest.py if this fails"""
+    assert load_manifest() == build_manifest()
+
+
+def test_manifest_entries_describe_registrations():
+    manifest = build_manifest()
+
+    router = manifest["meta_router"]
+    assert router["module"] == "src.agents.essential.routing.meta_router"
+    assert router["class_name"] == "MetaRouter"
+    assert router["tier"] == "essential"
+    assert router["group"] == "essential_routing"
+
+
+def test_get_agent_imports_from_manifest(registry_state, tmp_path, monkeypatch):
+    (tmp_path / "lazy_demo_agent.py").write_text(
+        "from src.services.infrastructure.agent_registry import AgentRegistry\n"
+        "\n"
+        '@AgentRegistry.register("lazy_demo", tier="essential", category="demo")\n'
+        "class LazyDemoAgent:\n"
+        "    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_demo_agent", raising=False)
+
+    AgentRegistry._manifest = {
+        "lazy_demo": {"module": "lazy_demo_agent", "class_name": "LazyDemoAgent"}
+    }
+
+    assert "lazy_demo_agent" not in sys.modules
+    agent_class = AgentRegistry.get_agent("lazy_demo")
+
+    assert agent_class.__name__ == "LazyDemoAgent"
+    assert "lazy_demo_agent" in sys.modules
+    assert AgentRegistry.get_agent("unknown_agent") is None
+
+
+def test_metadata_served_without_import(registry_state):
+    AgentRegistry._agents = {}
+    AgentRegistry._metadata = {}
+    AgentRegistry._manifest = {
+        "lazy_agent": {
+            "module": "src.agents.does_not_exist",
+            "class_name": "LazyAgent",
+            "tier": "revenue",
+            "category": "sales",
+        }
+    }
+
+    assert AgentRegistry.get_agents_by_category("sales") == ["lazy_agent"]
+    assert AgentRegistry.get_agent_metadata("lazy_agent")["class_name"] == "LazyAgent"
+    assert AgentRegistry.list_agents()[0]["class"] == "LazyAgent"
+    assert AgentRegistry.get_tier_summary() == {"revenue": 1}
+
+
+def test_failed_import_returns_none(registry_state):
+    AgentRegistry._agents = {}
+    AgentRegistry._manifest = {
+        "broken_agent": {"module": "src.agents.does_not_exist", "class_name": "Broken"}
+    }
+
+    assert AgentRegistry.get_agent("broken_agent") is None
@@ -0,0 +1,3 @@
+"""
+Database repository unit tests package
+"""
@@ -0,0 +1,86 @@
+"""
+Unit tests for ConversationRepository statistics queries
+
+Statements are compiled for Postgres against a fake session rather than
+executed, so these check query shape and result mapping only.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.repositories.conversation_repository import ConversationRepository
+from tests.unit.fake_session import FakeSession
+
+
+def _one(**values):
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(**values)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_agent_usage_counted_in_sql():
+    session = FakeSession([[("meta_router", 120), ("billing_agent", 80)]])
+
+    stats = await ConversationRepository(session).get_agent_usage_stats(days=30)
+
+    assert stats == {"meta_router": 120, "billing_agent": 80}
+    (sql,) = session.statements
+    assert "unnest(conversations.agents_involved)" in sql
+    assert "GROUP BY" in sql
+    # Only the unnested agent names leave the database, never full rows
+    assert "conversations.id" not in sql
+
+
+@pytest.mark.asyncio
+async def test_statistics_use_two_round_trips():
+    session = FakeSession(
+        [
+            _one(
+                total=50,
+                active=5,
+                resolved=40,
+                escalated=0,
+                avg_resolution=612.7,
+                avg_sentiment=0.4567,
+            ),
+            [("billing_upgrade", 30), ("technical_sync", 20)],
+        ]
+    )
+
+    stats = await ConversationRepository(session).get_statistics(days=7)
+
+    assert len(session.statements) == 2
+    assert session.statements[0].count("FILTER (WHERE") == 3
+    assert stats == {
+        "total_conversations": 50,
+        "by_status": {"active": 5, "resolved": 40},
+        "by_intent": {"billing_upgrade": 30, "technical_sync": 20},
+        "avg_resolution_time_seconds": 612,
+        "avg_sentiment": 0.46,
+    }
+
+
+@pytest.mark.asyncio
+async def test_statistics_empty_window():
+    session = FakeSession(
+        [
+            _one(
+                total=0,
+                active=0,
+                resolved=0,
+                escalated=0,
+                avg_resolution=None,
+                avg_sentiment=None,
+            ),
+            [],
+        ]
+    )
+
+    stats = await ConversationRepository(session).get_statistics()
+
+    assert stats["by_status"] == {}
+    assert stats["avg_resolution_time_seconds"] == 0
+    assert stats["avg_sentiment"] == 0.0
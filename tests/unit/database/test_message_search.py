@@ -0,0 +1,109 @@
+"""
+Unit tests for MessageRepository.search
+
+Statements are compiled for Postgres against a fake session rather than
+executed, so these check query shape and result mapping only.
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.database.models import Message
+from src.database.repositories.message_repository import MessageRepository
+from src.services.application.conversation_service import ConversationApplicationService
+from tests.unit.fake_session import FakeSession, rows_result
+
+
+def _message(content: str) -> Message:
+    return Message(
+        id=uuid4(),
+        conversation_id=uuid4(),
+        role="user",
+        content=content,
+        extra_metadata={},
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_uses_indexes_and_ranks_page():
+    session = FakeSession()
+
+    await MessageRepository(session).search(
+        "refund 50%_off",
+        conversation_id=uuid4(),
+        agent_name="billing_agent",
+        start_date=datetime(2026, 1, 1, tzinfo=UTC),
+        limit=10,
+        offset=20,
+    )
+
+    (sql,) = session.statements
+    (params,) = session.params
+    assert "messages.search_vector @@ websearch_to_tsquery(" in sql
+    assert "messages.content ILIKE" in sql
+    assert "ts_rank_cd(messages.search_vector" in sql
+    # Snippets only for the page: ts_headline runs outside the LIMIT subquery
+    assert sql.index("ts_headline(") < sql.index("LIMIT")
+    assert "messages.agent_name =" in sql
+    assert "messages.created_at >=" in sql
+    assert r"%refund 50\%\_off%" in params.values()
+    assert 10 in params.values() and 20 in params.values()
+
+
+@pytest.mark.asyncio
+async def test_short_queries_skip_substring_match():
+    session = FakeSession()
+
+    await MessageRepository(session).search("ok")
+
+    assert "ILIKE" not in session.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_search_content_returns_messages():
+    message = _message("I want a refund")
+    session = FakeSession([rows_result([(message, 0.5, "I want a <mark>refund</mark>")])])
+
+    assert await MessageRepository(session).search_content("refund") == [message]
+
+
+@pytest.mark.asyncio
+async def test_service_pages_with_one_extra_row():
+    rows = [(_message(f"refund {n}"), 1.0 - n / 10, f"<mark>refund</mark> {n}") for n in range(3)]
+    uow = SimpleNamespace(messages=MessageRepository(FakeSession([rows_result(rows)])))
+    service = ConversationApplicationService.__new__(ConversationApplicationService)
+    service.uow = uow
+    service.logger = MagicMock()
+
+    result = await service.search_messages("refund", limit=2)
+
+    page = result.value
+    assert page.has_more is True
+    assert [hit.snippet for hit in page.results] == [
+        "<mark>refund</mark> 0",
+        "<mark>refund</mark> 1",
+    ]
+    assert page.results[0].rank == 1.0
+    assert "LIMIT" in uow.messages.session.statements[0]
+    assert 3 in uow.messages.session.params[0].values()
+
+
+def test_search_indexes_are_gin():
+    indexes = {index.name: index for index in Message.__table__.indexes}
+
+    trgm = str(
+        CreateIndex(indexes["idx_messages_content_trgm"]).compile(dialect=postgresql.dialect())
+    )
+    fts = str(
+        CreateIndex(indexes["idx_messages_search_vector"]).compile(dialect=postgresql.dialect())
+    )
+
+    assert "USING gin (content gin_trgm_ops)" in trgm
+    assert "USING gin (search_vector)" in fts
@@ -0,0 +1,48 @@
+"""
+Fake AsyncSession for repository and service tests
+
+Statements are compiled for Postgres and recorded rather than executed, so
+tests using it check query shape and result mapping only.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+
+def rows_result(rows=()) -> MagicMock:
+    """Result whose all() and scalars().all() return the given rows"""
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    result.scalars.return_value.all.return_value = list(rows)
+    return result
+
+
+class FakeSession:
+    """
+    Records executed statements and replays canned results
+
+    Each execute() returns the next canned result, then empty results once
+    they run out. begin_nested() counts open savepoints.
+    """
+
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.statements: list[str] = []
+        self.params: list[dict] = []
+        self.savepoints = 0  # currently open
+
+    async def execute(self, statement):
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        self.params.append(compiled.params)
+        return self.results.pop(0) if self.results else rows_result()
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        self.savepoints += 1
+        try:
+            yield
+        finally:
+            self.savepoints -= 1
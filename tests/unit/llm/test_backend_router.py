@@ -0,0 +1,235 @@
+"""
+Unit tests for latency-aware backend routing and hedged LLM calls
+
+Router statistics are tested directly. Client routing and hedging run
+real LiteLLM calls against two local OpenAI-compatible stub servers, one
+standing in for each backend, with configurable delay and failures.
+"""
+
+import asyncio
+import time
+
+import litellm
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from src.core.config import LLMRoutingConfig
+from src.llm import backend_router
+from src.llm.backend_router import MIN_P95_SAMPLES, BackendRouter
+from src.llm.client import UnifiedLLMClient
+from src.llm.litellm_config import LiteLLMConfig, LLMBackend
+
+ANTHROPIC, VLLM = LLMBackend.ANTHROPIC, LLMBackend.VLLM
+
+
+def _routing(**overrides) -> LLMRoutingConfig:
+    fields = {
+        "enabled": True,
+        "hedge_tiers": ["haiku"],
+        "failure_threshold": 2,
+        "cooldown_seconds": 60.0,
+        "hedge_delay_ms": 100.0,
+        "min_hedge_delay_ms": 10.0,
+    }
+    fields.update(overrides)
+    return LLMRoutingConfig(**fields)
+
+
+class StubServer:
+    """OpenAI-compatible chat completions endpoint with a delay or failure status"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.delay = 0.0
+        self.status = 200
+        self.requests = 0
+        self.finished = 0
+        self.disconnected = 0
+
+        app = FastAPI()
+        app.post("/v1/chat/completions")(self._completions)
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+        )
+
+    async def _completions(self, request: Request):
+        self.requests += 1
+        body = await request.json()
+        if self.status != 200:
+            return JSONResponse({"error": {"message": "unavailable"}}, status_code=self.status)
+
+        await asyncio.sleep(self.delay)
+        self.finished += 1
+        if await request.is_disconnected():
+            self.disconnected += 1
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.name},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+        }
+
+    @property
+    def url(self) -> str:
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self.server.serve())
+        while not self.server.started:
+            await asyncio.sleep(0.01)
+
+    async def stop(self) -> None:
+        self.server.should_exit = True
+        await self._task
+
+
+@pytest.fixture
+async def stubs():
+    servers = {ANTHROPIC: StubServer("anthropic"), VLLM: StubServer("vllm")}
+    for server in servers.values():
+        await server.start()
+    yield servers
+    for server in servers.values():
+        await server.stop()
+
+
+@pytest.fixture
+def client(stubs):
+    """Client with both backends pointed at the stubs and vLLM selected"""
+    config = LiteLLMConfig()
+    config.set_vllm_endpoint(stubs[VLLM].url)
+    config.models[ANTHROPIC]["haiku"].api_base = f"{stubs[ANTHROPIC].url}/v1"
+    config.models[VLLM]["qwen"].api_key = "stub-key"
+    for models in config.models.values():
+        for model in models.values():
+            model.max_retries = 0
+            model.timeout = 10
+    config.switch_backend(VLLM)
+
+    llm = UnifiedLLMClient()
+    llm.config = config
+    llm.router = BackendRouter(_routing())
+    return llm
+
+
+MESSAGES = [{"role": "user", "content": "Where is my order?"}]
+
+
+@pytest.mark.asyncio
+async def test_fast_backend_is_not_hedged(client, stubs):
+    client.router = BackendRouter(_routing(hedge_delay_ms=5000.0))
+
+    assert await client.chat_completion(MESSAGES, model_tier="haiku") == "vllm"
+
+    assert stubs[ANTHROPIC].requests == 0
+    assert client.router.get_stats()["vllm"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_backend_is_hedged_and_loser_cancelled(client, stubs):
+    stubs[VLLM].delay = 3.0
+
+    started = time.perf_counter()
+    result = await client.chat_completion(MESSAGES, model_tier="haiku")
+
+    assert result == "anthropic"
+    assert time.perf_counter() - started < 2.5
+    # The vLLM request was dropped by the client before the stub answered
+    while stubs[VLLM].finished == 0:
+        await asyncio.sleep(0.05)
+    assert stubs[VLLM].disconnected == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_starts_hedge_at_once(client, stubs):
+    client.router = BackendRouter(_routing(hedge_delay_ms=600_000.0))
+    stubs[VLLM].status = 503
+
+    result = await asyncio.wait_for(client.chat_completion(MESSAGES, model_tier="haiku"), 60)
+
+    assert result == "anthropic"
+
+
+@pytest.mark.asyncio
+async def test_failing_backend_is_ejected(client, stubs):
+    stubs[VLLM].status = 503
+
+    for _ in range(2):
+        with pytest.raises(litellm.ServiceUnavailableError):
+            await client.chat_completion(MESSAGES, hedge=False, coalesce=False)
+
+    assert not client.router.is_healthy(VLLM)
+    assert await client.chat_completion(MESSAGES, hedge=False) == "anthropic"
+    assert stubs[VLLM].requests == 2
+
+
+@pytest.mark.asyncio
+async def test_routing_disabled_uses_current_backend(client, stubs):
+    client.router = BackendRouter(_routing(enabled=False))
+    stubs[VLLM].delay = 0.3
+
+    assert await client.chat_completion(MESSAGES, model_tier="haiku") == "vllm"
+    assert stubs[ANTHROPIC].requests == 0
+
+
+def test_preferred_backend_kept_unless_much_slower():
+    router = BackendRouter(_routing(switch_ratio=1.5, ewma_alpha=1.0))
+    both = [ANTHROPIC, VLLM]
+
+    assert router.rank(both, preferred=VLLM) == [VLLM, ANTHROPIC]
+
+    router.record(VLLM, 1000.0, success=True)
+    router.record(ANTHROPIC, 800.0, success=True)
+    assert router.rank(both, preferred=VLLM) == [VLLM, ANTHROPIC]
+
+    router.record(VLLM, 1300.0, success=True)
+    assert router.rank(both, preferred=VLLM) == [ANTHROPIC, VLLM]
+
+
+def test_ejected_backend_returns_after_cooldown(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(backend_router.time, "monotonic", lambda: now[0])
+    router = BackendRouter(_routing(failure_threshold=2, cooldown_seconds=30.0))
+
+    router.record(VLLM, 50.0, success=False)
+    assert router.is_healthy(VLLM)
+    router.record(VLLM, 50.0, success=False)
+    assert router.rank([VLLM, ANTHROPIC], preferred=VLLM) == [ANTHROPIC, VLLM]
+
+    now[0] += 30
+    assert router.is_healthy(VLLM)
+    router.record(VLLM, 50.0, success=False)  # still failing: ejected again
+    assert not router.is_healthy(VLLM)
+
+
+def test_hedge_delay_follows_p95():
+    router = BackendRouter(_routing(hedge_delay_ms=1000.0, min_hedge_delay_ms=10.0))
+
+    assert router.hedge_delay(VLLM) == 1.0
+    for latency in range(1, MIN_P95_SAMPLES * 5 + 1):
+        router.record(VLLM, float(latency), success=True)
+
+    assert router.hedge_delay(VLLM) == pytest.approx(0.095, abs=0.001)
+
+
+def test_abandoned_call_only_raises_latency():
+    router = BackendRouter(_routing(ewma_alpha=0.5))
+    router.record(VLLM, 200.0, success=True)
+
+    router.record_abandoned(VLLM, 100.0)
+    assert router.get_stats()["vllm"]["latency_ewma_ms"] == 200.0
+
+    router.record_abandoned(VLLM, 1000.0)
+    assert router.get_stats()["vllm"]["latency_ewma_ms"] == 600.0
+    assert router.get_stats()["vllm"]["calls"] == 1
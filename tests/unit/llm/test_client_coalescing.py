@@ -0,0 +1,123 @@
+"""
+Unit tests for single-flight coalescing in UnifiedLLMClient
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.llm.client import UnifiedLLMClient
+from src.utils.monitoring.metrics import llm_metrics
+
+
+def _response(content: str):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
+
+
+@pytest.fixture
+def client():
+    llm_metrics.reset_metrics()
+    return UnifiedLLMClient()
+
+
+@pytest.fixture
+def fake_acompletion():
+    """Slow fake backend that counts calls"""
+    calls = []
+
+    async def acompletion(**params):
+        calls.append(params)
+        await asyncio.sleep(0.05)
+        return _response(f"answer {len(calls)}")
+
+    with patch("src.llm.client.acompletion", side_effect=acompletion):
+        yield calls
+
+
+MESSAGES = [{"role": "user", "content": "How do I reset my password?"}]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_request(client, fake_acompletion):
+    results = await asyncio.gather(
+        *[client.chat_completion(messages=MESSAGES, model_tier="haiku") for _ in range(5)]
+    )
+
+    assert len(fake_acompletion) == 1
+    assert set(results) == {"answer 1"}
+    assert llm_metrics.get_all_stats()["overview"]["coalesced_calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_whitespace_differences_still_coalesce(client, fake_acompletion):
+    other = [{"role": "user", "content": "  How do I reset   my password? "}]
+
+    await asyncio.gather(
+        client.chat_completion(messages=MESSAGES), client.chat_completion(messages=other)
+    )
+
+    assert len(fake_acompletion) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced(client, fake_acompletion):
+    await asyncio.gather(
+        client.chat_completion(messages=MESSAGES, temperature=0.1),
+        client.chat_completion(messages=MESSAGES, temperature=0.9),
+        client.chat_completion(messages=MESSAGES, temperature=0.1, max_tokens=50),
+    )
+
+    assert len(fake_acompletion) == 3
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_cached(client, fake_acompletion):
+    first = await client.chat_completion(messages=MESSAGES)
+    second = await client.chat_completion(messages=MESSAGES)
+
+    assert (first, second) == ("answer 1", "answer 2")
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_opt_out(client, fake_acompletion):
+    await asyncio.gather(
+        client.chat_completion(messages=MESSAGES, coalesce=False),
+        client.chat_completion(messages=MESSAGES, coalesce=False),
+    )
+
+    assert len(fake_acompletion) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters(client):
+    async def failing(**params):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    with patch("src.llm.client.acompletion", side_effect=failing):
+        results = await asyncio.gather(
+            client.chat_completion(messages=MESSAGES),
+            client.chat_completion(messages=MESSAGES),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call(client, fake_acompletion):
+    first = asyncio.create_task(client.chat_completion(messages=MESSAGES))
+    second = asyncio.create_task(client.chat_completion(messages=MESSAGES))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+
+    assert await second == "answer 1"
+    assert len(fake_acompletion) == 1
@@ -0,0 +1,156 @@
+"""
+Unit tests for provider prompt caching
+
+Covers the cache-friendly message layout built by BaseAgent, how the
+client adapts it per backend, and cached-token accounting.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agents.essential.routing.complexity_assessor import ComplexityAssessor
+from src.agents.essential.routing.intent_classifier import IntentClassifier
+from src.agents.essential.routing.meta_router import MetaRouter
+from src.agents.essential.routing.sentiment_analyzer import SentimentAnalyzer
+from src.agents.essential.routing.support_domain_router import SupportDomainRouter
+from src.llm.client import UnifiedLLMClient, cache_usage, message_text
+from src.llm.litellm_config import LLMBackend
+from src.utils.cost_tracking import CostCalculator, CostTracker, cost_tracker
+from src.utils.monitoring.metrics import llm_metrics
+from src.workflow.state import create_initial_state
+
+HAIKU = "claude-3-haiku-20240307"
+
+
+@pytest.fixture
+def agent():
+    return MetaRouter()
+
+
+def test_messages_ordered_from_static_to_current(agent):
+    history = [{"role": "user", "content": "My invoice is wrong"}]
+
+    system, user = agent._build_messages(
+        "Static rules", "Any update?", conversation_history=history, context="Plan: premium"
+    )
+
+    assert system["role"] == "system"
+    assert [block["text"] for block in system["content"]] == ["Static rules", "Plan: premium"]
+    assert all(block["cache_control"] == {"type": "ephemeral"} for block in system["content"])
+
+    history_block, current_block = user["content"]
+    assert "Customer: My invoice is wrong" in history_block["text"]
+    assert "cache_control" in history_block
+    assert current_block == {"type": "text", "text": "## Current Message:\nAny update?"}
+
+
+def test_static_prefix_is_identical_across_customers(agent):
+    first = agent._build_messages(agent.build_system_prompt(), "hi", context="Plan: free")
+    second = agent._build_messages(agent.build_system_prompt(), "hello", context="Plan: premium")
+
+    assert first[0]["content"][0] == second[0]["content"][0]
+    assert len(agent._build_messages("", "hi")) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "agent_cls",
+    [MetaRouter, IntentClassifier, SentimentAnalyzer, ComplexityAssessor, SupportDomainRouter],
+)
+async def test_routing_agents_keep_customer_data_out_of_static_prompts(agent_cls):
+    agent = agent_cls()
+    agent.call_llm = AsyncMock(return_value="{}")
+    calls = []
+
+    for plan, emotion in (("free", "calm"), ("enterprise", "angry")):
+        state = create_initial_state(
+            "My invoice is wrong", context={"customer_metadata": {"plan": plan}}
+        )
+        state["emotion"] = emotion
+        state["intent_category"] = "billing"
+        await agent.process(state)
+        calls.append(agent.call_llm.call_args.kwargs)
+
+    assert calls[0]["system_prompt"] == calls[1]["system_prompt"]
+    assert calls[0]["context"] != calls[1]["context"]
+
+
+def test_blocks_flattened_for_vllm():
+    client = UnifiedLLMClient()
+    messages = [
+        {
+            "role": "system",
+            "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}],
+        },
+        {"role": "user", "content": "plain"},
+    ]
+
+    flattened = client._backend_messages(messages, LLMBackend.VLLM)
+    unchanged = client._backend_messages(messages, LLMBackend.ANTHROPIC)
+
+    assert flattened == [
+        {"role": "system", "content": "a\n\nb"},
+        {"role": "user", "content": "plain"},
+    ]
+    assert unchanged is messages
+    assert message_text(None) == ""
+
+
+def test_cache_usage_reads_both_formats():
+    anthropic = SimpleNamespace(cache_read_input_tokens=900, cache_creation_input_tokens=0)
+    openai = SimpleNamespace(prompt_tokens_details=SimpleNamespace(cached_tokens=512))
+
+    assert cache_usage(anthropic) == (900, 0)
+    assert cache_usage(openai) == (512, 0)
+    assert cache_usage(SimpleNamespace()) == (0, 0)
+
+
+def test_cached_tokens_are_billed_at_cache_rates():
+    full = CostCalculator.calculate_anthropic_cost(HAIKU, 1_000_000, 0)
+    read = CostCalculator.calculate_anthropic_cost(HAIKU, 1_000_000, 0, cache_read_tokens=1_000_000)
+    write = CostCalculator.calculate_anthropic_cost(
+        HAIKU, 1_000_000, 0, cache_write_tokens=1_000_000
+    )
+
+    assert (full, read, write) == (0.25, 0.025, 0.3125)
+
+    tracker = CostTracker()
+    tracker.add_anthropic_call(HAIKU, 2000, 10, cache_read_tokens=1500)
+    assert tracker.get_breakdown()["cache_read_tokens"] == 1500
+
+
+@pytest.mark.asyncio
+async def test_completion_tracks_cached_tokens():
+    llm_metrics.reset_metrics()
+    cost_tracker.reset()
+    client = UnifiedLLMClient()
+    usage = SimpleNamespace(
+        prompt_tokens=2000,
+        completion_tokens=20,
+        cache_read_input_tokens=1800,
+        cache_creation_input_tokens=0,
+    )
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))], usage=usage
+    )
+    sent = []
+
+    async def acompletion(**params):
+        sent.append(params)
+        return response
+
+    with (
+        patch.object(client.config, "current_backend", LLMBackend.ANTHROPIC),
+        patch("src.llm.client.acompletion", side_effect=acompletion),
+    ):
+        await client.chat_completion(
+            messages=[{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+        )
+
+    stats = llm_metrics.get_backend_stats("anthropic")
+    assert stats["cache_read_tokens"] == 1800
+    assert stats["cache_hit_rate"] == 0.9
+    assert cost_tracker.get_breakdown()["cache_read_tokens"] == 1800
+    assert isinstance(sent[0]["messages"][0]["content"], list)
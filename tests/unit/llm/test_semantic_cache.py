@@ -0,0 +1,222 @@
+"""
+Unit tests for SemanticResponseCache
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.agents.essential.routing.intent_classifier import IntentClassifier
+from src.agents.essential.routing.meta_router import MetaRouter
+from src.agents.essential.routing.sentiment_analyzer import SentimentAnalyzer
+from src.llm import semantic_cache
+from src.llm.semantic_cache import SemanticResponseCache
+from src.workflow.state import create_initial_state
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in (strings and hashes, TTLs recorded but not enforced)"""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+
+class FakeEmbedder:
+    """Maps known phrases to fixed vectors"""
+
+    VECTORS = {
+        "how do i reset my password": [1.0, 0.0, 0.0],
+        "how can i reset my password": [0.99, 0.1, 0.0],
+        "cancel my subscription": [0.0, 1.0, 0.0],
+    }
+
+    def __init__(self):
+        self.calls = []
+
+    async def embed(self, text):
+        self.calls.append(text)
+        return self.VECTORS.get(text.lower().strip(), [0.0, 0.0, 1.0])
+
+
+RESPONSE = json.dumps({"domain": "support", "confidence": 0.95})
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def embedder():
+    return FakeEmbedder()
+
+
+@pytest.fixture
+def cache(redis_client, embedder):
+    return SemanticResponseCache(
+        redis_client, embedder, agents=["meta_router"], similarity_threshold=0.95, ttl=60
+    )
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_skips_embedding(cache, embedder, redis_client):
+    await cache.set("meta_router", "How do I reset my password", RESPONSE)
+    embedder.calls.clear()
+
+    assert await cache.get("meta_router", "  how do I RESET my password ") == RESPONSE
+    assert embedder.calls == []
+    assert cache.get_stats()["exact_hits"] == 1
+    assert set(redis_client.ttls.values()) == {60}
+
+
+@pytest.mark.asyncio
+async def test_similar_message_hits(cache):
+    await cache.set("meta_router", "How do I reset my password", RESPONSE)
+
+    assert await cache.get("meta_router", "How can I reset my password") == RESPONSE
+    assert cache.get_stats()["semantic_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dissimilar_message_misses(cache):
+    await cache.set("meta_router", "How do I reset my password", RESPONSE)
+
+    assert await cache.get("meta_router", "Cancel my subscription") is None
+    assert cache.get_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scope_partitions_entries(cache):
+    await cache.set("meta_router", "How do I reset my password", RESPONSE, scope="free")
+
+    assert await cache.get("meta_router", "How do I reset my password", scope="enterprise") is None
+    assert await cache.get("meta_router", "How do I reset my password", scope="free") == RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_disabled_agent_is_ignored(cache, redis_client):
+    assert await cache.set("intent_classifier", "How do I reset my password", RESPONSE) is False
+    assert await cache.get("intent_classifier", "How do I reset my password") is None
+    assert redis_client.data == {}
+
+
+@pytest.mark.asyncio
+async def test_non_json_responses_are_not_stored(cache, redis_client):
+    assert (
+        await cache.set("meta_router", "How do I reset my password", "support, probably") is False
+    )
+    assert redis_client.data == {}
+
+
+@pytest.mark.asyncio
+async def test_entries_from_other_workers_are_loaded(redis_client, embedder):
+    writer = SemanticResponseCache(redis_client, embedder)
+    await writer.set("meta_router", "How do I reset my password", RESPONSE)
+
+    reader = SemanticResponseCache(redis_client, embedder)
+    await reader.sync("meta_router")
+
+    assert await reader.get("meta_router", "How can I reset my password") == RESPONSE
+    assert all(":index:" not in key for key in redis_client.data)
+    assert all("vector" not in json.loads(raw) for raw in redis_client.data.values())
+
+
+@pytest.mark.asyncio
+async def test_lookups_do_not_wait_for_sync(redis_client, embedder):
+    released = asyncio.Event()
+    hgetall = redis_client.hgetall
+
+    async def slow_hgetall(key):
+        await released.wait()
+        return await hgetall(key)
+
+    writer = SemanticResponseCache(redis_client, embedder)
+    await writer.set("meta_router", "How do I reset my password", RESPONSE)
+    redis_client.hgetall = slow_hgetall
+    reader = SemanticResponseCache(redis_client, embedder)
+
+    # Not loaded yet: a miss, answered while the reload is still running
+    assert await reader.get("meta_router", "How can I reset my password") is None
+    assert await reader.get("meta_router", "How can I reset my password") is None
+
+    released.set()
+    await reader._sync_tasks["meta_router"]
+
+    assert await reader.get("meta_router", "How can I reset my password") == RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_sync_drops_expired_index_fields(cache, redis_client, monkeypatch):
+    await cache.set("meta_router", "How do I reset my password", RESPONSE)
+    later = time.time() + 120
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: later)
+
+    await cache.sync("meta_router")
+
+    assert redis_client.hashes["semcache:index:meta_router"] == {}
+    assert cache.get_stats()["entries"] == {"meta_router": 0}
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_a_miss(cache, redis_client):
+    await cache.set("meta_router", "How do I reset my password", RESPONSE)
+    redis_client.data.clear()
+
+    assert await cache.get("meta_router", "How can I reset my password") is None
+    assert cache.get_stats()["entries"] == {"meta_router": 0}
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses(cache, redis_client):
+    async def broken_get(key):
+        raise ConnectionError("redis down")
+
+    redis_client.get = broken_get
+
+    assert await cache.get("meta_router", "How do I reset my password") is None
+    assert cache.get_stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("agent_cls", [MetaRouter, IntentClassifier, SentimentAnalyzer])
+async def test_routing_agents_scope_by_full_customer_context(agent_cls):
+    agent = agent_cls()
+    agent.call_llm = AsyncMock(return_value=RESPONSE)
+    scopes = []
+
+    for health_score in (90, 20):
+        customer = {"plan": "premium", "health_score": health_score}
+        state = create_initial_state("I want a refund", context={"customer_metadata": customer})
+        await agent.process(state)
+
+        scope = agent.call_llm.call_args.kwargs["cache_scope"]
+        assert scope == agent._format_customer_context(state["customer_metadata"])
+        scopes.append(scope)
+
+    # Same plan, different customers: cached responses must not be shared
+    assert scopes[0] != scopes[1]
@@ -0,0 +1,297 @@
+"""
+Unit tests for windowed conversation history
+
+Covers the keyset queries of MessageRepository.get_recent()/get_range()
+(compiled, not executed) and ConversationHistoryService's rolling summary
+over an in-memory message store.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.agents.base.base_agent import BaseAgent
+from src.core.result import Result
+from src.database.repositories.message_repository import MessageRepository
+from src.services.application.conversation_service import ConversationApplicationService
+from src.services.infrastructure import conversation_history_service
+from src.services.infrastructure.conversation_history_service import (
+    MAX_FOLD_PER_TURN,
+    ConversationHistoryService,
+)
+from src.workflow.state import create_initial_state
+from tests.unit.fake_session import FakeSession
+
+
+class FakeMessages:
+    """In-memory MessageRepository keyed on (created_at, id)"""
+
+    def __init__(self):
+        self.rows = []
+        self.reads = 0
+
+    def add(self, count: int):
+        start = datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=len(self.rows))
+        for i in range(count):
+            n = len(self.rows)
+            self.rows.append(
+                SimpleNamespace(
+                    id=uuid4(),
+                    role="user" if n % 2 == 0 else "assistant",
+                    content=f"message {n}",
+                    created_at=start + timedelta(minutes=i),
+                    agent_name=None,
+                )
+            )
+
+    async def create_message(self, conversation_id, role, content, **fields):
+        self.add(1)
+        self.rows[-1].role = role
+        self.rows[-1].content = content
+        return self.rows[-1]
+
+    @staticmethod
+    def _key(msg):
+        return (msg.created_at, msg.id)
+
+    async def get_recent(self, conversation_id, limit=10, before=None):
+        rows = [m for m in self.rows if before is None or self._key(m) < before]
+        self.reads += min(limit, len(rows))
+        return rows[-limit:]
+
+    async def get_range(self, conversation_id, after=None, before=None, limit=100):
+        rows = [
+            m
+            for m in self.rows
+            if (after is None or self._key(m) > after) and (before is None or self._key(m) < before)
+        ][:limit]
+        self.reads += len(rows)
+        return rows
+
+
+class FakeConversations:
+    def __init__(self):
+        self.summaries = []
+        self.conversation = None
+
+    async def get_without_messages(self, conversation_id):
+        return self.conversation
+
+    async def update(self, conversation_id, **fields):
+        pass
+
+    async def update_history_summary(self, conversation_id, summary):
+        self.summaries.append(summary)
+
+
+@pytest.fixture
+def history():
+    uow = SimpleNamespace(
+        session=FakeSession(), messages=FakeMessages(), conversations=FakeConversations()
+    )
+    folded = []
+
+    async def summarizer(summary, messages):
+        assert uow.session.savepoints == 0  # no savepoint held across the LLM call
+        folded.append([m["content"] for m in messages])
+        return f"{summary or ''}|{len(messages)}"
+
+    service = ConversationHistoryService(
+        uow, window_size=4, summary_batch_size=2, summarizer=summarizer
+    )
+    service.folded = folded
+    return service
+
+
+def _conversation():
+    return SimpleNamespace(id=uuid4(), extra_metadata={})
+
+
+@pytest.mark.asyncio
+async def test_keyset_queries():
+    session = FakeSession()
+    repo = MessageRepository(session)
+    cursor = (datetime(2026, 1, 1, tzinfo=UTC), uuid4())
+
+    await repo.get_recent(uuid4(), limit=10, before=cursor)
+    await repo.get_range(uuid4(), after=cursor, before=cursor, limit=5)
+
+    recent_sql, range_sql = session.statements
+    assert "(messages.created_at, messages.id) < (" in recent_sql
+    assert "ORDER BY messages.created_at DESC, messages.id DESC" in recent_sql
+    assert "LIMIT" in recent_sql
+    assert "(messages.created_at, messages.id) > (" in range_sql
+    assert "ORDER BY messages.created_at ASC, messages.id ASC" in range_sql
+
+
+@pytest.mark.asyncio
+async def test_context_is_window_plus_summary(history):
+    conversation = _conversation()
+    history.uow.messages.add(9)
+
+    window, summary = await history.get_context(conversation)
+
+    assert [m["content"] for m in window] == [f"message {n}" for n in range(5, 9)]
+    assert summary is None
+
+
+@pytest.mark.asyncio
+async def test_summary_folds_messages_leaving_the_window(history):
+    conversation = _conversation()
+    messages = history.uow.messages
+
+    messages.add(5)  # one message outside the window: below the batch size
+    assert await history.update_summary(conversation) is False
+
+    messages.add(1)
+    assert await history.update_summary(conversation) is True
+    assert history.folded == [["message 0", "message 1"]]
+
+    messages.add(2)
+    assert await history.update_summary(conversation) is True
+    assert history.folded[-1] == ["message 2", "message 3"]
+
+    record = conversation.extra_metadata["history_summary"]
+    assert record == history.uow.conversations.summaries[-1]
+    assert record["message_count"] == 4
+    assert record["through"]["id"] == str(messages.rows[3].id)
+
+    _, summary = await history.get_context(conversation)
+    assert summary == "|2|2"
+
+
+@pytest.mark.asyncio
+async def test_per_turn_reads_do_not_grow_with_conversation(history):
+    conversation = _conversation()
+    messages = history.uow.messages
+    reads = []
+
+    for _ in range(40):
+        messages.add(2)
+        messages.reads = 0
+        await history.get_context(conversation)
+        await history.update_summary(conversation)
+        reads.append(messages.reads)
+
+    assert max(reads[5:]) <= 2 * history.window_size + history.summary_batch_size
+    assert conversation.extra_metadata["history_summary"]["message_count"] == 76
+
+
+@pytest.mark.asyncio
+async def test_fold_is_capped_per_turn(history):
+    conversation = _conversation()
+    history.uow.messages.add(MAX_FOLD_PER_TURN + 10)
+
+    await history.update_summary(conversation)
+
+    assert len(history.folded[0]) == MAX_FOLD_PER_TURN
+
+
+@pytest.mark.asyncio
+async def test_summarizer_failure_falls_back_to_digest(history):
+    async def failing(summary, messages):
+        raise RuntimeError("llm down")
+
+    history.summarizer = failing
+    conversation = _conversation()
+    history.uow.messages.add(6)
+
+    assert await history.update_summary(conversation) is True
+
+    text = conversation.extra_metadata["history_summary"]["text"]
+    assert text == "Customer: message 0\nAgent: message 1"
+
+
+@pytest.fixture
+def detached_units(history, monkeypatch):
+    """Background folds get the fixture's unit of work; records each one opened"""
+    units = []
+
+    @asynccontextmanager
+    async def get_unit_of_work(current_user_id=None):
+        units.append(current_user_id)
+        yield history.uow
+
+    history.uow.current_user_id = None
+    monkeypatch.setattr(conversation_history_service, "get_unit_of_work", get_unit_of_work)
+    return units
+
+
+@pytest.mark.asyncio
+async def test_scheduled_fold_runs_in_its_own_unit_of_work(history, detached_units):
+    conversation = _conversation()
+    history.uow.conversations.conversation = conversation
+    history.uow.messages.add(6)
+
+    task = history.schedule_summary_update(conversation.id)
+    assert history.schedule_summary_update(conversation.id) is task  # one fold at a time
+
+    assert await task is True
+    assert detached_units == [None]
+    assert history.uow.conversations.summaries[-1]["message_count"] == 2
+    assert conversation.extra_metadata["history_summary"]["message_count"] == 2
+
+    # The finished fold is forgotten; the next turn schedules a new one
+    next_task = history.schedule_summary_update(conversation.id)
+    assert next_task is not task
+    assert await next_task is False  # nothing new left the window
+
+
+@pytest.mark.asyncio
+async def test_add_message_folds_turns_leaving_the_window(history, detached_units):
+    uow = history.uow
+    conversation = SimpleNamespace(
+        id=uuid4(), customer_id=uuid4(), status="active", extra_metadata={}
+    )
+    uow.conversations.conversation = conversation
+    uow.current_user_id = None
+    engine = SimpleNamespace(
+        execute=AsyncMock(return_value={"agent_response": "ok", "agent_history": ["billing"]})
+    )
+    service = ConversationApplicationService.__new__(ConversationApplicationService)
+    service.uow = uow
+    service.domain = SimpleNamespace(validate_message=lambda message: Result.ok(None))
+    service.customer_service = SimpleNamespace(get_by_id=AsyncMock(return_value=Result.ok(None)))
+    service.workflow_engine = engine
+    service.history = history
+    service.logger = MagicMock()
+
+    for turn in range(4):
+        folds = len(uow.conversations.summaries)
+        result = await service.add_message(conversation.id, f"question {turn}")
+        assert result.is_success
+        assert len(uow.conversations.summaries) == folds  # not folded inline
+
+        # As the routes do once the turn is committed
+        await history.schedule_summary_update(conversation.id)
+
+    # 8 messages with a window of 4: the first 4 were folded, two per turn
+    record = conversation.extra_metadata["history_summary"]
+    assert uow.conversations.summaries[-1] == record
+    assert record["message_count"] == 4
+    assert history.folded == [["question 0", "ok"], ["question 1", "ok"]]
+    assert engine.execute.await_args.kwargs["context"]["conversation_summary"] == "|2"
+
+
+def test_agents_see_summary_ahead_of_window():
+    state = create_initial_state(
+        message="And the invoice?",
+        context={
+            "conversation_history": [
+                {"role": "user", "content": f"question {n}"} for n in range(12)
+            ],
+            "conversation_summary": "Customer upgraded to Pro last week.",
+        },
+    )
+    # Neither method touches agent state; BaseAgent itself is abstract
+    history = BaseAgent.get_conversation_context(None, state)
+    text = BaseAgent._format_conversation_history(None, history, max_messages=10)
+
+    assert history[0]["role"] == "summary"
+    assert text.startswith("Summary of earlier conversation: Customer upgraded to Pro")
+    assert "question 1\n" not in text
+    assert text.endswith("Customer: question 11")
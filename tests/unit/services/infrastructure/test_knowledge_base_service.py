@@ -2,7 +2,7 @@
 Unit tests for KnowledgeBaseService
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.services.infrastructure.knowledge_base_service import KnowledgeBaseService
 from src.core.errors import ExternalServiceError
@@ -41,7 +41,7 @@ class TestKnowledgeBaseService:
                 "similarity_score": 0.9
             }
         ]
-        mock_vector_store.search.return_value = mock_articles
+        mock_vector_store.search_async = AsyncMock(return_value=mock_articles)
         
         # Act
         result = await service_with_mock.search_articles("test query")
@@ -68,7 +68,7 @@ class TestKnowledgeBaseService:
     async def test_search_articles_error(self, service_with_mock, mock_vector_store):
         """Test search with exception"""
         # Arrange
-        mock_vector_store.search.side_effect = Exception("Search failed")
+        mock_vector_store.search_async = AsyncMock(side_effect=Exception("Search failed"))
         
         # Act
         result = await service_with_mock.search_articles("test query")
@@ -0,0 +1,119 @@
+"""
+Unit tests for SQL-side support history aggregation
+
+Covers ConversationRepository.get_support_history_stats() against a fake
+session (statements are compiled, not executed) and SupportHistoryProvider's
+mapping of the aggregates.
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.database.repositories.conversation_repository import ConversationRepository
+from src.services.infrastructure.context_enrichment.providers.internal.support_history import (
+    SupportHistoryProvider,
+)
+from tests.unit.fake_session import FakeSession
+
+
+def _totals(**values):
+    row = {
+        "total": 0,
+        "resolved": 0,
+        "escalated": 0,
+        "open": 0,
+        "avg_resolution": None,
+        "last_started_at": None,
+        **values,
+    }
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(**row)
+    return result
+
+
+def _intents(names):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = names
+    return result
+
+
+@pytest.mark.asyncio
+async def test_repository_aggregates_in_two_queries():
+    last = datetime(2026, 1, 2, tzinfo=UTC)
+    session = FakeSession(
+        [
+            _totals(
+                total=40000,
+                resolved=30000,
+                escalated=500,
+                open=12,
+                avg_resolution=5400,
+                last_started_at=last,
+            ),
+            _intents(["billing_upgrade", "technical_sync", "account_login"]),
+        ]
+    )
+
+    stats = await ConversationRepository(session).get_support_history_stats(uuid4())
+
+    assert len(session.statements) == 2
+    totals_sql, intents_sql = session.statements
+    assert "count(conversations.id) FILTER (WHERE conversations.status" in totals_sql
+    assert "avg(conversations.resolution_time_seconds)" in totals_sql
+    assert "GROUP BY conversations.primary_intent" in intents_sql
+    assert "LIMIT" in intents_sql
+
+    assert stats == {
+        "total_conversations": 40000,
+        "resolved_conversations": 30000,
+        "escalated_conversations": 500,
+        "open_conversations": 12,
+        "avg_resolution_time_seconds": 5400.0,
+        "last_conversation": last,
+        "most_common_issues": ["billing_upgrade", "technical_sync", "account_login"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_repository_skips_intents_query_without_history():
+    session = FakeSession([_totals()])
+
+    stats = await ConversationRepository(session).get_support_history_stats(uuid4())
+
+    assert len(session.statements) == 1
+    assert stats["total_conversations"] == 0
+    assert stats["most_common_issues"] == []
+
+
+@pytest.mark.asyncio
+async def test_provider_maps_aggregates():
+    uow = MagicMock()
+    uow.conversations.get_support_history_stats = AsyncMock(
+        return_value={
+            "total_conversations": 10,
+            "resolved_conversations": 7,
+            "escalated_conversations": 2,
+            "open_conversations": 1,
+            "avg_resolution_time_seconds": 930.0,
+            "last_conversation": None,
+            "most_common_issues": ["billing_refund"],
+        }
+    )
+
+    with patch(
+        "src.services.infrastructure.context_enrichment.providers.internal.support_history.UnitOfWork",
+        return_value=uow,
+    ):
+        data = await SupportHistoryProvider()._fetch_with_session(uuid4(), session=MagicMock())
+
+    assert data["total_conversations"] == 10
+    assert data["resolved_conversations"] == 7
+    assert data["avg_resolution_time_minutes"] == 15.5
+    assert data["escalation_count"] == 2
+    assert data["open_tickets"] == 1
+    assert data["most_common_issues"] == ["billing_refund"]
+    uow.conversations.find_by.assert_not_called()
@@ -5,6 +5,8 @@ Tests both RedisJobStore and InMemoryJobStore implementations.
 """
 import pytest
 import asyncio
+import fnmatch
+import json
 from uuid import UUID
 from datetime import datetime, timedelta, UTC
 
@@ -452,3 +454,280 @@ async def test_concurrent_job_updates(memory_store):
     # Job should exist and have some progress
     job = await memory_store.get_job(job_id)
     assert job is not None
+
+
+# =============================================================================
+# TESTS - REDIS INDEXES
+# =============================================================================
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the job store's index paths"""
+
+    def __init__(self):
+        self.data = {}
+        self.zsets = {}
+        self.calls = []
+
+    async def set(self, key, value, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        self.calls.append("get")
+        return self.data.get(key)
+
+    async def expire(self, key, seconds):
+        pass
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def mget(self, keys):
+        self.calls.append("mget")
+        return [self.data.get(key) for key in keys]
+
+    async def scan_iter(self, match="*", count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def _sorted(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+
+    async def zrangebyscore(self, key, min_score, max_score):
+        self.calls.append("zrangebyscore")
+        lo, hi = float(min_score), float(max_score)
+        return [m for m, s in self._sorted(key) if lo <= s <= hi]
+
+    async def zrevrangebyscore(self, key, max_score, min_score, start=0, num=None, withscores=False):
+        self.calls.append("zrevrangebyscore")
+        lo, hi = float(min_score), float(max_score)
+        entries = [(m, s) for m, s in reversed(self._sorted(key)) if lo <= s <= hi]
+        entries = entries[start : start + num if num is not None else None]
+        return entries if withscores else [m for m, _ in entries]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self.redis.calls.append("pipeline")
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def indexed_store(fake_redis):
+    """RedisJobStore wired to the fake client (no connection, no cleanup loop)"""
+    store = RedisJobStore(redis_url="redis://fake")
+    store._redis = fake_redis
+    store._initialized = True
+    return store
+
+
+@pytest.mark.asyncio
+async def test_create_job_indexes_job(indexed_store, fake_redis):
+    """create_job writes the document and all four indexes in one pipeline"""
+    job_id = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION, agent_name="a")
+
+    member = str(job_id)
+    assert member in fake_redis.zsets["job:idx:created"]
+    assert member in fake_redis.zsets["job:idx:status:pending"]
+    assert member in fake_redis.zsets["job:idx:type:agent_execution"]
+    assert member in fake_redis.zsets["job:idx:status_type:pending:agent_execution"]
+    assert fake_redis.calls == ["pipeline"]
+
+
+@pytest.mark.asyncio
+async def test_update_job_moves_status_index(indexed_store, fake_redis):
+    """A status change moves the job between status indexes"""
+    job_id = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION, agent_name="a")
+    await indexed_store.update_job(job_id, status=JobStatus.RUNNING)
+
+    member = str(job_id)
+    assert member not in fake_redis.zsets["job:idx:status:pending"]
+    assert member not in fake_redis.zsets["job:idx:status_type:pending:agent_execution"]
+    assert member in fake_redis.zsets["job:idx:status:running"]
+    assert member in fake_redis.zsets["job:idx:status_type:running:agent_execution"]
+    assert member in fake_redis.zsets["job:idx:created"]
+
+
+@pytest.mark.asyncio
+async def test_delete_job_removes_from_indexes(indexed_store, fake_redis):
+    """delete_job drops the document and its index entries"""
+    job_id = await indexed_store.create_job(job_type=JobType.WORKFLOW_EXECUTION)
+    await indexed_store.delete_job(job_id)
+
+    assert not any(str(job_id) in zset for zset in fake_redis.zsets.values())
+    assert fake_redis.data == {}
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_uses_one_range_and_one_mget(indexed_store, fake_redis):
+    """Filtered listing reads the combined index and fetches documents in bulk"""
+    agent_ids = [
+        await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION, agent_name=f"a{i}")
+        for i in range(3)
+    ]
+    await indexed_store.create_job(job_type=JobType.WORKFLOW_EXECUTION)
+    await indexed_store.update_job(agent_ids[0], status=JobStatus.COMPLETED)
+    fake_redis.calls.clear()
+
+    jobs = await indexed_store.list_jobs(status=JobStatus.PENDING, job_type=JobType.AGENT_EXECUTION)
+
+    assert {j["job_id"] for j in jobs} == {str(agent_ids[1]), str(agent_ids[2])}
+    assert fake_redis.calls == ["zrevrangebyscore", "mget"]
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_page_cursor(indexed_store, fake_redis):
+    """Cursor pagination walks every job exactly once, newest first"""
+    job_ids = [
+        str(await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)) for _ in range(7)
+    ]
+    # Force ties on the score to exercise the job_id tie-break
+    for key in fake_redis.zsets:
+        for member in fake_redis.zsets[key]:
+            fake_redis.zsets[key][member] = 1000.0 + job_ids.index(member) // 3
+
+    seen = []
+    cursor = None
+    while True:
+        page = await indexed_store.list_jobs_page(limit=3, cursor=cursor)
+        seen.extend(j["job_id"] for j in page["jobs"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(job_ids)
+    assert len(seen) == len(job_ids)
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_prunes_expired_entries(indexed_store, fake_redis):
+    """Index entries whose documents expired are skipped and removed"""
+    live = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)
+    expired = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)
+    del fake_redis.data[f"job:{expired}"]
+
+    jobs = await indexed_store.list_jobs()
+
+    assert [j["job_id"] for j in jobs] == [str(live)]
+    assert str(expired) not in fake_redis.zsets["job:idx:created"]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_uses_time_index(indexed_store, fake_redis):
+    """cleanup_old_jobs only fetches jobs created before the cutoff"""
+    old = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)
+    old_running = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)
+    recent = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)
+    await indexed_store.update_job(old, status=JobStatus.COMPLETED)
+    await indexed_store.update_job(recent, status=JobStatus.COMPLETED)
+
+    # Backdate the two old jobs
+    past = datetime.now(UTC) - timedelta(hours=30)
+    for job_id in (old, old_running):
+        key = f"job:{job_id}"
+        job = json.loads(fake_redis.data[key])
+        job["created_at"] = past.isoformat()
+        if job["completed_at"]:
+            job["completed_at"] = (past + timedelta(minutes=5)).isoformat()
+        fake_redis.data[key] = json.dumps(job)
+        for zset in fake_redis.zsets.values():
+            if str(job_id) in zset:
+                zset[str(job_id)] = past.timestamp()
+
+    fake_redis.calls.clear()
+    deleted = await indexed_store.cleanup_old_jobs(max_age_hours=24)
+
+    assert deleted == 1
+    assert f"job:{old}" not in fake_redis.data
+    assert str(old) not in fake_redis.zsets["job:idx:created"]
+    assert f"job:{old_running}" in fake_redis.data
+    assert f"job:{recent}" in fake_redis.data
+    assert fake_redis.calls == ["zrangebyscore", "mget", "pipeline"]
+
+
+@pytest.mark.asyncio
+async def test_memory_store_list_jobs_page_cursor(memory_store):
+    """InMemoryJobStore pages with the same cursor semantics"""
+    job_ids = {
+        str(await memory_store.create_job(job_type=JobType.AGENT_EXECUTION)) for _ in range(5)
+    }
+
+    first = await memory_store.list_jobs_page(limit=2)
+    second = await memory_store.list_jobs_page(limit=2, cursor=first["next_cursor"])
+    third = await memory_store.list_jobs_page(limit=2, cursor=second["next_cursor"])
+
+    seen = [j["job_id"] for page in (first, second, third) for j in page["jobs"]]
+    assert set(seen) == job_ids
+    assert len(seen) == 5
+    assert third["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild_indexes_backfills_unindexed_jobs(indexed_store, fake_redis):
+    """Jobs stored before the indexes existed become listable"""
+    indexed = await indexed_store.create_job(job_type=JobType.AGENT_EXECUTION)
+    legacy = {
+        "job_id": "legacy-job",
+        "job_type": JobType.WORKFLOW_EXECUTION.value,
+        "status": JobStatus.COMPLETED.value,
+        "created_at": datetime(2026, 1, 1, tzinfo=UTC).isoformat(),
+    }
+    fake_redis.data["job:legacy-job"] = json.dumps(legacy)
+    fake_redis.data["job:idx:built"] = "1"
+
+    assert await indexed_store.rebuild_indexes(batch_size=1) == 2
+
+    jobs = await indexed_store.list_jobs(status=JobStatus.COMPLETED)
+    assert [j["job_id"] for j in jobs] == ["legacy-job"]
+    assert set(fake_redis.zsets["job:idx:created"]) == {str(indexed), "legacy-job"}
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_page_rejects_non_positive_limit(indexed_store, memory_store):
+    """limit=0 is a caller error, not an empty page"""
+    for store in (indexed_store, memory_store):
+        with pytest.raises(ValueError, match="limit"):
+            await store.list_jobs_page(limit=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["garbage", "1700000000.5", "nan:job", "1700000000.5:"])
+async def test_list_jobs_page_rejects_malformed_cursor(indexed_store, memory_store, cursor):
+    """A bad cursor is a caller error, not the end of the list"""
+    for store in (indexed_store, memory_store):
+        with pytest.raises(ValueError, match="cursor"):
+            await store.list_jobs_page(limit=10, cursor=cursor)
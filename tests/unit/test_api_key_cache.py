@@ -0,0 +1,148 @@
+"""
+Unit tests for the verified API-key cache and the API-key auth dependency
+
+The database is replaced by a fake unit of work; bcrypt itself is counted
+rather than run, so these check when verification is skipped.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.auth import api_key_manager
+from src.api.auth.api_key_manager import APIKeyManager, VerifiedKeyCache, verified_key_cache
+from src.api.dependencies import auth_dependencies
+from src.database.models.api_key import APIKey
+
+PLAIN_KEY = "msa_live_" + "A" * 43
+
+
+def _api_key(**overrides) -> APIKey:
+    fields = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "name": "integration",
+        "key_prefix": PLAIN_KEY[:20],
+        "key_hash": "$2b$12$stored-hash",
+        "is_active": True,
+        "expires_at": None,
+        "deleted_at": None,
+    }
+    fields.update(overrides)
+    return APIKey(**fields)
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    """Patch the unit of work and bcrypt; yields (key row, bcrypt call list)"""
+    verified_key_cache.clear()
+    api_key = _api_key()
+    calls = []
+
+    def fake_verify(plain_key, hashed_key):
+        calls.append(plain_key)
+        return plain_key == PLAIN_KEY
+
+    uow = SimpleNamespace(
+        api_keys=SimpleNamespace(
+            get_by_prefix=AsyncMock(side_effect=lambda prefix: api_key),
+            record_usage=AsyncMock(),
+        ),
+        commit=AsyncMock(),
+    )
+
+    @asynccontextmanager
+    async def fake_uow():
+        yield uow
+
+    monkeypatch.setattr(
+        APIKeyManager, "verify_api_key", classmethod(lambda cls, p, h: fake_verify(p, h))
+    )
+    monkeypatch.setattr(auth_dependencies, "get_unit_of_work", fake_uow)
+    yield api_key, calls
+    verified_key_cache.clear()
+
+
+def test_cache_is_keyed_by_hmac_and_expires(monkeypatch):
+    cache = VerifiedKeyCache(ttl_seconds=60)
+    key_id = uuid4()
+    now = [1000.0]
+    monkeypatch.setattr(api_key_manager.time, "monotonic", lambda: now[0])
+
+    cache.add(PLAIN_KEY, key_id, "hash")
+
+    assert PLAIN_KEY not in repr(cache._entries)
+    assert cache.is_verified(PLAIN_KEY, key_id, "hash")
+    assert not cache.is_verified(PLAIN_KEY, key_id, "rotated-hash")
+    assert not cache.is_verified(PLAIN_KEY, uuid4(), "hash")
+    assert not cache.is_verified(PLAIN_KEY[:-1] + "B", key_id, "hash")
+
+    now[0] += 61
+    assert not cache.is_verified(PLAIN_KEY, key_id, "hash")
+    assert len(cache) == 0
+
+
+def test_cache_invalidate_and_bound():
+    cache = VerifiedKeyCache(max_entries=2)
+    first, second = uuid4(), uuid4()
+
+    cache.add("key-1", first, "h")
+    cache.add("key-2", second, "h")
+    cache.add("key-3", second, "h")
+
+    assert not cache.is_verified("key-1", first, "h")
+    cache.invalidate(second)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_runs_once_per_ttl(auth):
+    api_key, calls = auth
+
+    for _ in range(3):
+        assert await auth_dependencies.verify_api_key(PLAIN_KEY, None) is api_key
+
+    assert calls == [PLAIN_KEY]
+
+
+@pytest.mark.asyncio
+async def test_wrong_key_is_not_cached(auth):
+    _, calls = auth
+    wrong = PLAIN_KEY[:-1] + "B"
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await auth_dependencies.verify_api_key(wrong, None)
+        assert exc.value.status_code == 401
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_revoked_key_rejected_despite_cache(auth):
+    api_key, calls = auth
+    await auth_dependencies.verify_api_key(PLAIN_KEY, None)
+
+    api_key.deleted_at = datetime.now(UTC)
+    with pytest.raises(HTTPException, match="not active"):
+        await auth_dependencies.verify_api_key(PLAIN_KEY, None)
+    assert len(verified_key_cache) == 0
+
+    api_key.deleted_at = None
+    api_key.expires_at = datetime.now(UTC) - timedelta(days=1)
+    with pytest.raises(HTTPException, match="expired"):
+        await auth_dependencies.verify_api_key(PLAIN_KEY, None)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_async_runs_off_loop():
+    full_key, _, key_hash = APIKeyManager.generate_api_key(is_test=True)
+
+    assert await APIKeyManager.verify_api_key_async(full_key, key_hash)
+    assert not await APIKeyManager.verify_api_key_async(full_key + "x", key_hash)
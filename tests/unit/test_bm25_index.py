@@ -0,0 +1,125 @@
+"""
+Unit tests for BM25Index
+"""
+
+import os
+
+import pytest
+
+from src import knowledge_base
+from src.bm25_index import BM25Index, tokenize
+from src.core.config import get_settings
+
+ARTICLES = [
+    {
+        "id": "1",
+        "title": "How to upgrade your plan",
+        "content": "Go to billing settings and choose a new plan. Payment is prorated.",
+        "category": "billing",
+        "tags": ["upgrade", "billing"],
+    },
+    {
+        "id": "2",
+        "title": "Requesting a refund",
+        "content": "Refunds are available within 30 days of payment.",
+        "category": "billing",
+        "tags": ["refund", "money-back"],
+    },
+    {
+        "id": "3",
+        "title": "Fixing sync issues",
+        "content": "If projects are not syncing, sign out and sign back in.",
+        "category": "technical",
+        "tags": ["sync", "troubleshooting"],
+    },
+]
+
+
+@pytest.fixture
+def index():
+    return BM25Index.from_articles(ARTICLES)
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    assert tokenize("How do I fix the Sync-issue?") == ["fix", "sync", "issue"]
+
+
+def test_title_terms_rank_higher(index):
+    results = index.search("upgrade plan")
+
+    assert results[0]["doc_id"] == "1"
+    assert 0 < results[0]["similarity_score"] < 1
+
+
+def test_category_filter(index):
+    results = index.search("payment", category="technical")
+    assert results == []
+
+    results = index.search("payment", category="billing")
+    assert {r["doc_id"] for r in results} == {"1", "2"}
+
+
+def test_unknown_terms_return_nothing(index):
+    assert index.search("kubernetes helm chart") == []
+
+
+def test_multi_word_tag_boost(index):
+    plain = index.score("money")
+    boosted = index.score("money back")
+
+    assert 1 not in plain
+    assert boosted[1] >= index.tag_boost
+
+
+def test_limit(index):
+    assert len(index.search("payment plan refund sync", limit=2)) == 2
+
+
+def test_save_and_load_roundtrip(index, tmp_path):
+    path = tmp_path / "bm25.json"
+    index.save(path)
+
+    loaded = BM25Index.load(path)
+
+    assert len(loaded) == len(index)
+    assert loaded.search("refund payment") == index.search("refund payment")
+    assert loaded.search("sync", category="technical") == index.search("sync", category="technical")
+
+
+def test_keyword_index_reloads_when_file_changes(tmp_path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(knowledge_base.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(get_settings().qdrant, "local_index_path", str(tmp_path))
+    monkeypatch.setattr(knowledge_base, "_keyword_index", None)
+    index_file = tmp_path / knowledge_base.KEYWORD_INDEX_FILE
+    BM25Index.from_articles(ARTICLES[:1]).save(index_file)
+
+    assert len(knowledge_base.get_keyword_index()) == 1
+
+    BM25Index.from_articles(ARTICLES).save(index_file)
+    os.utime(index_file, (1, 1))
+    assert len(knowledge_base.get_keyword_index()) == 1  # not checked again yet
+
+    now[0] += knowledge_base.KEYWORD_INDEX_RELOAD_INTERVAL
+    assert len(knowledge_base.get_keyword_index()) == 3
+
+    # An unreadable replacement keeps the current index serving
+    index_file.write_text("{not json")
+    now[0] += knowledge_base.KEYWORD_INDEX_RELOAD_INTERVAL
+    assert len(knowledge_base.get_keyword_index()) == 3
+
+
+def test_hybrid_counts_each_article_once_per_source(monkeypatch):
+    # Article 1 matched on three chunks; that must not outrank article 2,
+    # which both sources found
+    vector_hits = [{"doc_id": "1", "similarity_score": 0.9}] * 3 + [
+        {"doc_id": "2", "similarity_score": 0.8}
+    ]
+    keyword_hits = [{"doc_id": "2", "similarity_score": 0.5}]
+    monkeypatch.setattr(knowledge_base, "search_articles_vector", lambda *args: vector_hits)
+    monkeypatch.setattr(knowledge_base, "search_articles_keyword", lambda *args: keyword_hits)
+
+    results = knowledge_base.search_articles_hybrid("refund", limit=3)
+
+    assert [r["doc_id"] for r in results] == ["2", "1"]
+    assert results[1]["rrf_score"] == 1.0 / (knowledge_base.RRF_K + 1)
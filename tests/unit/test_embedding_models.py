@@ -0,0 +1,83 @@
+"""
+Unit tests for the shared embedding model registry
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src import embedding_models
+from src.embedding_models import (
+    clear_embedding_models,
+    get_embedding_model,
+    get_query_embedding_service,
+    loaded_models,
+    warm_up_embedding_models,
+)
+
+
+class FakeModel:
+    """Stand-in for SentenceTransformer"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.encoded: list[list[str]] = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.encoded.append(list(texts))
+        return np.zeros((len(texts), 2))
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace model loading with FakeModel and record each load"""
+    calls: list[str] = []
+
+    def fake_load(name):
+        calls.append(name)
+        return FakeModel(name)
+
+    clear_embedding_models()
+    monkeypatch.setattr(embedding_models, "_load_model", fake_load)
+    yield calls
+    clear_embedding_models()
+
+
+def test_aliases_share_one_model(loads):
+    first = get_embedding_model("all-MiniLM-L6-v2")
+    second = get_embedding_model("sentence-transformers/all-MiniLM-L6-v2")
+    default = get_embedding_model()
+
+    assert first is second is default
+    assert loads == ["sentence-transformers/all-MiniLM-L6-v2"]
+    assert loaded_models() == ["sentence-transformers/all-MiniLM-L6-v2"]
+
+
+def test_concurrent_first_use_loads_once(loads):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_embedding_model())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(model is results[0] for model in results)
+
+
+def test_query_service_is_shared_per_model(loads):
+    service = get_query_embedding_service("all-MiniLM-L6-v2")
+
+    assert get_query_embedding_service() is service
+    assert service.model is get_embedding_model()
+    assert get_query_embedding_service("other/model") is not service
+
+
+def test_warm_up_encodes_default_model(loads):
+    timings = warm_up_embedding_models()
+
+    assert list(timings) == ["sentence-transformers/all-MiniLM-L6-v2"]
+    assert get_embedding_model().encoded == [["warm up"]]
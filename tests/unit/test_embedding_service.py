@@ -0,0 +1,106 @@
+"""
+Unit tests for QueryEmbeddingService
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.embedding_service import QueryEmbeddingService, normalize_query
+
+
+class FakeModel:
+    """Stand-in for SentenceTransformer that records encode() batches"""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.batches.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts])
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+def test_normalize_query():
+    assert normalize_query("  How do I\n RESET   my password? ") == "how do i reset my password?"
+
+
+def test_embed_sync_uses_cache(model):
+    service = QueryEmbeddingService(model)
+
+    first = service.embed_sync("Reset password")
+    second = service.embed_sync("reset   PASSWORD")
+
+    assert first == second
+    assert model.batches == [["Reset password"]]
+    assert service.get_stats()["hits"] == 1
+
+
+def test_lru_eviction(model):
+    service = QueryEmbeddingService(model, cache_size=2)
+
+    service.embed_sync("a")
+    service.embed_sync("b")
+    service.embed_sync("a")  # refresh "a"
+    service.embed_sync("c")  # evicts "b"
+    service.embed_sync("b")
+
+    assert model.batches == [["a"], ["b"], ["c"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_are_batched(model):
+    service = QueryEmbeddingService(model, batch_window_ms=20)
+
+    vectors = await asyncio.gather(
+        service.embed("billing"), service.embed("sync issue"), service.embed("Billing")
+    )
+
+    # Duplicate normalized query shares one slot in a single batch
+    assert model.batches == [["billing", "sync issue"]]
+    assert vectors[0] == vectors[2]
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_encode_query_as_given(model):
+    await QueryEmbeddingService(model, batch_window_ms=1).embed("Reset  Password")
+    QueryEmbeddingService(model).embed_sync("Reset  Password")
+
+    assert model.batches == [["Reset  Password"], ["Reset  Password"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_flushes_at_max_size(model):
+    service = QueryEmbeddingService(model, batch_window_ms=10_000, max_batch_size=2)
+
+    await asyncio.wait_for(asyncio.gather(service.embed("one"), service.embed("two")), timeout=1)
+
+    assert model.batches == [["one", "two"]]
+
+
+@pytest.mark.asyncio
+async def test_async_results_are_cached(model):
+    service = QueryEmbeddingService(model, batch_window_ms=1)
+
+    await service.embed("upgrade plan")
+    await service.embed("upgrade plan")
+
+    assert len(model.batches) == 1
+    assert service.get_stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_encode_failure_propagates(model):
+    def broken_encode(texts, convert_to_numpy=True):
+        raise RuntimeError("model crashed")
+
+    model.encode = broken_encode
+    service = QueryEmbeddingService(model, batch_window_ms=1)
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        await service.embed("anything")
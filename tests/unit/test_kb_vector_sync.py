@@ -0,0 +1,192 @@
+"""
+Unit tests for incremental KB vector sync
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from qdrant_client.models import Filter, PointIdsList
+
+from src.kb_vector_sync import KBVectorSync, build_chunks, chunk_point_id
+from src.vector_store import VectorStore
+
+
+class FakeQdrant:
+    """In-memory stand-in for QdrantClient (scroll / upsert / delete)"""
+
+    def __init__(self, fail_upserts: int = 0):
+        self.points: dict[str, dict] = {}
+        self.upserts: list[int] = []
+        self.fail_upserts = fail_upserts
+
+    def scroll(self, collection_name, scroll_filter, limit, offset, with_payload, with_vectors):
+        points = [
+            SimpleNamespace(id=point_id, payload={"content_hash": payload.get("content_hash")})
+            for point_id, payload in sorted(self.points.items())
+            if scroll_filter is None or payload.get("doc_id") in scroll_filter.must[0].match.any
+        ]
+        start = offset or 0
+        next_offset = start + limit if start + limit < len(points) else None
+        return points[start : start + limit], next_offset
+
+    def upsert(self, collection_name, points):
+        if self.fail_upserts:
+            self.fail_upserts -= 1
+            raise ConnectionError("qdrant unavailable")
+        self.upserts.append(len(points))
+        for point in points:
+            self.points[str(point.id)] = point.payload
+
+    def delete(self, collection_name, points_selector):
+        if isinstance(points_selector, PointIdsList):
+            for point_id in points_selector.points:
+                self.points.pop(point_id, None)
+        elif isinstance(points_selector, Filter):
+            doc_ids = points_selector.must[0].match.any
+            self.points = {k: v for k, v in self.points.items() if v["doc_id"] not in doc_ids}
+
+
+class FakeModel:
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        self.encoded.extend(texts)
+        return np.zeros((len(texts), 4))
+
+
+def _article(n: int, words: int = 20, **fields) -> dict:
+    return {
+        "id": f"kb_{n}",
+        "title": f"Article {n}",
+        "content": " ".join(f"w{n}_{i}" for i in range(words)),
+        "category": "billing",
+        **fields,
+    }
+
+
+@pytest.fixture
+def qdrant():
+    return FakeQdrant()
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+def _sync(qdrant, model, **kwargs) -> KBVectorSync:
+    return KBVectorSync(qdrant, "kb", model, embed_batch_size=4, **kwargs)
+
+
+def test_chunks_have_stable_ids_and_hashes():
+    long_article = _article(1, words=1000)
+
+    chunks = build_chunks(long_article)
+
+    assert len(chunks) == 3
+    assert [c.point_id for c in chunks] == [chunk_point_id("kb_1", i) for i in range(3)]
+    assert all(c.text.startswith("Article 1\n\n") for c in chunks)
+    assert chunks[0].payload["total_chunks"] == 3
+    assert build_chunks(long_article)[1].payload == chunks[1].payload
+    edited = build_chunks({**long_article, "category": "technical"})
+    assert edited[1].payload["content_hash"] != chunks[1].payload["content_hash"]
+
+
+@pytest.mark.asyncio
+async def test_second_sync_embeds_only_changes(qdrant, model):
+    articles = [_article(n) for n in range(10)]
+    first = await _sync(qdrant, model).sync(articles, prune=True)
+
+    assert first["embedded"] == 10
+    assert qdrant.upserts == [4, 4, 2]  # batched across articles
+
+    model.encoded.clear()
+    articles[3] = _article(3, words=25)
+    second = await _sync(qdrant, model).sync(articles, prune=True)
+
+    assert second["unchanged"] == 9
+    assert second["embedded"] == 1
+    assert model.encoded == [build_chunks(articles[3])[0].text]
+
+
+@pytest.mark.asyncio
+async def test_model_change_reembeds_everything(qdrant, model):
+    articles = [_article(n) for n in range(3)]
+    await _sync(qdrant, model, model_name="all-MiniLM-L6-v2").sync(articles, prune=True)
+
+    same = await _sync(qdrant, model, model_name="sentence-transformers/all-MiniLM-L6-v2").sync(
+        articles, prune=True
+    )
+    assert same["unchanged"] == 3
+
+    other = await _sync(qdrant, model, model_name="all-mpnet-base-v2").sync(articles, prune=True)
+    assert other["unchanged"] == 0
+    assert other["embedded"] == 3
+
+
+@pytest.mark.asyncio
+async def test_prune_deletes_removed_articles_and_chunks(qdrant, model):
+    await _sync(qdrant, model).sync([_article(1, words=1000), _article(2)], prune=True)
+    qdrant.points["legacy-point"] = {"doc_id": "kb_1"}  # written by an older indexer
+    assert len(qdrant.points) == 5
+
+    stats = await _sync(qdrant, model).sync([_article(1, words=100)], prune=True)
+
+    assert stats["deleted"] == 4
+    assert set(qdrant.points) == {chunk_point_id("kb_1", 0)}
+
+
+@pytest.mark.asyncio
+async def test_partial_sync_keeps_other_articles(qdrant, model):
+    await _sync(qdrant, model).sync([_article(1, words=1000), _article(2)])
+
+    stats = await _sync(qdrant, model).sync([_article(1, words=100)])
+
+    assert stats["deleted"] == 2
+    assert chunk_point_id("kb_2", 0) in qdrant.points
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_on_next_run(qdrant, model):
+    articles = [_article(n) for n in range(8)]
+    progress = []
+    qdrant.fail_upserts = 1
+
+    first = await _sync(qdrant, model, progress=progress.append).sync(articles, prune=True)
+
+    assert first["failed"] == 4
+    assert first["embedded"] == 4
+    assert len(first["failed_article_ids"]) == 4
+    assert progress[-1]["done"] == 8
+
+    model.encoded.clear()
+    second = await _sync(qdrant, model).sync(articles, prune=True)
+
+    assert second["unchanged"] == 4
+    assert second["embedded"] == 4
+    assert len(model.encoded) == 4
+
+
+def test_vector_search_returns_one_hit_per_article():
+    calls = []
+
+    def query_points_groups(**kwargs):
+        calls.append(kwargs)
+        chunks = build_chunks(_article(1, words=1000))
+        hits = [SimpleNamespace(payload=chunk.payload, score=0.9) for chunk in chunks[1:2]]
+        return SimpleNamespace(groups=[SimpleNamespace(id="kb_1", hits=hits)])
+
+    store = VectorStore.__new__(VectorStore)
+    store.collection_name = "kb"
+    store.client = SimpleNamespace(query_points_groups=query_points_groups)
+    store.embedding_service = SimpleNamespace(embed_sync=lambda query: [0.0] * 4)
+
+    results = store.search("w1_600", limit=3)
+
+    assert calls[0]["group_by"] == "doc_id"
+    assert calls[0]["group_size"] == 1
+    assert calls[0]["limit"] == 3
+    assert [r["doc_id"] for r in results] == ["kb_1"]
+    assert "w1_600" in results[0]["content"]
@@ -0,0 +1,173 @@
+"""
+Unit tests for LocalVectorIndex
+"""
+
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src import knowledge_base
+from src.core.config import get_settings
+from src.local_vector_index import PAYLOADS_FILE, LocalVectorIndex
+
+
+def _article(doc_id, category, embedding, title=None):
+    return {
+        "id": doc_id,
+        "title": title or f"Article {doc_id}",
+        "content": "content",
+        "category": category,
+        "tags": ["tag"],
+        "embedding": embedding,
+    }
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    articles = [
+        _article("a", "billing", [1.0, 0.0, 0.0]),
+        _article("b", "billing", [0.7, 0.7, 0.0]),
+        _article("c", "technical", [0.0, 1.0, 0.0]),
+        _article("d", "technical", [0.0, 0.0, 2.0]),
+    ]
+    LocalVectorIndex.build(articles, tmp_path, model="test-model")
+    return tmp_path
+
+
+def test_build_and_load(index_path):
+    index = LocalVectorIndex(index_path)
+
+    assert len(index) == 4
+    assert index.dim == 3
+    assert index.model == "test-model"
+
+
+def test_search_ranks_by_cosine(index_path):
+    index = LocalVectorIndex(index_path)
+
+    results = index.search([1.0, 0.1, 0.0], limit=2)
+
+    assert [r["doc_id"] for r in results] == ["a", "b"]
+    assert results[0]["similarity_score"] > results[1]["similarity_score"]
+    assert set(results[0]) == {"doc_id", "title", "content", "category", "tags", "similarity_score"}
+
+
+def test_vectors_are_normalized(index_path):
+    index = LocalVectorIndex(index_path)
+
+    # Article "d" has norm 2 but must still score exactly 1.0
+    results = index.search([0.0, 0.0, 5.0], limit=1)
+
+    assert results[0]["doc_id"] == "d"
+    assert results[0]["similarity_score"] == pytest.approx(1.0)
+
+
+def test_category_filter(index_path):
+    index = LocalVectorIndex(index_path)
+
+    results = index.search([1.0, 0.0, 0.0], category="technical", limit=5)
+
+    assert {r["category"] for r in results} == {"technical"}
+    assert index.search([1.0, 0.0, 0.0], category="unknown") == []
+
+
+def test_score_threshold(index_path):
+    index = LocalVectorIndex(index_path)
+
+    results = index.search([1.0, 0.0, 0.0], limit=4, score_threshold=0.5)
+
+    assert [r["doc_id"] for r in results] == ["a", "b"]
+
+
+def test_hot_reload(index_path):
+    index = LocalVectorIndex(index_path, reload_interval=0)
+
+    LocalVectorIndex.build([_article("z", "usage", [1.0, 0.0, 0.0])], index_path)
+    # Make sure the mtime changes even on coarse-grained filesystems
+    payloads = index_path / PAYLOADS_FILE
+    stat = payloads.stat()
+    os.utime(payloads, (stat.st_atime, stat.st_mtime + 10))
+
+    results = index.search([1.0, 0.0, 0.0], limit=5)
+
+    assert [r["doc_id"] for r in results] == ["z"]
+
+
+def test_reload_failure_keeps_old_index(index_path):
+    index = LocalVectorIndex(index_path, reload_interval=0)
+
+    payloads = index_path / PAYLOADS_FILE
+    payloads.write_text("not json")
+    stat = payloads.stat()
+    os.utime(payloads, (stat.st_atime, stat.st_mtime + 10))
+
+    assert len(index.search([1.0, 0.0, 0.0], limit=5)) == 4
+
+
+def test_mismatched_files_rejected(index_path):
+    np.save(index_path / "vectors.npy", np.zeros((1, 3), dtype=np.float32))
+
+    with pytest.raises(ValueError, match="mismatch"):
+        LocalVectorIndex(index_path)
+
+
+def test_other_embedding_model_rejected(index_path):
+    with pytest.raises(ValueError, match="test-model"):
+        LocalVectorIndex(index_path, expected_model="all-MiniLM-L6-v2")
+
+    # Bare and sentence-transformers/ names are the same model
+    LocalVectorIndex.build([_article("a", "billing", [1.0, 0.0])], index_path, "all-MiniLM-L6-v2")
+    index = LocalVectorIndex(index_path, expected_model="sentence-transformers/all-MiniLM-L6-v2")
+    assert len(index) == 1
+
+
+def test_missing_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LocalVectorIndex(tmp_path / "missing")
+
+
+def _embedding_service(vector):
+    async def embed(query):
+        return vector
+
+    def embed_sync(query):
+        raise AssertionError("sync embedding on the async path")
+
+    return SimpleNamespace(embed=embed, embed_sync=embed_sync)
+
+
+@pytest.mark.asyncio
+async def test_async_search_embeds_off_loop(index_path, monkeypatch):
+    service = _embedding_service([0.0, 1.0, 0.0])
+    monkeypatch.setattr(knowledge_base, "get_query_embedding_service", lambda: service)
+    monkeypatch.setattr(knowledge_base, "_vector_store", SimpleNamespace())
+    monkeypatch.setattr(knowledge_base, "_local_index", LocalVectorIndex(index_path))
+    monkeypatch.setattr(get_settings().qdrant, "local_index_mode", "primary")
+
+    results = await knowledge_base.search_articles_vector_async("sync", "technical", limit=1)
+
+    assert [r["doc_id"] for r in results] == ["c"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["primary", "fallback"])
+async def test_local_index_serves_without_vector_store(index_path, monkeypatch, mode):
+    service = _embedding_service([0.0, 1.0, 0.0])
+    service.embed_sync = lambda query: [1.0, 0.0, 0.0]
+    monkeypatch.setattr(knowledge_base, "get_query_embedding_service", lambda: service)
+    monkeypatch.setattr(knowledge_base, "get_vector_store", lambda: None)
+    monkeypatch.setattr(knowledge_base, "_local_index", LocalVectorIndex(index_path))
+    monkeypatch.setattr(get_settings().qdrant, "local_index_mode", mode)
+
+    def keyword_search(*args):
+        raise AssertionError("fell back to keyword search")
+
+    monkeypatch.setattr(knowledge_base, "search_articles_keyword", keyword_search)
+
+    results = await knowledge_base.search_articles_vector_async("sync", "technical", limit=1)
+    assert [r["doc_id"] for r in results] == ["c"]
+
+    results = knowledge_base.search_articles_vector("charge", "billing", limit=1)
+    assert [r["doc_id"] for r in results] == ["a"]
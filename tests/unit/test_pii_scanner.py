@@ -0,0 +1,86 @@
+"""
+Unit tests for the single-pass PII scanner
+"""
+
+import pytest
+
+from src.utils.pii_scanner import (
+    COMPILED_PATTERNS,
+    detect_pii,
+    redact_pii,
+    scan_messages,
+    scan_text,
+)
+
+TEXT = (
+    "Card 4111 1111 1111 1111, SSN 123-45-6788, mail jane.doe@example.com, "
+    "call (415) 555-2671 from 10.0.12.7. password: hunter22 at 221 Baker Street 94107"
+)
+
+
+def test_detects_every_type_in_one_pass():
+    detections = detect_pii(TEXT)
+
+    assert [d["type"] for d in detections] == [
+        "credit_card",
+        "ssn",
+        "email",
+        "phone",
+        "ip_address",
+        "password",
+        "address",
+        "zipcode",
+    ]
+    for d in detections:
+        assert TEXT[d["start_position"] : d["end_position"]] == d["value"]
+        assert d["redaction_token"] == f"[REDACTED:{d['type'].upper()}]"
+
+
+def test_matches_each_pattern_on_its_own():
+    """Outside overlaps, the combined pattern finds what each per-type pattern finds"""
+    for detection in detect_pii(TEXT):
+        pattern = COMPILED_PATTERNS[detection["type"]]
+        assert pattern.fullmatch(detection["value"])
+
+
+def test_threshold_and_validation():
+    assert {d["type"] for d in detect_pii(TEXT, "critical")} == {"credit_card", "ssn", "password"}
+    # Fails Luhn / known-invalid SSN; the next pattern may still match inside
+    assert detect_pii("4111 1111 1111 1112", "critical") == []
+    assert detect_pii("id 123456789", "critical") == []
+
+
+def test_invalid_match_does_not_hide_later_pii():
+    text = "ref 4111111111111112 key " + "Ab1" * 12
+
+    assert [d["type"] for d in detect_pii(text, "critical")] == ["api_key"]
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        ("full", "SSN [REDACTED:SSN] or [REDACTED:EMAIL]"),
+        ("partial", "SSN ***-6788 or [REDACTED:EMAIL]"),
+    ],
+)
+def test_redaction_modes(mode, expected):
+    text = "SSN 123-45-6788 or a@b.io"
+
+    assert redact_pii(text, detect_pii(text), mode) == expected
+
+
+def test_hash_redaction_is_stable():
+    first = scan_text("mail a@b.io", redaction_mode="hash")["redacted"]
+
+    assert first.startswith("mail [HASH:")
+    assert scan_text("mail a@b.io", redaction_mode="hash")["redacted"] == first
+
+
+def test_scan_messages_in_order():
+    messages = ["nothing here", "a@b.io", "", "call 415-555-2671"]
+
+    serial = [r["redacted"] for r in scan_messages(iter(messages))]
+    pooled = [r["redacted"] for r in scan_messages(messages, workers=2, chunksize=1)]
+
+    assert serial == ["nothing here", "[REDACTED:EMAIL]", "", "call [REDACTED:PHONE]"]
+    assert pooled == serial
@@ -0,0 +1,149 @@
+"""
+Unit tests for the multi-window rate limiter and its local pre-check
+
+Redis is replaced by a fake script that replays canned replies, so these
+check how replies are interpreted and when Redis is skipped.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.auth import redis_client
+from src.api.auth.redis_client import (
+    LocalRateLimiter,
+    RateLimitDecision,
+    RateLimiter,
+    RateLimitWindow,
+)
+from src.api.middleware import rate_limit_middleware
+
+WINDOWS = [
+    RateLimitWindow("minute", 10, 60),
+    RateLimitWindow("hour", 100, 3600),
+    RateLimitWindow("day", 1000, 86400),
+]
+
+
+@pytest.fixture
+def script(monkeypatch):
+    """Fake Redis script; set script.return_value to the Lua reply"""
+    fake = AsyncMock()
+    monkeypatch.setattr(redis_client, "get_redis_client", AsyncMock(return_value=object()))
+    monkeypatch.setattr(redis_client, "_multi_window_script", lambda client: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_all_windows_in_one_call(script):
+    script.return_value = [1, 0, 0, 9, 6000, 99, 36000, 999, 86400]
+
+    decision = await RateLimiter.check_rate_limits("user:1", WINDOWS)
+
+    script.assert_awaited_once_with(
+        keys=["ratelimit:user:1"], args=[10, 60, 100, 3600, 1000, 86400]
+    )
+    assert decision.allowed
+    assert [(w.remaining, w.reset_seconds) for w in decision.windows] == [
+        (9, 6),
+        (99, 36),
+        (999, 87),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rejection_names_window_and_retry(script):
+    script.return_value = [0, 2, 35500, 4, 24000, 0, 3600000, 900, 8640000]
+
+    decision = await RateLimiter.check_rate_limits("user:1", WINDOWS)
+
+    assert not decision.allowed
+    assert decision.exceeded.name == "hour"
+    assert decision.retry_after == 36
+
+
+@pytest.mark.asyncio
+async def test_redis_unavailable_fails_open(monkeypatch):
+    monkeypatch.setattr(redis_client, "get_redis_client", AsyncMock(return_value=None))
+
+    decision = await RateLimiter.check_rate_limits("ip:1.2.3.4", WINDOWS)
+
+    assert decision.allowed
+    assert not decision.counted
+    assert decision.windows[0].remaining == 10
+
+
+@pytest.mark.asyncio
+async def test_fail_open_decisions_do_not_debit_local_bucket(monkeypatch):
+    monkeypatch.setattr(redis_client, "get_redis_client", AsyncMock(return_value=None))
+    monkeypatch.setattr(rate_limit_middleware, "local_rate_limiter", LocalRateLimiter())
+    request = SimpleNamespace(
+        headers={}, client=SimpleNamespace(host="10.0.0.1"), url=SimpleNamespace(path="/api/x")
+    )
+    middleware = rate_limit_middleware.RateLimitMiddleware(app=None)
+    call_next = AsyncMock(return_value=SimpleNamespace(headers={}))
+
+    # Well past every tier's minute limit: Redis is down, so nothing is shed
+    for _ in range(200):
+        await middleware.dispatch(request, call_next)
+
+    assert call_next.await_count == 200
+
+
+def test_local_bucket_sheds_only_after_redis_allowed(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(redis_client.time, "monotonic", lambda: now[0])
+    local = LocalRateLimiter()
+    allowed = RateLimitDecision(allowed=True)
+
+    assert local.check("user:1", WINDOWS) is None
+    for _ in range(10):
+        assert local.check("user:1", WINDOWS) is None
+        local.record("user:1", WINDOWS, allowed)
+
+    shed = local.check("user:1", WINDOWS)
+    assert not shed.allowed
+    assert shed.exceeded.name == "minute"
+    assert shed.retry_after == 6
+
+    now[0] += 6
+    assert local.check("user:1", WINDOWS) is None
+
+
+def test_local_block_follows_redis_retry_after(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(redis_client.time, "monotonic", lambda: now[0])
+    local = LocalRateLimiter(max_keys=1)
+    rejected = RateLimitDecision(allowed=False, exceeded=WINDOWS[2], retry_after=600)
+
+    local.record("user:1", WINDOWS, rejected)
+
+    assert local.check("user:1", WINDOWS).exceeded.name == "day"
+    now[0] += 600
+    assert local.check("user:1", WINDOWS) is None
+
+    local.record("user:2", WINDOWS, rejected)
+    assert local.check("user:1", WINDOWS) is None  # evicted
+
+
+@pytest.mark.asyncio
+async def test_middleware_skips_redis_for_shed_clients(monkeypatch):
+    rejected = RateLimitDecision(allowed=False, exceeded=WINDOWS[0], retry_after=5)
+    check = AsyncMock(return_value=rejected)
+    monkeypatch.setattr(RateLimiter, "check_rate_limits", check)
+    monkeypatch.setattr(rate_limit_middleware, "local_rate_limiter", LocalRateLimiter())
+    request = SimpleNamespace(
+        headers={}, client=SimpleNamespace(host="10.0.0.1"), url=SimpleNamespace(path="/api/x")
+    )
+    middleware = rate_limit_middleware.RateLimitMiddleware(app=None)
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc:
+            await middleware.dispatch(request, AsyncMock())
+
+    assert check.await_count == 1
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "5"
+    assert exc.value.detail["error"] == "Rate limit exceeded"
@@ -0,0 +1,140 @@
+"""
+Unit tests for the in-process token blacklist copy
+
+Redis is replaced by fakes that record commands and replay pub/sub
+messages, so these check when Redis is consulted and how the copy is
+kept current.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.api.auth import redis_client
+from src.api.auth.redis_client import (
+    BLACKLIST_CHANNEL,
+    BLACKLIST_INDEX,
+    RevokedTokenCache,
+    TokenBlacklist,
+)
+
+
+class FakePubSub:
+    """Replays messages, then fails like a dropped connection"""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.subscribed = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        if not self.messages:
+            raise ConnectionError("connection reset")
+        return self.messages.pop(0)
+
+    async def ping(self):
+        pass
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    revoked = RevokedTokenCache(horizon_seconds=3600, max_staleness_seconds=30)
+    monkeypatch.setattr(redis_client, "revoked_tokens", revoked)
+    return revoked
+
+
+@pytest.mark.asyncio
+async def test_follow_loads_index_then_applies_events(cache):
+    expires = time.time() + 600
+    pubsub = FakePubSub(
+        [
+            {"type": "message", "data": f"jti-new {expires}"},
+            {"type": "message", "data": f"jti-old {time.time() - 1}"},
+        ]
+    )
+    client = MagicMock()
+    client.pubsub.return_value = pubsub
+    client.zrangebyscore = AsyncMock(return_value=[("jti-loaded", expires)])
+
+    assert cache.lookup("jti-loaded") is None
+    with pytest.raises(ConnectionError):
+        await cache._follow(client)
+
+    assert pubsub.subscribed == [BLACKLIST_CHANNEL]
+    assert pubsub.closed
+    assert cache.lookup("jti-loaded") is True
+    assert cache.lookup("jti-new") is True
+    assert cache.lookup("jti-old") is False
+    assert cache.lookup("jti-other") is False
+
+
+def test_staleness_bound(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(redis_client.time, "monotonic", lambda: now[0])
+    cache._loaded = True
+    cache._healthy_at = now[0]
+    cache.add("jti-1", time.time() + 600)
+
+    now[0] += 30
+    assert cache.lookup("jti-1") is True
+    now[0] += 1
+    assert cache.lookup("jti-1") is None
+
+    cache._connected = True
+    assert cache.lookup("jti-1") is True
+
+
+@pytest.mark.asyncio
+async def test_cached_check_skips_redis(cache, monkeypatch):
+    get_client = AsyncMock()
+    monkeypatch.setattr(redis_client, "get_redis_client", get_client)
+    cache._loaded = cache._connected = True
+    cache.add("revoked", time.time() + 600)
+
+    assert await TokenBlacklist.is_blacklisted("revoked", cached=True) is True
+    assert await TokenBlacklist.is_blacklisted("valid", cached=True) is False
+    get_client.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_uncached_check_and_unloaded_copy_use_redis(cache, monkeypatch):
+    client = MagicMock()
+    client.exists = AsyncMock(return_value=1)
+    monkeypatch.setattr(redis_client, "get_redis_client", AsyncMock(return_value=client))
+
+    assert await TokenBlacklist.is_blacklisted("jti-1", cached=True) is True
+    cache._loaded = cache._connected = True
+    assert await TokenBlacklist.is_blacklisted("jti-1") is True
+
+    assert client.exists.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_add_token_publishes_short_lived_entries(cache, monkeypatch):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    monkeypatch.setattr(redis_client, "get_redis_client", AsyncMock(return_value=client))
+
+    await TokenBlacklist.add_token("access-jti", ttl_seconds=900)
+    await TokenBlacklist.add_token("refresh-jti", ttl_seconds=30 * 86400)
+
+    assert [c.args[0] for c in pipe.setex.call_args_list] == [
+        "blacklist:token:access-jti",
+        "blacklist:token:refresh-jti",
+    ]
+    (zadd,) = pipe.zadd.call_args_list
+    assert zadd.args[0] == BLACKLIST_INDEX and "access-jti" in zadd.args[1]
+    (publish,) = pipe.publish.call_args_list
+    assert publish.args[0] == BLACKLIST_CHANNEL
+    assert publish.args[1].startswith("access-jti ")
+    assert pipe.execute.await_count == 2
+    assert len(cache) == 1
@@ -0,0 +1,166 @@
+"""
+Unit tests for the concurrent pre-routing analysis stage.
+
+Uses stub analyzers so no LLM calls are made.
+"""
+
+import asyncio
+import time
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from src.core.config import get_settings
+from src.workflow.analysis import PreRoutingAnalysis
+from src.workflow.graph import SupportGraph
+from src.workflow.state import AgentState, create_initial_state
+
+
+class StubAnalyzer:
+    """Mimics a routing analyzer: update_state() bookkeeping plus its own keys"""
+
+    def __init__(self, name, updates, delay=0.05, error=None):
+        self.name = name
+        self.updates = updates
+        self.delay = delay
+        self.error = error
+
+    async def process(self, state):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        state["agent_history"].append(self.name)
+        state["current_agent"] = self.name
+        state["turn_count"] = state.get("turn_count", 0) + 1
+        state["status"] = "overwritten"
+        state.update(self.updates)
+        return state
+
+
+def _analyzers(**overrides):
+    analyzers = {
+        "sentiment_analyzer": StubAnalyzer(
+            "sentiment_analyzer", {"emotion": "frustrated", "urgency": "high"}
+        ),
+        "entity_extractor": StubAnalyzer(
+            "entity_extractor", {"extracted_entities": {"plan": "pro"}}
+        ),
+        "complexity_assessor": StubAnalyzer("complexity_assessor", {"complexity_score": 7}),
+        "intent_classifier": StubAnalyzer(
+            "intent_classifier", {"intent_domain": "support", "intent_category": "billing"}
+        ),
+    }
+    analyzers.update(overrides)
+    return analyzers
+
+
+@pytest.fixture
+def state():
+    return create_initial_state("I was charged twice, fix it now")
+
+
+class TestPreRoutingAnalysis:
+    """Test fan-out and merge rules"""
+
+    @pytest.mark.asyncio
+    async def test_analyzers_run_concurrently(self, state):
+        analysis = PreRoutingAnalysis(_analyzers(), timeout=5)
+
+        start = time.monotonic()
+        merged = await analysis.process(state)
+        elapsed = time.monotonic() - start
+
+        # Four 50ms analyzers: ~max, not ~sum
+        assert elapsed < 0.15
+        assert merged["analysis_metadata"]["completed"] == list(_analyzers())
+
+    @pytest.mark.asyncio
+    async def test_merge_rules(self, state):
+        merged = await PreRoutingAnalysis(_analyzers(), timeout=5).process(state)
+
+        assert merged["emotion"] == "frustrated"
+        assert merged["extracted_entities"] == {"plan": "pro"}
+        assert merged["complexity_score"] == 7
+        assert merged["intent_category"] == "billing"
+        # Analysis is not an agent hop
+        assert merged["turn_count"] == state["turn_count"]
+        assert merged["current_agent"] == state["current_agent"]
+        # Keys an analyzer does not own are dropped
+        assert merged["status"] == "active"
+        assert merged["agent_history"] == list(_analyzers())
+
+    @pytest.mark.asyncio
+    async def test_input_state_is_not_mutated(self, state):
+        await PreRoutingAnalysis(_analyzers(), timeout=5).process(state)
+
+        assert state["agent_history"] == []
+        assert "emotion" not in state
+
+    @pytest.mark.asyncio
+    async def test_shared_timeout_drops_slow_analyzer(self, state):
+        slow = StubAnalyzer("complexity_assessor", {"complexity_score": 9}, delay=5)
+        analysis = PreRoutingAnalysis(_analyzers(complexity_assessor=slow), timeout=0.2)
+
+        start = time.monotonic()
+        merged = await analysis.process(state)
+
+        assert time.monotonic() - start < 1
+        assert "complexity_score" not in merged
+        assert merged["analysis_metadata"]["timed_out"] == ["complexity_assessor"]
+        assert merged["emotion"] == "frustrated"
+
+    @pytest.mark.asyncio
+    async def test_failed_analyzer_is_skipped(self, state):
+        broken = StubAnalyzer("entity_extractor", {}, error=RuntimeError("boom"))
+        merged = await PreRoutingAnalysis(_analyzers(entity_extractor=broken), timeout=5).process(
+            state
+        )
+
+        assert merged["analysis_metadata"]["failed"] == ["entity_extractor"]
+        assert "entity_extractor" not in merged["agent_history"]
+        assert merged["intent_domain"] == "support"
+
+    def test_unknown_analyzer_rejected(self):
+        with pytest.raises(ValueError, match="No merge rules"):
+            PreRoutingAnalysis({"billing_agent": StubAnalyzer("billing_agent", {})})
+
+    @pytest.mark.asyncio
+    async def test_outputs_reach_next_graph_node(self, state):
+        seen = {}
+
+        async def router(s):
+            seen.update(s)
+            return s
+
+        workflow = StateGraph(AgentState)
+        workflow.add_node("analysis", PreRoutingAnalysis(_analyzers(), timeout=5).process)
+        workflow.add_node("router", router)
+        workflow.set_entry_point("analysis")
+        workflow.add_edge("analysis", "router")
+        workflow.add_edge("router", END)
+
+        await workflow.compile().ainvoke(state)
+
+        assert seen["urgency"] == "high"
+        assert seen["analysis_metadata"]["completed"] == list(_analyzers())
+
+
+class TestGraphAnalysisStage:
+    """The analysis stage is opt-in through WorkflowConfig"""
+
+    def test_graph_routes_directly_by_default(self):
+        graph = SupportGraph()
+
+        assert graph.analysis.analyzers == {}
+        assert "analysis" not in graph.app.get_graph().nodes
+
+    def test_configured_analyzers_run_before_router(self, monkeypatch):
+        workflow_settings = get_settings().workflow
+        monkeypatch.setattr(workflow_settings, "pre_routing_analyzers", ["sentiment_analyzer"])
+        monkeypatch.setattr(workflow_settings, "analysis_timeout_seconds", 3.0)
+
+        graph = SupportGraph()
+
+        assert list(graph.analysis.analyzers) == ["sentiment_analyzer"]
+        assert graph.analysis.timeout == 3.0
+        assert "analysis" in graph.app.get_graph().nodes
@@ -0,0 +1,60 @@
+"""
+Unit tests for the process-wide workflow engine.
+
+The engine constructor is patched, so no agents or graph are built.
+"""
+
+import threading
+
+import pytest
+
+from src.agents.base import base_agent
+from src.workflow import engine as engine_module
+
+
+@pytest.fixture
+def fresh_engine_slot(monkeypatch):
+    """Empty the module-level engine slot and count constructions"""
+    built = []
+
+    class FakeEngine:
+        def __init__(self):
+            built.append(self)
+
+    monkeypatch.setattr(engine_module, "_workflow_engine", None)
+    monkeypatch.setattr(engine_module, "AgentWorkflowEngine", FakeEngine)
+    return built
+
+
+def test_engine_built_once(fresh_engine_slot):
+    first = engine_module.get_workflow_engine()
+    second = engine_module.get_workflow_engine()
+
+    assert first is second
+    assert len(fresh_engine_slot) == 1
+
+
+def test_engine_built_once_across_threads(fresh_engine_slot):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(engine_module.get_workflow_engine()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fresh_engine_slot) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_cached_dependency_uses_shared_engine(fresh_engine_slot):
+    from src.api.dependencies.service_dependencies import get_cached_workflow_engine
+
+    assert get_cached_workflow_engine() is engine_module.get_workflow_engine()
+    assert len(fresh_engine_slot) == 1
+
+
+def test_agents_share_anthropic_client():
+    assert base_agent.get_shared_anthropic_client() is base_agent.get_shared_anthropic_client()
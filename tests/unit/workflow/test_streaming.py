@@ -0,0 +1,205 @@
+"""
+Unit tests for workflow token streaming.
+
+Covers the ContextVar token sink, AgentWorkflowEngine.execute_stream()
+and the SSE events built from it, without running the real LangGraph
+workflow or touching the database.
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.api.routes.conversations_stream import stream_conversation_response
+from src.utils.logging.setup import get_logger
+from src.workflow.engine import AgentWorkflowEngine
+from src.workflow.exceptions import AgentExecutionError
+from src.workflow.streaming import emit_reset, emit_token, is_streaming
+
+
+def _make_engine(execute):
+    """Build an engine without compiling the graph, with a stubbed execute()"""
+    engine = AgentWorkflowEngine.__new__(AgentWorkflowEngine)
+    engine.logger = get_logger(__name__)
+    engine.execute = execute
+    return engine
+
+
+class TestTokenSink:
+    """Test the module-level token sink helpers"""
+
+    def test_not_streaming_by_default(self):
+        assert is_streaming() is False
+
+    def test_emit_without_sink_is_noop(self):
+        # Must not raise outside a streaming execution
+        emit_token("billing_agent", "hello")
+        emit_reset()
+
+
+class TestExecuteStream:
+    """Test AgentWorkflowEngine.execute_stream()"""
+
+    @pytest.mark.asyncio
+    async def test_tokens_then_result(self):
+        async def execute(message, context=None):
+            assert is_streaming()
+            for chunk in ["Hel", "lo"]:
+                emit_token("billing_agent", chunk)
+                await asyncio.sleep(0)
+            return {"agent_response": "Hello"}
+
+        engine = _make_engine(execute)
+        events = [event async for event in engine.execute_stream("hi")]
+
+        assert events == [
+            {"type": "token", "agent": "billing_agent", "chunk": "Hel"},
+            {"type": "token", "agent": "billing_agent", "chunk": "lo"},
+            {"type": "result", "result": {"agent_response": "Hello"}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sink_does_not_leak_into_caller(self):
+        async def execute(message, context=None):
+            return {}
+
+        engine = _make_engine(execute)
+        async for _ in engine.execute_stream("hi"):
+            assert is_streaming() is False
+
+    @pytest.mark.asyncio
+    async def test_reset_is_forwarded(self):
+        async def execute(message, context=None):
+            emit_token("billing_agent", "stale")
+            emit_reset()
+            emit_token("billing_agent", "fresh")
+            return {}
+
+        engine = _make_engine(execute)
+        types = [event["type"] async for event in engine.execute_stream("hi")]
+
+        assert types == ["token", "reset", "token", "result"]
+
+    @pytest.mark.asyncio
+    async def test_error_raised_after_pending_tokens(self):
+        async def execute(message, context=None):
+            emit_token("billing_agent", "partial")
+            raise AgentExecutionError("boom")
+
+        engine = _make_engine(execute)
+        received = []
+
+        with pytest.raises(AgentExecutionError):
+            async for event in engine.execute_stream("hi"):
+                received.append(event)
+
+        assert received == [{"type": "token", "agent": "billing_agent", "chunk": "partial"}]
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_workflow(self):
+        cancelled = asyncio.Event()
+
+        async def execute(message, context=None):
+            emit_token("billing_agent", "first")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        engine = _make_engine(execute)
+        stream = engine.execute_stream("hi")
+        await stream.__anext__()
+        await stream.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def _make_service(events):
+    """Conversation service fake whose workflow streams the given events"""
+
+    async def execute_stream(message, context=None):
+        for event in events:
+            yield event
+
+    conversation = SimpleNamespace(id=uuid4(), customer_id=uuid4(), status="active")
+    message = SimpleNamespace(id=uuid4(), created_at=datetime(2026, 1, 1, tzinfo=UTC))
+    uow = SimpleNamespace(
+        current_user_id=None,
+        conversations=SimpleNamespace(
+            get_without_messages=AsyncMock(return_value=conversation), update=AsyncMock()
+        ),
+        messages=SimpleNamespace(create_message=AsyncMock(return_value=message)),
+        commit=AsyncMock(),
+    )
+    history = SimpleNamespace(
+        get_context=AsyncMock(return_value=([], None)), schedule_summary_update=MagicMock()
+    )
+    return SimpleNamespace(
+        uow=uow, history=history, workflow_engine=SimpleNamespace(execute_stream=execute_stream)
+    )
+
+
+class TestConversationStream:
+    """Test the SSE content events sent to the client"""
+
+    @staticmethod
+    async def _content_events(events):
+        service = _make_service(events)
+        sse = [chunk async for chunk in stream_conversation_response(uuid4(), "hi", service)]
+        parsed = [json.loads(chunk.removeprefix("data: ")) for chunk in sse]
+        return [event for event in parsed if event["type"] == "content"]
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_client_text(self):
+        result = {"agent_response": "Fresh answer", "agent_history": ["billing_agent"]}
+        events = await self._content_events(
+            [
+                {"type": "token", "agent": "billing_agent", "chunk": "stale"},
+                {"type": "reset"},
+                {"type": "result", "result": result},
+            ]
+        )
+
+        # The retry streamed nothing: the client must drop "stale" before
+        # the final response is appended
+        assert [(e["chunk"], e["accumulated"], e.get("replace")) for e in events] == [
+            ("stale", "stale", None),
+            ("", "", True),
+            ("Fresh answer", "Fresh answer", False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reset_before_any_token_sends_nothing(self):
+        result = {"agent_response": "Hello", "agent_history": ["billing_agent"]}
+        events = await self._content_events(
+            [
+                {"type": "reset"},
+                {"type": "token", "agent": "billing_agent", "chunk": "Hello"},
+                {"type": "result", "result": result},
+            ]
+        )
+
+        assert [e["chunk"] for e in events] == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_summary_fold_starts_after_commit_and_done(self):
+        result = {"agent_response": "Hello", "agent_history": ["billing_agent"]}
+        service = _make_service([{"type": "result", "result": result}])
+        stream = stream_conversation_response(uuid4(), "hi", service)
+
+        async for chunk in stream:
+            if json.loads(chunk.removeprefix("data: "))["type"] == "done":
+                break
+        service.uow.commit.assert_awaited_once()
+        service.history.schedule_summary_update.assert_not_called()
+
+        assert [chunk async for chunk in stream] == []
+        conversation = await service.uow.conversations.get_without_messages()
+        service.history.schedule_summary_update.assert_called_once_with(conversation.id)